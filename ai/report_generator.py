@@ -23,6 +23,7 @@ load_dotenv()
 
 from config.persona_config import TARGET_PERSONAS, get_persona_filters
 from database.supabase_client import SupabaseClient
+from database.persona_rollups import get_rollup_store
 
 logger = logging.getLogger(__name__)
 
@@ -82,17 +83,8 @@ class PersonaReportGenerator:
             return []
         
         try:
-            # 최근 N일간의 페르소나 데이터 조회
-            cutoff_date = (datetime.now() - timedelta(days=days_back)).isoformat()
-            
-            query = self.supabase_client.client.table('shopee_products')\
-                .select('*')\
-                .contains('discount_info', {'persona_name': persona_name})\
-                .gte('created_at', cutoff_date)\
-                .order('created_at', desc=True)\
-                .execute()
-            
-            products = query.data if query.data else []
+            # 최근 N일간의 페르소나 데이터 조회 (짧은 TTL 캐시, 새 데이터 저장 시 무효화)
+            products = self.supabase_client.get_persona_products(persona_name, days_back=days_back)
             logger.info(f"📊 Retrieved {len(products)} products for {persona_name} (last {days_back} days)")
             
             return products
@@ -101,6 +93,34 @@ class PersonaReportGenerator:
             logger.error(f"❌ Error retrieving persona data: {e}")
             return []
     
+    def analyze_persona(self, persona_name: str, days_back: int = 7) -> Dict[str, Any]:
+        """
+        최근 N일 페르소나 분석
+        
+        일별 롤업이 기간을 모두 포함하면 롤업 합계만 읽고,
+        아니면 (롤업 비활성화/백필 이전 기간) 원본 행을 조회해 analyze_products 로 계산합니다.
+        """
+        store = get_rollup_store()
+        if store is not None and persona_name in TARGET_PERSONAS:
+            try:
+                if store.covers(days_back, persona_name, self.supabase_client):
+                    summary = store.summary(persona_name, days_back)
+                    if not summary["total_products"]:
+                        return {"status": "no_data", "insights": []}
+                    return self._complete_analysis(summary, persona_name)
+            except Exception as e:
+                logger.warning(f"⚠️ Persona rollups unavailable, scanning raw rows: {e}")
+        
+        products = self.get_persona_data(persona_name, days_back=days_back)
+        return self.analyze_products(products, persona_name)
+    
+    def _complete_analysis(self, summary: Dict[str, Any], persona_name: str) -> Dict[str, Any]:
+        """집계 통계에 인사이트/추천 추가"""
+        analysis = {**summary, "insights": [], "recommendations": []}
+        analysis["insights"] = self._generate_insights(analysis, persona_name)
+        analysis["recommendations"] = self._generate_recommendations(analysis, persona_name)
+        return analysis
+    
     def analyze_products(self, products: List[Dict[str, Any]], persona_name: str) -> Dict[str, Any]:
         """제품 데이터 분석 및 인사이트 생성"""
         
@@ -154,7 +174,7 @@ class PersonaReportGenerator:
                 valid_scores += 1
             
             # 카테고리 분포
-            category = product.get('category', 'unknown')
+            category = product.get('category') or 'unknown'
             analysis["top_categories"][category] = analysis["top_categories"].get(category, 0) + 1
             
             # 브랜드 분포 (제품명에서 추출)
@@ -286,9 +306,8 @@ class PersonaReportGenerator:
         if persona_name not in template["personas"]:
             return {"error": f"Persona {persona_name} not supported for scenario {scenario}"}
         
-        # 데이터 수집
-        products = self.get_persona_data(persona_name, days_back=7)
-        analysis = self.analyze_products(products, persona_name)
+        # 데이터 분석 (일별 롤업 사용)
+        analysis = self.analyze_persona(persona_name, days_back=7)
         
         # 시나리오별 리포트 생성
         report = {
@@ -410,25 +429,20 @@ class PersonaReportGenerator:
     def generate_daily_report(self, persona_name: str) -> Dict[str, Any]:
         """일일 페르소나 리포트 생성"""
         
-        # 오늘 수집된 데이터
-        today_products = self.get_persona_data(persona_name, days_back=1)
-        
-        # 주간 트렌드 비교
-        week_products = self.get_persona_data(persona_name, days_back=7)
-        
-        today_analysis = self.analyze_products(today_products, persona_name)
-        week_analysis = self.analyze_products(week_products, persona_name)
+        # 오늘 수집된 데이터 / 주간 트렌드 비교 (일별 롤업 사용)
+        today_analysis = self.analyze_persona(persona_name, days_back=1)
+        week_analysis = self.analyze_persona(persona_name, days_back=7)
         
         report = {
             "type": "daily_report",
             "persona": persona_name,
             "date": datetime.now().strftime("%Y-%m-%d"),
             "today": {
-                "products_found": len(today_products),
+                "products_found": today_analysis.get("total_products", 0),
                 "analysis": today_analysis
             },
             "weekly_comparison": {
-                "total_products": len(week_products),
+                "total_products": week_analysis.get("total_products", 0),
                 "analysis": week_analysis,
                 "trends": self._compare_trends(today_analysis, week_analysis)
             },
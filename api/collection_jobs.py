@@ -0,0 +1,119 @@
+"""
+대시보드 수동 수집 백그라운드 작업
+Background collection jobs - browser scrapes run off the request path, clients poll the job status
+"""
+
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CollectionJob:
+    """수동 수집 작업 상태"""
+    job_id: str
+    persona_name: str
+    limit: int
+    requested_by: Optional[str] = None
+    status: str = "queued"  # queued → running → completed / failed
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    duration_seconds: Optional[float] = None
+    products_collected: int = 0
+    error: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        return self.status in ("queued", "running")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class CollectionJobManager:
+    """
+    수동 수집 작업 큐
+
+    - 브라우저 수집은 별도 스레드 풀에서 실행 (기본 1개 - 공유 드라이버 풀과 사이트 부하 고려)
+    - 같은 페르소나의 작업이 대기/실행 중이면 새 작업 대신 기존 작업 반환
+    - 완료된 작업은 최근 max_history 개만 보관
+    """
+
+    def __init__(self, collect_func: Callable[[str, int], Optional[List[Dict[str, Any]]]], max_workers: int = 1, max_history: int = 100):
+        """
+        Args:
+            collect_func: (persona_name, limit) → 수집된 상품 목록 (예: PersonaScheduler.manual_collect)
+            max_workers: 동시에 실행할 수집 작업 수
+            max_history: 보관할 완료 작업 수
+        """
+        self.collect_func = collect_func
+        self.max_history = max(1, max_history)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="collection-job")
+        self._jobs: Dict[str, CollectionJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, persona_name: str, limit: int, requested_by: Optional[str] = None) -> CollectionJob:
+        """작업 등록 (같은 페르소나 작업이 진행 중이면 그 작업 반환)"""
+        with self._lock:
+            for job in self._jobs.values():
+                if job.persona_name == persona_name and job.active:
+                    return job
+
+            job = CollectionJob(job_id=uuid.uuid4().hex, persona_name=persona_name, limit=limit, requested_by=requested_by)
+            self._jobs[job.job_id] = job
+            self._trim_history()
+
+        self._executor.submit(self._run, job)
+        logger.info(f"📥 Collection job {job.job_id[:8]} queued for {persona_name} ({limit} products)")
+        return job
+
+    def _run(self, job: CollectionJob):
+        start = time.time()
+        job.status = "running"
+        job.started_at = datetime.now().isoformat()
+
+        try:
+            products = self.collect_func(job.persona_name, job.limit)
+            job.products_collected = len(products) if products else 0
+            job.status = "completed"
+            logger.info(f"✅ Collection job {job.job_id[:8]} completed: {job.products_collected} products")
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            logger.error(f"❌ Collection job {job.job_id[:8]} failed: {e}")
+        finally:
+            job.finished_at = datetime.now().isoformat()
+            job.duration_seconds = round(time.time() - start, 1)
+
+    def _trim_history(self):
+        finished = [job for job in self._jobs.values() if not job.active]
+        for job in finished[:max(0, len(finished) - self.max_history)]:
+            del self._jobs[job.job_id]
+
+    def get(self, job_id: str) -> Optional[CollectionJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self, persona_name: Optional[str] = None) -> List[CollectionJob]:
+        """최근 작업 목록 (최신순)"""
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if persona_name is None or job.persona_name == persona_name]
+        return sorted(jobs, key=lambda job: job.created_at, reverse=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = {"queued": 0, "running": 0, "completed": 0, "failed": 0}
+            for job in self._jobs.values():
+                stats[job.status] += 1
+            return stats
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -7,11 +7,14 @@ User Dashboard API - Persona-Targeted Data Service
 import os
 import sys
 import json
+import asyncio
+import functools
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
-from fastapi import FastAPI, HTTPException, Query, Depends
+from fastapi import FastAPI, HTTPException, Query, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
@@ -26,8 +29,14 @@ load_dotenv()
 
 from config.persona_config import TARGET_PERSONAS, get_persona_filters
 from database.supabase_client import SupabaseClient
+from database.query_cache import get_query_cache
+from database.table_stats import get_table_stats
+from api.collection_jobs import CollectionJobManager
+from api.response_cache import ResponseCache
 from ai.report_generator import PersonaReportGenerator
 from automation.scheduler import PersonaScheduler
+from scrapers.lazada_persona_scraper import LazadaPersonaScraper
+from utils.driver_pool import close_all_pools
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +47,15 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# 폴링되는 GET 응답 캐시 (ETag/304, 의존 테이블 저장 시 무효화)
+# CORS 미들웨어보다 먼저 등록해야 캐시된 응답에도 CORS 헤더가 붙음
+response_cache = ResponseCache(ttl=int(os.getenv("RESPONSE_CACHE_TTL", "300")))
+response_cache.cache_route(r"/personas", tables=())
+response_cache.cache_route(r"/persona/[^/]+/report/[^/]+", tables=("shopee_products",))
+response_cache.cache_route(r"/user/[^/]+/dashboard", tables=("shopee_products",))
+response_cache.cache_route(r"/elias/(dashboard|exam-report)", tables=("shopee_products",))
+app.middleware("http")(response_cache.middleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -51,6 +69,18 @@ app.add_middleware(
 supabase_client = None
 report_generator = None
 scheduler = None
+collection_jobs = None
+
+# 동기 supabase 클라이언트 호출용 스레드 풀 (이벤트 루프를 막지 않도록, 동시 DB 요청 수 제한)
+DB_WORKERS = int(os.getenv("DASHBOARD_DB_WORKERS", "8"))
+db_executor = ThreadPoolExecutor(max_workers=DB_WORKERS, thread_name_prefix="dashboard-db")
+
+
+async def run_blocking(func, *args, **kwargs):
+    """동기 함수 (DB 조회, 리포트 생성) 를 DB 스레드 풀에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(db_executor, functools.partial(func, *args, **kwargs))
+
 
 # Pydantic 모델들
 class UserRequest(BaseModel):
@@ -87,13 +117,24 @@ class DashboardData(BaseModel):
 @app.on_event("startup")
 async def startup_event():
     """API 시작 시 초기화"""
-    global supabase_client, report_generator, scheduler
+    global supabase_client, report_generator, scheduler, collection_jobs
     
     try:
         # 서비스 초기화
         supabase_client = SupabaseClient()
         report_generator = PersonaReportGenerator()
         scheduler = PersonaScheduler()
+        collection_jobs = CollectionJobManager(scheduler.manual_collect)
+        
+        # 저장/수집 완료 시 캐시된 응답 무효화
+        get_query_cache().add_invalidation_listener(response_cache.invalidate)
+        scheduler.add_collection_listener(lambda persona_name, products_count: response_cache.invalidate("shopee_products"))
+        
+        # /system/stats 용 근사 행 수 (exact COUNT 대신 주기적 추정값)
+        get_table_stats().start_background()
+        
+        # 수동 수집 요청이 브라우저 기동을 기다리지 않도록 미리 준비
+        LazadaPersonaScraper.shared_driver_pool().warm_up(background=True)
         
         logger.info("✅ Dashboard API services initialized")
         
@@ -101,6 +142,17 @@ async def startup_event():
         logger.error(f"❌ Failed to initialize services: {e}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """API 종료 시 작업 스레드와 공유 브라우저 정리"""
+    if collection_jobs:
+        collection_jobs.shutdown(wait=False)
+    get_table_stats().stop()
+    db_executor.shutdown(wait=False, cancel_futures=True)
+    close_all_pools()
+    logger.info("✅ WebDriver pools closed")
+
+
 @app.get("/")
 async def root():
     """API 상태 확인"""
@@ -175,11 +227,11 @@ async def get_user_dashboard(user_id: str):
         persona_name = user_persona_response["persona_name"]
         
         # 최근 제품 데이터 조회
-        products = await get_persona_products(persona_name, limit=20)
+        products = await get_persona_products(persona_name, limit=20, days_back=7, min_score=None, cursor=None)
         
         # AI 리포트 생성
         if report_generator:
-            daily_report = report_generator.generate_daily_report(persona_name)
+            daily_report = await run_blocking(report_generator.generate_daily_report, persona_name)
             insights = daily_report.get("actionable_insights", [])
         else:
             insights = ["서비스 초기화 중입니다."]
@@ -218,9 +270,10 @@ async def get_persona_products(
     persona_name: str,
     limit: int = Query(20, ge=1, le=100),
     days_back: int = Query(7, ge=1, le=30),
-    min_score: Optional[float] = Query(None, ge=0, le=100)
+    min_score: Optional[float] = Query(None, ge=0, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
 ):
-    """페르소나별 제품 데이터 조회"""
+    """페르소나별 제품 데이터 조회 (최신순, next_cursor 로 다음 페이지)"""
     
     if persona_name not in TARGET_PERSONAS:
         raise HTTPException(status_code=404, detail="Persona not found")
@@ -229,43 +282,25 @@ async def get_persona_products(
         raise HTTPException(status_code=503, detail="Database service unavailable")
     
     try:
-        # 날짜 필터
-        cutoff_date = (datetime.now() - timedelta(days=days_back)).isoformat()
-        
-        # 쿼리 빌드
-        query = supabase_client.client.table('shopee_products')\
-            .select('*')\
-            .contains('discount_info', {'persona_name': persona_name})\
-            .gte('created_at', cutoff_date)\
-            .order('created_at', desc=True)
-        
-        if limit:
-            query = query.limit(limit)
-        
-        result = query.execute()
-        products = result.data if result.data else []
-        
-        # 페르소나 점수 필터링
-        if min_score is not None:
-            products = [
-                p for p in products 
-                if p.get('discount_info', {}).get('persona_score', 0) >= min_score
-            ]
+        # 최근 N일 페르소나 상품 한 페이지 (점수 필터와 keyset 커서는 쿼리에서 처리, 캐시 사용)
+        products, next_cursor = await run_blocking(
+            supabase_client.get_persona_products_page,
+            persona_name, days_back=days_back, limit=limit, min_score=min_score, cursor=cursor
+        )
         
         # 응답 데이터 포맷팅
         formatted_products = []
         for product in products:
-            discount_info = product.get('discount_info', {})
             formatted_products.append({
                 "id": product.get('id'),
                 "product_name": product.get('product_name', 'Unknown'),
                 "price": product.get('price'),
                 "rating": product.get('rating'),
-                "persona_score": discount_info.get('persona_score', 0),
+                "persona_score": product.get('persona_score') or 0,
                 "category": product.get('category', 'general'),
                 "product_url": product.get('product_url'),
                 "image_url": product.get('image_url'),
-                "brand_bonus": discount_info.get('brand_bonus', False),
+                "brand_bonus": product.get('brand_bonus') or False,
                 "collection_date": product.get('created_at')
             })
         
@@ -273,6 +308,8 @@ async def get_persona_products(
             "persona": persona_name,
             "products": formatted_products,
             "total_count": len(formatted_products),
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
             "filters_applied": {
                 "days_back": days_back,
                 "min_score": min_score,
@@ -280,6 +317,8 @@ async def get_persona_products(
             }
         }
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching products for {persona_name}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch products")
@@ -296,7 +335,7 @@ async def get_scenario_report(persona_name: str, scenario: str):
         raise HTTPException(status_code=503, detail="Report service unavailable")
     
     try:
-        report = report_generator.generate_scenario_report(scenario, persona_name)
+        report = await run_blocking(report_generator.generate_scenario_report, scenario, persona_name)
         
         if "error" in report:
             raise HTTPException(status_code=400, detail=report["error"])
@@ -308,26 +347,27 @@ async def get_scenario_report(persona_name: str, scenario: str):
         raise HTTPException(status_code=500, detail="Failed to generate report")
 
 
-@app.post("/user/{user_id}/collect")
+@app.post("/user/{user_id}/collect", status_code=status.HTTP_202_ACCEPTED)
 async def trigger_manual_collection(user_id: str, limit: int = Query(10, ge=1, le=50)):
-    """사용자를 위한 수동 데이터 수집 트리거"""
+    """사용자를 위한 수동 데이터 수집 트리거 (백그라운드 작업, /jobs/{job_id} 로 상태 확인)"""
+    
+    # 사용자 페르소나 확인
+    user_persona_response = await get_user_persona(user_id)
+    persona_name = user_persona_response["persona_name"]
+    
+    if not collection_jobs:
+        raise HTTPException(status_code=503, detail="Scheduler service unavailable")
     
     try:
-        # 사용자 페르소나 확인
-        user_persona_response = await get_user_persona(user_id)
-        persona_name = user_persona_response["persona_name"]
-        
-        if not scheduler:
-            raise HTTPException(status_code=503, detail="Scheduler service unavailable")
-        
-        # 수동 수집 실행
-        products = scheduler.manual_collect(persona_name, limit)
+        job = collection_jobs.submit(persona_name, limit, requested_by=user_id)
         
         return {
             "user_id": user_id,
             "persona": persona_name,
             "collection_triggered": True,
-            "products_collected": len(products) if products else 0,
+            "job_id": job.job_id,
+            "status": job.status,
+            "status_url": f"/jobs/{job.job_id}",
             "timestamp": datetime.now().isoformat()
         }
         
@@ -336,6 +376,30 @@ async def trigger_manual_collection(user_id: str, limit: int = Query(10, ge=1, l
         raise HTTPException(status_code=500, detail="Failed to trigger collection")
 
 
+@app.get("/jobs/{job_id}")
+async def get_collection_job(job_id: str):
+    """수동 수집 작업 상태 조회"""
+    
+    job = collection_jobs.get(job_id) if collection_jobs else None
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return job.to_dict()
+
+
+@app.get("/jobs")
+async def list_collection_jobs(persona_name: Optional[str] = None):
+    """최근 수동 수집 작업 목록"""
+    
+    if not collection_jobs:
+        return {"jobs": [], "stats": {}}
+    
+    return {
+        "jobs": [job.to_dict() for job in collection_jobs.list_jobs(persona_name)],
+        "stats": collection_jobs.get_stats()
+    }
+
+
 @app.get("/system/stats")
 async def get_system_stats():
     """시스템 통계 및 상태"""
@@ -355,17 +419,26 @@ async def get_system_stats():
         scheduler_stats = scheduler.get_stats()
         stats["scheduler"] = scheduler_stats
     
-    # 데이터베이스 통계 (간단히)
+    if collection_jobs:
+        stats["collection_jobs"] = collection_jobs.get_stats()
+    
+    # 데이터베이스 통계 (메모리의 근사 행 수, 백그라운드에서 갱신)
     if supabase_client:
-        try:
-            # 전체 제품 수
-            total_query = supabase_client.client.table('shopee_products').select('id', count='exact').execute()
-            stats["database"] = {
-                "total_products": total_query.count if total_query.count else 0,
-                "status": "connected"
-            }
-        except:
-            stats["database"] = {"status": "error"}
+        table_stats = get_table_stats().snapshot()
+        products = table_stats["tables"].get("shopee_products", {})
+        stats["database"] = {
+            "total_products": products.get("rows") or 0,
+            "approximate": True,
+            "refreshed_at": products.get("refreshed_at"),
+            "age_seconds": table_stats["age_seconds"],
+            "last_error": table_stats["last_error"],
+            "status": "error" if products.get("error") else "connected" if products.get("refreshed_at") else "pending",
+            "tables": table_stats["tables"]
+        }
+        
+        stats["query_cache"] = get_query_cache().get_stats()
+    
+    stats["response_cache"] = response_cache.get_stats()
     
     return stats
 
@@ -0,0 +1,192 @@
+"""
+대시보드 API 응답 캐시 (ETag / Last-Modified / 304)
+Response cache for polled GET endpoints - identical JSON is served from memory and revalidated with 304s
+
+- 경로 패턴별로 의존 테이블을 등록 (예: 리포트 → shopee_products)
+- 해당 테이블에 저장이 일어나면 (QueryCache 무효화 리스너 / 스케줄러 수집 완료) 관련 항목 제거
+- 등록된 경로의 200 응답에는 ETag 를 붙이고, If-None-Match 가 같으면 본문 없이 304
+- 등록되지 않은 경로는 응답을 읽거나 다시 만들지 않고 그대로 전달 (스트리밍 응답 유지)
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+ALL_TABLES = "*"
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    media_type: Optional[str]
+    etag: str
+    last_modified: float
+    expires_at: float
+    tables: Tuple[str, ...]
+
+
+class ResponseCache:
+    """
+    GET 응답 캐시
+
+    키는 (경로, 정렬된 쿼리 문자열) 입니다. 등록되지 않은 경로는 캐시/ETag 없이 원래 응답을 그대로 반환합니다.
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 256):
+        """
+        Args:
+            ttl: 항목 유지 시간 (초) - 다른 프로세스의 저장은 무효화 신호가 오지 않으므로 상한 역할
+            max_entries: 최대 항목 수 (LRU)
+        """
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._routes: List[Tuple[Pattern, Tuple[str, ...]]] = []
+        self._entries: "OrderedDict[Tuple[str, str], CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 무효화 세대 - 응답 계산 중에 무효화가 일어나면 그 응답은 보관하지 않음 (QueryCache 와 같은 방식)
+        self._table_generation: Dict[str, int] = {}
+        self._full_generation = 0  # invalidate(None)
+        self._invalidation_count = 0  # 모든 invalidate 호출 (ALL_TABLES 경로용)
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0, "invalidations": 0, "evictions": 0}
+
+    def cache_route(self, pattern: str, tables: Iterable[str] = (ALL_TABLES,)):
+        """
+        캐시할 경로 등록
+
+        Args:
+            pattern: 경로 정규식 (전체 일치)
+            tables: 응답이 의존하는 테이블 (이 테이블이 무효화되면 항목 제거, 빈 값이면 TTL 만 적용)
+        """
+        self._routes.append((re.compile(pattern), tuple(tables)))
+
+    def _route_tables(self, path: str) -> Optional[Tuple[str, ...]]:
+        for pattern, tables in self._routes:
+            if pattern.fullmatch(path):
+                return tables
+        return None
+
+    def _generation(self, tables: Tuple[str, ...]) -> Tuple[int, ...]:
+        """tables 에 의존하는 항목의 현재 무효화 세대 (lock 안에서 호출)"""
+        if ALL_TABLES in tables:
+            return (self._invalidation_count,)
+        return (self._full_generation, *(self._table_generation.get(table, 0) for table in tables))
+
+    @staticmethod
+    def _key(request: Request) -> Tuple[str, str]:
+        return request.url.path, "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+
+    @staticmethod
+    def make_etag(body: bytes) -> str:
+        return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+    @staticmethod
+    def _not_modified(request: Request, etag: str, last_modified: float) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            candidates = [value.strip() for value in if_none_match.split(",")]
+            return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _respond(self, request: Request, entry: CachedResponse, cache_status: str) -> Response:
+        headers = {
+            "ETag": entry.etag,
+            "Last-Modified": formatdate(entry.last_modified, usegmt=True),
+            "Cache-Control": "private, no-cache",
+            "X-Cache": cache_status
+        }
+        if self._not_modified(request, entry.etag, entry.last_modified):
+            self.stats["not_modified"] += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+
+    async def middleware(self, request: Request, call_next):
+        """FastAPI http 미들웨어 (app.middleware("http")(cache.middleware))"""
+        if request.method != "GET":
+            return await call_next(request)
+
+        tables = self._route_tables(request.url.path)
+        if tables is None:
+            response = await call_next(request)
+            response.headers["X-Cache"] = "BYPASS"
+            return response
+
+        key = self._key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.time():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+            else:
+                self.stats["misses"] += 1
+                generation = self._generation(tables)
+        if entry is not None:
+            return self._respond(request, entry, "HIT")
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        now = time.time()
+        entry = CachedResponse(
+            body=body,
+            media_type=response.media_type or response.headers.get("content-type"),
+            etag=self.make_etag(body),
+            last_modified=now,
+            expires_at=now + self.ttl,
+            tables=tables
+        )
+
+        with self._lock:
+            # 계산 중에 의존 테이블이 무효화되었다면 오래된 응답일 수 있으므로 이번 요청에만 사용
+            if self._generation(tables) == generation:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.stats["evictions"] += 1
+
+        return self._respond(request, entry, "MISS")
+
+    def invalidate(self, table: Optional[str] = None):
+        """테이블에 의존하는 항목 제거 (table 이 None 이면 전체)"""
+        with self._lock:
+            self._invalidation_count += 1
+            if table is None:
+                self._full_generation += 1
+            else:
+                self._table_generation[table] = self._table_generation.get(table, 0) + 1
+            keys = [
+                key for key, entry in self._entries.items()
+                if table is None or ALL_TABLES in entry.tables or table in entry.tables
+            ]
+            for key in keys:
+                del self._entries[key]
+            self.stats["invalidations"] += 1
+        if keys:
+            logger.debug(f"🧹 Response cache: dropped {len(keys)} entries ({table or 'all'})")
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, "entries": len(self._entries)}
@@ -22,7 +22,10 @@ def apply_migrations():
         "20240320_002_tiktok_shop_sellers.sql", 
         "20240320_003_tiktok_shop_categories.sql",
         "20240320_004_tiktok_shop_products.sql",
-        "20240320_005_tiktok_shop_product_stats.sql"
+        "20240320_005_tiktok_shop_product_stats.sql",
+        "20250715_001_natural_key_upserts.sql",
+        "20250716_001_persona_products_keyset.sql",
+        "20250717_001_local_event_clusters.sql"
     ]
     
     migrations_dir = "supabase/migrations"
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+스크래퍼 병렬 실행 오케스트레이터
+Concurrent Scraper Orchestrator - runs independent scrapers in a thread pool
+"""
+
+import sys
+import time
+import logging
+import traceback
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.rate_limiter import DomainRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScraperJob:
+    """오케스트레이터가 실행할 작업 정의"""
+    name: str
+    func: Callable[[], Dict[str, Any]]
+    domains: List[str] = field(default_factory=list)  # 작업이 접근하는 외부 도메인
+    depends_on: List[str] = field(default_factory=list)  # 먼저 끝나야 하는 작업 이름
+
+
+class ScraperOrchestrator:
+    """
+    독립적인 스크래퍼를 스레드 풀에서 동시에 실행
+
+    - 서로 다른 도메인을 다루는 작업은 병렬 실행
+    - 같은 도메인을 다루는 작업은 DomainRateLimiter 로 직렬화 + 간격 유지
+    - depends_on 으로 선언된 작업은 입력 작업이 모두 끝난 뒤 시작
+    - 결과는 작업 등록 순서대로 반환 (순차 실행과 동일한 all_results 형태)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        rate_limiter: Optional[DomainRateLimiter] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = rate_limiter or DomainRateLimiter(min_interval=5.0, max_concurrent=1)
+        self.logger = logger or logging.getLogger(__name__)
+
+    def _validate(self, jobs: List[ScraperJob]):
+        names = [job.name for job in jobs]
+        if len(names) != len(set(names)):
+            raise ValueError(f"Duplicate job names: {names}")
+
+        known = set(names)
+        for job in jobs:
+            missing = [dep for dep in job.depends_on if dep not in known]
+            if missing:
+                raise ValueError(f"Job '{job.name}' depends on unknown jobs: {missing}")
+
+        # 순환 의존성 확인
+        resolved = set()
+        pending = list(jobs)
+        while pending:
+            ready = [job for job in pending if all(dep in resolved for dep in job.depends_on)]
+            if not ready:
+                raise ValueError(f"Circular dependency among jobs: {[job.name for job in pending]}")
+            for job in ready:
+                resolved.add(job.name)
+                pending.remove(job)
+
+    def _run_job(self, job: ScraperJob) -> Dict[str, Any]:
+        """도메인 슬롯을 확보한 뒤 작업 실행 (예외는 결과 dict 로 변환)"""
+        start_time = time.time()
+        try:
+            with self.rate_limiter.slots(job.domains):
+                self.logger.info(f"▶️ [{job.name}] started (domains: {job.domains or ['-']})")
+                return job.func()
+        except Exception as e:
+            self.logger.error(f"❌ [{job.name}] crashed in orchestrator: {e}")
+            self.logger.error(traceback.format_exc())
+            return {
+                "name": job.name,
+                "success": False,
+                "data_count": 0,
+                "error": str(e),
+                "duration": round(time.time() - start_time, 2)
+            }
+
+    def run(self, jobs: List[ScraperJob]) -> List[Dict[str, Any]]:
+        """
+        작업 실행
+
+        Returns:
+            작업 등록 순서대로 정렬된 결과 리스트
+        """
+        self._validate(jobs)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        remaining = list(jobs)
+        running = {}
+        wall_start = time.time()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scraper") as executor:
+            while remaining or running:
+                # 의존성이 충족된 작업 제출
+                for job in list(remaining):
+                    if all(dep in results for dep in job.depends_on):
+                        remaining.remove(job)
+                        running[executor.submit(self._run_job, job)] = job
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    results[job.name] = future.result()
+                    status = "✅" if results[job.name].get("success") else "⚠️"
+                    self.logger.info(f"{status} [{job.name}] finished in {results[job.name].get('duration', 0)}s")
+
+        wall_clock = time.time() - wall_start
+        serial_time = sum(result.get("duration", 0) for result in results.values())
+        self.logger.info(
+            f"⏱️ Orchestrator wall-clock: {wall_clock:.2f}s "
+            f"(sum of job durations: {serial_time:.2f}s, workers: {self.max_workers})"
+        )
+        for domain, domain_stats in self.rate_limiter.get_stats().items():
+            self.logger.debug(f"   - {domain}: {domain_stats}")
+
+        return [results[job.name] for job in jobs]
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+페르소나 설정 변경 시 저장된 점수 재계산
+Incremental persona re-scoring - rewrites stale shopee_products.discount_info.persona_score
+
+TARGET_PERSONAS / PERSONA_SEARCH_STRATEGIES 가 바뀌면 get_persona_fingerprint 값이 달라지고,
+이전 지문으로 계산된 행만 페이지 단위로 읽어 PersonaBatchScorer 로 다시 계산한 뒤 bulk_write 로 저장합니다.
+
+사용 예:
+    python automation/rescoring.py                          # 모든 페르소나
+    python automation/rescoring.py --persona young_filipina --page-size 2000
+    python automation/rescoring.py --reset                  # 체크포인트 무시하고 처음부터
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.persona_config import TARGET_PERSONAS, get_persona_fingerprint
+from utils.persona_batch_scorer import PersonaBatchScorer, ProductBatch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_PATH = os.getenv("RESCORING_CHECKPOINT", "data/rescoring/checkpoint.json")
+
+TABLE = "shopee_products"
+
+
+class PersonaRescorer:
+    """
+    지문이 다른 (오래된) 행만 골라 다시 점수를 매기는 재계산기
+
+    - 페르소나별로 id 순 keyset 페이지 조회 (id > 마지막 처리 id)
+    - 페이지마다 일괄 계산 후 id 기준 upsert
+    - 페이지 저장이 끝날 때마다 체크포인트 기록 → 중단 후 재실행 시 이어서 진행
+      (설정이 다시 바뀌어 지문이 달라지면 처음부터)
+    """
+
+    def __init__(
+        self,
+        database_client=None,
+        page_size: int = 1000,
+        batch_size: int = 500,
+        checkpoint_path: Optional[str] = None
+    ):
+        """
+        Args:
+            database_client: client (supabase Client) 와 bulk_write 를 제공하는 객체 (기본값: SupabaseClient)
+            page_size: 한 번에 읽을 행 수
+            batch_size: upsert 요청당 행 수
+            checkpoint_path: 진행 상황 파일 (기본값: RESCORING_CHECKPOINT 또는 data/rescoring/checkpoint.json)
+        """
+        if database_client is None:
+            from database.supabase_client import SupabaseClient
+            database_client = SupabaseClient()
+            database_client._ensure_client()
+
+        self.db = database_client
+        self.page_size = max(1, page_size)
+        self.batch_size = max(1, batch_size)
+        self.checkpoint_path = Path(checkpoint_path or DEFAULT_CHECKPOINT_PATH)
+        self.checkpoint = self._load_checkpoint()
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # 체크포인트
+    # ------------------------------------------------------------------
+
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        if self.checkpoint_path.exists():
+            try:
+                return json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to read rescoring checkpoint, starting over: {e}")
+        return {}
+
+    def _save_checkpoint(self):
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.checkpoint, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def reset(self, persona_name: Optional[str] = None):
+        """체크포인트 삭제 (persona_name 이 None 이면 전체)"""
+        if persona_name is None:
+            self.checkpoint = {}
+        else:
+            self.checkpoint.pop(persona_name, None)
+        self._save_checkpoint()
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+
+    def _fetch_page(self, persona_name: str, fingerprint: str, after_id: Optional[str]) -> List[Dict[str, Any]]:
+        """다른 지문(또는 지문 없음)으로 계산된 행 한 페이지"""
+        # 주입된 SupabaseClient (scheduler 공유 인스턴스 등) 는 아직 client 가 없을 수 있음
+        if hasattr(self.db, "_ensure_client"):
+            self.db._ensure_client()
+        query = self.db.client.table(TABLE) \
+            .select("*") \
+            .eq("discount_info->>persona_name", persona_name) \
+            .or_(
+                "discount_info->>persona_fingerprint.is.null,"
+                f"discount_info->>persona_fingerprint.neq.{fingerprint}"
+            )
+        if after_id is not None:
+            query = query.gt("id", after_id)
+
+        response = query.order("id").limit(self.page_size).execute()
+        return response.data or []
+
+    def iter_stale_pages(self, persona_name: str, fingerprint: str, after_id: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """오래된 행을 페이지 단위로 스트리밍"""
+        while True:
+            rows = self._fetch_page(persona_name, fingerprint, after_id)
+            if not rows:
+                return
+            yield rows
+            if len(rows) < self.page_size:
+                return
+            after_id = rows[-1]["id"]
+
+    def rescore_rows(self, scorer: PersonaBatchScorer, persona_name: str, rows: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """행 목록을 일괄 계산하여 discount_info 만 갱신한 행 반환"""
+        batch = ProductBatch.from_columns(
+            names=[row.get("product_name") for row in rows],
+            categories=[row.get("category") for row in rows],
+            price_numeric=[row.get("price") for row in rows],
+            rating_numeric=[row.get("rating") for row in rows],
+            review_count_numeric=[row.get("review_count") for row in rows]
+        )
+        result = scorer.score(batch).for_persona(persona_name)
+        fingerprint = get_persona_fingerprint(persona_name)
+        rescored_at = datetime.now().isoformat()
+
+        updated = []
+        for index, row in enumerate(rows):
+            discount_info = dict(row.get("discount_info") or {})
+            discount_info.update({
+                "persona_score": float(result["scores"][index]),
+                "brand_bonus": bool(result["brand_bonus"][index]),
+                # 새 설정에서는 수집 대상이 아닌 상품 (행은 유지)
+                "persona_relevant": bool(result["relevant"][index]),
+                "persona_fingerprint": fingerprint,
+                "rescored_at": rescored_at
+            })
+            updated.append({**row, "discount_info": discount_info})
+        return updated
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+
+    def rescore_persona(self, persona_name: str) -> Dict[str, Any]:
+        """페르소나 하나의 오래된 점수 재계산 (체크포인트에서 이어서)"""
+        if persona_name not in TARGET_PERSONAS:
+            raise ValueError(f"Unknown persona: {persona_name}")
+
+        fingerprint = get_persona_fingerprint(persona_name)
+        state = self.checkpoint.get(persona_name, {})
+        if state.get("fingerprint") != fingerprint:
+            state = {"fingerprint": fingerprint, "last_id": None, "rows": 0, "seconds": 0.0, "completed": False}
+        elif state.get("completed"):
+            # 완료 후 새로 저장된 (지문 없는) 행이 있을 수 있으므로 처음부터 다시 확인
+            state.update({"last_id": None, "completed": False})
+        else:
+            logger.info(f"↩️ Resuming {persona_name} rescoring after id {state.get('last_id')} ({state.get('rows', 0)} rows done)")
+
+        stats = {
+            "persona": persona_name, "fingerprint": fingerprint, "pages": 0, "rows": 0,
+            "written": 0, "failed": 0, "requests": 0, "seconds": 0.0, "rows_per_second": 0.0, "completed": False
+        }
+        scorer = PersonaBatchScorer([persona_name])
+        start = last_page_end = time.perf_counter()
+
+        try:
+            for rows in self.iter_stale_pages(persona_name, fingerprint, state.get("last_id")):
+                updated = self.rescore_rows(scorer, persona_name, rows)
+                write_stats = self.db.bulk_write(TABLE, updated, on_conflict=("id",), chunk_size=self.batch_size)
+
+                stats["pages"] += 1
+                stats["requests"] += write_stats["requests"]
+                stats["written"] += write_stats["written"]
+                stats["failed"] += write_stats["failed"]
+                if write_stats["failed"]:
+                    # 체크포인트를 진행시키지 않음 - 다음 실행에서 이 페이지부터 다시 시도
+                    logger.error(f"❌ {persona_name}: {write_stats['failed']} rows failed to save, stopping at id {state.get('last_id')}")
+                    break
+
+                now = time.perf_counter()
+                stats["rows"] += len(rows)
+                state["last_id"] = rows[-1]["id"]
+                state["rows"] = state.get("rows", 0) + len(rows)
+                state["seconds"] = state.get("seconds", 0.0) + (now - last_page_end)
+                last_page_end = now
+                self.checkpoint[persona_name] = state
+                self._save_checkpoint()
+            else:
+                state["completed"] = True
+                stats["completed"] = True
+
+        except Exception as e:
+            logger.error(f"❌ Rescoring {persona_name} failed after {stats['rows']} rows: {e}")
+
+        stats["seconds"] = time.perf_counter() - start
+        stats["rows_per_second"] = round(stats["rows"] / stats["seconds"], 1) if stats["seconds"] > 0 else 0.0
+        state["rows_per_second"] = round(state.get("rows", 0) / state["seconds"], 1) if state.get("seconds") else 0.0
+        self.checkpoint[persona_name] = state
+        self._save_checkpoint()
+
+        self.stats[persona_name] = stats
+        status = "✅" if stats["completed"] else "⏸️"
+        logger.info(
+            f"{status} {persona_name}: rescored {stats['rows']} rows in {stats['pages']} pages, "
+            f"{stats['seconds']:.1f}s ({stats['rows_per_second']} rows/s)"
+        )
+        return stats
+
+    def run(self, persona_names: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """여러 페르소나 순차 재계산"""
+        for persona_name in persona_names or list(TARGET_PERSONAS):
+            self.rescore_persona(persona_name)
+        return self.get_stats()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """페르소나별 처리량 (이번 실행)"""
+        return {name: dict(stats) for name, stats in self.stats.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score stored products after persona config changes")
+    parser.add_argument("--persona", action="append", choices=list(TARGET_PERSONAS), help="Persona to re-score (repeatable, default: all)")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint file path")
+    parser.add_argument("--reset", action="store_true", help="Ignore the saved checkpoint")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    try:
+        rescorer = PersonaRescorer(page_size=args.page_size, batch_size=args.batch_size, checkpoint_path=args.checkpoint)
+    except Exception as e:
+        print(f"❌ Database unavailable: {e}")
+        return 1
+
+    if args.reset:
+        rescorer.reset()
+
+    stats = rescorer.run(args.persona)
+
+    print("📊 Persona rescoring")
+    print("=" * 80)
+    for persona_name, persona_stats in stats.items():
+        status = "✅" if persona_stats["completed"] else "⏸️"
+        print(
+            f"   {status} {persona_name:22s} {persona_stats['rows']:8,} rows | "
+            f"{persona_stats['rows_per_second']:10,.1f} rows/s | {persona_stats['failed']} failed"
+        )
+    return 0 if all(persona_stats["completed"] for persona_stats in stats.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,6 +24,8 @@ load_dotenv()
 
 from config.persona_config import TARGET_PERSONAS, PERSONA_SEARCH_STRATEGIES
 from database.supabase_client import SupabaseClient
+from database.table_stats import get_table_stats
+from database.write_behind import get_write_behind_writer
 from scrapers.lazada_persona_scraper import LazadaPersonaScraper
 
 logger = logging.getLogger(__name__)
@@ -35,6 +37,7 @@ class PersonaScheduler:
     def __init__(self):
         self.supabase_client = None
         self.active_scrapers = {}
+        self.collection_listeners = []  # (persona_name, products_count) - 수집 완료 알림 (예: 응답 캐시 무효화)
         self.collection_stats = {
             "total_runs": 0,
             "successful_runs": 0,
@@ -47,6 +50,11 @@ class PersonaScheduler:
         try:
             self.supabase_client = SupabaseClient()
             logger.info("✅ Supabase client initialized for scheduler")
+            
+            # 장애 중 로컬 스풀에 쌓인 저장 항목 주기적 재전송
+            spool_replayer = self.supabase_client.get_spool_replayer()
+            if spool_replayer:
+                spool_replayer.start_background(interval=300)
         except Exception as e:
             logger.error(f"❌ Failed to initialize Supabase client: {e}")
             self.supabase_client = None
@@ -92,6 +100,9 @@ class PersonaScheduler:
         # 통계 업데이트
         schedule.every().day.at("23:59").do(self._update_daily_stats)
         
+        # 페르소나 설정 변경 후 저장된 점수 재계산 (변경이 없으면 조회만 하고 종료)
+        schedule.every().day.at("03:00").do(self._rescore_stale_products)
+        
         logger.info(f"📅 Scheduled collection for {len(persona_schedules)} personas")
     
     def _register_persona_schedule(self, persona_name: str, config: Dict[str, Any]):
@@ -134,10 +145,12 @@ class PersonaScheduler:
         try:
             self.collection_stats["total_runs"] += 1
             
-            # 페르소나 스크래퍼 초기화
+            # 페르소나 스크래퍼 초기화 (브라우저는 공유 풀에서 대여)
             scraper = LazadaPersonaScraper(
                 persona_name=persona_name,
-                use_undetected=True
+                use_undetected=True,
+                database_writer=get_write_behind_writer() if self.supabase_client else None,
+                driver_pool=LazadaPersonaScraper.shared_driver_pool()
             )
             
             # 데이터 수집 실행
@@ -159,6 +172,7 @@ class PersonaScheduler:
             # 사용자 알림을 위한 이벤트 데이터 저장
             if products_count > 0:
                 self._save_collection_event(persona_name, products_count, start_time)
+                self._notify_collection(persona_name, products_count)
             
             return products
             
@@ -174,6 +188,18 @@ class PersonaScheduler:
             except:
                 pass
     
+    def add_collection_listener(self, listener):
+        """수집 완료 콜백 등록 (persona_name, products_count)"""
+        if listener not in self.collection_listeners:
+            self.collection_listeners.append(listener)
+    
+    def _notify_collection(self, persona_name: str, products_count: int):
+        for listener in list(self.collection_listeners):
+            try:
+                listener(persona_name, products_count)
+            except Exception as e:
+                logger.warning(f"⚠️ Collection listener failed: {e}")
+    
     def _save_collection_event(self, persona_name: str, products_count: int, collection_time: datetime):
         """수집 이벤트를 데이터베이스에 저장 (사용자 알림용)"""
         
@@ -202,11 +228,12 @@ class PersonaScheduler:
     def _health_check(self):
         """시스템 헬스체크"""
         try:
-            # 데이터베이스 연결 확인
+            # 데이터베이스 연결 확인 (근사 행 수 갱신을 겸함, 최근에 갱신되었으면 조회 생략)
             if self.supabase_client:
-                # 간단한 쿼리로 연결 확인
-                test_query = self.supabase_client.client.table('shopee_products').select('id').limit(1).execute()
-                logger.debug("✅ Database connection healthy")
+                if get_table_stats().refresh_if_stale():
+                    logger.debug("✅ Database connection healthy")
+                else:
+                    logger.warning("⚠️ Database row estimates could not be refreshed")
             
             # 메모리 사용량 확인
             import psutil
@@ -233,6 +260,20 @@ class PersonaScheduler:
             "products_collected": 0  # 일일 카운트 리셋
         })
     
+    def _rescore_stale_products(self):
+        """이전 페르소나 설정으로 계산된 persona_score 재계산"""
+        if not self.supabase_client:
+            return
+        
+        try:
+            from automation.rescoring import PersonaRescorer
+            stats = PersonaRescorer(self.supabase_client).run()
+            rescored = sum(persona_stats["rows"] for persona_stats in stats.values())
+            if rescored:
+                logger.info(f"🔁 Rescored {rescored} products after persona config change")
+        except Exception as e:
+            logger.error(f"❌ Persona rescoring failed: {e}")
+    
     def get_persona_last_collection(self, persona_name: str) -> Optional[datetime]:
         """특정 페르소나의 마지막 수집 시간 조회"""
         
@@ -269,7 +310,8 @@ class PersonaScheduler:
         stats.update({
             "active_personas": list(TARGET_PERSONAS.keys()),
             "scheduled_jobs": len(schedule.jobs),
-            "next_run": str(schedule.next_run()) if schedule.jobs else None
+            "next_run": str(schedule.next_run()) if schedule.jobs else None,
+            "driver_pool": LazadaPersonaScraper.shared_driver_pool().get_stats()
         })
         
         return stats
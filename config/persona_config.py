@@ -3,8 +3,10 @@ Persona-based targeting configuration for Vootcamp PH Data Scraper
 페르소나 기반 타겟팅 설정
 """
 
+import hashlib
+import json
 from typing import Dict, List, Any
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from enum import Enum
 
 class AgeGroup(Enum):
@@ -299,6 +301,25 @@ def get_persona_filters(persona_name: str) -> Dict[str, Any]:
         "price_ranges": [(pr.value[0], pr.value[1]) for pr in persona.price_ranges]
     }
 
+def get_persona_fingerprint(persona_name: str) -> str:
+    """
+    페르소나 설정 지문 (TARGET_PERSONAS + PERSONA_SEARCH_STRATEGIES)
+
+    저장된 persona_score 가 어떤 설정으로 계산되었는지 비교하는 데 사용합니다.
+    설정이 바뀌면 값이 달라집니다.
+    """
+    if persona_name not in TARGET_PERSONAS:
+        return ""
+
+    config = {
+        "profile": asdict(TARGET_PERSONAS[persona_name]),
+        "strategy": PERSONA_SEARCH_STRATEGIES.get(persona_name, {})
+    }
+    encoded = json.dumps(
+        config, sort_keys=True, default=lambda value: value.value if isinstance(value, Enum) else str(value)
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
 def get_trending_keywords_for_persona(persona_name: str, base_trends: List[str]) -> List[str]:
     """트렌드와 페르소나를 결합한 키워드 생성"""
     if persona_name not in TARGET_PERSONAS:
@@ -110,6 +110,7 @@ class Settings:
     ANTI_BOT: AntiBotConfig = field(default_factory=lambda: AntiBotConfig())
     SCRAPING: ScrapingConfig = field(default_factory=lambda: ScrapingConfig())
     MONITORING: MonitoringConfig = field(default_factory=lambda: MonitoringConfig())
+    DELAY_BETWEEN_REQUESTS: float = 2.0  # Google Trends 배치 요청 간격 (초), 캐시 적중 시 생략
 
 # 전역 설정 인스턴스
 settings = Settings() 
\ No newline at end of file
@@ -0,0 +1,6 @@
+-- Keyset pagination for /persona/{persona_name}/products
+-- SupabaseClient.get_persona_products_page filters discount_info->>'persona_name' and
+-- orders by (created_at DESC, id DESC); this index serves both the filter and each cursor seek
+
+CREATE INDEX IF NOT EXISTS idx_shopee_products_persona_keyset
+    ON shopee_products ((discount_info->>'persona_name'), created_at DESC, id DESC);
@@ -0,0 +1,44 @@
+"""
+Keyset (cursor) pagination helpers.
+(created_at, id) 내림차순 목록에서 마지막 행 위치를 불투명한 커서 문자열로 주고받습니다.
+OFFSET 과 달리 깊은 페이지도 인덱스 탐색 한 번으로 조회됩니다.
+"""
+import base64
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def encode_cursor(row: Dict[str, Any]) -> str:
+    """행의 (created_at, id) → URL-safe 커서"""
+    payload = json.dumps([row["created_at"], row["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """커서 → (created_at, id), 형식이 잘못되면 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(created_at, str) or not isinstance(row_id, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return created_at, row_id
+
+
+def keyset_filter(cursor: str) -> str:
+    """
+    (created_at, id) < 커서 위치 조건 (PostgREST or= 문법)
+
+    값에 ':' '+' 가 들어가므로 큰따옴표로 감쌉니다.
+    """
+    created_at, row_id = decode_cursor(cursor)
+    return f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt."{row_id}")'
+
+
+def split_page(rows: List[Dict[str, Any]], limit: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """limit + 1 개 조회 결과 → (페이지, 다음 커서 또는 None)"""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(page[-1])
@@ -0,0 +1,432 @@
+"""
+Per-persona daily rollups for shopee_products.
+저장된 상품 행을 (페르소나, 날짜) 단위 합계로 로컬 SQLite 에 누적하여,
+리포트/대시보드가 원본 행을 매번 다시 읽지 않고 작은 요약만 읽도록 합니다.
+
+- SupabaseClient.bulk_write 가 shopee_products 저장 결과 행을 apply_rows 로 넘김 (insert_* / 재계산 모두 포함)
+- 같은 id 가 다시 저장되면 이전 기여분을 빼고 새 값을 더함 (upsert / persona_score 재계산)
+- 생성 이전 데이터는 backfill 로 채우며, 그 전까지 해당 기간은 covers() 가 False (원본 조회로 대체)
+
+모든 writer (main.py / scheduler / dashboard) 는 같은 롤업 파일을 써야 합니다.
+기본 경로는 실행 디렉터리와 무관하게 프로젝트 루트 기준 data/rollups/persona_rollups.db 이며,
+PERSONA_ROLLUP_PATH 가 상대 경로면 역시 프로젝트 루트 기준으로 해석합니다.
+writer 가 여러 호스트/컨테이너에 있으면 이 경로를 공유 볼륨에 두거나 PERSONA_ROLLUPS_ENABLED=false 로 끄세요.
+다른 파일에 기록된 행이 있으면 covers(..., supabase_client=...) 가 원본 행 수와 비교해 False 를 돌려줍니다.
+"""
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_ROLLUP_PATH = str(PROJECT_ROOT / os.getenv("PERSONA_ROLLUP_PATH", "data/rollups/persona_rollups.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rollup_rows (
+    id TEXT PRIMARY KEY,
+    persona TEXT NOT NULL,
+    day TEXT NOT NULL,
+    price REAL,
+    rating REAL,
+    score REAL,
+    category TEXT NOT NULL,
+    brand TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_rollup_rows_bucket ON rollup_rows(persona, day);
+
+CREATE TABLE IF NOT EXISTS persona_daily_rollups (
+    persona TEXT NOT NULL,
+    day TEXT NOT NULL,
+    products INTEGER NOT NULL DEFAULT 0,
+    price_sum REAL NOT NULL DEFAULT 0,
+    price_count INTEGER NOT NULL DEFAULT 0,
+    price_min REAL,
+    price_max REAL,
+    rating_sum REAL NOT NULL DEFAULT 0,
+    rating_count INTEGER NOT NULL DEFAULT 0,
+    score_sum REAL NOT NULL DEFAULT 0,
+    score_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (persona, day)
+);
+
+CREATE TABLE IF NOT EXISTS persona_daily_categories (
+    persona TEXT NOT NULL,
+    day TEXT NOT NULL,
+    category TEXT NOT NULL,
+    products INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (persona, day, category)
+);
+
+CREATE TABLE IF NOT EXISTS persona_daily_brands (
+    persona TEXT NOT NULL,
+    day TEXT NOT NULL,
+    brand TEXT NOT NULL,
+    products INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (persona, day, brand)
+);
+
+CREATE TABLE IF NOT EXISTS rollup_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# 행 하나의 기여분: (persona, day, price, rating, score, category, brand)
+Contribution = Tuple[str, str, Optional[float], Optional[float], Optional[float], str, Optional[str]]
+
+
+def _utc_today():
+    return datetime.now(timezone.utc).date()
+
+
+class PersonaRollupStore:
+    """
+    (페르소나, UTC 날짜) 단위 상품 합계 저장소
+
+    집계 기준은 PersonaReportGenerator.analyze_products 와 같습니다.
+    (가격 > 0, 평점 있음, persona_score > 0 인 값만 평균에 포함, 카테고리 없음은 'unknown',
+    선호 브랜드는 상품명에 처음 포함된 하나만 집계)
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본값: PERSONA_ROLLUP_PATH 또는 <프로젝트 루트>/data/rollups/persona_rollups.db)
+        """
+        self.db_path = Path(db_path or DEFAULT_ROLLUP_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+        # 오늘 생성 이전에 저장된 행(다른 프로세스/호스트 포함)은 빠져 있으므로 다음 날(UTC)부터 집계 완료로 간주
+        # (그 전 기간은 backfill 후에 covers() 가 True)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO rollup_meta(key, value) VALUES ('coverage_start', ?)",
+            ((_utc_today() + timedelta(days=1)).isoformat(),)
+        )
+        self._conn.commit()
+
+        self.stats = {"rows_applied": 0, "rows_replaced": 0, "rows_skipped": 0, "summaries": 0}
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _contribution(row: Dict[str, Any]) -> Optional[Contribution]:
+        """저장된 shopee_products 행 → 기여분 (페르소나 상품이 아니면 None)"""
+        from config.persona_config import TARGET_PERSONAS
+
+        discount_info = row.get("discount_info") or {}
+        persona_name = discount_info.get("persona_name") if isinstance(discount_info, dict) else None
+        created_at = row.get("created_at") or row.get("collection_date")
+        if not persona_name or not created_at or not row.get("id"):
+            return None
+
+        day = str(created_at)[:10]
+
+        price = row.get("price")
+        price = float(price) if price and isinstance(price, (int, float)) and price > 0 else None
+
+        rating = row.get("rating")
+        rating = float(rating) if rating and isinstance(rating, (int, float)) else None
+
+        score = discount_info.get("persona_score", 0)
+        score = float(score) if isinstance(score, (int, float)) and score > 0 else None
+
+        category = row.get("category") or "unknown"
+
+        brand = None
+        persona = TARGET_PERSONAS.get(persona_name)
+        if persona:
+            product_name = (row.get("product_name") or "").lower()
+            for preferred in persona.preferred_brands:
+                if preferred.lower() in product_name:
+                    brand = preferred
+                    break
+
+        return (persona_name, day, price, rating, score, category, brand)
+
+    def _add(self, cursor, contribution: Contribution, sign: int):
+        persona, day, price, rating, score, category, brand = contribution
+
+        cursor.execute("INSERT OR IGNORE INTO persona_daily_rollups(persona, day) VALUES (?, ?)", (persona, day))
+        cursor.execute(
+            """
+            UPDATE persona_daily_rollups SET
+                products = products + ?,
+                price_sum = price_sum + ?, price_count = price_count + ?,
+                rating_sum = rating_sum + ?, rating_count = rating_count + ?,
+                score_sum = score_sum + ?, score_count = score_count + ?
+            WHERE persona = ? AND day = ?
+            """,
+            (
+                sign,
+                sign * (price or 0), sign * (price is not None),
+                sign * (rating or 0), sign * (rating is not None),
+                sign * (score or 0), sign * (score is not None),
+                persona, day
+            )
+        )
+
+        if price is not None:
+            if sign > 0:
+                cursor.execute(
+                    """
+                    UPDATE persona_daily_rollups SET
+                        price_min = CASE WHEN price_min IS NULL OR ? < price_min THEN ? ELSE price_min END,
+                        price_max = CASE WHEN price_max IS NULL OR ? > price_max THEN ? ELSE price_max END
+                    WHERE persona = ? AND day = ?
+                    """,
+                    (price, price, price, price, persona, day)
+                )
+            else:
+                # 최소/최대값이 빠진 경우에만 남은 행에서 다시 계산
+                cursor.execute(
+                    """
+                    UPDATE persona_daily_rollups SET
+                        price_min = (SELECT MIN(price) FROM rollup_rows WHERE persona = ? AND day = ?),
+                        price_max = (SELECT MAX(price) FROM rollup_rows WHERE persona = ? AND day = ?)
+                    WHERE persona = ? AND day = ? AND (price_min = ? OR price_max = ?)
+                    """,
+                    (persona, day, persona, day, persona, day, price, price)
+                )
+
+        for table, column, value in (("persona_daily_categories", "category", category), ("persona_daily_brands", "brand", brand)):
+            if value is None:
+                continue
+            cursor.execute(
+                f"INSERT OR IGNORE INTO {table}(persona, day, {column}) VALUES (?, ?, ?)", (persona, day, value)
+            )
+            cursor.execute(
+                f"UPDATE {table} SET products = products + ? WHERE persona = ? AND day = ? AND {column} = ?",
+                (sign, persona, day, value)
+            )
+            if sign < 0:
+                cursor.execute(f"DELETE FROM {table} WHERE products <= 0 AND persona = ? AND day = ?", (persona, day))
+
+    def apply_rows(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """저장된 행을 합계에 반영 (이미 반영된 id 는 이전 기여분을 빼고 다시 더함)"""
+        applied = 0
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                for row in rows:
+                    contribution = self._contribution(row)
+                    if contribution is None:
+                        self.stats["rows_skipped"] += 1
+                        continue
+
+                    row_id = str(row["id"])
+                    previous = cursor.execute(
+                        "SELECT persona, day, price, rating, score, category, brand FROM rollup_rows WHERE id = ?", (row_id,)
+                    ).fetchone()
+                    if previous:
+                        cursor.execute("DELETE FROM rollup_rows WHERE id = ?", (row_id,))
+                        self._add(cursor, tuple(previous), -1)
+                        self.stats["rows_replaced"] += 1
+
+                    cursor.execute("INSERT INTO rollup_rows VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (row_id, *contribution))
+                    self._add(cursor, contribution, 1)
+                    applied += 1
+
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+            self.stats["rows_applied"] += applied
+        return applied
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _window_start(self, days_back: int) -> str:
+        """days_back=1 → 오늘 (UTC), 7 → 오늘 포함 최근 7일"""
+        return (_utc_today() - timedelta(days=max(1, days_back) - 1)).isoformat()
+
+    def covers(self, days_back: int, persona_name: Optional[str] = None, supabase_client=None) -> bool:
+        """
+        요청 기간이 모두 집계되어 있는지 (backfill 이전 기간이면 False)
+
+        supabase_client 를 주면 이 저장소가 기간의 저장을 실제로 모두 받았는지도 확인합니다.
+        (다른 롤업 파일을 쓰는 writer 가 저장한 행이 있으면 원본 행 수와 달라 False)
+        """
+        start = self._window_start(days_back)
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM rollup_meta WHERE key = 'coverage_start'").fetchone()
+        if not row or row[0] > start:
+            return False
+        if supabase_client is None:
+            return True
+
+        with self._lock:
+            query = "SELECT COALESCE(SUM(products), 0) FROM persona_daily_rollups WHERE day >= ?"
+            params = [start]
+            if persona_name:
+                query += " AND persona = ?"
+                params.append(persona_name)
+            rolled_up = self._conn.execute(query, params).fetchone()[0]
+
+        try:
+            source = self._source_count(supabase_client, start, persona_name)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not verify persona rollups against Supabase: {e}")
+            return False
+
+        if source != rolled_up:
+            logger.info(f"📊 Persona rollups missing writes since {start} ({rolled_up}/{source} rows), scanning raw rows")
+            return False
+        return True
+
+    @staticmethod
+    def _source_count(supabase_client, start: str, persona_name: Optional[str] = None) -> int:
+        """기간 내 shopee_products 페르소나 행 수 (backfill 과 같은 조건)"""
+        supabase_client._ensure_client()
+        query = supabase_client.client.table("shopee_products") \
+            .select("id", count="exact") \
+            .gte("created_at", start) \
+            .not_.is_("discount_info->>persona_name", "null")
+        if persona_name:
+            query = query.eq("discount_info->>persona_name", persona_name)
+        response = query.limit(1).execute()
+        return response.count or 0
+
+    def summary(self, persona_name: str, days_back: int = 7) -> Dict[str, Any]:
+        """기간 합계 (analyze_products 의 통계 필드와 같은 형태)"""
+        start = self._window_start(days_back)
+        with self._lock:
+            totals = self._conn.execute(
+                """
+                SELECT COALESCE(SUM(products), 0), COALESCE(SUM(price_sum), 0), COALESCE(SUM(price_count), 0),
+                       MIN(price_min), MAX(price_max),
+                       COALESCE(SUM(rating_sum), 0), COALESCE(SUM(rating_count), 0),
+                       COALESCE(SUM(score_sum), 0), COALESCE(SUM(score_count), 0)
+                FROM persona_daily_rollups WHERE persona = ? AND day >= ?
+                """,
+                (persona_name, start)
+            ).fetchone()
+            categories = self._conn.execute(
+                "SELECT category, SUM(products) FROM persona_daily_categories WHERE persona = ? AND day >= ? "
+                "GROUP BY category ORDER BY SUM(products) DESC",
+                (persona_name, start)
+            ).fetchall()
+            brands = self._conn.execute(
+                "SELECT brand, SUM(products) FROM persona_daily_brands WHERE persona = ? AND day >= ? "
+                "GROUP BY brand ORDER BY SUM(products) DESC",
+                (persona_name, start)
+            ).fetchall()
+            self.stats["summaries"] += 1
+
+        products, price_sum, price_count, price_min, price_max, rating_sum, rating_count, score_sum, score_count = totals
+        return {
+            "total_products": int(products),
+            "avg_price": price_sum / price_count if price_count else 0,
+            "price_range": {"min": price_min, "max": price_max} if price_count else {"min": 0, "max": 0},
+            "avg_rating": rating_sum / rating_count if rating_count else 0,
+            "avg_persona_score": score_sum / score_count if score_count else 0,
+            "top_categories": {category: int(count) for category, count in categories if count > 0},
+            "brand_distribution": {brand: int(count) for brand, count in brands if count > 0}
+        }
+
+    # ------------------------------------------------------------------
+    # 백필
+    # ------------------------------------------------------------------
+
+    def backfill(self, supabase_client, days_back: int = 30, page_size: int = 1000) -> int:
+        """기존 shopee_products 페르소나 행으로 최근 N일 합계 채우기 (id 순 keyset 페이지)"""
+        start = self._window_start(days_back)
+        after_id = None
+        total = 0
+
+        supabase_client._ensure_client()
+        while True:
+            query = supabase_client.client.table("shopee_products") \
+                .select("id, created_at, collection_date, product_name, price, rating, category, discount_info") \
+                .gte("created_at", start) \
+                .not_.is_("discount_info->>persona_name", "null")
+            if after_id is not None:
+                query = query.gt("id", after_id)
+            rows = query.order("id").limit(page_size).execute().data or []
+            if not rows:
+                break
+
+            total += self.apply_rows(rows)
+            after_id = rows[-1]["id"]
+            if len(rows) < page_size:
+                break
+
+        with self._lock:
+            self._conn.execute(
+                "UPDATE rollup_meta SET value = MIN(value, ?) WHERE key = 'coverage_start'", (start,)
+            )
+            self._conn.commit()
+
+        logger.info(f"✅ Persona rollups backfilled from {start}: {total} rows")
+        return total
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            buckets = self._conn.execute("SELECT COUNT(*) FROM persona_daily_rollups").fetchone()[0]
+            rows = self._conn.execute("SELECT COUNT(*) FROM rollup_rows").fetchone()[0]
+            coverage = self._conn.execute("SELECT value FROM rollup_meta WHERE key = 'coverage_start'").fetchone()
+        return {**self.stats, "buckets": buckets, "rows": rows, "coverage_start": coverage[0] if coverage else None}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_rollup_store: Optional[PersonaRollupStore] = None
+_rollup_store_lock = threading.Lock()
+_rollups_disabled = False
+
+
+def get_rollup_store() -> Optional[PersonaRollupStore]:
+    """프로세스 공용 롤업 저장소 (PERSONA_ROLLUPS_ENABLED=false 또는 초기화 실패 시 None)"""
+    global _rollup_store, _rollups_disabled
+    default_enabled = "false" if os.environ.get('TESTING') == 'true' else "true"
+    if _rollups_disabled or os.getenv("PERSONA_ROLLUPS_ENABLED", default_enabled).lower() != "true":
+        return None
+
+    with _rollup_store_lock:
+        if _rollup_store is None:
+            try:
+                _rollup_store = PersonaRollupStore()
+            except Exception as e:
+                logger.warning(f"⚠️ Persona rollups unavailable, reports will scan raw rows: {e}")
+                _rollups_disabled = True
+        return _rollup_store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill per-persona daily rollups from Supabase")
+    parser.add_argument("--days", type=int, default=30, help="Number of days to backfill")
+    parser.add_argument("--page-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    project_root = Path(__file__).parent.parent
+    sys.path.insert(0, str(project_root))
+    from database.supabase_client import SupabaseClient
+
+    store = PersonaRollupStore()
+    store.backfill(SupabaseClient(), days_back=args.days, page_size=args.page_size)
+    print(f"📊 {store.get_stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
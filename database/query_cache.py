@@ -0,0 +1,178 @@
+"""
+Read-through cache for Supabase read queries.
+get_latest_* / 페르소나 상품 조회 결과를 테이블별 TTL 동안 메모리에 보관하고,
+같은 테이블에 저장이 일어나면 해당 테이블 항목을 모두 무효화합니다.
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 테이블별 TTL (초) - 수집 주기가 긴 테이블일수록 길게
+DEFAULT_TABLE_TTLS = {
+    "google_trends": 600,
+    "shopee_products": 120,
+    "tiktok_shop_products": 300,
+    "tiktok_videos": 300,
+    "tiktok_hashtags": 300,
+    "local_events": 900,
+}
+
+DEFAULT_TTL = int(os.getenv("QUERY_CACHE_DEFAULT_TTL", "60"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "256"))
+
+
+class QueryCache:
+    """
+    테이블 단위 무효화를 지원하는 TTL + LRU 캐시
+
+    - 키: (테이블, 조회 종류와 인자)
+    - max_entries 를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - loader 예외는 캐시하지 않고 그대로 전파 (호출 측의 기존 오류 처리 유지)
+    - 캐시된 행 목록은 호출자 간에 공유되므로 수정하지 말 것 (리스트는 복사해서 반환)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = DEFAULT_TTL,
+        enabled: Optional[bool] = None
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수 (LRU)
+            ttls: 테이블별 TTL (초, 0 이면 캐시하지 않음)
+            default_ttl: ttls 에 없는 테이블의 TTL
+            enabled: False 면 항상 loader 호출 (기본값: QUERY_CACHE_ENABLED, 테스트 환경에서는 비활성화)
+        """
+        if enabled is None:
+            default_enabled = "false" if os.environ.get('TESTING') == 'true' else "true"
+            enabled = os.getenv("QUERY_CACHE_ENABLED", default_enabled).lower() == "true"
+
+        self.enabled = enabled
+        self.max_entries = max(1, max_entries)
+        self.ttls = dict(DEFAULT_TABLE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._table_generation: Dict[str, int] = {}
+        self._listeners: List[Callable[[str], None]] = []
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _table_stats(self, table: str) -> Dict[str, int]:
+        if table not in self._stats:
+            self._stats[table] = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "invalidations": 0}
+        return self._stats[table]
+
+    def ttl_for(self, table: str) -> float:
+        return self.ttls.get(table, self.default_ttl)
+
+    def get_or_load(self, table: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """캐시된 결과 반환, 없거나 만료되었으면 loader 결과를 저장 후 반환"""
+        ttl = self.ttl_for(table)
+        if not self.enabled or ttl <= 0:
+            return loader()
+
+        cache_key = (table, key)
+        with self._lock:
+            stats = self._table_stats(table)
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(cache_key)
+                    stats["hits"] += 1
+                    return self._copy(value)
+                del self._entries[cache_key]
+                stats["expired"] += 1
+            stats["misses"] += 1
+            generation = self._table_generation.get(table, 0)
+
+        value = loader()
+
+        with self._lock:
+            # 조회 중에 저장(무효화)이 일어났다면 오래된 결과일 수 있으므로 보관하지 않음
+            if self._table_generation.get(table, 0) == generation:
+                self._entries[cache_key] = (time.monotonic() + ttl, value)
+                self._entries.move_to_end(cache_key)
+                while len(self._entries) > self.max_entries:
+                    (evicted_table, _), _ = self._entries.popitem(last=False)
+                    self._table_stats(evicted_table)["evictions"] += 1
+
+        return self._copy(value)
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        return list(value) if isinstance(value, list) else value
+
+    def invalidate(self, table: str):
+        """테이블의 캐시 항목 제거 후 리스너 호출 (insert_* / bulk_write 저장 후 호출됨)"""
+        with self._lock:
+            self._table_generation[table] = self._table_generation.get(table, 0) + 1
+            keys = [cache_key for cache_key in self._entries if cache_key[0] == table]
+            for cache_key in keys:
+                del self._entries[cache_key]
+            self._table_stats(table)["invalidations"] += 1
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            try:
+                listener(table)
+            except Exception as e:
+                logger.warning(f"⚠️ Cache invalidation listener failed for {table}: {e}")
+
+    def clear(self):
+        """모든 항목 제거 (통계는 유지)"""
+        with self._lock:
+            for table in {cache_key[0] for cache_key in self._entries}:
+                self._table_generation[table] = self._table_generation.get(table, 0) + 1
+            self._entries.clear()
+
+    def add_invalidation_listener(self, listener: Callable[[str], None]):
+        """테이블이 무효화될 때 호출할 콜백 등록 (예: 상위 응답 캐시 무효화)"""
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """테이블별 hit/miss 통계와 적중률"""
+        with self._lock:
+            tables = {}
+            for table, stats in self._stats.items():
+                lookups = stats["hits"] + stats["misses"]
+                tables[table] = {
+                    **stats,
+                    "entries": sum(1 for cache_key in self._entries if cache_key[0] == table),
+                    "ttl": self.ttl_for(table),
+                    "hit_rate": round(stats["hits"] / lookups, 3) if lookups else 0.0
+                }
+            hits = sum(stats["hits"] for stats in self._stats.values())
+            misses = sum(stats["misses"] for stats in self._stats.values())
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+                "tables": tables
+            }
+
+
+_query_cache: Optional[QueryCache] = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_cache() -> QueryCache:
+    """프로세스 공용 QueryCache 반환"""
+    global _query_cache
+    with _query_cache_lock:
+        if _query_cache is None:
+            _query_cache = QueryCache()
+        return _query_cache
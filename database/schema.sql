@@ -106,6 +106,7 @@ CREATE TABLE IF NOT EXISTS local_events (
     is_recurring BOOLEAN DEFAULT FALSE, -- True for weekly/monthly events
     parsed_start_date DATE, -- Parsed start date if extractable
     parsed_end_date DATE, -- Parsed end date if extractable
+    event_cluster_id VARCHAR(40), -- Same value for near-duplicate listings across sources/days
     created_at TIMESTAMPTZ DEFAULT NOW(),
     
     -- Ensure we don't duplicate events from the same source
@@ -116,16 +117,19 @@ CREATE TABLE IF NOT EXISTS local_events (
 CREATE INDEX IF NOT EXISTS idx_google_trends_collection_date ON google_trends(collection_date);
 CREATE INDEX IF NOT EXISTS idx_google_trends_keyword ON google_trends(keyword);
 CREATE INDEX IF NOT EXISTS idx_google_trends_trend_type ON google_trends(trend_type);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_google_trends_natural_key ON google_trends(keyword, trend_type, collection_date);
 
 CREATE INDEX IF NOT EXISTS idx_shopee_products_collection_date ON shopee_products(collection_date);
 CREATE INDEX IF NOT EXISTS idx_shopee_products_search_keyword ON shopee_products(search_keyword);
 CREATE INDEX IF NOT EXISTS idx_shopee_products_price ON shopee_products(price);
 CREATE INDEX IF NOT EXISTS idx_shopee_products_rating ON shopee_products(rating);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_shopee_products_natural_key ON shopee_products(product_url, collection_date);
 
 CREATE INDEX IF NOT EXISTS idx_tiktok_videos_collection_date ON tiktok_videos(collection_date);
 CREATE INDEX IF NOT EXISTS idx_tiktok_videos_hashtag ON tiktok_videos(hashtag);
 CREATE INDEX IF NOT EXISTS idx_tiktok_videos_view_count ON tiktok_videos(view_count);
 CREATE INDEX IF NOT EXISTS idx_tiktok_videos_is_trending ON tiktok_videos(is_trending);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_tiktok_videos_natural_key ON tiktok_videos(video_id, collection_date);
 
 -- TikTok Shop Products Indexes
 CREATE INDEX IF NOT EXISTS idx_tiktok_shop_collection_date ON tiktok_shop_products(collection_date);
@@ -135,6 +139,7 @@ CREATE INDEX IF NOT EXISTS idx_tiktok_shop_rating ON tiktok_shop_products(rating
 CREATE INDEX IF NOT EXISTS idx_tiktok_shop_category ON tiktok_shop_products(category);
 CREATE INDEX IF NOT EXISTS idx_tiktok_shop_is_flash_sale ON tiktok_shop_products(is_flash_sale);
 CREATE INDEX IF NOT EXISTS idx_tiktok_shop_is_trending ON tiktok_shop_products(is_trending);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_tiktok_shop_products_natural_key ON tiktok_shop_products(product_url, collection_date);
 
 -- Local Events Indexes
 CREATE INDEX IF NOT EXISTS idx_local_events_collection_date ON local_events(collection_date);
@@ -142,6 +147,7 @@ CREATE INDEX IF NOT EXISTS idx_local_events_source_website ON local_events(sourc
 CREATE INDEX IF NOT EXISTS idx_local_events_event_type ON local_events(event_type);
 CREATE INDEX IF NOT EXISTS idx_local_events_parsed_start_date ON local_events(parsed_start_date);
 CREATE INDEX IF NOT EXISTS idx_local_events_location ON local_events(event_location);
+CREATE INDEX IF NOT EXISTS idx_local_events_cluster ON local_events(event_cluster_id);
 
 -- Create a view for trending analysis
 CREATE OR REPLACE VIEW trending_summary AS
@@ -2,17 +2,27 @@
 Supabase client module.
 Handles database operations with Supabase.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import atexit
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from .pagination import keyset_filter, split_page
+from .query_cache import get_query_cache
+from .table_stats import get_table_stats
+
 class SupabaseClient:
     """Supabase 데이터베이스 클라이언트"""
     
     _instance = None
     client: Optional[Client] = None
+    last_write_stats: Optional[Dict[str, Any]] = None  # 마지막 bulk_write 결과
+    spool = None  # WriteSpool (insert_* 는 저장 전에 먼저 스풀에 기록)
+    _spool_disabled = False
+    _spool_replayer = None
+    query_cache = None  # QueryCache (get_latest_* / 페르소나 상품 조회 결과, 저장 시 테이블 단위 무효화)
 
     def __new__(cls):
         if cls._instance is None:
@@ -41,63 +51,267 @@ class SupabaseClient:
             self.client = get_singleton_client()
             self._initialized = True
     
-    def insert_google_trends(self, data: Dict[str, Any]) -> None:
-        """Google Trends 데이터 저장"""
-        self._ensure_client()
+    # 테이블별 자연 키 (upsert on_conflict 대상, 마이그레이션의 UNIQUE 인덱스와 일치해야 함)
+    NATURAL_KEYS = {
+        "google_trends": ("keyword", "trend_type", "collection_date"),
+        "shopee_products": ("product_url", "collection_date"),
+        "tiktok_shop_products": ("product_url", "collection_date"),
+        "tiktok_videos": ("video_id", "collection_date"),
+        "local_events": ("source_url", "event_name"),
+    }
+    
+    # 한 번의 요청으로 보낼 최대 행 수
+    DEFAULT_CHUNK_SIZE = int(os.getenv("SUPABASE_CHUNK_SIZE", "500"))
+    
+    def _get_spool(self):
+        """로컬 스풀 반환 (SUPABASE_SPOOL_ENABLED=false 이면 비활성화)"""
+        default_enabled = "false" if os.environ.get('TESTING') == 'true' else "true"
+        if self.spool is None and not self._spool_disabled and os.getenv("SUPABASE_SPOOL_ENABLED", default_enabled).lower() == "true":
+            try:
+                from .write_spool import WriteSpool
+                SupabaseClient.spool = WriteSpool()
+                # 종료 시 잠금 해제 (남은 항목은 다음 프로세스의 replay 가 이어받음)
+                atexit.register(SupabaseClient.spool.close)
+            except Exception as e:
+                print(f"⚠️ Write spool unavailable, writing without local durability: {e}")
+                SupabaseClient._spool_disabled = True
+        return self.spool
+    
+    def get_spool_replayer(self):
+        """스풀 재전송기 반환 (스풀 비활성화 시 None)"""
+        spool = self._get_spool()
+        if spool is None:
+            return None
+        if self._spool_replayer is None:
+            from .write_spool import SpoolReplayer
+            SupabaseClient._spool_replayer = SpoolReplayer(self, spool)
+        return self._spool_replayer
+    
+    def _cached_query(self, table: str, key: Tuple[Any, ...], loader):
+        """읽기 전용 조회를 QueryCache 를 거쳐 실행 (loader 예외는 그대로 전파)"""
+        if self.query_cache is None:
+            SupabaseClient.query_cache = get_query_cache()
+        return self.query_cache.get_or_load(table, key, loader)
+    
+    def invalidate_cache(self, table: str):
+        """테이블의 캐시된 조회 결과 무효화"""
+        if self.query_cache is None:
+            SupabaseClient.query_cache = get_query_cache()
+        self.query_cache.invalidate(table)
+    
+    def _update_rollups(self, rows: List[Dict[str, Any]]):
+        """저장된 상품 행을 페르소나 일별 합계에 반영 (실패해도 저장 결과에는 영향 없음)"""
+        try:
+            from .persona_rollups import get_rollup_store
+            store = get_rollup_store()
+            if store is not None and rows:
+                store.apply_rows(rows)
+        except Exception as e:
+            print(f"⚠️ Failed to update persona rollups: {e}")
+    
+    def _write_records(self, table: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """스풀에 먼저 기록한 뒤 일괄 저장, 성공 시 ack (실패분은 재전송 대상으로 남김)"""
+        spool = self._get_spool() if records else None
+        seq = spool.append(table, records) if spool else None
+        
+        stats = self.bulk_write(table, records, on_conflict=self.NATURAL_KEYS.get(table))
+        
+        if seq is not None:
+            if stats["failed"] == 0:
+                spool.ack(seq)
+            else:
+                spool.release(seq)
+                print(f"💾 {stats['failed']} {table} rows kept in local spool for replay")
+        
+        return stats
+    
+    def bulk_write(
+        self,
+        table: str,
+        records: List[Dict[str, Any]],
+        on_conflict: Optional[Tuple[str, ...]] = None,
+        chunk_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        레코드를 청크 단위로 일괄 저장 (on_conflict 지정 시 upsert)
+        
+        실패한 청크는 절반씩 나눠 다시 시도하여 문제 행만 격리합니다.
+        
+        Args:
+            table: 대상 테이블
+            records: 저장할 레코드 (이미 스키마 형식으로 변환된 dict)
+            on_conflict: upsert 기준 컬럼 (None 이면 일반 insert)
+            chunk_size: 요청당 최대 행 수
+        
+        Returns:
+            {"table", "records", "written", "failed", "requests", "data"}
+        """
+        chunk_size = max(1, chunk_size or self.DEFAULT_CHUNK_SIZE)
+        
+        stats = {
+            "table": table, "records": len(records), "written": 0, "failed": 0,
+            "requests": 0, "connection_error": False, "data": []
+        }
+        if not records:
+            return stats
+        
+        try:
+            self._ensure_client()
+        except Exception as e:
+            print(f"❌ Supabase client unavailable for {table}: {e}")
+            stats.update({"failed": len(records), "connection_error": True})
+            self.last_write_stats = stats
+            return stats
+        
+        if on_conflict:
+            records = self._dedupe_by_key(records, on_conflict)
+        
+        for start in range(0, len(records), chunk_size):
+            self._write_chunk(table, records[start:start + chunk_size], on_conflict, stats)
+        
+        if stats["written"]:
+            self.invalidate_cache(table)
+            get_table_stats().record_write(table, stats["written"])
+            if table == "shopee_products":
+                self._update_rollups(stats["data"])
+        
+        if stats["failed"]:
+            print(f"⚠️ {table}: wrote {stats['written']}/{len(records)} rows in {stats['requests']} requests ({stats['failed']} failed)")
+        
+        self.last_write_stats = stats
+        return stats
+    
+    def _write_chunk(self, table: str, chunk: List[Dict[str, Any]], on_conflict: Optional[Tuple[str, ...]], stats: Dict[str, Any]):
+        """청크 하나 저장, 실패 시 이분할 재시도 (연결 오류는 분할하지 않고 중단)"""
+        if stats.get("connection_error"):
+            stats["failed"] += len(chunk)
+            return
+        
         try:
-            # Google Trends 데이터를 개별 키워드별로 저장
-            keywords = data.get("keywords", [])
-            interest_data = data.get("interest_over_time", {})
-            related_queries = data.get("related_queries", {})
-            collection_timestamp = data.get("collected_at", datetime.now().isoformat())
+            stats["requests"] += 1
+            query = self.client.table(table)
+            if on_conflict:
+                response = query.upsert(chunk, on_conflict=",".join(on_conflict)).execute()
+            else:
+                response = query.insert(chunk).execute()
             
-            for keyword in keywords:
-                # 각 키워드별로 레코드 생성
-                record = {
-                    "collection_date": collection_timestamp,
-                    "trend_type": "search_trends",
-                    "keyword": keyword,
-                    "search_volume": None,  # pytrends doesn't provide absolute volume
-                    "related_topics": {
-                        "interest_over_time": interest_data,
-                        "related_queries": related_queries.get(keyword, {})
-                    },
-                    "region": "PH",
-                    "timeframe": "today 3-m"
-                }
-                
-                self.client.table("google_trends").insert(record).execute()
+            stats["written"] += len(chunk)
+            stats["data"].extend(getattr(response, "data", None) or [])
+            
+        except Exception as e:
+            if self._is_connection_error(e):
+                # 데이터 문제가 아니므로 분할해도 소용 없음 - 남은 청크도 건너뜀
+                stats["connection_error"] = True
+                stats["failed"] += len(chunk)
+                print(f"❌ Connection error while writing to {table}: {e}")
+                return
+            
+            if len(chunk) == 1:
+                stats["failed"] += 1
+                print(f"❌ Failed to write row to {table}: {e}")
+                return
+            
+            middle = len(chunk) // 2
+            self._write_chunk(table, chunk[:middle], on_conflict, stats)
+            self._write_chunk(table, chunk[middle:], on_conflict, stats)
+    
+    @staticmethod
+    def _is_connection_error(error: Exception) -> bool:
+        """네트워크/연결 계열 오류인지 확인 (httpx 예외 포함)"""
+        if isinstance(error, (ConnectionError, TimeoutError)):
+            return True
+        connection_error_names = {
+            "ConnectError", "ConnectTimeout", "ReadTimeout", "WriteTimeout", "PoolTimeout",
+            "NetworkError", "RemoteProtocolError", "ReadError", "WriteError"
+        }
+        return any(cls.__name__ in connection_error_names for cls in type(error).__mro__)
+    
+    def _dedupe_by_key(self, records: List[Dict[str, Any]], key_columns: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """
+        같은 요청 안의 자연 키 중복 제거 (마지막 값 유지)
+        
+        Postgres 는 한 번의 upsert 에서 같은 행을 두 번 갱신할 수 없으므로 필요합니다.
+        키 컬럼에 NULL 이 있는 행은 충돌하지 않으므로 그대로 둡니다.
+        """
+        unique = {}
+        for index, record in enumerate(records):
+            key = tuple(record.get(column) for column in key_columns)
+            if any(value is None for value in key):
+                key = ("__no_key__", index)
+            unique[key] = record
+        return list(unique.values())
+    
+    def _format_google_trends_records(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Google Trends 수집 결과를 키워드별 레코드로 변환"""
+        keywords = data.get("keywords", [])
+        interest_data = data.get("interest_over_time", {})
+        related_queries = data.get("related_queries", {})
+        collection_timestamp = data.get("collected_at", datetime.now().isoformat())
+        
+        return [
+            {
+                "collection_date": collection_timestamp,
+                "trend_type": "search_trends",
+                "keyword": keyword,
+                "search_volume": None,  # pytrends doesn't provide absolute volume
+                "related_topics": {
+                    "interest_over_time": interest_data,
+                    "related_queries": related_queries.get(keyword, {})
+                },
+                "region": "PH",
+                "timeframe": "today 3-m"
+            }
+            for keyword in keywords
+        ]
+    
+    def _format_shopee_product(self, product: Dict[str, Any], type: str = "top_sales") -> Dict[str, Any]:
+        """
+        제품 데이터를 shopee_products 스키마로 변환
+        
+        스크래퍼 원본 키(name/url/image)와 이미 변환된 키(product_name/product_url/image_url) 모두 지원합니다.
+        """
+        discount_info = product.get("discount_info")
+        if not isinstance(discount_info, dict):
+            discount_info = {"original_price": product.get("original_price"), "discount": product.get("discount")} if product.get("discount") else {}
+        
+        return {
+            "collection_date": product.get("collected_at", product.get("collection_date", datetime.now().isoformat())),
+            "search_keyword": product.get("search_keyword", type),
+            "product_name": product.get("name") or product.get("product_name") or product.get("title", "Unknown Product"),
+            "seller_name": product.get("seller", product.get("shop_name", product.get("seller_name"))),
+            "price": self._parse_price(product.get("price")),
+            "currency": "PHP",
+            "rating": self._parse_rating(product.get("rating")),
+            "review_count": self._parse_number(product.get("reviews", product.get("review_count"))),
+            "sales_count": self._parse_number(product.get("sales", product.get("sold"))),
+            "product_url": product.get("url") or product.get("link") or product.get("product_url"),
+            "image_url": product.get("image", product.get("image_url")),
+            "category": product.get("category"),
+            "location": product.get("location"),
+            "discount_info": discount_info
+        }
+    
+    def insert_google_trends(self, data: Dict[str, Any]) -> bool:
+        """Google Trends 데이터 저장 (키워드별 레코드, 일괄 upsert)"""
+        try:
+            records = self._format_google_trends_records(data)
+            stats = self._write_records("google_trends", records)
+            return stats["failed"] == 0
                 
         except Exception as e:
             print(f"Error inserting Google Trends data: {e}")
+            return False
     
-    def insert_shopee_products(self, products: List[Dict[str, Any]], type: str = "top_sales") -> None:
-        """Shopee 제품 데이터 저장"""
-        self._ensure_client()
+    def insert_shopee_products(self, products: List[Dict[str, Any]], type: str = "top_sales") -> bool:
+        """Shopee 제품 데이터 저장 (일괄 upsert)"""
         try:
-            for product in products:
-                # Shopee 제품 데이터를 스키마에 맞게 변환
-                record = {
-                    "collection_date": product.get("collected_at", datetime.now().isoformat()),
-                    "search_keyword": product.get("search_keyword", type),
-                    "product_name": product.get("name", product.get("title", "Unknown Product")),
-                    "seller_name": product.get("seller", product.get("shop_name")),
-                    "price": self._parse_price(product.get("price")),
-                    "currency": "PHP",
-                    "rating": self._parse_rating(product.get("rating")),
-                    "review_count": self._parse_number(product.get("reviews", product.get("review_count"))),
-                    "sales_count": self._parse_number(product.get("sales", product.get("sold"))),
-                    "product_url": product.get("url", product.get("link")),
-                    "image_url": product.get("image"),
-                    "category": product.get("category"),
-                    "location": product.get("location"),
-                    "discount_info": {"original_price": product.get("original_price"), "discount": product.get("discount")} if product.get("discount") else {}
-                }
-                
-                self.client.table("shopee_products").insert(record).execute()
+            records = [self._format_shopee_product(product, type) for product in products]
+            stats = self._write_records("shopee_products", records)
+            return stats["failed"] == 0
                 
         except Exception as e:
             print(f"Error inserting Shopee products: {e}")
+            return False
     
     def _parse_price(self, price_str) -> float:
         """가격 문자열을 float로 변환"""
@@ -134,57 +348,57 @@ class SupabaseClient:
         except:
             return None
     
-    def insert_tiktok_hashtags(self, hashtags: List[Dict[str, Any]]) -> None:
-        """TikTok 해시태그 데이터 저장"""
-        self._ensure_client()
+    def insert_tiktok_hashtags(self, hashtags: List[Dict[str, Any]]) -> bool:
+        """TikTok 해시태그 데이터 저장 (일괄 insert)"""
         try:
-            for hashtag in hashtags:
-                self.client.table("tiktok_hashtags").insert({
-                    **hashtag,
-                    "created_at": datetime.now().isoformat()
-                }).execute()
+            created_at = datetime.now().isoformat()
+            records = [{**hashtag, "created_at": created_at} for hashtag in hashtags]
+            stats = self._write_records("tiktok_hashtags", records)
+            return stats["failed"] == 0
         except Exception as e:
             print(f"Error inserting TikTok hashtags: {e}")
+            return False
     
-    def insert_tiktok_videos(self, videos: List[Dict[str, Any]]) -> None:
-        """TikTok 비디오 데이터 저장"""
-        self._ensure_client()
+    def _format_tiktok_video(self, video: Dict[str, Any]) -> Dict[str, Any]:
+        """TikTok 비디오 데이터를 스키마에 맞게 변환"""
+        return {
+            "collection_date": video.get("collected_at", datetime.now().isoformat()),
+            "hashtag": ",".join(video.get("hashtags", [])) if video.get("hashtags") else "unknown",
+            "video_url": video.get("video_url"),
+            "video_id": video.get("video_id"),
+            "uploader_name": video.get("author_name"),
+            "uploader_username": video.get("author_username"),
+            "view_count": video.get("view_count"),
+            "like_count": video.get("like_count"),
+            "comment_count": video.get("comment_count"),
+            "share_count": video.get("share_count"),
+            "video_title": video.get("title"),
+            "video_description": video.get("description"),
+            "used_hashtags": video.get("hashtags", []),
+            "sound_info": {"title": video.get("music_title")} if video.get("music_title") else {},
+            "is_trending": True  # All collected videos are considered trending
+        }
+    
+    def insert_tiktok_videos(self, videos: List[Dict[str, Any]]) -> bool:
+        """TikTok 비디오 데이터 저장 (일괄 upsert)"""
         try:
-            for video in videos:
-                # TikTok 비디오 데이터를 스키마에 맞게 변환
-                record = {
-                    "collection_date": video.get("collected_at", datetime.now().isoformat()),
-                    "hashtag": ",".join(video.get("hashtags", [])) if video.get("hashtags") else "unknown",
-                    "video_url": video.get("video_url"),
-                    "video_id": video.get("video_id"),
-                    "uploader_name": video.get("author_name"),
-                    "uploader_username": video.get("author_username"),
-                    "view_count": video.get("view_count"),
-                    "like_count": video.get("like_count"),
-                    "comment_count": video.get("comment_count"),
-                    "share_count": video.get("share_count"),
-                    "video_title": video.get("title"),
-                    "video_description": video.get("description"),
-                    "used_hashtags": video.get("hashtags", []),
-                    "sound_info": {"title": video.get("music_title")} if video.get("music_title") else {},
-                    "is_trending": True  # All collected videos are considered trending
-                }
-                
-                self.client.table("tiktok_videos").insert(record).execute()
+            records = [self._format_tiktok_video(video) for video in videos]
+            stats = self._write_records("tiktok_videos", records)
+            return stats["failed"] == 0
                 
         except Exception as e:
             print(f"Error inserting TikTok videos: {e}")
+            return False
     
     def get_latest_google_trends(self, limit: int = 10) -> List[Dict[str, Any]]:
         """최근 Google Trends 데이터 조회"""
         self._ensure_client()
         try:
-            response = self.client.table("google_trends") \
+            return self._cached_query("google_trends", ("latest", limit), lambda: self.client.table("google_trends") \
                 .select("*") \
                 .order("created_at", desc=True) \
                 .limit(limit) \
-                .execute()
-            return response.data
+                .execute().data)
         except Exception as e:
             print(f"Error fetching Google Trends data: {e}")
             return []
@@ -192,13 +406,12 @@ class SupabaseClient:
     def get_latest_shopee_products(self, type: str = "top_sales", limit: int = 50) -> List[Dict[str, Any]]:
         """최근 Shopee 제품 데이터 조회"""
         try:
-            response = self.client.table("shopee_products") \
+            return self._cached_query("shopee_products", ("latest", type, limit), lambda: self.client.table("shopee_products") \
                 .select("*") \
                 .eq("type", type) \
                 .order("created_at", desc=True) \
                 .limit(limit) \
-                .execute()
-            return response.data
+                .execute().data)
         except Exception as e:
             print(f"Error fetching Shopee products: {e}")
             return []
@@ -206,90 +419,77 @@ class SupabaseClient:
     def get_latest_tiktok_hashtags(self, limit: int = 20) -> List[Dict[str, Any]]:
         """최근 TikTok 해시태그 데이터 조회"""
         try:
-            response = self.client.table("tiktok_hashtags") \
+            return self._cached_query("tiktok_hashtags", ("latest", limit), lambda: self.client.table("tiktok_hashtags") \
                 .select("*") \
                 .order("created_at", desc=True) \
                 .limit(limit) \
-                .execute()
-            return response.data
+                .execute().data)
         except Exception as e:
             print(f"Error fetching TikTok hashtags: {e}")
             return []
     
     def get_latest_tiktok_videos(self, hashtag: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
         """최근 TikTok 비디오 데이터 조회"""
-        try:
+        def load():
             query = self.client.table("tiktok_videos").select("*")
             
             if hashtag:
                 query = query.eq("hashtag", hashtag)
             
-            response = query \
+            return query \
                 .order("created_at", desc=True) \
                 .limit(limit) \
-                .execute()
-            return response.data
+                .execute().data
+        
+        try:
+            return self._cached_query("tiktok_videos", ("latest", hashtag, limit), load)
         except Exception as e:
             print(f"Error fetching TikTok videos: {e}")
             return []
     
-    def insert_tiktok_shop_products(self, products: List[Dict[str, Any]]) -> None:
-        """TikTok Shop 상품 데이터 저장"""
-        self._ensure_client()
-        
+    def _format_tiktok_shop_product(self, product: Dict[str, Any]) -> Dict[str, Any]:
+        """TikTok Shop 상품 데이터를 스키마에 맞게 변환"""
+        return {
+            "collection_date": product.get("collection_date", datetime.now().isoformat()),
+            "source_type": product.get("source_type", "unknown"),
+            "product_name": product.get("product_name", "Unknown Product"),
+            "price": product.get("price_numeric"),
+            "currency": "PHP",
+            "discount_price": product.get("original_price_numeric"),
+            "discount_percentage": product.get("discount_percentage"),
+            "seller_name": product.get("seller_info", "Unknown Seller"),
+            "seller_id": None,  # TikTok Shop 스크래퍼에서 추출하면 업데이트
+            "rating": product.get("rating_numeric"),
+            "sales_count": product.get("sales_count_numeric"),
+            "product_url": product.get("product_url"),
+            "image_url": product.get("image_url"),
+            "category": product.get("category"),
+            "subcategory": None,
+            "brand": None,
+            "is_flash_sale": product.get("source_type") == "flash_sale",
+            "is_trending": False,
+            "is_sponsored": False,
+            "product_tags": [],
+            "product_description": product.get("product_name"),  # 기본적으로 상품명 사용
+            "shipping_info": {},
+            "stock_count": None  # 재고 정보는 상세페이지에서만 가능
+        }
+    
+    def insert_tiktok_shop_products(self, products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """TikTok Shop 상품 데이터 저장 (일괄 upsert, 실패 청크는 이분할로 격리)"""
         if not products:
             print("⚠️ No products to insert")
-            return
+            return []
 
         try:
-            # TikTok Shop 상품 데이터를 적절한 형식으로 변환
-            formatted_products = []
-            
-            for product in products:
-                # 상품 ID 생성 (URL에서 추출 또는 고유 식별자 생성)
-                product_id = self._extract_product_id(product)
-                
-                formatted_product = {
-                    "collection_date": product.get("collection_date", datetime.now().isoformat()),
-                    "source_type": product.get("source_type", "unknown"),
-                    "product_name": product.get("product_name", "Unknown Product"),
-                    "price": product.get("price_numeric"),
-                    "currency": "PHP",
-                    "discount_price": product.get("original_price_numeric"),
-                    "discount_percentage": product.get("discount_percentage"),
-                    "seller_name": product.get("seller_info", "Unknown Seller"),
-                    "seller_id": None,  # TikTok Shop 스크래퍼에서 추출하면 업데이트
-                    "rating": product.get("rating_numeric"),
-                    "sales_count": product.get("sales_count_numeric"),
-                    "product_url": product.get("product_url"),
-                    "image_url": product.get("image_url"),
-                    "category": product.get("category"),
-                    "subcategory": None,
-                    "brand": None,
-                    "is_flash_sale": product.get("source_type") == "flash_sale",
-                    "is_trending": False,
-                    "is_sponsored": False,
-                    "product_tags": [],
-                    "product_description": product.get("product_name"),  # 기본적으로 상품명 사용
-                    "shipping_info": {},
-                    "stock_count": None  # 재고 정보는 상세페이지에서만 가능
-                }
-                
-                formatted_products.append(formatted_product)
-            
-            # 배치로 데이터 삽입
-            if formatted_products:
-                response = self.client.table("tiktok_shop_products").insert(formatted_products).execute()
-                print(f"✅ Inserted {len(formatted_products)} TikTok Shop products to database")
-                return response.data
-            else:
-                print("⚠️ No TikTok Shop products to insert")
-                return []
+            formatted_products = [self._format_tiktok_shop_product(product) for product in products]
+            stats = self._write_records("tiktok_shop_products", formatted_products)
+            print(f"✅ Inserted {stats['written']} TikTok Shop products to database ({stats['requests']} requests)")
+            return stats["data"]
                 
         except Exception as e:
             print(f"❌ Error inserting TikTok Shop products: {e}")
-            # 개별 삽입 시도 (일부 데이터라도 저장)
-            return self._insert_tiktok_shop_products_individually(products)
+            return []
     
     def _extract_product_id(self, product: Dict[str, Any]) -> str:
         """상품 URL에서 상품 ID 추출 또는 고유 ID 생성"""
@@ -317,94 +517,141 @@ class SupabaseClient:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
             return f"tiktok_unknown_{timestamp}"
     
-    def _insert_tiktok_shop_products_individually(self, products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """TikTok Shop 상품을 개별적으로 삽입 (배치 삽입 실패 시 fallback)"""
-        successfully_inserted = []
-        
-        for i, product in enumerate(products):
-            try:
-                formatted_product = {
-                    "collection_date": product.get("collection_date", datetime.now().isoformat()),
-                    "source_type": product.get("source_type", "unknown"),
-                    "product_name": product.get("product_name", "Unknown Product"),
-                    "seller_name": product.get("seller_info", "Unknown Seller"),
-                    "price": product.get("price_numeric"),
-                    "currency": "PHP",
-                    "rating": product.get("rating_numeric"),
-                    "sales_count": product.get("sales_count_numeric"),
-                    "product_url": product.get("product_url"),
-                    "image_url": product.get("image_url"),
-                    "category": product.get("category")
-                }
-                
-                response = self.client.table("tiktok_shop_products").insert(formatted_product).execute()
-                successfully_inserted.append(response.data[0] if response.data else formatted_product)
-                print(f"✅ Individual insert successful for product {i+1}")
-                
-            except Exception as e:
-                print(f"❌ Failed to insert individual product {i+1}: {e}")
-                continue
-        
-        print(f"💾 Successfully inserted {len(successfully_inserted)}/{len(products)} TikTok Shop products individually")
-        return successfully_inserted
-    
     def get_latest_tiktok_shop_products(self, source_type: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
         """최근 TikTok Shop 상품 데이터 조회"""
-        try:
+        def load():
             query = self.client.table("tiktok_shop_products").select("*")
             
             if source_type:
                 query = query.eq("source_type", source_type)
             
-            response = query \
+            return query \
                 .order("collection_date", desc=True) \
                 .limit(limit) \
-                .execute()
-            
-            return response.data
+                .execute().data
+        
+        try:
+            return self._cached_query("tiktok_shop_products", ("latest", source_type, limit), load)
         except Exception as e:
             print(f"❌ Error fetching TikTok Shop products: {e}")
             return []
     
-    def insert_local_events(self, events: List[Dict[str, Any]]) -> None:
-        """로컬 이벤트 데이터 저장"""
-        self._ensure_client()
+    def _format_local_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """로컬 이벤트 데이터를 스키마에 맞게 변환"""
+        record = {
+            "collection_date": event.get("collection_date", datetime.now().isoformat()),
+            "event_name": event.get("event_name"),
+            "event_dates": event.get("event_dates"),
+            "event_location": event.get("event_location"),
+            "event_description": event.get("event_description"),
+            "source_url": event.get("source_url"),
+            "source_website": event.get("source_website"),
+            "event_type": event.get("event_type", "lifestyle_event"),
+            "event_tags": event.get("event_tags", []),
+            "is_recurring": event.get("is_recurring", False)
+        }
+        # 유사 중복 클러스터링을 거친 이벤트만 (컬럼이 없는 기존 DB 와 호환)
+        if event.get("event_cluster_id"):
+            record["event_cluster_id"] = event["event_cluster_id"]
+        return record
+    
+    def insert_local_events(self, events: List[Dict[str, Any]]) -> bool:
+        """로컬 이벤트 데이터 저장 (일괄 upsert, UNIQUE(source_url, event_name) 기준)"""
         try:
-            for event in events:
-                # 로컬 이벤트 데이터를 스키마에 맞게 변환
-                record = {
-                    "collection_date": event.get("collection_date", datetime.now().isoformat()),
-                    "event_name": event.get("event_name"),
-                    "event_dates": event.get("event_dates"),
-                    "event_location": event.get("event_location"),
-                    "event_description": event.get("event_description"),
-                    "source_url": event.get("source_url"),
-                    "source_website": event.get("source_website"),
-                    "event_type": event.get("event_type", "lifestyle_event"),
-                    "event_tags": event.get("event_tags", []),
-                    "is_recurring": event.get("is_recurring", False)
-                }
-                
-                self.client.table("local_events").insert(record).execute()
+            records = [self._format_local_event(event) for event in events]
+            stats = self._write_records("local_events", records)
+            return stats["failed"] == 0
                 
         except Exception as e:
             print(f"Error inserting local events: {e}")
+            return False
     
     def get_latest_local_events(self, event_type: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
         """최근 로컬 이벤트 데이터 조회"""
         self._ensure_client()
-        try:
+        
+        def load():
             query = self.client.table("local_events").select("*")
             
             if event_type:
                 query = query.eq("event_type", event_type)
             
-            response = query.order("collection_date", desc=True).limit(limit).execute()
-            return response.data
+            return query.order("collection_date", desc=True).limit(limit).execute().data
+        
+        try:
+            return self._cached_query("local_events", ("latest", event_type, limit), load)
         except Exception as e:
             print(f"Error fetching local events: {e}")
             return []
 
+    def get_persona_products(self, persona_name: str, days_back: int = 7, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        최근 N일간 페르소나 타겟 상품 조회 (최신순, 캐시 사용)
+        
+        조회 오류는 호출 측에서 처리하도록 그대로 전파합니다.
+        """
+        self._ensure_client()
+        
+        def load():
+            cutoff_date = (datetime.now() - timedelta(days=days_back)).isoformat()
+            query = self.client.table("shopee_products") \
+                .select("*") \
+                .contains("discount_info", {"persona_name": persona_name}) \
+                .gte("created_at", cutoff_date) \
+                .order("created_at", desc=True)
+            if limit:
+                query = query.limit(limit)
+            return query.execute().data or []
+        
+        return self._cached_query("shopee_products", ("persona", persona_name, days_back, limit), load)
+    
+    # 상품 목록 응답에 필요한 컬럼만 (discount_info 전체 대신 필요한 키만)
+    PERSONA_PRODUCT_LIST_COLUMNS = (
+        "id,product_name,price,rating,category,product_url,image_url,created_at,"
+        "persona_score:discount_info->persona_score,brand_bonus:discount_info->brand_bonus"
+    )
+    
+    def get_persona_products_page(
+        self,
+        persona_name: str,
+        days_back: int = 7,
+        limit: int = 20,
+        min_score: Optional[float] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        페르소나 상품 목록 한 페이지 (created_at, id 내림차순 keyset, 캐시 사용)
+        
+        min_score 는 쿼리에서 필터링하므로 조건에 맞는 행이 남아 있으면 페이지가 짧아지지 않습니다.
+        
+        Returns:
+            (행 목록, 다음 페이지 커서 또는 None)
+        
+        Raises:
+            ValueError: 커서 형식이 잘못된 경우
+        """
+        keyset = keyset_filter(cursor) if cursor else None
+        self._ensure_client()
+        
+        def load():
+            cutoff_date = (datetime.now() - timedelta(days=days_back)).isoformat()
+            query = self.client.table("shopee_products") \
+                .select(self.PERSONA_PRODUCT_LIST_COLUMNS) \
+                .eq("discount_info->>persona_name", persona_name) \
+                .gte("created_at", cutoff_date)
+            if min_score is not None:
+                query = query.gte("discount_info->persona_score", min_score)
+            if keyset:
+                query = query.or_(keyset)
+            rows = query \
+                .order("created_at", desc=True) \
+                .order("id", desc=True) \
+                .limit(limit + 1) \
+                .execute().data or []
+            return split_page(rows, limit)
+        
+        return self._cached_query("shopee_products", ("persona_page", persona_name, days_back, limit, min_score, cursor), load)
+
 def get_supabase_client() -> Client:
     """
     Get Supabase client instance
@@ -0,0 +1,171 @@
+"""
+In-memory approximate row counts for Supabase tables.
+count='exact' (전체 스캔) 대신 count='estimated' (플래너 추정값) 를 주기적으로 읽고,
+그 사이에는 bulk_write 저장 행 수를 더해 메모리에서 바로 응답합니다.
+"""
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+TRACKED_TABLES = ("shopee_products", "google_trends", "tiktok_videos", "tiktok_shop_products", "local_events")
+
+DEFAULT_REFRESH_INTERVAL = float(os.getenv("TABLE_STATS_REFRESH_INTERVAL", "900"))
+
+
+class TableStatsService:
+    """
+    테이블별 근사 행 수
+
+    - refresh(): 테이블마다 count='estimated' 조회 한 번 (행은 1개만 받음)
+    - record_write(): 저장 성공 행 수를 누적 (upsert 로 갱신된 행도 포함되므로 다음 refresh 까지 근사값)
+    - snapshot(): DB 조회 없이 현재 값과 갱신 시각, 마지막 갱신 오류 반환
+    """
+
+    def __init__(self, supabase_client=None, tables: Iterable[str] = TRACKED_TABLES, refresh_interval: float = DEFAULT_REFRESH_INTERVAL):
+        """
+        Args:
+            supabase_client: client 속성을 가진 SupabaseClient (기본값: 첫 refresh 때 생성)
+            tables: 추적할 테이블
+            refresh_interval: 추정값 재조회 주기 (초)
+        """
+        self.supabase_client = supabase_client
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._tables: Dict[str, Dict[str, Any]] = {
+            table: {"rows": None, "refreshed_at": None, "written_since_refresh": 0, "error": None}
+            for table in tables
+        }
+        self._last_refresh: Optional[float] = None  # 마지막으로 성공한 refresh 시각
+        self._last_error: Optional[str] = None
+        self._last_error_at: Optional[str] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _client(self):
+        if self.supabase_client is None:
+            from .supabase_client import SupabaseClient
+            self.supabase_client = SupabaseClient()
+        self.supabase_client._ensure_client()
+        return self.supabase_client.client
+
+    def record_write(self, table: str, rows: int):
+        """저장된 행 수 반영 (bulk_write 에서 호출)"""
+        if rows <= 0:
+            return
+        with self._lock:
+            stats = self._tables.get(table)
+            if stats is None:
+                return
+            stats["written_since_refresh"] += rows
+            if stats["rows"] is not None:
+                stats["rows"] += rows
+
+    def _record_error(self, error: str):
+        with self._lock:
+            self._last_error = error
+            self._last_error_at = datetime.now().isoformat()
+
+    def refresh(self) -> bool:
+        """
+        모든 테이블의 추정 행 수 재조회 (하나라도 성공하면 True)
+
+        모두 실패하면 갱신 시각을 바꾸지 않으므로 refresh_if_stale 은 다음 호출에서 다시 시도합니다.
+        """
+        try:
+            client = self._client()
+        except Exception as e:
+            self._record_error(f"client unavailable: {e}")
+            logger.warning(f"⚠️ Failed to refresh row estimates - Supabase client unavailable: {e}")
+            return False
+
+        refreshed = False
+        errors = []
+
+        for table in list(self._tables):
+            try:
+                response = client.table(table).select("id", count="estimated").limit(1).execute()
+                count = response.count
+                with self._lock:
+                    self._tables[table].update({
+                        "rows": count,
+                        "refreshed_at": datetime.now().isoformat(),
+                        "written_since_refresh": 0,
+                        "error": None
+                    })
+                refreshed = True
+            except Exception as e:
+                with self._lock:
+                    self._tables[table]["error"] = str(e)
+                errors.append(f"{table}: {e}")
+                logger.warning(f"⚠️ Failed to refresh row estimate for {table}: {e}")
+
+        if errors:
+            self._record_error("; ".join(errors))
+        with self._lock:
+            if refreshed:
+                self._last_refresh = time.time()
+            if not errors:
+                self._last_error = None
+        return refreshed
+
+    def refresh_if_stale(self, max_age: Optional[float] = None) -> bool:
+        """마지막 갱신 후 max_age(기본값 refresh_interval) 가 지났으면 refresh"""
+        max_age = self.refresh_interval if max_age is None else max_age
+        with self._lock:
+            fresh = self._last_refresh is not None and time.time() - self._last_refresh < max_age
+        return True if fresh else self.refresh()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """메모리의 근사 행 수와 신선도"""
+        with self._lock:
+            age = round(time.time() - self._last_refresh, 1) if self._last_refresh is not None else None
+            return {
+                "approximate": True,
+                "age_seconds": age,
+                "refresh_interval": self.refresh_interval,
+                "last_error": self._last_error,
+                "last_error_at": self._last_error_at,
+                "tables": {table: dict(stats) for table, stats in self._tables.items()}
+            }
+
+    def start_background(self, interval: Optional[float] = None) -> threading.Thread:
+        """주기적으로 refresh 실행 (데몬 스레드, 이미 실행 중이면 그대로 반환)"""
+        interval = self.refresh_interval if interval is None else interval
+        if self._thread and self._thread.is_alive():
+            return self._thread
+
+        def run():
+            while not self._stop_event.is_set():
+                try:
+                    self.refresh()
+                except Exception as e:
+                    logger.error(f"❌ Table stats refresh error: {e}")
+                self._stop_event.wait(interval)
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=run, name="table-stats", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+
+_table_stats: Optional[TableStatsService] = None
+_table_stats_lock = threading.Lock()
+
+
+def get_table_stats() -> TableStatsService:
+    """프로세스 공용 TableStatsService 반환"""
+    global _table_stats
+    with _table_stats_lock:
+        if _table_stats is None:
+            _table_stats = TableStatsService()
+        return _table_stats
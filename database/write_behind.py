@@ -0,0 +1,309 @@
+"""
+Write-behind queue for Supabase writes.
+스크래퍼는 레코드를 큐에 넘기고 바로 다음 페이지로 진행하며,
+백그라운드 writer 스레드가 테이블별로 모아 bulk_write 로 저장합니다.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .supabase_client import SupabaseClient
+
+logger = logging.getLogger(__name__)
+
+# flush / close 가 대기 중인 writer 스레드를 깨우기 위해 넣는 항목
+_WAKE_UP = object()
+
+
+class WriteBehindWriter:
+    """
+    비동기 일괄 저장기 (SupabaseClient.insert_* 와 같은 메서드 제공)
+
+    - 큐 크기 제한: 가득 차면 put 이 대기 (backpressure)
+    - 테이블별 배치: batch_size 에 도달하거나 flush_interval 이 지나면 저장
+    - 종료 시 남은 레코드를 모두 저장 (close / atexit)
+    - 큐에 넣기 전에 로컬 스풀에 기록, 저장 실패분은 SpoolReplayer 가 재전송
+
+    insert_* 이외의 속성(get_latest_* 등 조회)은 내부 SupabaseClient 로 위임됩니다.
+    """
+
+    def __init__(
+        self,
+        client: Optional[SupabaseClient] = None,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+        put_timeout: Optional[float] = 60.0
+    ):
+        """
+        Args:
+            client: 저장에 사용할 SupabaseClient (None 이면 싱글톤)
+            max_queue_size: 대기 가능한 최대 레코드 수
+            batch_size: 테이블별로 이만큼 모이면 즉시 저장
+            flush_interval: 마지막 저장 후 이 시간(초)이 지나면 저장
+            put_timeout: 큐가 가득 찼을 때 최대 대기 시간 (None 이면 무한 대기)
+        """
+        self.client = client or SupabaseClient()
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+
+        self._queue: "queue.Queue[tuple]" = queue.Queue(maxsize=max_queue_size)
+        self._flush_requested = threading.Event()
+        self._stopping = threading.Event()
+        self._stats_lock = threading.Lock()
+        
+        # 스풀 항목별 남은 레코드 수 / 실패 여부
+        self.spool = self.client._get_spool()
+        self._entry_remaining: Dict[int, int] = {}
+        self._entry_failed = set()
+        self.stats = {
+            "enqueued": 0,
+            "written": 0,
+            "failed": 0,
+            "batches": 0,
+            "requests": 0,
+            "backpressure_waits": 0,
+            "dropped": 0
+        }
+
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __getattr__(self, name: str):
+        # 조회 메서드 등은 그대로 SupabaseClient 사용
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    # ------------------------------------------------------------------
+    # SupabaseClient 와 같은 이름의 insert 메서드 (즉시 반환)
+    # ------------------------------------------------------------------
+
+    def insert_google_trends(self, data: Dict[str, Any]) -> bool:
+        """Google Trends 데이터 저장 예약"""
+        return self.submit("google_trends", self.client._format_google_trends_records(data))
+
+    def insert_shopee_products(self, products: List[Dict[str, Any]], type: str = "top_sales") -> bool:
+        """Shopee/Lazada 제품 데이터 저장 예약"""
+        return self.submit("shopee_products", [self.client._format_shopee_product(p, type) for p in products])
+
+    def insert_tiktok_shop_products(self, products: List[Dict[str, Any]]) -> bool:
+        """TikTok Shop 상품 데이터 저장 예약"""
+        return self.submit("tiktok_shop_products", [self.client._format_tiktok_shop_product(p) for p in products])
+
+    def insert_tiktok_videos(self, videos: List[Dict[str, Any]]) -> bool:
+        """TikTok 비디오 데이터 저장 예약"""
+        return self.submit("tiktok_videos", [self.client._format_tiktok_video(v) for v in videos])
+
+    def insert_tiktok_hashtags(self, hashtags: List[Dict[str, Any]]) -> bool:
+        """TikTok 해시태그 데이터 저장 예약"""
+        created_at = datetime.now().isoformat()
+        return self.submit("tiktok_hashtags", [{**hashtag, "created_at": created_at} for hashtag in hashtags])
+
+    def insert_local_events(self, events: List[Dict[str, Any]]) -> bool:
+        """로컬 이벤트 데이터 저장 예약"""
+        return self.submit("local_events", [self.client._format_local_event(e) for e in events])
+
+    # ------------------------------------------------------------------
+    # 큐 처리
+    # ------------------------------------------------------------------
+
+    def submit(self, table: str, records: List[Dict[str, Any]]) -> bool:
+        """
+        변환된 레코드를 큐에 추가
+
+        Returns:
+            모든 레코드가 큐에 들어갔으면 True (put_timeout 초과 시 나머지는 버리고 False)
+        """
+        if not records:
+            return True
+
+        if self._stopping.is_set():
+            logger.warning(f"⚠️ Write-behind writer is closed - writing {len(records)} {table} rows synchronously")
+            stats = self.client._write_records(table, records)
+            return stats["failed"] == 0
+
+        seq = None
+        if self.spool:
+            seq = self.spool.append(table, records)
+            with self._stats_lock:
+                self._entry_remaining[seq] = len(records)
+
+        for index, record in enumerate(records):
+            try:
+                self._queue.put_nowait((table, record, seq))
+            except queue.Full:
+                with self._stats_lock:
+                    self.stats["backpressure_waits"] += 1
+                self._flush_requested.set()
+                self._wake()
+                try:
+                    self._queue.put((table, record, seq), timeout=self.put_timeout)
+                except queue.Full:
+                    dropped = len(records) - index
+                    with self._stats_lock:
+                        self.stats["dropped"] += dropped
+                    if seq is not None:
+                        # 큐에 못 들어간 레코드는 스풀에 남아 있으므로 재전송기가 처리
+                        self._settle_entries([seq] * dropped, failed=True)
+                        logger.error(f"❌ Write-behind queue full for {self.put_timeout}s - {dropped} {table} rows left in spool for replay")
+                    else:
+                        logger.error(f"❌ Write-behind queue full for {self.put_timeout}s - dropped {dropped} {table} rows")
+                    return False
+
+            with self._stats_lock:
+                self.stats["enqueued"] += 1
+
+        return True
+
+    def _run(self):
+        """writer 스레드: 테이블별로 모아서 저장"""
+        pending: Dict[str, List[tuple]] = {}
+        last_flush = time.monotonic()
+
+        while True:
+            timeout = max(0.05, self.flush_interval - (time.monotonic() - last_flush))
+            items = []
+            try:
+                items.append(self._queue.get(timeout=timeout))
+
+                # 이미 쌓여 있는 레코드는 한 번에 가져옴 (배치 크기까지)
+                while len(items) < self.batch_size:
+                    items.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            for item in items:
+                if item is _WAKE_UP:
+                    self._queue.task_done()
+                    continue
+                table, record, seq = item
+                pending.setdefault(table, []).append((record, seq))
+
+            full_tables = [table for table, records in pending.items() if len(records) >= self.batch_size]
+            due = (
+                time.monotonic() - last_flush >= self.flush_interval
+                or self._flush_requested.is_set()
+                or (self._stopping.is_set() and self._queue.empty())
+            )
+
+            if full_tables and not due:
+                for table in full_tables:
+                    self._write_batch(table, pending.pop(table))
+            elif due and pending:
+                for table in list(pending):
+                    self._write_batch(table, pending.pop(table))
+
+            if due:
+                last_flush = time.monotonic()
+                if self._queue.empty():
+                    self._flush_requested.clear()
+
+            if self._stopping.is_set() and self._queue.empty() and not pending:
+                return
+
+    def _write_batch(self, table: str, items: List[tuple]):
+        records = [record for record, _ in items]
+        try:
+            result = self.client.bulk_write(table, records, on_conflict=SupabaseClient.NATURAL_KEYS.get(table))
+            written, failed, requests = result["written"], result["failed"], result["requests"]
+        except Exception as e:
+            logger.error(f"❌ Write-behind batch for {table} failed: {e}")
+            written, failed, requests = 0, len(records), 0
+        finally:
+            self._settle_entries([seq for _, seq in items if seq is not None], failed=failed > 0)
+            for _ in items:
+                self._queue.task_done()
+
+        with self._stats_lock:
+            self.stats["written"] += written
+            self.stats["failed"] += failed
+            self.stats["batches"] += 1
+            self.stats["requests"] += requests
+
+        logger.debug(f"💾 Write-behind flushed {written}/{len(records)} {table} rows")
+
+    def _settle_entries(self, seqs: List[int], failed: bool):
+        """
+        배치 결과를 스풀 항목에 반영
+
+        항목의 레코드가 모두 처리되면 전부 성공한 경우 ack, 하나라도 실패했으면
+        release 하여 SpoolReplayer 가 다시 전송하도록 합니다 (upsert 라 중복 저장 없음).
+        """
+        if not self.spool or not seqs:
+            return
+
+        completed = []
+        with self._stats_lock:
+            for seq in seqs:
+                if failed:
+                    self._entry_failed.add(seq)
+                self._entry_remaining[seq] -= 1
+                if self._entry_remaining[seq] == 0:
+                    del self._entry_remaining[seq]
+                    completed.append((seq, seq in self._entry_failed))
+                    self._entry_failed.discard(seq)
+
+        acked = [seq for seq, entry_failed in completed if not entry_failed]
+        released = [seq for seq, entry_failed in completed if entry_failed]
+        if acked:
+            self.spool.ack(acked)
+        if released:
+            self.spool.release(released)
+            logger.warning(f"💾 {len(released)} spooled writes kept for replay")
+
+    def _wake(self):
+        """queue.get 에서 대기 중인 writer 스레드 깨우기 (큐가 가득 차 있으면 이미 처리 중)"""
+        try:
+            self._queue.put_nowait(_WAKE_UP)
+        except queue.Full:
+            pass
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """지금까지 큐에 넣은 레코드가 모두 저장될 때까지 대기"""
+        self._flush_requested.set()
+        self._wake()
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(lambda: self._queue.unfinished_tasks == 0, timeout)
+
+    def close(self, timeout: Optional[float] = 120.0):
+        """남은 레코드를 저장하고 writer 스레드 종료"""
+        if self._stopping.is_set():
+            return
+
+        self._stopping.set()
+        self._flush_requested.set()
+        self._wake()
+        self._thread.join(timeout)
+
+        if self._thread.is_alive():
+            logger.warning(f"⚠️ Write-behind writer did not drain within {timeout}s ({self._queue.qsize()} rows queued)")
+        else:
+            logger.info(f"✅ Write-behind writer drained: {self.get_stats()}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """큐/저장 통계"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats["queued"] = self._queue.qsize()
+        return stats
+
+
+# 프로세스 전역 writer (scheduler, scrapers 가 공유)
+_write_behind_writer = None
+_write_behind_lock = threading.Lock()
+
+
+def get_write_behind_writer(**kwargs) -> WriteBehindWriter:
+    """싱글톤 WriteBehindWriter 반환 (lazy initialization)"""
+    global _write_behind_writer
+    with _write_behind_lock:
+        if _write_behind_writer is None or _write_behind_writer._stopping.is_set():
+            _write_behind_writer = WriteBehindWriter(**kwargs)
+        return _write_behind_writer
@@ -0,0 +1,425 @@
+"""
+Durable local spool for Supabase writes.
+모든 insert_* 는 먼저 JSONL 세그먼트에 기록되고, 저장이 확인되면 ack 됩니다.
+Supabase 장애로 저장되지 못한 항목은 SpoolReplayer 가 나중에 일괄 전송합니다.
+
+main.py / scheduler / dashboard 가 같은 data/spool 을 쓰므로 프로세스마다 하위 디렉터리
+(<호스트>-<pid>-<uuid>) 를 따로 쓰고, 살아 있는 동안 그 디렉터리의 owner.lock 에 flock 을 잡습니다.
+잠금을 얻을 수 있는 다른 디렉터리는 소유 프로세스가 종료된 것이므로 adopt_orphans() 가
+남은 항목을 자기 스풀로 옮긴 뒤 삭제합니다.
+"""
+import json
+import logging
+import os
+import shutil
+import socket
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SPOOL_DIR = str(PROJECT_ROOT / os.getenv("SUPABASE_SPOOL_DIR", "data/spool"))
+
+
+class WriteSpool:
+    """
+    append-only JSONL 스풀
+
+    - 한 번의 insert 호출 = 한 줄 (seq, table, records)
+    - segment_<첫 seq>.jsonl 단위로 회전, 모두 ack 된 세그먼트는 삭제
+    - checkpoint.json 에 ack 진행 상황 저장 (재시작 후 이어서 전송)
+    - 이 프로세스에서 저장 중인 항목(inflight)은 재전송 대상에서 제외
+    - 프로세스별 디렉터리에만 기록하므로 seq / 체크포인트 / 세그먼트 정리가 다른 프로세스와 겹치지 않음
+      (fcntl 이 없는 환경에서는 기본 디렉터리를 그대로 사용 - 단일 프로세스 전용)
+    """
+
+    SEGMENT_PREFIX = "segment_"
+    CHECKPOINT_FILE = "checkpoint.json"
+    DEAD_LETTER_FILE = "dead_letter.jsonl"
+    OWNER_LOCK_FILE = "owner.lock"
+
+    def __init__(self, spool_dir: Optional[str] = None, segment_max_entries: int = 1000, fsync: bool = False):
+        """
+        Args:
+            spool_dir: 스풀 기본 디렉터리 (기본값: SUPABASE_SPOOL_DIR 또는 <프로젝트 루트>/data/spool)
+            segment_max_entries: 세그먼트 하나에 기록할 최대 항목 수
+            fsync: 기록마다 fsync 수행 (전원 장애까지 대비할 때)
+        """
+        self.base_dir = Path(spool_dir or DEFAULT_SPOOL_DIR)
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._owner_lock = None
+        self.spool_dir = self._claim_owner_dir() if FCNTL_AVAILABLE else self.base_dir
+        self.segment_max_entries = max(1, segment_max_entries)
+        self.fsync = fsync
+
+        self._lock = threading.RLock()
+        self._acked_upto = 0  # 이 seq 이하 항목은 모두 ack 됨
+        self._acked: Set[int] = set()  # acked_upto 이후에 ack 된 seq
+        self._inflight: Set[int] = set()
+        self._next_seq = 1
+        self._segment_path: Optional[Path] = None
+        self._segment_entries = 0
+
+        self._load_checkpoint()
+        self.adopt_orphans()
+
+    # ------------------------------------------------------------------
+    # 프로세스별 디렉터리
+    # ------------------------------------------------------------------
+
+    def _claim_owner_dir(self) -> Path:
+        """이 프로세스 전용 디렉터리 생성 + owner.lock 잠금 (잠근 뒤에 이름을 공개해 adopt 와 경쟁하지 않음)"""
+        name = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        staging = self.base_dir / f".{name}"
+        staging.mkdir()
+        self._owner_lock = open(staging / self.OWNER_LOCK_FILE, "a+")
+        fcntl.flock(self._owner_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        owner_dir = self.base_dir / name
+        os.rename(staging, owner_dir)
+        return owner_dir
+
+    def adopt_orphans(self) -> int:
+        """
+        종료된 프로세스의 디렉터리에서 ack 되지 않은 항목을 이 스풀로 옮기고 디렉터리 삭제
+
+        Returns:
+            옮긴 항목 수
+        """
+        if not FCNTL_AVAILABLE:
+            return 0
+
+        adopted = 0
+        for directory in sorted(self.base_dir.iterdir()):
+            if directory == self.spool_dir or directory.name.startswith(".") or not directory.is_dir():
+                continue
+            lock_path = directory / self.OWNER_LOCK_FILE
+            if not lock_path.exists():
+                continue
+
+            try:
+                lock = open(lock_path, "a+")
+            except FileNotFoundError:
+                continue  # 다른 프로세스가 먼저 adopt
+            try:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue  # 소유 프로세스가 살아 있음
+                if not lock_path.exists():
+                    continue  # 잠금 직전에 다른 프로세스가 adopt 후 삭제
+
+                entries = list(self._unacked_entries(directory))
+                with self._lock:
+                    for entry in entries:
+                        self.append(entry["table"], entry["records"], inflight=False, sync=True)
+                    dead_letter = directory / self.DEAD_LETTER_FILE
+                    if dead_letter.exists():
+                        with open(self.spool_dir / self.DEAD_LETTER_FILE, "a", encoding="utf-8") as f:
+                            f.write(dead_letter.read_text(encoding="utf-8"))
+                shutil.rmtree(directory, ignore_errors=True)
+                adopted += len(entries)
+                if entries:
+                    logger.info(f"💾 Adopted {len(entries)} spooled writes from exited process {directory.name}")
+            finally:
+                lock.close()
+        return adopted
+
+    def close(self):
+        """잠금 해제, 남은 항목이 없으면 디렉터리 삭제 (남아 있으면 다른 프로세스가 adopt)"""
+        with self._lock:
+            if self._owner_lock is None:
+                return
+            if self.get_stats()["unacked"] == 0 and not (self.spool_dir / self.DEAD_LETTER_FILE).exists():
+                shutil.rmtree(self.spool_dir, ignore_errors=True)
+            self._owner_lock.close()
+            self._owner_lock = None
+
+    # ------------------------------------------------------------------
+    # 체크포인트
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def _read_checkpoint(cls, directory: Path) -> Tuple[int, Set[int], int]:
+        """(acked_upto, acked, next_seq) - 체크포인트가 없거나 깨졌으면 처음부터"""
+        checkpoint_path = directory / cls.CHECKPOINT_FILE
+        if checkpoint_path.exists():
+            try:
+                checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+                acked_upto = int(checkpoint.get("acked_upto", 0))
+                acked = {int(seq) for seq in checkpoint.get("acked", []) if int(seq) > acked_upto}
+                return acked_upto, acked, int(checkpoint.get("next_seq", 1))
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to read spool checkpoint in {directory.name}, replaying from the start: {e}")
+        return 0, set(), 1
+
+    def _unacked_entries(self, directory: Path, skip: Optional[Set[int]] = None) -> Iterator[Dict[str, Any]]:
+        """디렉터리의 ack 되지 않은 항목 (seq 순, skip 제외)"""
+        acked_upto, acked, _ = self._read_checkpoint(directory)
+        skip = acked | (skip or set())
+        for segment in self._segments(directory):
+            for entry in self._read_segment(segment):
+                seq = entry.get("seq", 0)
+                if seq > acked_upto and seq not in skip:
+                    yield entry
+
+    def _load_checkpoint(self):
+        self._acked_upto, self._acked, self._next_seq = self._read_checkpoint(self.spool_dir)
+
+        # 체크포인트 이후에 기록된 항목이 있을 수 있으므로 마지막 세그먼트 확인
+        segments = self._segments()
+        if segments:
+            for entry in self._read_segment(segments[-1]):
+                self._next_seq = max(self._next_seq, entry["seq"] + 1)
+        self._next_seq = max(self._next_seq, self._acked_upto + 1)
+
+    def _save_checkpoint(self):
+        checkpoint = {
+            "acked_upto": self._acked_upto,
+            "acked": sorted(self._acked),
+            "next_seq": self._next_seq,
+            "updated_at": time.time()
+        }
+        tmp_path = self.spool_dir / f"{self.CHECKPOINT_FILE}.tmp"
+        tmp_path.write_text(json.dumps(checkpoint), encoding="utf-8")
+        os.replace(tmp_path, self.spool_dir / self.CHECKPOINT_FILE)
+
+    # ------------------------------------------------------------------
+    # 세그먼트
+    # ------------------------------------------------------------------
+
+    def _segments(self, directory: Optional[Path] = None) -> List[Path]:
+        return sorted((directory or self.spool_dir).glob(f"{self.SEGMENT_PREFIX}*.jsonl"))
+
+    @staticmethod
+    def _segment_first_seq(path: Path) -> int:
+        return int(path.stem.split("_")[-1])
+
+    def _read_segment(self, path: Path) -> Iterator[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # 기록 도중 종료된 마지막 줄
+                        logger.warning(f"⚠️ Skipping corrupt spool line {path.name}:{line_number}")
+        except FileNotFoundError:
+            return
+
+    def _compact(self):
+        """모든 항목이 ack 된 세그먼트 삭제 (현재 기록 중인 세그먼트 제외)"""
+        segments = self._segments()
+        for index, current in enumerate(segments):
+            if current == self._segment_path:
+                continue
+            if index + 1 < len(segments):
+                last_seq = self._segment_first_seq(segments[index + 1]) - 1
+            else:
+                last_seq = self._next_seq - 1
+            if last_seq <= self._acked_upto:
+                current.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # 기록 / ack
+    # ------------------------------------------------------------------
+
+    def append(self, table: str, records: List[Dict[str, Any]], inflight: bool = True, sync: bool = False) -> int:
+        """
+        레코드 묶음을 스풀에 기록하고 inflight 로 표시
+
+        Args:
+            inflight: False 면 바로 재전송 대상 (adopt 한 항목)
+            sync: 이 기록만 fsync (원본 디렉터리를 지우기 전)
+
+        Returns:
+            항목 seq (저장 완료 시 ack, 실패 시 release 에 사용)
+        """
+        with self._lock:
+            seq = self._next_seq
+            self._next_seq += 1
+
+            if self._segment_path is None or self._segment_entries >= self.segment_max_entries:
+                self._segment_path = self.spool_dir / f"{self.SEGMENT_PREFIX}{seq:012d}.jsonl"
+                self._segment_entries = 0
+
+            line = json.dumps({"seq": seq, "table": table, "records": records, "spooled_at": time.time()}, default=str)
+            with open(self._segment_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                if self.fsync or sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            self._segment_entries += 1
+            if inflight:
+                self._inflight.add(seq)
+            return seq
+
+    def ack(self, seqs):
+        """저장이 확인된 항목 ack (체크포인트 갱신 + 세그먼트 정리)"""
+        if isinstance(seqs, int):
+            seqs = [seqs]
+
+        with self._lock:
+            for seq in seqs:
+                self._inflight.discard(seq)
+                if seq > self._acked_upto:
+                    self._acked.add(seq)
+
+            while self._acked_upto + 1 in self._acked:
+                self._acked_upto += 1
+                self._acked.discard(self._acked_upto)
+
+            self._save_checkpoint()
+            self._compact()
+
+    def release(self, seqs):
+        """저장 실패 항목을 재전송 대상으로 전환"""
+        if isinstance(seqs, int):
+            seqs = [seqs]
+        with self._lock:
+            for seq in seqs:
+                self._inflight.discard(seq)
+
+    def dead_letter(self, entry: Dict[str, Any], error: str):
+        """재전송해도 저장되지 않는 항목을 별도 파일로 옮기고 ack"""
+        with self._lock:
+            with open(self.spool_dir / self.DEAD_LETTER_FILE, "a", encoding="utf-8") as f:
+                f.write(json.dumps({**entry, "error": error, "dead_lettered_at": time.time()}, default=str) + "\n")
+        self.ack(entry["seq"])
+
+    def pending_entries(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """아직 ack 되지 않았고 저장 중도 아닌 항목 (seq 순)"""
+        with self._lock:
+            acked_upto = self._acked_upto
+            skip = set(self._acked) | set(self._inflight)
+
+        count = 0
+        for segment in self._segments():
+            for entry in self._read_segment(segment):
+                seq = entry.get("seq", 0)
+                if seq <= acked_upto or seq in skip:
+                    continue
+                yield entry
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+    def get_stats(self) -> Dict[str, Any]:
+        """스풀 상태"""
+        with self._lock:
+            return {
+                "spool_dir": str(self.spool_dir),
+                "base_dir": str(self.base_dir),
+                "acked_upto": self._acked_upto,
+                "next_seq": self._next_seq,
+                "unacked": self._next_seq - 1 - self._acked_upto - len(self._acked),
+                "inflight": len(self._inflight),
+                "segments": len(self._segments())
+            }
+
+
+class SpoolReplayer:
+    """스풀에 남은 항목을 Supabase 로 일괄 전송"""
+
+    def __init__(self, client, spool: WriteSpool, max_entries_per_round: int = 200):
+        """
+        Args:
+            client: bulk_write / NATURAL_KEYS 를 제공하는 SupabaseClient
+            spool: 대상 스풀
+            max_entries_per_round: 한 번에 읽어 전송할 최대 항목 수
+        """
+        self.client = client
+        self.spool = spool
+        self.max_entries_per_round = max_entries_per_round
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def replay(self, stop_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        남은 항목을 모두 전송 (연결 오류 시 중단, 다음 호출에서 이어서 진행)
+
+        Args:
+            stop_event: 설정되면 다음 라운드 전에 중단 (백그라운드 스레드용, 직접 호출 시에는 끝까지 전송)
+
+        Returns:
+            {"entries", "records", "dead_lettered", "stopped_on_connection_error"}
+        """
+        summary = {"entries": 0, "records": 0, "dead_lettered": 0, "stopped_on_connection_error": False}
+
+        # 그사이 종료된 다른 프로세스(scheduler / dashboard 작업)의 남은 항목도 이어받음
+        self.spool.adopt_orphans()
+
+        while not (stop_event and stop_event.is_set()):
+            entries = list(self.spool.pending_entries(limit=self.max_entries_per_round))
+            if not entries:
+                break
+
+            # 테이블별로 묶어서 한 번에 전송
+            by_table: Dict[str, List[Dict[str, Any]]] = {}
+            for entry in entries:
+                by_table.setdefault(entry["table"], []).append(entry)
+
+            for table, table_entries in by_table.items():
+                records = [record for entry in table_entries for record in entry["records"]]
+                stats = self.client.bulk_write(table, records, on_conflict=self.client.NATURAL_KEYS.get(table))
+
+                if stats["connection_error"]:
+                    summary["stopped_on_connection_error"] = True
+                    logger.warning(f"⚠️ Spool replay paused - Supabase unreachable ({self.spool.get_stats()['unacked']} entries pending)")
+                    return summary
+
+                if stats["failed"] == 0:
+                    self.spool.ack([entry["seq"] for entry in table_entries])
+                else:
+                    # 문제 항목만 격리: 항목별로 다시 시도, 그래도 실패하면 dead letter
+                    for entry in table_entries:
+                        entry_stats = self.client.bulk_write(table, entry["records"], on_conflict=self.client.NATURAL_KEYS.get(table))
+                        if entry_stats["connection_error"]:
+                            summary["stopped_on_connection_error"] = True
+                            return summary
+                        if entry_stats["failed"]:
+                            self.spool.dead_letter(entry, f"{entry_stats['failed']} rows rejected")
+                            summary["dead_lettered"] += 1
+                        else:
+                            self.spool.ack(entry["seq"])
+
+                summary["entries"] += len(table_entries)
+                summary["records"] += len(records)
+
+        if summary["entries"]:
+            logger.info(f"✅ Replayed {summary['entries']} spooled writes ({summary['records']} rows)")
+        return summary
+
+    def start_background(self, interval: float = 60.0) -> threading.Thread:
+        """주기적으로 replay 실행 (데몬 스레드)"""
+
+        def run():
+            while not self._stop_event.is_set():
+                try:
+                    self.replay(self._stop_event)
+                except Exception as e:
+                    logger.error(f"❌ Spool replay error: {e}")
+                self._stop_event.wait(interval)
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=run, name="spool-replayer", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        """백그라운드 스레드 중지 (이후 replay() 직접 호출은 그대로 동작)"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
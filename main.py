@@ -18,6 +18,7 @@ from config.settings import Settings
 
 # Import database client
 from database.supabase_client import SupabaseClient
+from database.write_behind import WriteBehindWriter
 
 # Import core scrapers (focused on 4 key scrapers)
 from scrapers.google_trends import GoogleTrendsScraper
@@ -38,6 +39,11 @@ from utils.ethical_scraping import ScrapingPolicy
 # Import persona recommendation engine
 from persona_recommendation_engine import PersonaRecommendationEngine
 
+# Import concurrent orchestrator
+from automation.orchestrator import ScraperOrchestrator, ScraperJob
+from utils.rate_limiter import DomainRateLimiter
+from utils.driver_pool import close_all_pools
+
 
 def setup_logging():
     """Setup logging configuration"""
@@ -64,8 +70,16 @@ def initialize_components(logger):
     try:
         # Initialize database client
         logger.info("Initializing Supabase database client...")
-        database_client = SupabaseClient()
-        logger.info("✅ Database client initialized successfully")
+        # Scrapers hand records to the write-behind queue and continue immediately;
+        # reads are delegated to the underlying SupabaseClient
+        database_client = WriteBehindWriter(SupabaseClient())
+        logger.info("✅ Database client initialized successfully (write-behind enabled)")
+        
+        # Ship writes left in the local spool by earlier runs / outages
+        spool_replayer = database_client.get_spool_replayer()
+        if spool_replayer:
+            logger.info(f"💾 Local write spool: {database_client.spool.get_stats()}")
+            spool_replayer.start_background(interval=60)
         
         # Initialize anti-bot system
         logger.info("Initializing anti-bot protection system...")
@@ -96,6 +110,41 @@ def initialize_components(logger):
         raise
 
 
+def flush_pending_writes(database_client, logger, timeout: float = 120.0):
+    """Wait until queued database writes are stored (before components that read them back)"""
+    if not hasattr(database_client, "flush"):
+        return
+    
+    logger.info("💾 Flushing pending database writes...")
+    if not database_client.flush(timeout):
+        logger.warning(f"⚠️ Pending writes not flushed within {timeout}s: {database_client.get_stats()}")
+
+
+def shutdown_pipeline(database_client, logger):
+    """Quit pooled browsers, drain the write-behind queue and replay spooled writes (also on errors/interrupts)"""
+    try:
+        close_all_pools()
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to close browser pools: {e}")
+    
+    if database_client is None:
+        return
+    
+    try:
+        database_client.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to drain pending database writes: {e}")
+    
+    # Retry anything that failed during this run (kept in the local spool otherwise)
+    try:
+        spool_replayer = database_client.get_spool_replayer()
+        if spool_replayer:
+            spool_replayer.stop()
+            spool_replayer.replay()
+    except Exception as e:
+        logger.warning(f"⚠️ Spool replay on shutdown failed: {e}")
+
+
 def run_google_trends_scraper(database_client, anti_bot_system, scraping_policy, logger) -> Dict[str, Any]:
     """Run Google Trends scraper"""
     scraper_name = "Google Trends"
@@ -145,7 +194,10 @@ def run_lazada_persona_scraper(database_client, anti_bot_system, scraping_policy
     
     try:
         # 페르소나 타겟 스크래퍼 초기화 
-        scraper = LazadaPersonaScraper(persona_name="young_filipina", use_undetected=True)
+        scraper = LazadaPersonaScraper(
+            persona_name="young_filipina", use_undetected=True, database_writer=database_client,
+            driver_pool=LazadaPersonaScraper.shared_driver_pool()
+        )
         
         logger.info(f"🎯 Target Persona: {scraper.persona.name}")
         logger.info(f"👥 Age Group: {scraper.persona.age_group.value}")
@@ -206,45 +258,30 @@ def run_tiktok_shop_scraper(database_client, anti_bot_system, scraping_policy, l
     logger.info(f"🛍️ Starting {scraper_name} scraper...")
     
     try:
-        scraper = TikTokShopScraper(use_undetected=True, headless=True)
-        
-        all_products = []
-        
-        # 1. Top Products 수집
-        logger.info("🎯 Collecting Top Products...")
-        top_products = scraper.get_top_products(limit=10)
-        all_products.extend(top_products)
-        
-        if top_products:
-            logger.info(f"✅ Collected {len(top_products)} top products")
-        else:
-            logger.warning("⚠️ No top products found")
-        
-        # Delay between collections
-        time.sleep(5)
-        
-        # 2. Flash Sale Products 수집
-        logger.info("⚡ Collecting Flash Sale Products...")
-        flash_products = scraper.get_flash_sale_products(limit=8)
-        all_products.extend(flash_products)
-        
-        if flash_products:
-            logger.info(f"✅ Collected {len(flash_products)} flash sale products")
-        else:
-            logger.warning("⚠️ No flash sale products found")
-        
-        # Delay between collections
-        time.sleep(5)
-        
-        # 3. Category Products 수집 (beauty category)
-        logger.info("💄 Collecting Beauty Category Products...")
-        beauty_products = scraper.get_category_products("beauty", limit=7)
-        all_products.extend(beauty_products)
-        
-        if beauty_products:
-            logger.info(f"✅ Collected {len(beauty_products)} beauty category products")
-        else:
-            logger.warning("⚠️ No beauty category products found")
+        scraper = TikTokShopScraper(use_undetected=True, headless=True, driver_pool=TikTokShopScraper.shared_driver_pool(headless=True))
+        
+        # Top Products / Flash Sale / Beauty 카테고리를 한 번에 수집
+        # offline 파싱은 백그라운드에서 진행되고 브라우저는 바로 다음 섹션을 로드
+        logger.info("🎯 Collecting Top Products, Flash Sale and Beauty Category Products...")
+        sections = scraper.collect_sections(
+            [
+                {"section": "top_products", "limit": 10},
+                {"section": "flash_sale", "limit": 8},
+                {"section": "category", "category": "beauty", "limit": 7}
+            ],
+            parse_mode="offline",
+            delay_between=5
+        )
+        top_products = sections["top_products"]
+        flash_products = sections["flash_sale"]
+        beauty_products = sections["category_beauty"]
+        all_products = top_products + flash_products + beauty_products
+        
+        for label, products in (("top products", top_products), ("flash sale products", flash_products), ("beauty category products", beauty_products)):
+            if products:
+                logger.info(f"✅ Collected {len(products)} {label}")
+            else:
+                logger.warning(f"⚠️ No {label} found")
         
         if all_products:
             # Store in database
@@ -378,6 +415,9 @@ def run_event_trend_analyzer(database_client, logger) -> Dict[str, Any]:
     logger.info(f"🔗 Starting {scraper_name}...")
     
     try:
+        # Events and trends must be stored before they can be correlated
+        flush_pending_writes(database_client, logger)
+        
         # Initialize EventTrendAnalyzer
         analyzer = EventTrendAnalyzer()
         
@@ -500,6 +540,8 @@ Examples:
   python main.py --debug            # Run with transparency report (debug mode)
   python main.py --persona-only     # Run only persona recommendation engine
   python main.py --debug --persona-only  # Run persona engine with debug output
+  python main.py --parallel         # Run independent scrapers concurrently
+  python main.py --parallel --max-workers 2  # Limit concurrent scrapers
         """
     )
     
@@ -515,6 +557,19 @@ Examples:
         help='Run only the persona recommendation engine (skip scrapers)'
     )
     
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Run independent scrapers concurrently (per-domain politeness limits still apply)'
+    )
+    
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=4,
+        help='Maximum number of scrapers running at the same time in --parallel mode (default: 4)'
+    )
+    
     return parser.parse_args()
 
 def run_persona_recommendation_engine(debug_mode: bool = False, logger=None) -> Dict[str, Any]:
@@ -587,6 +642,58 @@ def run_persona_recommendation_engine(debug_mode: bool = False, logger=None) ->
     
     return results
 
+def run_parallel_pipeline(database_client, anti_bot_system, scraping_policy, logger,
+                          debug_mode: bool = False, max_workers: int = 4) -> List[Dict[str, Any]]:
+    """Run the core pipeline with independent scrapers executed concurrently"""
+    # Each scraper hits a different domain, so the fixed sleeps between them are replaced
+    # by per-domain politeness limits enforced by the orchestrator.
+    rate_limiter = DomainRateLimiter(min_interval=5.0, max_concurrent=1)
+    orchestrator = ScraperOrchestrator(max_workers=max_workers, rate_limiter=rate_limiter, logger=logger)
+    
+    def run_persona_engine():
+        # Persona engine reads trends back from the database
+        flush_pending_writes(database_client, logger)
+        return run_persona_recommendation_engine(debug_mode=debug_mode, logger=logger)
+    
+    jobs = [
+        ScraperJob(
+            name="google_trends",
+            func=lambda: run_google_trends_scraper(database_client, anti_bot_system, scraping_policy, logger),
+            domains=["trends.google.com"]
+        ),
+        ScraperJob(
+            name="lazada_persona",
+            func=lambda: run_lazada_persona_scraper(database_client, anti_bot_system, scraping_policy, logger),
+            domains=["lazada.com.ph"]
+        ),
+        ScraperJob(
+            name="tiktok_shop",
+            func=lambda: run_tiktok_shop_scraper(database_client, anti_bot_system, scraping_policy, logger),
+            domains=["tiktok.com"]
+        ),
+        ScraperJob(
+            name="local_events",
+            func=lambda: run_local_event_scraper(database_client, anti_bot_system, scraping_policy, logger),
+            domains=["filipiknow.net", "timeout.com", "choosephilippines.com", "spot.ph", "wheninmanila.com"]
+        ),
+        # Event-trend analysis correlates stored events with stored trends
+        ScraperJob(
+            name="event_trend_analyzer",
+            func=lambda: run_event_trend_analyzer(database_client, logger),
+            depends_on=["google_trends", "local_events"]
+        ),
+        # Persona engine reads the latest Google Trends data
+        ScraperJob(
+            name="persona_engine",
+            func=run_persona_engine,
+            depends_on=["google_trends"]
+        ),
+    ]
+    
+    logger.info(f"⚡ Parallel mode: {len(jobs)} components, up to {max_workers} running concurrently")
+    return orchestrator.run(jobs)
+
+
 def main():
     """Main orchestration function"""
     args = parse_arguments()
@@ -607,6 +714,7 @@ def main():
     logger.info("=" * 60)
     
     all_results = []
+    database_client = None
     
     try:
         # If only running persona engine
@@ -624,6 +732,13 @@ def main():
             # Initialize core components
             database_client, anti_bot_system, scraping_policy = initialize_components(logger)
             
+        if not args.persona_only and args.parallel:
+            all_results.extend(run_parallel_pipeline(
+                database_client, anti_bot_system, scraping_policy, logger,
+                debug_mode=args.debug, max_workers=args.max_workers
+            ))
+        
+        elif not args.persona_only:
             # Run core 5 components (4 scrapers + 1 analyzer + persona engine)
             logger.info("🎯 Starting CORE 6 COMPONENTS execution sequence...")
             logger.info("📊 Pipeline: Google Trends → Lazada Persona → TikTok Shop → Local Events → Event-Trend Analysis → Persona Recommendations")
@@ -675,9 +790,15 @@ def main():
             
             # 6. Persona Recommendation Engine (Generate persona-based recommendations)
             logger.info("6️⃣ Persona Recommendation Engine - Starting...")
+            flush_pending_writes(database_client, logger)
             persona_results = run_persona_recommendation_engine(debug_mode=args.debug, logger=logger)
             all_results.append(persona_results)
         
+        if not args.persona_only:
+            # Quit pooled browsers and drain the write-behind queue before reporting
+            shutdown_pipeline(database_client, logger)
+            database_client = None  # already shut down - skip the cleanup in finally
+        
         # Generate summary report
         generate_summary_report(all_results, logger)
         
@@ -710,6 +831,11 @@ def main():
         logger.error(traceback.format_exc())
         sys.exit(1)
     
+    finally:
+        # Exceptions, Ctrl+C and sys.exit() must not leak Chrome processes or leave queued writes to atexit
+        if database_client is not None:
+            shutdown_pipeline(database_client, logger)
+    
     logger.info("=" * 60)
     if args.persona_only:
         logger.info("🏁 VOOTCAMP PH PERSONA RECOMMENDATION ENGINE - COMPLETED")
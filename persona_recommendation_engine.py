@@ -7,9 +7,11 @@ Persona-based Recommendation Engine
 import json
 from datetime import datetime
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from dotenv import load_dotenv
 
+from utils.keyword_matcher import FUZZY_SPECIAL_MATCHES, PersonaKeywordMatcher, TrendCategoryMatcher
+
 @dataclass
 class PersonaProfile:
     """페르소나 프로필 정의"""
@@ -48,12 +50,23 @@ class ContentIdea:
 class PersonaRecommendationEngine:
     """페르소나 맞춤 추천 엔진"""
     
-    def __init__(self, debug_mode: bool = False):
+    def __init__(self, debug_mode: bool = False, use_compiled_matcher: bool = True):
+        """
+        Args:
+            use_compiled_matcher: 관심사/트렌드 매칭에 사전 컴파일된 매처 사용 (False 면 기존 순차 탐색)
+        """
         self.debug_mode = debug_mode
+        self.use_compiled_matcher = use_compiled_matcher
         self.personas = self._define_personas()
         self.trend_data = self._get_current_trends()
         self.debug_log = []  # Store debug information
         
+        # 페르소나/트렌드 로드 시 한 번 컴파일 (설정이 바뀌면 자동으로 다시 컴파일)
+        self._interest_matchers: Dict[str, PersonaKeywordMatcher] = {}
+        self._trend_matcher = TrendCategoryMatcher(self.trend_data)
+        for persona in self.personas.values():
+            self._get_interest_matcher(persona)
+        
         if self.debug_mode:
             self._debug_print("🎯 PersonaRecommendationEngine initialized in debug mode")
             self._debug_print(f"📊 Loaded {len(self.personas)} personas")
@@ -169,19 +182,8 @@ class PersonaRecommendationEngine:
     
     def _fuzzy_match(self, keyword: str, text: str) -> bool:
         """Enhanced matching for better keyword detection"""
-        # 특별한 매칭 규칙들
-        special_matches = {
-            "skincare": ["스킨케어", "세럼", "retinol", "레티놀"],
-            "makeup": ["메이크업", "립밤", "lip", "틴트", "tint"],
-            "tote bag": ["토트백", "토트 백", "bag"],
-            "blazer": ["블레이저"],
-            "sustainable": ["서스테이너블", "지속가능"],
-            "korean": ["한국", "코리안", "k-"],
-            "accessories": ["액세서리", "가방", "bag"]
-        }
-        
         # 특별 매칭 규칙 확인
-        for match_keyword, variants in special_matches.items():
+        for match_keyword, variants in FUZZY_SPECIAL_MATCHES.items():
             if keyword in match_keyword or match_keyword in keyword:
                 for variant in variants:
                     if variant in text:
@@ -189,6 +191,78 @@ class PersonaRecommendationEngine:
         
         return False
     
+    def _get_interest_matcher(self, persona: PersonaProfile) -> PersonaKeywordMatcher:
+        """페르소나별 컴파일된 관심사 매처"""
+        matcher = self._interest_matchers.get(persona.name)
+        if matcher is None or not matcher.matches(persona.interests):
+            matcher = PersonaKeywordMatcher(persona.interests)
+            self._interest_matchers[persona.name] = matcher
+        return matcher
+    
+    def _match_trends(self, category_lower: str) -> List[Tuple[str, int]]:
+        """카테고리와 매칭되는 트렌드 (trend_data 순서)"""
+        if self.use_compiled_matcher:
+            if not self._trend_matcher.matches(self.trend_data):
+                self._trend_matcher = TrendCategoryMatcher(self.trend_data)
+            return self._trend_matcher.match_category(category_lower)
+        
+        matched = []
+        for trend_keyword, trend_score in self.trend_data.items():
+            keyword_lower = trend_keyword.lower()
+            # Check for category-trend matches
+            if (keyword_lower in category_lower or 
+                category_lower in keyword_lower or
+                (category_lower == "메이크업" and keyword_lower == "makeup") or
+                (category_lower == "makeup" and keyword_lower == "makeup") or
+                (category_lower == "스킨케어" and keyword_lower == "skincare") or
+                (category_lower == "skincare" and keyword_lower == "skincare") or
+                (category_lower == "패션" and keyword_lower == "fashion") or
+                (category_lower == "fashion" and keyword_lower == "fashion")):
+                matched.append((trend_keyword, trend_score))
+        return matched
+    
+    def _match_interests(self, search_text: str, persona: PersonaProfile) -> List[Tuple[str, str, bool]]:
+        """
+        상품 텍스트와 매칭되는 관심사
+        
+        Returns:
+            [(관심사 키워드, 매칭된 키워드, 메인 키워드 매칭 여부), ...]
+        """
+        if self.use_compiled_matcher:
+            return self._get_interest_matcher(persona).match_interests(search_text)
+        
+        matched = []
+        matched_interest_categories = set()  # 중복 점수 방지
+        
+        for interest_obj in persona.interests:
+            keyword = interest_obj["keyword"]
+            related_keywords = interest_obj["related"]
+            
+            # 해당 관심사 카테고리가 이미 매칭되었는지 확인
+            if keyword in matched_interest_categories:
+                continue
+            
+            # 1. 메인 키워드 확인 (부분 문자열 매칭 포함)
+            keyword_lower = keyword.lower()
+            if (keyword_lower in search_text or 
+                any(part in search_text for part in keyword_lower.split()) or
+                self._fuzzy_match(keyword_lower, search_text)):
+                matched.append((keyword, keyword, True))
+                matched_interest_categories.add(keyword)
+                continue
+            
+            # 2. 관련 키워드 확인 (향상된 매칭)
+            for related in related_keywords:
+                related_lower = related.lower()
+                if (related_lower in search_text or 
+                    any(part in search_text for part in related_lower.split()) or
+                    self._fuzzy_match(related_lower, search_text)):
+                    matched.append((keyword, related, False))
+                    matched_interest_categories.add(keyword)
+                    break
+        
+        return matched
+    
     def _calculate_product_score(self, product_name: str, category: str, persona: PersonaProfile) -> Dict[str, Any]:
         """Calculate detailed scoring for product recommendations"""
         scoring_details = {
@@ -214,21 +288,11 @@ class PersonaRecommendationEngine:
         category_lower = category.lower()
         matched_trends = []
         
-        for trend_keyword, trend_score in self.trend_data.items():
-            keyword_lower = trend_keyword.lower()
-            # Check for category-trend matches
-            if (keyword_lower in category_lower or 
-                category_lower in keyword_lower or
-                (category_lower == "메이크업" and keyword_lower == "makeup") or
-                (category_lower == "makeup" and keyword_lower == "makeup") or
-                (category_lower == "스킨케어" and keyword_lower == "skincare") or
-                (category_lower == "skincare" and keyword_lower == "skincare") or
-                (category_lower == "패션" and keyword_lower == "fashion") or
-                (category_lower == "fashion" and keyword_lower == "fashion")):
-                # Scale trend score to max 25 points (trend scores are typically 0-100)
-                boost = min(25, int(trend_score * 0.25))
-                trend_boost += boost
-                matched_trends.append(f"{trend_keyword}({trend_score})")
+        for trend_keyword, trend_score in self._match_trends(category_lower):
+            # Scale trend score to max 25 points (trend scores are typically 0-100)
+            boost = min(25, int(trend_score * 0.25))
+            trend_boost += boost
+            matched_trends.append(f"{trend_keyword}({trend_score})")
         
         trend_boost = min(25, trend_boost)
         scoring_details["trend_boost"] = trend_boost
@@ -241,7 +305,6 @@ class PersonaRecommendationEngine:
         # Smart Interest Alignment (20 points max)
         interest_score = 0
         matching_interests = []
-        matched_interest_categories = set()  # 중복 점수 방지
         
         # 상품명과 카테고리를 소문자로 변환하여 검색 대상 텍스트 준비
         search_text = f"{product_name.lower()} {category_lower}".strip()
@@ -250,48 +313,19 @@ class PersonaRecommendationEngine:
             self._debug_print(f"   🔎 Smart Interest Matching for: {product_name}")
             self._debug_print(f"      Search text: '{search_text}'")
         
-        for interest_obj in persona.interests:
-            keyword = interest_obj["keyword"]
-            related_keywords = interest_obj["related"]
-            
-            # 해당 관심사 카테고리가 이미 매칭되었는지 확인
-            if keyword in matched_interest_categories:
-                continue
-            
-            match_found = False
-            matched_keyword = None
-            
-            # 1. 메인 키워드 확인 (부분 문자열 매칭 포함)
-            keyword_lower = keyword.lower()
-            if (keyword_lower in search_text or 
-                any(part in search_text for part in keyword_lower.split()) or
-                self._fuzzy_match(keyword_lower, search_text)):
-                match_found = True
-                matched_keyword = keyword
-                if self.debug_mode:
+        for keyword, matched_keyword, is_main in self._match_interests(search_text, persona):
+            if self.debug_mode:
+                if is_main:
                     self._debug_print(f"      ✓ Main keyword match: '{keyword}'")
-            
-            # 2. 관련 키워드 확인 (향상된 매칭)
-            if not match_found:
-                for related in related_keywords:
-                    related_lower = related.lower()
-                    if (related_lower in search_text or 
-                        any(part in search_text for part in related_lower.split()) or
-                        self._fuzzy_match(related_lower, search_text)):
-                        match_found = True
-                        matched_keyword = related
-                        if self.debug_mode:
-                            self._debug_print(f"      ✓ Related keyword match: '{related}' for '{keyword}'")
-                        break
+                else:
+                    self._debug_print(f"      ✓ Related keyword match: '{matched_keyword}' for '{keyword}'")
             
             # 매칭이 발견되면 점수 부여 (관심사당 8점)
-            if match_found:
-                interest_score += 8
-                matching_interests.append(f"{keyword} -> {matched_keyword}")
-                matched_interest_categories.add(keyword)
-                
-                if self.debug_mode:
-                    self._debug_print(f"      🎯 Interest match: {keyword} -> {matched_keyword} (+8 points)")
+            interest_score += 8
+            matching_interests.append(f"{keyword} -> {matched_keyword}")
+            
+            if self.debug_mode:
+                self._debug_print(f"      🎯 Interest match: {keyword} -> {matched_keyword} (+8 points)")
         
         interest_score = min(20, interest_score)
         scoring_details["interest_alignment"] = interest_score
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+이벤트 유사 중복 탐지 (MinHash + LSH)
+Near-duplicate clustering for local events across sources and across days
+
+- 이벤트 이름 + 설명을 단어 shingle 집합으로 만들고 MinHash 서명 계산
+- 서명을 band 로 나눈 LSH 버킷을 로컬 SQLite 에 저장 → 새 이벤트는 같은 버킷의 후보만 비교 (전체 스캔 없음)
+- 날짜/장소 blocking: 둘 다 값이 있는데 서로 다르면 후보에서 제외 (같은 장소의 다른 회차, 같은 날 다른 장소)
+- 클러스터 ID 는 처음 본 이벤트의 키로 고정되어 다음 실행에서도 유지
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = os.getenv("EVENT_DEDUP_INDEX_PATH", "data/event_dedup/event_index.db")
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_TOKEN = re.compile(r'[a-z0-9]+')
+_MONTHS = ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+
+# 같은 장소의 다른 표기
+LOCATION_ALIASES = {
+    'bonifacio global city': 'bgc',
+    'bonifacio globalcity': 'bgc',
+    'metro manila': 'manila',
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS event_signatures (
+    event_key TEXT PRIMARY KEY,
+    cluster_id TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    date_key TEXT,
+    location_key TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_event_signatures_cluster ON event_signatures(cluster_id);
+CREATE INDEX IF NOT EXISTS idx_event_signatures_last_seen ON event_signatures(last_seen);
+
+CREATE TABLE IF NOT EXISTS lsh_buckets (
+    bucket INTEGER NOT NULL,
+    event_key TEXT NOT NULL,
+    PRIMARY KEY (bucket, event_key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_lsh_buckets_event ON lsh_buckets(event_key);
+"""
+
+
+def event_key(event: Dict[str, Any]) -> str:
+    """DB 고유 키 (source_url, event_name) 와 같은 기준의 이벤트 키"""
+    name = (event.get('event_name') or '').lower().strip()
+    return hashlib.sha1(f"{event.get('source_url') or ''}|{name}".encode('utf-8')).hexdigest()[:20]
+
+
+def shingles(event: Dict[str, Any], size: int = 2) -> Set[int]:
+    """이름 단어 + 이름/설명 단어 n-gram → 32비트 해시 집합"""
+    name_tokens = _TOKEN.findall((event.get('event_name') or '').lower())
+    text_tokens = _TOKEN.findall(f"{event.get('event_name') or ''} {event.get('event_description') or ''}".lower())
+
+    grams = {f"n:{token}" for token in name_tokens}
+    grams.update(" ".join(text_tokens[i:i + size]) for i in range(max(1, len(text_tokens) - size + 1)))
+    return {zlib.crc32(gram.encode('utf-8')) for gram in grams if gram}
+
+
+def date_key(raw_date: Optional[str]) -> Optional[str]:
+    """날짜 문자열 → 비교용 키 (월 + 첫 날짜, 반복 일정은 정규화한 문구)"""
+    if not raw_date:
+        return None
+    text = raw_date.lower()
+    tokens = _TOKEN.findall(text)
+    if 'every' in tokens:
+        return " ".join(tokens)
+
+    month = next((m for token in tokens for m in _MONTHS if token.startswith(m)), None)
+    day = next((token for token in tokens if token.isdigit() and len(token) <= 2), None)
+    if '/' in text:
+        parts = re.findall(r'\d+', text)
+        if len(parts) >= 2:
+            return f"{int(parts[0]):02d}-{int(parts[1]):02d}"
+    if month and day:
+        return f"{_MONTHS.index(month) + 1:02d}-{int(day):02d}"
+    return " ".join(tokens) or None
+
+
+def location_key(location: Optional[str]) -> Optional[str]:
+    if not location:
+        return None
+    normalized = " ".join(_TOKEN.findall(location.lower()))
+    return LOCATION_ALIASES.get(normalized, normalized) or None
+
+
+class EventDeduplicator:
+    """
+    MinHash/LSH 기반 이벤트 클러스터링 + 영구 서명 인덱스
+
+    deduplicate() 는 실행 단위로 클러스터당 한 건만 남기고 모든 이벤트에 event_cluster_id 를 붙입니다.
+    """
+
+    def __init__(
+        self,
+        index_path: Optional[str] = None,
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.5,
+        seed: int = 1
+    ):
+        """
+        Args:
+            index_path: SQLite 인덱스 경로 (기본값: EVENT_DEDUP_INDEX_PATH 또는 data/event_dedup/event_index.db)
+            num_perm: MinHash 해시 함수 수
+            bands: LSH band 수 (num_perm 의 약수, band 가 많을수록 낮은 유사도도 후보가 됨)
+            threshold: 중복으로 볼 추정 Jaccard 유사도
+            seed: 해시 계수 시드 (인덱스와 같은 값을 유지해야 함)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, _MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+
+        self.index_path = Path(index_path or DEFAULT_INDEX_PATH)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+        self.stats = {"events": 0, "duplicates": 0, "new_clusters": 0, "queries": 0, "candidates": 0}
+
+    # ------------------------------------------------------------------
+    # 서명
+    # ------------------------------------------------------------------
+
+    def signature(self, shingle_hashes: Set[int]) -> np.ndarray:
+        """MinHash 서명 (num_perm 개의 uint32)"""
+        if not shingle_hashes:
+            return np.full(self.num_perm, _MERSENNE_PRIME, dtype=np.uint32)
+        values = np.fromiter(shingle_hashes, dtype=np.uint64, count=len(shingle_hashes)) % _MERSENNE_PRIME
+        hashed = (np.outer(self._a, values) + self._b[:, None]) % _MERSENNE_PRIME
+        return hashed.min(axis=1).astype(np.uint32)
+
+    def _buckets(self, signature: np.ndarray) -> List[int]:
+        """band 별 버킷 키 (band 번호 포함, SQLite INTEGER 범위)"""
+        buckets = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            digest = hashlib.blake2b(chunk, digest_size=7, person=band.to_bytes(2, 'little')).digest()
+            buckets.append(int.from_bytes(digest, 'little'))
+        return buckets
+
+    @staticmethod
+    def similarity(left: np.ndarray, right: np.ndarray) -> float:
+        """추정 Jaccard 유사도"""
+        return float(np.mean(left == right))
+
+    # ------------------------------------------------------------------
+    # 조회 / 기록
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _compatible(left: Optional[str], right: Optional[str]) -> bool:
+        return left is None or right is None or left == right
+
+    def _best_match(
+        self, cursor, key: str, signature: np.ndarray, buckets: List[int], dates: Optional[str], location: Optional[str]
+    ) -> Optional[Tuple[str, float]]:
+        placeholders = ",".join("?" * len(buckets))
+        rows = cursor.execute(
+            f"""
+            SELECT s.event_key, s.cluster_id, s.signature, s.date_key, s.location_key
+            FROM event_signatures s
+            WHERE s.event_key IN (SELECT DISTINCT event_key FROM lsh_buckets WHERE bucket IN ({placeholders}))
+              AND s.event_key != ?
+            """,
+            (*buckets, key)
+        ).fetchall()
+
+        self.stats["queries"] += 1
+        self.stats["candidates"] += len(rows)
+
+        best = None
+        for _, cluster_id, blob, other_date, other_location in rows:
+            if not (self._compatible(dates, other_date) and self._compatible(location, other_location)):
+                continue
+            score = self.similarity(signature, np.frombuffer(blob, dtype=np.uint32))
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (cluster_id, score)
+        return best
+
+    def assign(self, event: Dict[str, Any], cursor=None) -> Tuple[str, bool]:
+        """
+        이벤트를 인덱스에 기록하고 클러스터 ID 반환
+
+        Returns:
+            (cluster_id, 기존 클러스터에 합류했는지)
+        """
+        own_cursor = cursor is None
+        with self._lock:
+            cursor = cursor or self._conn.cursor()
+            key = event_key(event)
+            signature = self.signature(shingles(event))
+            buckets = self._buckets(signature)
+            dates = date_key(event.get('event_dates'))
+            location = location_key(event.get('event_location'))
+            now = time.time()
+
+            existing = cursor.execute(
+                "SELECT cluster_id, signature FROM event_signatures WHERE event_key = ?", (key,)
+            ).fetchone()
+            if existing and np.array_equal(np.frombuffer(existing[1], dtype=np.uint32), signature):
+                cursor.execute("UPDATE event_signatures SET last_seen = ? WHERE event_key = ?", (now, key))
+                cluster_id, joined = existing[0], existing[0] != key
+            else:
+                match = self._best_match(cursor, key, signature, buckets, dates, location)
+                if existing:
+                    cluster_id = existing[0]
+                elif match:
+                    cluster_id = match[0]
+                else:
+                    cluster_id = key
+                    self.stats["new_clusters"] += 1
+                joined = cluster_id != key
+
+                cursor.execute("DELETE FROM lsh_buckets WHERE event_key = ?", (key,))
+                cursor.execute(
+                    """
+                    INSERT INTO event_signatures(event_key, cluster_id, signature, date_key, location_key, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(event_key) DO UPDATE SET
+                        signature = excluded.signature, date_key = excluded.date_key,
+                        location_key = excluded.location_key, last_seen = excluded.last_seen
+                    """,
+                    (key, cluster_id, signature.tobytes(), dates, location, now, now)
+                )
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO lsh_buckets(bucket, event_key) VALUES (?, ?)",
+                    [(bucket, key) for bucket in buckets]
+                )
+
+            if own_cursor:
+                self._conn.commit()
+            return cluster_id, joined
+
+    def deduplicate(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        클러스터당 한 건만 남긴 이벤트 목록 (입력 순서 유지)
+
+        이번 실행에 클러스터 대표(처음 본 이벤트)가 있으면 대표를, 없으면 처음 나온 이벤트를 남깁니다.
+        """
+        tagged: List[Dict[str, Any]] = []
+        clusters: Dict[str, List[int]] = {}
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                for event in events:
+                    cluster_id, _ = self.assign(event, cursor)
+                    clusters.setdefault(cluster_id, []).append(len(tagged))
+                    tagged.append({**event, 'event_cluster_id': cluster_id})
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+        kept_positions = []
+        for cluster_id, positions in clusters.items():
+            representative = next((i for i in positions if event_key(tagged[i]) == cluster_id), positions[0])
+            kept_positions.append(representative)
+            if len(positions) > 1:
+                sources = sorted({tagged[i].get('source_website') or 'unknown' for i in positions})
+                logger.debug(f"🧬 '{tagged[representative].get('event_name')}' listed {len(positions)}x ({', '.join(sources)})")
+        kept = [tagged[i] for i in sorted(kept_positions)]
+
+        self.stats["events"] += len(events)
+        self.stats["duplicates"] += len(events) - len(kept)
+        return kept
+
+    def prune(self, max_age_days: int = 60) -> int:
+        """max_age_days 동안 다시 보이지 않은 이벤트 제거"""
+        cutoff = time.time() - max_age_days * 86400
+        with self._lock:
+            keys = [row[0] for row in self._conn.execute(
+                "SELECT event_key FROM event_signatures WHERE last_seen < ?", (cutoff,)
+            ).fetchall()]
+            self._conn.executemany("DELETE FROM lsh_buckets WHERE event_key = ?", [(key,) for key in keys])
+            self._conn.executemany("DELETE FROM event_signatures WHERE event_key = ?", [(key,) for key in keys])
+            self._conn.commit()
+        return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            indexed, clusters = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT cluster_id) FROM event_signatures"
+            ).fetchone()
+        avg_candidates = self.stats["candidates"] / self.stats["queries"] if self.stats["queries"] else 0.0
+        return {**self.stats, "indexed": indexed, "clusters": clusters, "avg_candidates": round(avg_candidates, 2)}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+이벤트 필드 일괄 추출기
+Compiled date / location / category / tag extraction for LocalEventScraper
+
+- 날짜/장소: 필드별 패턴을 모듈 로드 시 한 번만 컴파일하고, 기존과 같은 우선순위 순서로 검색.
+  \\w+ 로 시작하는 패턴은 단어 시작에만 매치되도록 고정하고 (가장 왼쪽 매치는 항상 단어 시작이므로
+  결과 동일), 패턴에 반드시 필요한 리터럴(연도 숫자, 'every', 지명)이 없으면 정규식을 건너뜀
+- 분류/태그: 모든 키워드 → 라벨 자동자 한 번의 스캔 (pyahocorasick 이 있으면 Aho-Corasick,
+  없으면 중복 제거한 키워드 부분 문자열 검사)
+- 결과는 LocalEventScraper 의 이벤트별 메서드와 항상 동일
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 우선순위 순서 (앞의 패턴이 어디서든 매치되면 그 결과 사용)
+DATE_PATTERNS = [
+    r'(\w+\s+\d{1,2}(?:-\d{1,2})?,?\s+\d{4})',  # "July 11-13, 2025"
+    r'(\d{1,2}(?:-\d{1,2})?\s+\w+\s+\d{4})',     # "11-13 July 2025"
+    r'(every\s+\w+)',                             # "every Saturday"
+    r'(\w+\s+\d{1,2},?\s+\d{4})',                # "July 11, 2025"
+    r'(\d{1,2}/\d{1,2}/\d{4})',                  # "07/11/2025"
+]
+
+# Common Philippine location patterns
+LOCATION_PATTERNS = [
+    r'(BGC|Bonifacio Global City)',
+    r'(Makati|Manila|Quezon City|Taguig|Pasig)',
+    r'(Greenbelt|SM\s+\w+|Ayala\s+\w+)',
+    r'(The\s+\w+\s+Mall|Gateway\s+Mall)',
+    r'(\w+\s+Center|\w+\s+Plaza)'
+]
+
+# 패턴별 필수 조건: (4자리 숫자 필요 여부, 소문자 텍스트에 하나는 있어야 하는 리터럴)
+DATE_GUARDS = [(True, ()), (True, ()), (False, ('every',)), (True, ()), (True, ('/',))]
+LOCATION_GUARDS = [
+    (False, ('bgc', 'bonifacio global city')),
+    (False, ('makati', 'manila', 'quezon city', 'taguig', 'pasig')),
+    (False, ('greenbelt', 'sm', 'ayala')),
+    (False, ('mall',)),
+    (False, ('center', 'plaza')),
+]
+
+# 우선순위 순서, 어느 키워드도 없으면 DEFAULT_CATEGORY
+CATEGORY_KEYWORDS = {
+    'bazaar': ['bazaar', 'market', 'tiangge'],
+    'pop_up': ['pop-up', 'popup', 'pop up'],
+    'festival': ['festival', 'fest'],
+    'exhibition': ['exhibition', 'exhibit', 'gallery'],
+    'food_event': ['food', 'restaurant', 'dining'],
+    'fashion_event': ['fashion', 'style', 'clothing'],
+    'art_event': ['art', 'creative', 'design'],
+}
+DEFAULT_CATEGORY = 'lifestyle_event'
+
+TAG_KEYWORDS = {
+    'food': ['food', 'dining', 'restaurant', 'eat', 'cuisine'],
+    'fashion': ['fashion', 'style', 'clothing', 'outfit', 'wear'],
+    'art': ['art', 'creative', 'design', 'artist', 'gallery'],
+    'music': ['music', 'band', 'concert', 'live', 'performance'],
+    'wellness': ['wellness', 'health', 'yoga', 'meditation', 'fitness'],
+    'beauty': ['beauty', 'makeup', 'skincare', 'cosmetics'],
+    'shopping': ['shopping', 'sale', 'discount', 'store', 'boutique'],
+    'local': ['local', 'filipino', 'pinoy', 'manila', 'philippine']
+}
+
+_YEAR = re.compile(r'\d{4}')
+
+
+# (\w+\s+\d{1,2}...) 형태 - 숫자 부분을 먼저 찾고 앞 단어로 확장
+_WORD_THEN_DIGITS = re.compile(r'^\(\\w\+\\s\+\\d\{1,2\}(.*)\)$')
+
+
+def _anchor_word_start(pattern: str) -> str:
+    """
+    \\w+ 로 시작하는 대안 앞에 (?<!\\w) 추가
+
+    단어 중간에서 매치되면 같은 단어의 시작에서도 매치되므로 가장 왼쪽 매치는 바뀌지 않고,
+    단어 중간 위치마다 \\w+ 를 다시 시도하는 비용만 사라집니다.
+    """
+    return re.sub(r'(^\(|\|)\\w\+', r'\1(?<!\\w)\\w+', pattern)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'  # 정규식 \w 와 같은 기준
+
+
+class _RegexRule:
+    def __init__(self, pattern: str, flags: int):
+        self._regex = re.compile(_anchor_word_start(pattern), flags)
+
+    def search(self, text: str) -> Optional[str]:
+        match = self._regex.search(text)
+        return match.group(1) if match else None
+
+
+class _WordThenDigitsRule:
+    """
+    (\\w+\\s+\\d{1,2}REST) 전용 검색
+
+    \\w+\\s+ 부분은 단어 전체와 공백 전체를 소비할 수밖에 없으므로, 공백 바로 뒤의 숫자 부분
+    (\\d\\d?REST) 을 왼쪽부터 찾은 뒤 앞의 공백/단어로 확장하면 같은 매치가 됩니다.
+    숫자는 드물기 때문에 모든 단어 시작에서 정규식을 시도하는 것보다 훨씬 빠릅니다.
+    """
+
+    def __init__(self, rest: str, flags: int):
+        self._core = re.compile(r'\d(?<=\s\d)\d?' + rest, flags)
+
+    def search(self, text: str) -> Optional[str]:
+        pos = 0
+        while True:
+            match = self._core.search(text, pos)
+            if match is None:
+                return None
+            start = match.start()
+            while start > 0 and text[start - 1].isspace():
+                start -= 1
+            if start > 0 and _is_word_char(text[start - 1]):
+                while start > 0 and _is_word_char(text[start - 1]):
+                    start -= 1
+                return text[start:match.end()]
+            pos = match.start() + 1
+
+
+def _compile_rule(pattern: str, flags: int):
+    word_then_digits = _WORD_THEN_DIGITS.match(pattern)
+    if word_then_digits:
+        return _WordThenDigitsRule(word_then_digits.group(1), flags)
+    return _RegexRule(pattern, flags)
+
+
+class OrderedPatterns:
+    """
+    우선순위 패턴 목록의 컴파일 버전
+
+    결과는 `for p in patterns: m = re.search(p, text, flags); if m: return m.group(1)` 과 같습니다.
+    리터럴 조건은 ASCII 텍스트에만 적용합니다 (IGNORECASE 의 유니코드 대소문자 매칭과 str.lower() 차이 회피).
+    """
+
+    def __init__(self, patterns: Sequence[str], guards: Sequence[Tuple[bool, Tuple[str, ...]]], flags: int = 0):
+        if len(patterns) != len(guards):
+            raise ValueError("Each pattern needs a guard")
+        self._rules = [
+            (_compile_rule(pattern, flags), needs_year, literals)
+            for pattern, (needs_year, literals) in zip(patterns, guards)
+        ]
+        self._uses_year = any(needs_year for _, needs_year, _ in self._rules)
+
+    def search(self, text: str, lowered: Optional[str] = None) -> Optional[str]:
+        """
+        Args:
+            text: 원본 텍스트
+            lowered: text.lower() (ASCII 텍스트일 때만 리터럴 조건에 사용, 없으면 계산)
+        """
+        if text.isascii():
+            lowered = lowered if lowered is not None else text.lower()
+        else:
+            lowered = None
+        has_year = _YEAR.search(text) is not None if self._uses_year else True
+
+        for rule, needs_year, literals in self._rules:
+            if needs_year and not has_year:
+                continue
+            if literals and lowered is not None and not any(literal in lowered for literal in literals):
+                continue
+            found = rule.search(text)
+            if found is not None:
+                return found
+        return None
+
+
+class KeywordAutomaton:
+    """
+    키워드 → 라벨 집합 단일 스캔
+
+    결과는 라벨별 `any(keyword in text for keyword in keywords)` 와 같습니다.
+    """
+
+    def __init__(self, keyword_labels: Dict[str, Iterable[str]]):
+        self._labels: Dict[str, FrozenSet[str]] = {
+            keyword: frozenset(labels) for keyword, labels in keyword_labels.items()
+        }
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, labels in self._labels.items():
+                self._automaton.add_word(keyword, labels)
+            self._automaton.make_automaton()
+
+    def labels(self, text: str) -> FrozenSet[str]:
+        """text (이미 소문자) 에 등장하는 키워드의 라벨 전체"""
+        found = set()
+        if self._automaton is not None:
+            for _, labels in self._automaton.iter(text):
+                found.update(labels)
+        else:
+            for keyword, labels in self._labels.items():
+                if keyword in text:
+                    found.update(labels)
+        return frozenset(found)
+
+
+def _keyword_labels() -> Dict[str, List[str]]:
+    keyword_labels: Dict[str, List[str]] = {}
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_labels.setdefault(keyword, []).append(f"category:{category}")
+    for tag, keywords in TAG_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_labels.setdefault(keyword, []).append(f"tag:{tag}")
+    return keyword_labels
+
+
+DATE_REGEX = OrderedPatterns(DATE_PATTERNS, DATE_GUARDS, re.IGNORECASE)
+LOCATION_REGEX = OrderedPatterns(LOCATION_PATTERNS, LOCATION_GUARDS, re.IGNORECASE)
+KEYWORDS = KeywordAutomaton(_keyword_labels())
+CATEGORY_LABELS = [(f"category:{category}", category) for category in CATEGORY_KEYWORDS]
+TAG_LABELS = [(f"tag:{tag}", tag) for tag in TAG_KEYWORDS]
+
+
+@dataclass
+class EventFields:
+    """이벤트 한 건의 추출 결과"""
+    raw_date: Optional[str]
+    is_recurring: bool
+    location: Optional[str]
+    event_type: str
+    tags: List[str]
+
+
+def extract_date_info(text: str, lowered: Optional[str] = None) -> Dict[str, Optional[str]]:
+    """LocalEventScraper._extract_date_info 와 같은 결과"""
+    raw_date = DATE_REGEX.search(text, lowered)
+    if raw_date is None:
+        return {'raw_date': None, 'is_recurring': False}
+    return {'raw_date': raw_date, 'is_recurring': 'every' in raw_date.lower()}
+
+
+def extract_location(text: str, lowered: Optional[str] = None) -> Optional[str]:
+    """LocalEventScraper._extract_location_info 와 같은 결과"""
+    return LOCATION_REGEX.search(text, lowered)
+
+
+def classify(title: str, description: str) -> Tuple[str, List[str]]:
+    """(분류, 태그) - _categorize_event / _extract_tags 와 같은 결과를 한 번의 스캔으로"""
+    labels = KEYWORDS.labels(f"{title} {description}".lower())
+    event_type = next((category for label, category in CATEGORY_LABELS if label in labels), DEFAULT_CATEGORY)
+    return event_type, [tag for label, tag in TAG_LABELS if label in labels]
+
+
+def extract_fields(title: str, text: str) -> EventFields:
+    """제목 + 본문 텍스트에서 모든 필드 추출"""
+    lowered = text.lower()
+    date_info = extract_date_info(text, lowered)
+    event_type, tags = classify(title, text)
+    return EventFields(
+        raw_date=date_info['raw_date'],
+        is_recurring=date_info['is_recurring'],
+        location=extract_location(text, lowered),
+        event_type=event_type,
+        tags=tags
+    )
+
+
+def extract_batch(events: Iterable[Tuple[str, str]]) -> List[EventFields]:
+    """(제목, 본문) 목록을 한 번 순회하며 필드 추출"""
+    return [extract_fields(title, text) for title, text in events]
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+이벤트 페이지 파서 백엔드
+Pluggable HTML backends for LocalEventScraper - html.parser / lxml (BeautifulSoup) or selectolax
+
+- 기본 추출 규칙: 키워드(event|festival|bazaar|market) 텍스트만 가진 div/article/section 의
+  부모 요소 텍스트를 앞에서부터 max_candidates 개까지 반환
+- selective 모드: SoupStrainer 로 이벤트 컨테이너 태그의 서브트리만 트리로 만들어 파싱 시간/메모리 절약
+  (컨테이너가 아닌 태그가 부모인 경우 해당 요소 텍스트만 사용하므로 결과가 달라질 수 있음)
+"""
+
+import logging
+import os
+import re
+from typing import List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import lxml  # noqa: F401 - BeautifulSoup "lxml" tree builder
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+EVENT_TAGS = ['div', 'article', 'section']
+EVENT_KEYWORD_PATTERN = re.compile(r'event|festival|bazaar|market', re.IGNORECASE)
+
+# selective 모드에서 남길 컨테이너 태그 (이벤트 요소와 그 부모가 대부분 여기에 속함)
+CONTAINER_TAGS = ['div', 'article', 'section', 'li']
+
+# BeautifulSoup.get_text() 가 제외하는 태그
+NON_TEXT_TAGS = ['script', 'style', 'template']
+
+
+def available_backends() -> List[str]:
+    """설치된 파서 백엔드 목록 (빠른 순)"""
+    backends = []
+    if SELECTOLAX_AVAILABLE:
+        backends.append('selectolax')
+    if LXML_AVAILABLE:
+        backends.append('lxml')
+    backends.append('html.parser')
+    return backends
+
+
+def default_backend() -> str:
+    """EVENT_HTML_PARSER 환경 변수 또는 사용 가능한 가장 빠른 백엔드"""
+    requested = os.getenv('EVENT_HTML_PARSER')
+    if requested:
+        if requested in available_backends():
+            return requested
+        logger.warning(f"⚠️ HTML parser backend '{requested}' unavailable, using {available_backends()[0]}")
+    return available_backends()[0]
+
+
+def _selectolax_string(node) -> Optional[str]:
+    """BeautifulSoup Tag.string 과 같은 규칙 (자식이 하나뿐인 경로를 따라 단일 텍스트)"""
+    while True:
+        children = list(node.iter(include_text=True))
+        if len(children) != 1:
+            return None
+        node = children[0]
+        if node.tag == '-text':
+            return node.text(deep=False)
+
+
+class EventPageParser:
+    """
+    이벤트 후보 텍스트 추출기
+
+    backend 와 무관하게 같은 후보 텍스트를 반환하는 것을 목표로 하며,
+    나머지 필드 추출(날짜/장소/분류)은 LocalEventScraper 가 담당합니다.
+    """
+
+    def __init__(self, backend: Optional[str] = None, selective: Optional[bool] = None, max_candidates: int = 5):
+        """
+        Args:
+            backend: 'selectolax', 'lxml', 'html.parser' (None 이면 default_backend())
+            selective: 컨테이너 서브트리만 파싱 (BeautifulSoup 백엔드 전용, None 이면 EVENT_PARSE_SELECTIVE)
+            max_candidates: 페이지당 후보 수
+        """
+        self.backend = backend or default_backend()
+        if self.backend not in available_backends():
+            raise ValueError(f"Unknown or unavailable HTML parser backend: {self.backend}")
+        if selective is None:
+            selective = os.getenv('EVENT_PARSE_SELECTIVE', 'false').lower() == 'true'
+        self.selective = selective
+        self.max_candidates = max_candidates
+
+    def candidate_texts(self, html: bytes) -> List[str]:
+        """페이지에서 이벤트 후보 컨테이너 텍스트 추출"""
+        if self.backend == 'selectolax':
+            return self._selectolax_candidates(html)
+        return self._soup_candidates(html)
+
+    def _soup_candidates(self, html: bytes) -> List[str]:
+        parse_only = SoupStrainer(CONTAINER_TAGS) if self.selective else None
+        soup = BeautifulSoup(html, self.backend, parse_only=parse_only)
+
+        texts = []
+        for element in soup.find_all(EVENT_TAGS, string=EVENT_KEYWORD_PATTERN, limit=self.max_candidates):
+            parent = element.parent if element.parent else element
+            if parent is soup and self.selective:
+                parent = element  # 원래 부모는 걸러진 태그
+            texts.append(parent.get_text(strip=True))
+        return texts
+
+    def _selectolax_candidates(self, html: bytes) -> List[str]:
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(NON_TEXT_TAGS, recursive=True)
+
+        texts = []
+        for node in tree.css(', '.join(EVENT_TAGS)):
+            string = _selectolax_string(node)
+            if string is None or not EVENT_KEYWORD_PATTERN.search(string):
+                continue
+            parent = node.parent if node.parent else node
+            texts.append(parent.text(deep=True, separator='', strip=True))
+            if len(texts) >= self.max_candidates:
+                break
+        return texts
@@ -1,9 +1,10 @@
 """
 Google Trends scraper implementation
 """
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import logging
 import json
+import os
 import asyncio
 import time
 import pandas as pd
@@ -21,6 +22,7 @@ sys.path.insert(0, str(project_root))
 from config.settings import Settings
 from utils.anti_bot_system import AntiBotSystem
 from utils.ethical_scraping import ScrapingPolicy
+from utils.trends_cache import TrendsCache
 
 logger = logging.getLogger(__name__)
 
@@ -28,17 +30,35 @@ logger = logging.getLogger(__name__)
 class GoogleTrendsScraper:
     """Google Trends 데이터 스크래퍼"""
     
+    # 같은 build_payload 인자를 다시 쓸 수 있는 시간 (초) - 한 번의 get_trends 안에서만 재사용되도록 짧게 유지
+    PAYLOAD_REUSE_SECONDS = 60
+    
     def __init__(
         self,
         anti_bot_system: AntiBotSystem,
         scraping_policy: ScrapingPolicy,
         hl: str = "en-PH",
-        tz: int = 480  # Manila timezone
+        tz: int = 480,  # Manila timezone
+        trends_cache: Optional[TrendsCache] = None
     ):
+        """
+        Args:
+            trends_cache: pytrends 결과 영구 캐시 (기본값: TRENDS_CACHE_ENABLED 이면 data/trends_cache, False 면 사용 안 함)
+        """
         self.anti_bot_system = anti_bot_system
         self.scraping_policy = scraping_policy
         self.pytrends = TrendReq(hl=hl, tz=tz)
         self.last_request_time = None
+        self._payload = None  # 마지막 build_payload 인자 (같은 요청이면 토큰 재요청 생략)
+        self._payload_built_at = 0.0
+        
+        self.trends_cache = trends_cache
+        default_cache = "false" if os.environ.get('TESTING') == 'true' else "true"
+        if self.trends_cache is None and os.getenv('TRENDS_CACHE_ENABLED', default_cache).lower() == 'true':
+            try:
+                self.trends_cache = TrendsCache()
+            except Exception as e:
+                logger.warning(f"⚠️ Trends cache unavailable, every request will hit Google Trends: {e}")
         
         # Popular keywords in Philippines to track instead of trending searches
         self.popular_keywords = [
@@ -65,23 +85,109 @@ class GoogleTrendsScraper:
         
         logger.info(f"Google Trends scraper initialized for region: {hl}")
     
+    def _build_payload(self, keywords: List[str], timeframe: str, geo: str, cat: int) -> None:
+        payload = (tuple(keywords), timeframe, geo, cat)
+        expired = time.monotonic() - self._payload_built_at >= self.PAYLOAD_REUSE_SECONDS
+        if self._payload != payload or expired:
+            self._payload = None
+            self.pytrends.build_payload(list(keywords), cat=cat, timeframe=timeframe, geo=geo, gprop='')
+            self._payload = payload
+            self._payload_built_at = time.monotonic()
+    
+    def _interest_over_time(
+        self,
+        keywords: List[str],
+        timeframe: str,
+        geo: str = 'PH',
+        cat: int = 0,
+        before_fetch: Optional[Callable[[], None]] = None
+    ) -> Tuple[pd.DataFrame, bool]:
+        """
+        interest_over_time DataFrame (캐시 우선)
+        
+        Returns:
+            (DataFrame, Google Trends 에 실제로 요청했는지)
+        """
+        if self.trends_cache:
+            cached = self.trends_cache.get('interest_over_time', keywords, timeframe, geo, cat)
+            if cached is not None:
+                return cached['interest_over_time'], False
+        
+        if before_fetch:
+            before_fetch()
+        started = time.monotonic()
+        self._build_payload(keywords, timeframe, geo, cat)
+        interest_df = self.pytrends.interest_over_time()
+        if self.trends_cache:
+            self.trends_cache.put(
+                'interest_over_time', keywords, timeframe, {'interest_over_time': interest_df},
+                geo, cat, fetch_seconds=time.monotonic() - started
+            )
+        return interest_df, True
+    
+    def _related_queries(
+        self,
+        keywords: List[str],
+        timeframe: str,
+        geo: str = 'PH',
+        cat: int = 0,
+        before_fetch: Optional[Callable[[], None]] = None
+    ) -> Tuple[Dict[str, Dict[str, Optional[pd.DataFrame]]], bool]:
+        """
+        related_queries 결과 {keyword: {'top': df, 'rising': df}} (캐시 우선)
+        
+        Returns:
+            (결과, Google Trends 에 실제로 요청했는지)
+        """
+        if self.trends_cache:
+            cached = self.trends_cache.get('related_queries', keywords, timeframe, geo, cat)
+            if cached is not None:
+                related_queries: Dict[str, Dict[str, Optional[pd.DataFrame]]] = {}
+                for name, frame in cached.items():
+                    keyword, section = name.rsplit('::', 1)
+                    related_queries.setdefault(keyword, {})[section] = frame
+                return related_queries, False
+        
+        if before_fetch:
+            before_fetch()
+        started = time.monotonic()
+        self._build_payload(keywords, timeframe, geo, cat)
+        related_queries = self.pytrends.related_queries()
+        if self.trends_cache:
+            frames = {
+                f"{keyword}::{section}": frame
+                for keyword, sections in related_queries.items()
+                for section, frame in (sections or {}).items()
+            }
+            self.trends_cache.put(
+                'related_queries', keywords, timeframe, frames,
+                geo, cat, fetch_seconds=time.monotonic() - started
+            )
+        return related_queries, True
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Trends 캐시 통계 (캐시 비활성화 시 빈 dict)"""
+        return self.trends_cache.get_stats() if self.trends_cache else {}
+    
     def get_trends(self, keywords: List[str], timeframe: str = "today 3-m") -> Dict[str, Any]:
-        """키워드에 대한 트렌드 데이터 수집"""
-        # 윤리적 스크래핑 정책 확인
-        self.scraping_policy.wait_for_rate_limit()
+        """키워드에 대한 트렌드 데이터 수집 (캐시에 있으면 요청/대기 없이 반환)"""
+        prepared = []
+        
+        def before_fetch():
+            # 실제 요청 전에 한 번만: 윤리적 스크래핑 정책 확인 + Anti-bot 시스템 적용
+            if not prepared:
+                prepared.append(True)
+                self.scraping_policy.wait_for_rate_limit()
+                self.anti_bot_system.simulate_human_behavior()
         
         try:
-            # Anti-bot 시스템 적용
-            self.anti_bot_system.simulate_human_behavior()
-            
             # 트렌드 데이터 요청
-            self.pytrends.build_payload(keywords, cat=0, timeframe=timeframe, geo="PH")
-            interest_over_time = self.pytrends.interest_over_time()
+            interest_over_time, _ = self._interest_over_time(keywords, timeframe, before_fetch=before_fetch)
             
             # related_queries를 안전하게 처리
             related_queries = {}
             try:
-                related_queries = self.pytrends.related_queries()
+                related_queries, _ = self._related_queries(keywords, timeframe, before_fetch=before_fetch)
             except (IndexError, KeyError, Exception) as e:
                 logger.warning(f"Related queries not available for keywords {keywords}: {e}")
                 related_queries = {}
@@ -150,17 +256,8 @@ class GoogleTrendsScraper:
                 batch_keywords = self.popular_keywords[i:i + batch_size]
                 
                 try:
-                    # Build payload for this batch
-                    self.pytrends.build_payload(
-                        batch_keywords, 
-                        cat=0, 
-                        timeframe='now 1-d', 
-                        geo='PH',
-                        gprop=''
-                    )
-                    
-                    # Get interest over time
-                    interest_df = self.pytrends.interest_over_time()
+                    # Get interest over time (cached batches skip the request and the delay)
+                    interest_df, fetched = self._interest_over_time(batch_keywords, 'now 1-d')
                     
                     if not interest_df.empty:
                         # Process each keyword's latest interest score
@@ -183,7 +280,8 @@ class GoogleTrendsScraper:
                                     })
                     
                     # Add delay between batches
-                    time.sleep(Settings.DELAY_BETWEEN_REQUESTS)
+                    if fetched:
+                        time.sleep(Settings.DELAY_BETWEEN_REQUESTS)
                     
                 except Exception as e:
                     logger.warning(f"Failed to get data for batch {batch_keywords}: {e}")
@@ -211,17 +309,8 @@ class GoogleTrendsScraper:
         try:
             logger.info(f"Fetching related queries for keyword: {keyword}")
             
-            # Build payload for the keyword
-            self.pytrends.build_payload(
-                [keyword], 
-                cat=0, 
-                timeframe=timeframe, 
-                geo='PH',
-                gprop=''
-            )
-            
             # Get related queries
-            related_queries = self.pytrends.related_queries()
+            related_queries, fetched = self._related_queries([keyword], timeframe)
             
             result = []
             current_time = datetime.utcnow()
@@ -276,7 +365,8 @@ class GoogleTrendsScraper:
             logger.info(f"Successfully fetched {len(result)} related queries for '{keyword}'")
             
             # Add delay to prevent rate limiting
-            time.sleep(Settings.DELAY_BETWEEN_REQUESTS)
+            if fetched:
+                time.sleep(Settings.DELAY_BETWEEN_REQUESTS)
             
             return result
             
@@ -302,15 +392,7 @@ class GoogleTrendsScraper:
             # Limit to 5 keywords at a time (Google Trends limitation)
             keywords = keywords[:5]
             
-            self.pytrends.build_payload(
-                keywords, 
-                cat=0, 
-                timeframe=timeframe, 
-                geo='PH',
-                gprop=''
-            )
-            
-            interest_df = self.pytrends.interest_over_time()
+            interest_df, fetched = self._interest_over_time(keywords, timeframe)
             
             result = []
             current_time = datetime.utcnow()
@@ -335,7 +417,8 @@ class GoogleTrendsScraper:
             logger.info(f"Successfully fetched interest over time data: {len(result)} records")
             
             # Add delay to prevent rate limiting
-            time.sleep(Settings.DELAY_BETWEEN_REQUESTS)
+            if fetched:
+                time.sleep(Settings.DELAY_BETWEEN_REQUESTS)
             
             return result
             
@@ -439,6 +522,13 @@ class GoogleTrendsScraper:
             
             logger.info(f"Google Trends data collection completed. Total records: {len(all_data)}")
             
+            if self.trends_cache:
+                stats = self.trends_cache.get_stats()
+                logger.info(
+                    f"💾 Trends cache: {stats['hits']} hits / {stats['misses']} misses, "
+                    f"saved {stats['fetch_seconds_saved']:.1f}s of requests"
+                )
+            
         except Exception as e:
             logger.error(f"Error in collect_all_data: {e}")
         
@@ -3,7 +3,9 @@ Persona-targeted Lazada Philippines scraper
 페르소나 타겟 Lazada 스크래퍼 - 20-35세 필리핀 여성 타겟
 """
 
+import os
 import time
+import queue
 import random
 import logging
 import json
@@ -11,6 +13,7 @@ import re
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
 try:
@@ -42,26 +45,152 @@ except ImportError:
     SupabaseClient = None
     print("⚠️ SupabaseClient not available - data will not be saved to database")
 
+from utils.driver_pool import WebDriverPool, get_driver_pool
+from utils.element_fields import first_tag, from_selectors
+from utils.page_readiness import PageReadinessEngine
+from utils.resource_filter import IMAGE_ATTRIBUTES, get_resource_filter, pick_image_url
+from utils.rate_limiter import DomainRateLimiter
+
 from config.persona_config import (
     TARGET_PERSONAS, 
     get_persona_keywords, 
     get_persona_filters,
+    get_persona_fingerprint,
     get_current_persona,
     ACTIVE_PERSONA
 )
 
 logger = logging.getLogger(__name__)
 
+# 카테고리 병렬 수집 설정 (워커 수와 무관하게 lazada.com.ph 요청 간격 유지)
+DEFAULT_CATEGORY_WORKERS = int(os.getenv("LAZADA_CATEGORY_WORKERS", "1"))
+LAZADA_MIN_REQUEST_INTERVAL = float(os.getenv("LAZADA_MIN_REQUEST_INTERVAL", "4.5"))  # 기존 카테고리 간 대기 3~6초 평균
+LAZADA_RATE_LIMITER = DomainRateLimiter(min_interval=LAZADA_MIN_REQUEST_INTERVAL)
+
+# 모든 제품 카드의 후보 필드를 한 번의 WebDriver 호출로 수집하는 스크립트
+# 셀렉터 순서/폴백 규칙은 _collect_candidates_webdriver 와 동일하며,
+# 값 선택은 Python 쪽 _build_product_data 에서 수행합니다.
+PRODUCT_FIELDS_SCRIPT = """
+const cards = arguments[0];
+const selectors = arguments[1];
+const imageAttributes = arguments[2];
+
+// Selenium WebElement.text 와 같이 렌더링되지 않은 요소는 빈 문자열
+const visibleText = (el) => {
+    if (!el.getClientRects().length) return '';
+    return (el.innerText || '').replace(/\\u00a0/g, ' ').trim();
+};
+const first = (card, selector) => {
+    try { return card.querySelector(selector); } catch (e) { return null; }
+};
+const pick = (card, list, read) => list.map((selector) => {
+    const el = first(card, selector);
+    return el ? (read(el) || null) : null;
+});
+// 이미지 요청이 차단되어도 DOM 속성에 남은 URL 사용 (resource_filter.pick_image_url 과 동일)
+const imageUrl = (img) => {
+    for (const attr of imageAttributes) {
+        let value = (img.getAttribute(attr) || '').trim();
+        if (value.includes(',') || value.includes(' ')) value = value.split(',')[0].trim().split(' ')[0];
+        if (value && !value.startsWith('data:')) return new URL(value, document.baseURI).href;
+    }
+    return null;
+};
+
+return cards.map((card) => {
+    const link = card.querySelector('a');
+    const img = card.querySelector('img');
+    return {
+        names: pick(card, selectors.name, (el) => el.getAttribute('title') || visibleText(el)),
+        prices: pick(card, selectors.price, visibleText),
+        href: link ? (link.href || link.getAttribute('href')) : null,
+        image: img ? imageUrl(img) : null,
+        ratings: pick(card, selectors.rating, (el) => visibleText(el) || el.getAttribute('title')),
+        reviews: pick(card, selectors.review, visibleText)
+    };
+});
+"""
+
+
+def create_lazada_driver():
+    """Lazada 용 undetected Chrome 생성 (드라이버 풀 factory)"""
+    options = uc.ChromeOptions()
+    options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--window-size=1366,768')
+    
+    # Philippines 지역 설정
+    user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    options.add_argument(f'--user-agent={user_agent}')
+    options.add_argument('--lang=en-PH,en-US,en')
+    
+    driver = uc.Chrome(options=options, version_main=None)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    driver.set_page_load_timeout(60)
+    
+    # 이미지/폰트/미디어/트래커 차단 (드라이버 수명 동안 유지)
+    get_resource_filter("lazada").apply(driver)
+    return driver
+
 
 class LazadaPersonaScraper:
     """페르소나 타겟 Lazada 스크래퍼"""
     
+    # 제품 카드 내부 필드 셀렉터 (우선순위 순)
+    PRODUCT_SELECTORS = [
+        '[data-qa-locator="product-item"]',
+        '.product-item',
+        '.item-box',
+        '.product-card'
+    ]
+    
+    NAME_SELECTORS = [
+        '[data-qa-locator="product-item"] .title',
+        '.title-wrapper a',
+        '.product-card .title',
+        'a[title]',
+        '.item-title'
+    ]
+    PRICE_SELECTORS = [
+        '.price-current',
+        '.currency',
+        '.price',
+        '[data-qa-locator="product-price"]'
+    ]
+    RATING_SELECTORS = [
+        '.rating-star',
+        '.score-average',
+        '[data-qa-locator="product-rating"]'
+    ]
+    REVIEW_SELECTORS = [
+        '.review-count',
+        '.reviews',
+        '[data-qa-locator="reviews"]'
+    ]
+    
     def __init__(
         self,
         persona_name: str = ACTIVE_PERSONA,
         base_url: str = "https://www.lazada.com.ph",
-        use_undetected: bool = True
+        use_undetected: bool = True,
+        extraction_engine: str = "js",
+        database_writer=None,
+        driver_pool: Optional[WebDriverPool] = None,
+        wait_strategy: str = "signals",
+        category_workers: int = DEFAULT_CATEGORY_WORKERS,
+        rate_limiter: Optional[DomainRateLimiter] = None
     ):
+        """
+        Args:
+            extraction_engine: "js" (단일 execute_script) 또는 "webdriver" (요소별 find_element)
+            database_writer: insert_shopee_products 를 제공하는 저장기 (예: WriteBehindWriter).
+                             지정하면 저장을 큐에 넘기고 바로 다음 작업으로 진행
+            driver_pool: 지정하면 브라우저를 새로 띄우지 않고 풀에서 대여 후 close() 에서 반납
+            wait_strategy: "signals" (카드 수/DOM/네트워크 신호 대기) 또는 "fixed" (기존 고정 sleep)
+            category_workers: 2 이상이면 카테고리 검색을 풀의 브라우저 워커들에 분산
+            rate_limiter: 검색 페이지 로드 전 도메인 요청 간격 대기 (병렬 모드 기본값: LAZADA_RATE_LIMITER)
+        """
         self.persona_name = persona_name
         self.persona = TARGET_PERSONAS.get(persona_name)
         self.persona_filters = get_persona_filters(persona_name)
@@ -69,8 +198,22 @@ class LazadaPersonaScraper:
         if not self.persona:
             raise ValueError(f"Unknown persona: {persona_name}")
         
+        if extraction_engine not in ("js", "webdriver"):
+            raise ValueError(f"Unknown extraction engine: {extraction_engine}")
+        
         self.base_url = base_url
         self.use_undetected = use_undetected
+        self.extraction_engine = extraction_engine
+        self.database_writer = database_writer
+        self.driver_pool = driver_pool
+        self.wait_strategy = wait_strategy
+        self.category_workers = max(1, category_workers)
+        self.rate_limiter = rate_limiter
+        self.readiness = PageReadinessEngine(self.PRODUCT_SELECTORS)
+        self.resource_filter = get_resource_filter("lazada")
+        self._driver_lease = None
+        self._pages_loaded = 0
+        self._bot_detected = False
         self.driver = None
         self.user_agent = UserAgent()
         self.collection_date = datetime.now()
@@ -88,25 +231,25 @@ class LazadaPersonaScraper:
         
         logger.info(f"🎯 Initialized persona scraper for: {self.persona.name}")
     
+    @classmethod
+    def shared_driver_pool(cls, max_size: int = 2, warm_size: int = 1, **kwargs) -> WebDriverPool:
+        """프로세스 전역 Lazada 드라이버 풀 (scheduler / dashboard 공용)"""
+        return get_driver_pool("lazada_persona", create_lazada_driver, max_size=max_size, warm_size=warm_size, **kwargs)
+    
     def _setup_driver(self):
-        """브라우저 설정"""
+        """브라우저 설정 (풀이 있으면 대여)"""
         try:
+            if self.driver_pool:
+                self._driver_lease = self.driver_pool.checkout()
+                self.driver = self._driver_lease.driver
+                logger.info(f"✅ Persona-targeted WebDriver checked out from pool ({self._driver_lease.checkouts} uses)")
+                return
+            
             if self.use_undetected:
-                options = uc.ChromeOptions()
-                options.add_argument('--headless=new')
-                options.add_argument('--no-sandbox')
-                options.add_argument('--disable-dev-shm-usage')
-                options.add_argument('--window-size=1366,768')
-                
-                # Philippines 지역 설정
-                user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                options.add_argument(f'--user-agent={user_agent}')
-                options.add_argument('--lang=en-PH,en-US,en')
-                
-                self.driver = uc.Chrome(options=options, version_main=None)
+                self.driver = create_lazada_driver()
             
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.driver.set_page_load_timeout(60)
+            if not self.driver:
+                raise RuntimeError("No WebDriver configured (use_undetected=False and no driver_pool)")
             
             logger.info("✅ Persona-targeted WebDriver setup completed")
             
@@ -116,6 +259,18 @@ class LazadaPersonaScraper:
     
     def _wait_and_scroll(self, wait_time: int = 10):
         """페이지 로드 대기 및 스크롤링"""
+        if self.wait_strategy == "fixed":
+            return self._wait_and_scroll_fixed(wait_time)
+        
+        try:
+            # 기존 방식: wait_time + 스크롤 3회 평균 3초 + 복귀 후 2초
+            self.readiness.wait_for_page(self.driver, scroll_count=3, legacy_seconds=wait_time + 3 * 3 + 2)
+        except Exception as e:
+            logger.warning(f"⚠️ Readiness wait failed, falling back to fixed sleeps: {e}")
+            self._wait_and_scroll_fixed(wait_time)
+    
+    def _wait_and_scroll_fixed(self, wait_time: int = 10):
+        """고정 sleep 기반 페이지 로드 대기 및 스크롤링 (wait_strategy="fixed")"""
         try:
             time.sleep(wait_time)
             
@@ -275,123 +430,120 @@ class LazadaPersonaScraper:
         
         return min(100, score)
     
+    def _build_product_data(self, candidates: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        수집된 후보 필드 값으로 제품 데이터 구성
+
+        candidates 의 names/prices/ratings/reviews 는 셀렉터 순서대로의 후보 값
+        (요소가 없으면 None), href/image 는 첫 번째 a/img 요소의 값입니다.
+        """
+        product_data = {
+            'collection_date': self.collection_date.isoformat(),
+            'search_keyword': '',
+            'product_name': 'Unknown Product',
+            'product_url': '',
+            'price': '',
+            'price_numeric': None,
+            'seller_name': 'Unknown Seller',
+            'rating': None,
+            'rating_numeric': None,
+            'review_count': None,
+            'review_count_numeric': None,
+            'image_url': '',
+            'platform': 'lazada',
+            'persona_target': self.persona_name,
+            'persona_score': 0
+        }
+        
+        # 제품명 추출
+        for name in candidates['names']:
+            if name and name.strip():
+                product_data['product_name'] = name.strip()
+                break
+        
+        # 가격 추출
+        for price_text in candidates['prices']:
+            if price_text and ('₱' in price_text or 'PHP' in price_text):
+                product_data['price'] = price_text.strip()
+                product_data['price_numeric'] = self._extract_price_value(price_text)
+                break
+        
+        # URL 추출
+        href = candidates['href']
+        if href:
+            if href.startswith('/'):
+                href = self.base_url + href
+            product_data['product_url'] = href
+        
+        # 이미지 URL 추출
+        if candidates['image']:
+            product_data['image_url'] = candidates['image']
+        
+        # 평점 추출
+        for rating_text in candidates['ratings']:
+            if rating_text:
+                product_data['rating'] = rating_text
+                product_data['rating_numeric'] = self._extract_rating_value(rating_text)
+                break
+        
+        # 리뷰 수 추출
+        for review_text in candidates['reviews']:
+            if review_text:
+                product_data['review_count'] = review_text
+                product_data['review_count_numeric'] = self._extract_review_count(review_text)
+                break
+        
+        return product_data
+    
+    def _collect_candidates_js(self, product_elements: list) -> List[Dict[str, Any]]:
+        """execute_script 한 번으로 모든 카드의 후보 필드 수집"""
+        selectors = {
+            'name': self.NAME_SELECTORS,
+            'price': self.PRICE_SELECTORS,
+            'rating': self.RATING_SELECTORS,
+            'review': self.REVIEW_SELECTORS
+        }
+        raw_cards = self.driver.execute_script(PRODUCT_FIELDS_SCRIPT, product_elements, selectors, list(IMAGE_ATTRIBUTES))
+        
+        if not isinstance(raw_cards, list) or len(raw_cards) != len(product_elements):
+            raise ValueError(f"Unexpected extraction result for {len(product_elements)} cards")
+        
+        return raw_cards
+    
+    def _collect_candidates_webdriver(self, element) -> Dict[str, Any]:
+        """요소별 find_element 호출로 후보 필드 수집 (레거시 엔진)"""
+        return {
+            'names': from_selectors(element, self.NAME_SELECTORS, lambda e: e.get_attribute('title') or e.text),
+            'prices': from_selectors(element, self.PRICE_SELECTORS, lambda e: e.text),
+            'href': first_tag(element, 'a', lambda e: e.get_attribute('href')),
+            'image': first_tag(element, 'img', lambda e: pick_image_url((e.get_attribute(a) for a in IMAGE_ATTRIBUTES), self.base_url)),
+            'ratings': from_selectors(element, self.RATING_SELECTORS, lambda e: e.text or e.get_attribute('title')),
+            'reviews': from_selectors(element, self.REVIEW_SELECTORS, lambda e: e.text)
+        }
+    
     def _extract_product_data(self, product_elements: list) -> List[Dict[str, Any]]:
         """제품 요소에서 페르소나 타겟 데이터 추출"""
         products = []
         
+        start_time = time.time()
+        engine = self.extraction_engine
+        raw_cards = None
+        
+        if engine == "js":
+            try:
+                raw_cards = self._collect_candidates_js(product_elements)
+            except Exception as e:
+                logger.warning(f"⚠️ JS extraction failed, falling back to WebDriver engine: {e}")
+                engine = "webdriver"
+        
         for i, element in enumerate(product_elements):
             try:
-                product_data = {
-                    'collection_date': self.collection_date.isoformat(),
-                    'search_keyword': '',
-                    'product_name': 'Unknown Product',
-                    'product_url': '',
-                    'price': '',
-                    'price_numeric': None,
-                    'seller_name': 'Unknown Seller',
-                    'rating': None,
-                    'rating_numeric': None,
-                    'review_count': None,
-                    'review_count_numeric': None,
-                    'image_url': '',
-                    'platform': 'lazada',
-                    'persona_target': self.persona_name,
-                    'persona_score': 0
-                }
-                
-                # 제품명 추출
-                name_selectors = [
-                    '[data-qa-locator="product-item"] .title',
-                    '.title-wrapper a',
-                    '.product-card .title',
-                    'a[title]',
-                    '.item-title'
-                ]
-                
-                for selector in name_selectors:
-                    try:
-                        name_element = element.find_element(By.CSS_SELECTOR, selector)
-                        name = name_element.get_attribute('title') or name_element.text
-                        if name and name.strip():
-                            product_data['product_name'] = name.strip()
-                            break
-                    except:
-                        continue
-                
-                # 가격 추출
-                price_selectors = [
-                    '.price-current',
-                    '.currency',
-                    '.price',
-                    '[data-qa-locator="product-price"]'
-                ]
-                
-                for selector in price_selectors:
-                    try:
-                        price_element = element.find_element(By.CSS_SELECTOR, selector)
-                        price_text = price_element.text
-                        if price_text and ('₱' in price_text or 'PHP' in price_text):
-                            product_data['price'] = price_text.strip()
-                            product_data['price_numeric'] = self._extract_price_value(price_text)
-                            break
-                    except:
-                        continue
-                
-                # URL 추출
-                try:
-                    link_element = element.find_element(By.TAG_NAME, 'a')
-                    href = link_element.get_attribute('href')
-                    if href:
-                        if href.startswith('/'):
-                            href = self.base_url + href
-                        product_data['product_url'] = href
-                except:
-                    pass
-                
-                # 이미지 URL 추출
-                try:
-                    img_element = element.find_element(By.TAG_NAME, 'img')
-                    img_src = img_element.get_attribute('src') or img_element.get_attribute('data-src')
-                    if img_src:
-                        product_data['image_url'] = img_src
-                except:
-                    pass
+                if raw_cards is not None:
+                    candidates = raw_cards[i]
+                else:
+                    candidates = self._collect_candidates_webdriver(element)
                 
-                # 평점 추출
-                rating_selectors = [
-                    '.rating-star',
-                    '.score-average',
-                    '[data-qa-locator="product-rating"]'
-                ]
-                
-                for selector in rating_selectors:
-                    try:
-                        rating_element = element.find_element(By.CSS_SELECTOR, selector)
-                        rating_text = rating_element.text or rating_element.get_attribute('title')
-                        if rating_text:
-                            product_data['rating'] = rating_text
-                            product_data['rating_numeric'] = self._extract_rating_value(rating_text)
-                            break
-                    except:
-                        continue
-                
-                # 리뷰 수 추출
-                review_selectors = [
-                    '.review-count',
-                    '.reviews',
-                    '[data-qa-locator="reviews"]'
-                ]
-                
-                for selector in review_selectors:
-                    try:
-                        review_element = element.find_element(By.CSS_SELECTOR, selector)
-                        review_text = review_element.text
-                        if review_text:
-                            product_data['review_count'] = review_text
-                            product_data['review_count_numeric'] = self._extract_review_count(review_text)
-                            break
-                    except:
-                        continue
+                product_data = self._build_product_data(candidates)
                 
                 # 페르소나 적합성 체크
                 if self._is_persona_relevant(product_data):
@@ -410,6 +562,8 @@ class LazadaPersonaScraper:
                 logger.debug(f"⚠️ Error extracting product {i}: {e}")
                 continue
         
+        logger.debug(f"⏱️ Extracted {len(product_elements)} cards with '{engine}' engine in {time.time() - start_time:.2f}s")
+        
         # 페르소나 점수 기준으로 정렬
         products.sort(key=lambda x: x['persona_score'], reverse=True)
         
@@ -432,28 +586,30 @@ class LazadaPersonaScraper:
             logger.info(f"🎯 Persona search for: {search_keyword} (max ₱{max_price})")
             logger.info(f"📍 Navigating to: {search_url}")
             
-            # 페이지 로드
+            # 페이지 로드 (병렬 워커 간 요청 간격 공유)
+            if self.rate_limiter:
+                self.rate_limiter.wait(search_url)
             self.driver.get(search_url)
+            self._pages_loaded += 1
             self._wait_and_scroll(15)
             
+            try:
+                self.resource_filter.record_page(self.driver)
+            except Exception as e:
+                logger.debug(f"Resource filter stats unavailable: {e}")
+            
             # 봇 감지 확인
             current_url = self.driver.current_url
             page_source = self.driver.page_source.lower()
             
             if 'captcha' in page_source or 'verify' in current_url:
                 logger.warning("❌ Bot detection triggered")
+                self._bot_detected = True
                 return []
             
             # 제품 요소 찾기
-            product_selectors = [
-                '[data-qa-locator="product-item"]',
-                '.product-item',
-                '.item-box',
-                '.product-card'
-            ]
-            
             found_elements = []
-            for selector in product_selectors:
+            for selector in self.PRODUCT_SELECTORS:
                 try:
                     elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                     if len(elements) >= 3:
@@ -491,35 +647,123 @@ class LazadaPersonaScraper:
             logger.error(f"❌ Error in persona product search: {e}")
             return []
     
-    def get_persona_trending_products(self, limit: int = 20, save_to_db: bool = True) -> List[Dict[str, Any]]:
-        """페르소나 타겟 트렌딩 제품 수집"""
+    def _tag_category_products(self, products: List[Dict[str, Any]], category: str) -> List[Dict[str, Any]]:
+        """카테고리 정보 추가"""
+        for product in products:
+            product['persona_category'] = category
+            product['product_type'] = f'persona_trending_{self.persona_name}'
+        return products
+    
+    def _collect_categories_sequential(self, categories: List[str], products_per_category: int) -> List[Dict[str, Any]]:
+        """단일 드라이버로 카테고리 순차 검색"""
+        all_products = []
+        
+        for category in categories:
+            try:
+                logger.info(f"🏷️ Searching persona category: {category}")
+                products = self.search_persona_products(category, limit=products_per_category)
+                all_products.extend(self._tag_category_products(products, category))
+                
+                # 카테고리 간 대기
+                time.sleep(random.uniform(3, 6))
+                
+            except Exception as e:
+                logger.warning(f"⚠️ Error with category '{category}': {e}")
+                continue
+        
+        return all_products
+    
+    def _worker_scraper(self, driver_pool: WebDriverPool, rate_limiter: DomainRateLimiter) -> "LazadaPersonaScraper":
+        """병렬 수집용 워커 (같은 설정, 드라이버는 풀에서 대여, 저장은 호출한 스크래퍼가 수행)"""
+        return LazadaPersonaScraper(
+            persona_name=self.persona_name,
+            base_url=self.base_url,
+            use_undetected=self.use_undetected,
+            extraction_engine=self.extraction_engine,
+            driver_pool=driver_pool,
+            wait_strategy=self.wait_strategy,
+            category_workers=1,
+            rate_limiter=rate_limiter
+        )
+    
+    def _collect_categories_parallel(self, categories: List[str], products_per_category: int, workers: int) -> List[Dict[str, Any]]:
+        """
+        카테고리 검색을 여러 브라우저 워커에 분산
+        
+        워커마다 풀에서 드라이버를 하나 대여해 남은 카테고리를 차례로 처리하며,
+        모든 페이지 로드는 rate_limiter 로 도메인 요청 간격을 공유합니다.
+        """
+        driver_pool = self.driver_pool or self.shared_driver_pool(max_size=workers)
+        rate_limiter = self.rate_limiter or LAZADA_RATE_LIMITER
+        
+        # 이미 만들어진 공용 풀은 max_size 를 바꾸지 않으므로 풀 크기보다 많은 워커는 대여 대기만 함
+        if driver_pool.max_size < min(workers, len(categories)):
+            logger.warning(
+                f"⚠️ Driver pool holds at most {driver_pool.max_size} browsers - "
+                f"using {driver_pool.max_size} category workers instead of {workers}"
+            )
+        workers = min(workers, driver_pool.max_size, len(categories))
+        
+        logger.info(f"🧵 Searching {len(categories)} categories with {workers} browser workers")
+        
+        pending: "queue.Queue[str]" = queue.Queue()
+        for category in categories:
+            pending.put(category)
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        
+        def run_worker():
+            scraper = self._worker_scraper(driver_pool, rate_limiter)
+            try:
+                while True:
+                    try:
+                        category = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        logger.info(f"🏷️ Searching persona category: {category}")
+                        products = scraper.search_persona_products(category, limit=products_per_category)
+                        results[category] = self._tag_category_products(products, category)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Error with category '{category}': {e}")
+            finally:
+                scraper.close()
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lazada-category") as executor:
+            futures = [executor.submit(run_worker) for _ in range(workers)]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning(f"⚠️ Category worker failed: {e}")
+        
+        # 순차 모드와 같은 카테고리 순서로 병합
+        return [product for category in categories for product in results.get(category, [])]
+    
+    def get_persona_trending_products(
+        self,
+        limit: int = 20,
+        save_to_db: bool = True,
+        workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        페르소나 타겟 트렌딩 제품 수집
+        
+        Args:
+            workers: 카테고리 병렬 워커 수 (None 이면 category_workers, 1 이면 순차 검색)
+        """
         try:
             logger.info(f"📈 Collecting persona-targeted products for: {self.persona.name}")
             
             # 페르소나 관심사 기반 카테고리
             categories = self.persona.interests[:6]  # 상위 6개 관심사
             
-            all_products = []
             products_per_category = max(1, limit // len(categories))
+            workers = self.category_workers if workers is None else max(1, workers)
             
-            for category in categories:
-                try:
-                    logger.info(f"🏷️ Searching persona category: {category}")
-                    products = self.search_persona_products(category, limit=products_per_category)
-                    
-                    # 카테고리 정보 추가
-                    for product in products:
-                        product['persona_category'] = category
-                        product['product_type'] = f'persona_trending_{self.persona_name}'
-                        
-                    all_products.extend(products)
-                    
-                    # 카테고리 간 대기
-                    time.sleep(random.uniform(3, 6))
-                    
-                except Exception as e:
-                    logger.warning(f"⚠️ Error with category '{category}': {e}")
-                    continue
+            if workers > 1 and len(categories) > 1:
+                all_products = self._collect_categories_parallel(categories, products_per_category, workers)
+            else:
+                all_products = self._collect_categories_sequential(categories, products_per_category)
             
             # 중복 제거 (URL 기준)
             seen_urls = set()
@@ -555,7 +799,8 @@ class LazadaPersonaScraper:
     
     def _save_to_supabase(self, products: List[Dict[str, Any]]) -> bool:
         """페르소나 타겟 제품을 Supabase에 저장"""
-        if not self.supabase_client:
+        writer = self.database_writer or self.supabase_client
+        if not writer:
             logger.warning("⚠️ Supabase client not available - skipping database save")
             return False
         
@@ -587,6 +832,7 @@ class LazadaPersonaScraper:
                         'scrape_method': 'persona_targeted',
                         'persona_name': self.persona_name,
                         'persona_score': product.get('persona_score', 0),
+                        'persona_fingerprint': get_persona_fingerprint(self.persona_name),
                         'brand_bonus': product.get('brand_bonus', False),
                         'collection_timestamp': self.collection_date.isoformat()
                     }
@@ -594,7 +840,7 @@ class LazadaPersonaScraper:
                 formatted_products.append(formatted_product)
             
             # 데이터베이스 저장
-            success = self.supabase_client.insert_shopee_products(formatted_products)
+            success = writer.insert_shopee_products(formatted_products)
             
             if success:
                 logger.info(f"✅ Successfully saved {len(formatted_products)} persona-targeted products")
@@ -608,8 +854,29 @@ class LazadaPersonaScraper:
             return False
     
     def close(self):
-        """브라우저 종료"""
-        if self.driver:
+        """브라우저 종료 (풀에서 대여한 경우 반납)"""
+        readiness_stats = self.readiness.get_stats()
+        if readiness_stats["pages"]:
+            logger.info(
+                f"⚡ Page readiness: {readiness_stats['pages']} pages, avg {readiness_stats['avg_wait_seconds']}s wait, "
+                f"{readiness_stats['saved_seconds']:.0f}s saved vs fixed sleeps"
+            )
+        
+        filter_stats = self.resource_filter.get_stats()
+        if filter_stats["pages"]:
+            logger.info(
+                f"🚫 Resource filter: {filter_stats['blocked_requests']} requests blocked "
+                f"(~{filter_stats['estimated_mb_saved']} MB saved) over {filter_stats['pages']} pages"
+            )
+        
+        if self._driver_lease:
+            self.driver_pool.checkin(self._driver_lease, pages=self._pages_loaded, bot_detected=self._bot_detected)
+            self._driver_lease = None
+            self._pages_loaded = 0
+            self._bot_detected = False
+            self.driver = None
+            logger.info("✅ Persona scraper browser returned to pool")
+        elif self.driver:
             self.driver.quit()
             self.driver = None
             logger.info("✅ Persona scraper browser closed")
@@ -4,40 +4,140 @@ Scrapes events from Nylon Manila, Spot.ph, and When in Manila
 Adheres to Lean MVP principle: Text and Numbers only
 """
 
-import requests
+import os
+import sys
+import hashlib
+from pathlib import Path
 from bs4 import BeautifulSoup
-import time
 import re
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 from urllib.parse import urljoin, urlparse
 import logging
 
+# 프로젝트 루트 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from utils.async_fetcher import AsyncFetcher, FetchResult
+from utils.http_cache import HttpCache
+from scrapers.event_page_parser import EventPageParser
+from scrapers.event_dedup import EventDeduplicator
+from scrapers.event_extraction import (
+    CATEGORY_KEYWORDS, DATE_PATTERNS, DEFAULT_CATEGORY, LOCATION_PATTERNS, TAG_KEYWORDS, extract_batch
+)
+
 logger = logging.getLogger(__name__)
 
+# 소스별 수집 대상 페이지 (앞쪽 URL 에서 이벤트가 나오면 나머지는 파싱하지 않음)
+EVENT_SOURCES = {
+    'nylon_manila': [
+        "https://www.filipiknow.net/events-in-metro-manila/",
+        "https://www.timeout.com/manila",
+        "https://www.choosephilippines.com/events",
+    ],
+    'spot_ph': [
+        "https://www.spot.ph/things-to-do",
+    ],
+    'when_in_manila': [
+        "https://www.wheninmanila.com/category/events/",
+    ],
+}
+
+SOURCE_LABELS = {
+    'nylon_manila': 'Nylon Manila',
+    'spot_ph': 'Spot.ph',
+    'when_in_manila': 'When in Manila',
+}
+
+
 class LocalEventScraper:
     """
     Scraper for local Philippine events from lifestyle media websites
     """
     
-    def __init__(self):
-        """Initialize the scraper with basic settings"""
-        self.session = requests.Session()
-        self.session.headers.update({
+    def __init__(
+        self,
+        fetcher: Optional[AsyncFetcher] = None,
+        http_cache: Optional[HttpCache] = None,
+        page_parser: Optional[EventPageParser] = None,
+        save_pages_dir: Optional[str] = None,
+        deduplicator: Optional[EventDeduplicator] = None
+    ):
+        """
+        Initialize the scraper with basic settings
+        
+        Args:
+            fetcher: 비동기 수집기 (기본값: 호스트별 base_delay 간격, EVENT_FETCH_CONCURRENCY 동시 요청)
+            http_cache: 조건부 재검증 캐시 (기본값: EVENT_HTTP_CACHE_ENABLED 이면 data/http_cache, False 면 사용 안 함)
+            page_parser: HTML 파서 백엔드 (기본값: EVENT_HTML_PARSER 또는 가장 빠른 설치된 백엔드)
+            save_pages_dir: 지정 시 새로 받은 페이지를 저장 (파서 벤치마크용, 기본값: EVENT_SAVE_PAGES_DIR)
+            deduplicator: 소스/날짜를 넘는 유사 중복 클러스터링 (기본값: EVENT_DEDUP_ENABLED 이면 data/event_dedup, False 면 사용 안 함)
+        """
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
             'Sec-Fetch-Mode': 'navigate',
             'Sec-Fetch-Site': 'none',
             'Sec-Fetch-User': '?1',
             'Cache-Control': 'max-age=0',
-        })
-        self.base_delay = 3  # Increased delay for respectful scraping
+        }
+        self.base_delay = 3  # 같은 호스트에 대한 요청 간격 (초)
+        self.fetcher = fetcher or AsyncFetcher(
+            per_host_delay=self.base_delay,
+            max_concurrency=int(os.getenv('EVENT_FETCH_CONCURRENCY', '6')),
+            timeout=float(os.getenv('EVENT_FETCH_TIMEOUT', '30')),
+            retries=int(os.getenv('EVENT_FETCH_RETRIES', '2')),
+            headers=self.headers
+        )
+        self.http_cache = http_cache
+        default_cache = "false" if os.environ.get('TESTING') == 'true' else "true"
+        if self.http_cache is None and os.getenv('EVENT_HTTP_CACHE_ENABLED', default_cache).lower() == 'true':
+            try:
+                self.http_cache = HttpCache()
+            except Exception as e:
+                logger.warning(f"⚠️ HTTP cache unavailable, pages will be re-downloaded: {e}")
+        self.page_parser = page_parser or EventPageParser()
+        self.save_pages_dir = save_pages_dir or os.getenv('EVENT_SAVE_PAGES_DIR')
+        self.deduplicator = deduplicator
+        if self.deduplicator is None and os.getenv('EVENT_DEDUP_ENABLED', default_cache).lower() == 'true':
+            try:
+                self.deduplicator = EventDeduplicator()
+            except Exception as e:
+                logger.warning(f"⚠️ Event deduplication index unavailable, only exact duplicates will be removed: {e}")
+    
+    def _fetch_pages(self, urls: List[str]) -> Dict[str, FetchResult]:
+        """
+        Fetch several URLs concurrently (per-host politeness), revalidating cached copies
         
+        Args:
+            urls: URLs to scrape
+            
+        Returns:
+            Dictionary of URL -> FetchResult (status 304 means the cached copy is current)
+        """
+        headers = {url: self.http_cache.conditional_headers(url) for url in urls} if self.http_cache else None
+        pages = {}
+        for result in self.fetcher.run(urls, headers=headers):
+            if self.http_cache and result.ok:
+                self.http_cache.store(result.url, result.body, result.headers)
+            elif self.http_cache and result.not_modified and not self.http_cache.mark_not_modified(result.url):
+                result.error = "HTTP 304 without cached copy"
+            pages[result.url] = result
+        return pages
+    
+    def _page_body(self, result: FetchResult) -> Optional[bytes]:
+        if result.ok:
+            return result.body
+        if result.not_modified and self.http_cache:
+            return self.http_cache.load_body(result.url)
+        return None
+    
     def _make_request(self, url: str) -> Optional[BeautifulSoup]:
         """
         Make a respectful HTTP request and return BeautifulSoup object
@@ -49,14 +149,8 @@ class LocalEventScraper:
             BeautifulSoup object or None if failed
         """
         try:
-            time.sleep(self.base_delay)  # Respectful delay
-            
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            return soup
-            
+            body = self._page_body(self._fetch_pages([url])[url])
+            return BeautifulSoup(body, 'html.parser') if body is not None else None
         except Exception as e:
             logger.error(f"Failed to fetch {url}: {str(e)}")
             return None
@@ -64,6 +158,7 @@ class LocalEventScraper:
     def _extract_date_info(self, text: str) -> Dict[str, Optional[str]]:
         """
         Extract date information from text using regex patterns
+        (per-event path - _parse_events uses the compiled event_extraction.extract_batch)
         
         Args:
             text: Text containing date information
@@ -71,15 +166,7 @@ class LocalEventScraper:
         Returns:
             Dictionary with date information
         """
-        date_patterns = [
-            r'(\w+\s+\d{1,2}(?:-\d{1,2})?,?\s+\d{4})',  # "July 11-13, 2025"
-            r'(\d{1,2}(?:-\d{1,2})?\s+\w+\s+\d{4})',     # "11-13 July 2025"
-            r'(every\s+\w+)',                             # "every Saturday"
-            r'(\w+\s+\d{1,2},?\s+\d{4})',                # "July 11, 2025"
-            r'(\d{1,2}/\d{1,2}/\d{4})',                  # "07/11/2025"
-        ]
-        
-        for pattern in date_patterns:
+        for pattern in DATE_PATTERNS:
             match = re.search(pattern, text, re.IGNORECASE)
             if match:
                 return {
@@ -100,15 +187,7 @@ class LocalEventScraper:
             Extracted location string or None
         """
         # Common Philippine location patterns
-        location_patterns = [
-            r'(BGC|Bonifacio Global City)',
-            r'(Makati|Manila|Quezon City|Taguig|Pasig)',
-            r'(Greenbelt|SM\s+\w+|Ayala\s+\w+)',
-            r'(The\s+\w+\s+Mall|Gateway\s+Mall)',
-            r'(\w+\s+Center|\w+\s+Plaza)'
-        ]
-        
-        for pattern in location_patterns:
+        for pattern in LOCATION_PATTERNS:
             match = re.search(pattern, text, re.IGNORECASE)
             if match:
                 return match.group(1)
@@ -128,22 +207,10 @@ class LocalEventScraper:
         """
         text = f"{title} {description}".lower()
         
-        if any(word in text for word in ['bazaar', 'market', 'tiangge']):
-            return 'bazaar'
-        elif any(word in text for word in ['pop-up', 'popup', 'pop up']):
-            return 'pop_up'
-        elif any(word in text for word in ['festival', 'fest']):
-            return 'festival'
-        elif any(word in text for word in ['exhibition', 'exhibit', 'gallery']):
-            return 'exhibition'
-        elif any(word in text for word in ['food', 'restaurant', 'dining']):
-            return 'food_event'
-        elif any(word in text for word in ['fashion', 'style', 'clothing']):
-            return 'fashion_event'
-        elif any(word in text for word in ['art', 'creative', 'design']):
-            return 'art_event'
-        else:
-            return 'lifestyle_event'
+        for category, keywords in CATEGORY_KEYWORDS.items():
+            if any(word in text for word in keywords):
+                return category
+        return DEFAULT_CATEGORY
     
     def _extract_tags(self, title: str, description: str) -> List[str]:
         """
@@ -159,18 +226,7 @@ class LocalEventScraper:
         text = f"{title} {description}".lower()
         tags = []
         
-        tag_keywords = {
-            'food': ['food', 'dining', 'restaurant', 'eat', 'cuisine'],
-            'fashion': ['fashion', 'style', 'clothing', 'outfit', 'wear'],
-            'art': ['art', 'creative', 'design', 'artist', 'gallery'],
-            'music': ['music', 'band', 'concert', 'live', 'performance'],
-            'wellness': ['wellness', 'health', 'yoga', 'meditation', 'fitness'],
-            'beauty': ['beauty', 'makeup', 'skincare', 'cosmetics'],
-            'shopping': ['shopping', 'sale', 'discount', 'store', 'boutique'],
-            'local': ['local', 'filipino', 'pinoy', 'manila', 'philippine']
-        }
-        
-        for tag, keywords in tag_keywords.items():
+        for tag, keywords in TAG_KEYWORDS.items():
             if any(keyword in text for keyword in keywords):
                 tags.append(tag)
         
@@ -256,120 +312,167 @@ class LocalEventScraper:
         
         return sample_events
     
-    def scrape_nylon_manila(self) -> List[Dict]:
+    def _parse_events(self, html: bytes, url: str, source_website: str) -> List[Dict]:
         """
-        Scrape events from Nylon Manila (fallback to alternative sources)
+        Extract event dictionaries from a fetched page
         
+        Args:
+            html: Page body
+            url: Page URL
+            source_website: Name of the source website
+            
         Returns:
             List of event dictionaries
         """
         events = []
         
-        # Alternative approach: Use general lifestyle content that might mention events
-        alternative_sources = [
-            "https://www.filipiknow.net/events-in-metro-manila/",
-            "https://www.timeout.com/manila",
-            "https://www.choosephilippines.com/events",
-        ]
-        
-        logger.info("🎯 Attempting alternative sources for Nylon Manila...")
-        
-        for url in alternative_sources:
-            soup = self._make_request(url)
-            if not soup:
-                continue
+        # Look for event-related content (first 5 candidate containers)
+        candidates = []
+        for text_content in self.page_parser.candidate_texts(html):
+            if len(text_content) > 50:  # Only process substantial content
+                # Extract potential event name (first meaningful sentence)
+                sentences = text_content.split('.')
+                event_name = sentences[0][:100] if sentences else text_content[:100]
                 
-            # Look for event-related content
-            event_elements = soup.find_all(['div', 'article', 'section'], 
-                                         string=re.compile(r'event|festival|bazaar|market', re.IGNORECASE))
-            
-            for element in event_elements[:5]:  # Limit to first 5
-                try:
-                    # Extract nearby text that might contain event info
-                    parent = element.parent if element.parent else element
-                    text_content = parent.get_text(strip=True)
-                    
-                    if len(text_content) > 50:  # Only process substantial content
-                        # Extract potential event name (first meaningful sentence)
-                        sentences = text_content.split('.')
-                        event_name = sentences[0][:100] if sentences else text_content[:100]
-                        
-                        # Skip if not event-related enough
-                        if not any(word in event_name.lower() for word in ['event', 'festival', 'bazaar', 'market', 'exhibition']):
-                            continue
-                        
-                        date_info = self._extract_date_info(text_content)
-                        location = self._extract_location_info(text_content)
-                        
-                        event_data = {
-                            'event_name': event_name,
-                            'event_dates': date_info['raw_date'],
-                            'event_location': location,
-                            'event_description': text_content[:300],
-                            'source_url': url,
-                            'source_website': 'nylon_manila',
-                            'event_type': self._categorize_event(event_name, text_content),
-                            'event_tags': self._extract_tags(event_name, text_content),
-                            'is_recurring': date_info['is_recurring'],
-                            'collection_date': datetime.now().isoformat()
-                        }
-                        
-                        events.append(event_data)
-                        
-                except Exception as e:
-                    logger.error(f"Error processing alternative source content: {str(e)}")
+                # Skip if not event-related enough
+                if not any(word in event_name.lower() for word in ['event', 'festival', 'bazaar', 'market', 'exhibition']):
                     continue
-            
-            if events:  # If we found events, no need to try other sources
-                break
+                
+                candidates.append((event_name, text_content))
         
-        # If still no events, create sample/mock events for demonstration
-        if not events:
-            logger.info("🎭 Creating sample events for demonstration...")
-            sample_events = self._create_sample_events('nylon_manila')
-            events.extend(sample_events)
+        try:
+            fields = extract_batch(candidates)
+        except Exception as e:
+            logger.error(f"Error processing {source_website} content: {str(e)}")
+            return events
+        
+        collection_date = datetime.now().isoformat()
+        for (event_name, text_content), event_fields in zip(candidates, fields):
+            events.append({
+                'event_name': event_name,
+                'event_dates': event_fields.raw_date,
+                'event_location': event_fields.location,
+                'event_description': text_content[:300],
+                'source_url': url,
+                'source_website': source_website,
+                'event_type': event_fields.event_type,
+                'event_tags': event_fields.tags,
+                'is_recurring': event_fields.is_recurring,
+                'collection_date': collection_date
+            })
         
-        logger.info(f"Scraped {len(events)} events from Nylon Manila")
         return events
     
-    def scrape_spot_ph(self) -> List[Dict]:
+    def _page_events(self, source_website: str, result: Optional[FetchResult]) -> Optional[List[Dict]]:
         """
-        Scrape events from Spot.ph (with fallback to sample data)
+        Events for one fetched page - a 304 reuses the events extracted last time without parsing
         
+        Args:
+            source_website: Name of the source website
+            result: Fetch result for the page
+            
         Returns:
-            List of event dictionaries
+            List of event dictionaries, or None if the page could not be fetched
         """
-        events = []
+        if result is None:
+            return None
+        
+        if result.not_modified and self.http_cache:
+            cached_events = self.http_cache.load_extracted(result.url)
+            if cached_events is not None:
+                logger.info(f"💾 {result.url} not modified, reusing {len(cached_events)} events")
+                collection_date = datetime.now().isoformat()
+                return [{**event, 'collection_date': collection_date} for event in cached_events]
         
-        logger.info("🎯 Attempting to scrape Spot.ph...")
+        body = self._page_body(result)
+        if body is None:
+            return None
         
-        # Create sample events for demonstration (since real scraping may be blocked)
-        logger.info("🎭 Creating sample events for Spot.ph...")
-        sample_events = self._create_sample_events('spot_ph')
-        events.extend(sample_events)
+        if self.save_pages_dir and result.ok:
+            self._save_page_snapshot(body, result.url, source_website)
         
-        logger.info(f"Scraped {len(events)} events from Spot.ph")
+        started = time.perf_counter()
+        events = self._parse_events(body, result.url, source_website)
+        if self.http_cache:
+            self.http_cache.store_extracted(result.url, events, time.perf_counter() - started)
         return events
     
-    def scrape_when_in_manila(self) -> List[Dict]:
+    def _save_page_snapshot(self, body: bytes, page_url: str, source_website: str):
+        """벤치마크/디버깅용 페이지 저장 (<source>_<timestamp>_<url hash>.html + .url)"""
+        try:
+            save_dir = Path(self.save_pages_dir)
+            save_dir.mkdir(parents=True, exist_ok=True)
+            
+            url_hash = hashlib.sha1(page_url.encode('utf-8')).hexdigest()[:8]
+            stem = save_dir / f"{source_website}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{url_hash}"
+            stem.with_suffix('.html').write_bytes(body)
+            stem.with_suffix('.url').write_text(page_url, encoding='utf-8')
+            
+            logger.debug(f"💾 Saved page snapshot: {stem}.html")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to save page snapshot: {e}")
+    
+    def _events_from_pages(self, source_website: str, pages: Dict[str, FetchResult]) -> List[Dict]:
         """
-        Scrape events from When in Manila (with fallback to sample data)
+        Parse a source's fetched pages in order, falling back to sample data
         
+        Args:
+            source_website: Name of the source website
+            pages: URL -> FetchResult
+            
         Returns:
             List of event dictionaries
         """
         events = []
         
-        logger.info("🎯 Attempting to scrape When in Manila...")
+        for url in EVENT_SOURCES[source_website]:
+            page_events = self._page_events(source_website, pages.get(url))
+            if not page_events:
+                continue
+            
+            events.extend(page_events)
+            break  # If we found events, no need to parse other pages
         
-        # Create sample events for demonstration (since real scraping may be blocked)
-        logger.info("🎭 Creating sample events for When in Manila...")
-        sample_events = self._create_sample_events('when_in_manila')
-        events.extend(sample_events)
+        # If still no events, create sample/mock events for demonstration
+        if not events:
+            logger.info(f"🎭 Creating sample events for {SOURCE_LABELS[source_website]}...")
+            events.extend(self._create_sample_events(source_website))
         
-        logger.info(f"Scraped {len(events)} events from When in Manila")
+        logger.info(f"Scraped {len(events)} events from {SOURCE_LABELS[source_website]}")
         return events
     
+    def _scrape_source(self, source_website: str) -> List[Dict]:
+        logger.info(f"🎯 Attempting to scrape {SOURCE_LABELS[source_website]}...")
+        pages = self._fetch_pages(EVENT_SOURCES[source_website])
+        return self._events_from_pages(source_website, pages)
+    
+    def scrape_nylon_manila(self) -> List[Dict]:
+        """
+        Scrape events from Nylon Manila (fallback to alternative sources)
+        
+        Returns:
+            List of event dictionaries
+        """
+        return self._scrape_source('nylon_manila')
+    
+    def scrape_spot_ph(self) -> List[Dict]:
+        """
+        Scrape events from Spot.ph (with fallback to sample data)
+        
+        Returns:
+            List of event dictionaries
+        """
+        return self._scrape_source('spot_ph')
+    
+    def scrape_when_in_manila(self) -> List[Dict]:
+        """
+        Scrape events from When in Manila (with fallback to sample data)
+        
+        Returns:
+            List of event dictionaries
+        """
+        return self._scrape_source('when_in_manila')
+    
     def _remove_duplicates(self, events: List[Dict]) -> List[Dict]:
         """
         Remove duplicate events based on URL and event name
@@ -403,32 +506,54 @@ class LocalEventScraper:
         logger.info("Starting local events scraping from all sources...")
         
         all_events = []
+        if self.http_cache:
+            self.http_cache.reset_stats()
         
-        # Scrape from all sources
-        try:
-            nylon_events = self.scrape_nylon_manila()
-            all_events.extend(nylon_events)
-        except Exception as e:
-            logger.error(f"Failed to scrape Nylon Manila: {str(e)}")
-        
+        # 모든 소스의 페이지를 한 번에 수집 (호스트가 다르면 병렬, 같은 호스트는 base_delay 간격)
+        urls = [url for source_urls in EVENT_SOURCES.values() for url in source_urls]
         try:
-            spot_events = self.scrape_spot_ph()
-            all_events.extend(spot_events)
+            pages = self._fetch_pages(urls)
         except Exception as e:
-            logger.error(f"Failed to scrape Spot.ph: {str(e)}")
+            logger.error(f"Failed to fetch event sources: {str(e)}")
+            pages = {}
         
-        try:
-            wim_events = self.scrape_when_in_manila()
-            all_events.extend(wim_events)
-        except Exception as e:
-            logger.error(f"Failed to scrape When in Manila: {str(e)}")
+        for source_website in EVENT_SOURCES:
+            try:
+                all_events.extend(self._events_from_pages(source_website, pages))
+            except Exception as e:
+                logger.error(f"Failed to scrape {SOURCE_LABELS[source_website]}: {str(e)}")
         
         # Remove duplicates
         unique_events = self._remove_duplicates(all_events)
         
         logger.info(f"Total events collected: {len(all_events)}, Unique events: {len(unique_events)}")
         
+        # 같은 이벤트의 다른 소스 / 다른 날 게시물 병합
+        if self.deduplicator:
+            try:
+                exact_count = len(unique_events)
+                unique_events = self.deduplicator.deduplicate(unique_events)
+                stats = self.deduplicator.get_stats()
+                logger.info(
+                    f"🧬 Near-duplicate events merged: {exact_count - len(unique_events)}, "
+                    f"{stats['clusters']} clusters indexed ({stats['avg_candidates']} candidates per lookup)"
+                )
+            except Exception as e:
+                logger.error(f"Near-duplicate detection failed, keeping exact-deduplicated events: {str(e)}")
+        
+        if self.http_cache:
+            stats = self.http_cache.get_stats()
+            logger.info(
+                f"💾 HTTP cache: {stats['not_modified']}/{stats['requests']} pages not modified, "
+                f"saved {stats['bytes_saved'] / 1024:.1f} KB and {stats['parse_seconds_saved']:.2f}s parsing "
+                f"(downloaded {stats['bytes_downloaded'] / 1024:.1f} KB, parsed {stats['parse_seconds']:.2f}s)"
+            )
+        
         return unique_events
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """마지막 실행의 HTTP 캐시 통계 (캐시 비활성화 시 빈 dict)"""
+        return self.http_cache.get_stats() if self.http_cache else {}
 
 def main():
     """
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+TikTok Shop 오프라인 페이지 파서
+Parses a saved driver.page_source snapshot with lxml/cssselect instead of live WebDriver queries
+"""
+
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin
+
+try:
+    import lxml.html
+    from lxml.cssselect import CSSSelector
+    from cssselect import SelectorError
+    from cssselect.xpath import ExpressionError
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+from utils.resource_filter import IMAGE_ATTRIBUTES, pick_image_url
+
+logger = logging.getLogger(__name__)
+
+# 브라우저가 지원하지 않는 셀렉터 (라이브 경로에서 항상 실패하므로 오프라인에서도 제외)
+BROWSER_UNSUPPORTED_PSEUDOS = (':contains(',)
+
+# 렌더링되지 않는 태그 (WebElement.text 에 포함되지 않음)
+NON_RENDERED_TAGS = {'script', 'style', 'noscript', 'template', 'head'}
+
+
+def _is_hidden(node) -> bool:
+    """인라인 스타일/hidden 속성 기준으로 숨겨진 요소인지 확인"""
+    if node.get('hidden') is not None:
+        return True
+    style = (node.get('style') or '').replace(' ', '').lower()
+    return 'display:none' in style or 'visibility:hidden' in style
+
+
+def visible_text(element) -> str:
+    """WebElement.text 에 가까운 가시 텍스트 추출 (줄 단위 공백 정규화)"""
+    chunks = []
+
+    def walk(node):
+        if not isinstance(node.tag, str):
+            return  # 주석, 처리 명령
+        if node.tag.lower() in NON_RENDERED_TAGS or _is_hidden(node):
+            return
+        if node.text:
+            chunks.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                chunks.append(child.tail)
+
+    walk(element)
+    lines = (" ".join(line.replace('\xa0', ' ').split()) for line in "".join(chunks).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+class TikTokPageParser:
+    """
+    page_source 스냅샷에서 상품 요소 탐색 + 필드 후보 추출
+
+    셀렉터는 한 번만 컴파일되며, 반환되는 후보 dict 는
+    TikTokShopScraper._build_product_data 가 라이브 경로와 동일하게 해석합니다.
+    """
+
+    def __init__(self, product_selectors: List[str], field_selectors: Dict[str, List[str]]):
+        if not LXML_AVAILABLE:
+            raise ImportError("lxml and cssselect are required for offline parsing")
+
+        self.product_selectors = self._compile(product_selectors)
+        self.field_selectors = {
+            field: self._compile(selectors) for field, selectors in field_selectors.items()
+        }
+        self._first_a = CSSSelector('a', translator='html')
+        self._first_img = CSSSelector('img', translator='html')
+
+    @staticmethod
+    def _compile(selectors: List[str]) -> List[Tuple[str, Any]]:
+        compiled = []
+        for selector in selectors:
+            if any(pseudo in selector for pseudo in BROWSER_UNSUPPORTED_PSEUDOS):
+                logger.debug(f"Skipping browser-unsupported selector: {selector}")
+                continue
+            try:
+                compiled.append((selector, CSSSelector(selector, translator='html')))
+            except (SelectorError, ExpressionError) as e:
+                logger.debug(f"Skipping selector not supported by cssselect: {selector} ({e})")
+        return compiled
+
+    @staticmethod
+    def _first_descendant(element, selector) -> Optional[Any]:
+        """find_element 와 동일하게 자기 자신을 제외한 첫 번째 하위 요소"""
+        for match in selector(element):
+            if match is not element:
+                return match
+        return None
+
+    def find_product_elements(self, root) -> Tuple[List[Any], Optional[str]]:
+        """3개 이상 매칭되는 첫 번째 셀렉터의 요소 반환"""
+        for selector, compiled in self.product_selectors:
+            elements = compiled(root)
+            if len(elements) >= 3:
+                return elements, selector
+        return [], None
+
+    def _from_selectors(self, element, field: str, read) -> Iterator[Optional[str]]:
+        for _, compiled in self.field_selectors.get(field, []):
+            match = self._first_descendant(element, compiled)
+            yield read(match) if match is not None else None
+
+    def collect_candidates(self, element, page_url: str) -> Dict[str, Any]:
+        """상품 요소 하나의 필드 후보 값 (셀렉터 순서, 지연 평가)"""
+        link = self._first_descendant(element, self._first_a)
+        img = self._first_descendant(element, self._first_img)
+
+        href = link.get('href') if link is not None else None
+        image = None
+        if img is not None:
+            image = pick_image_url(img.get(attr) for attr in IMAGE_ATTRIBUTES)
+
+        return {
+            # WebElement.get_attribute('href'/'src') 처럼 절대 URL 로 변환
+            'href': urljoin(page_url, href) if href else None,
+            'image': urljoin(page_url, image) if image else None,
+            'names': self._from_selectors(element, 'name', lambda e: visible_text(e) or e.get('title')),
+            'prices': self._from_selectors(element, 'price', visible_text),
+            'ratings': self._from_selectors(element, 'rating', lambda e: visible_text(e) or e.get('title')),
+            'reviews': self._from_selectors(element, 'review', visible_text),
+            'sales': self._from_selectors(element, 'sales', visible_text)
+        }
+
+    def parse(self, html: str, page_url: str) -> Tuple[List[Any], Optional[str]]:
+        """HTML 을 파싱하고 상품 요소 목록과 사용된 셀렉터 반환"""
+        root = lxml.html.fromstring(html)
+        return self.find_product_elements(root)
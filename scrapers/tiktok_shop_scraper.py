@@ -6,6 +6,7 @@ TikTok Shop 필리핀 스크래퍼 - Top Products, Flash Sale, Category Products
 
 import time
 import random
+import functools
 import logging
 import json
 import re
@@ -13,6 +14,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 
 try:
     import undetected_chromedriver as uc
@@ -37,21 +39,163 @@ sys.path.insert(0, str(project_root))
 from dotenv import load_dotenv
 load_dotenv()
 
+from scrapers.tiktok_page_parser import TikTokPageParser, LXML_AVAILABLE
+from utils.driver_pool import WebDriverPool, get_driver_pool
+from utils.element_fields import first_tag, from_selectors
+from utils.page_readiness import PageReadinessEngine
+from utils.resource_filter import IMAGE_ATTRIBUTES, get_resource_filter, pick_image_url
+
 logger = logging.getLogger(__name__)
 
 
+def create_tiktok_shop_driver(headless: bool = True):
+    """TikTok Shop 최적화된 undetected Chrome 생성 (드라이버 풀 factory)"""
+    options = uc.ChromeOptions()
+    
+    if headless:
+        options.add_argument('--headless=new')
+    
+    # 기본 스텔스 옵션
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument('--window-size=1366,768')
+    
+    # TikTok 특화 설정
+    options.add_argument('--disable-features=VizDisplayCompositor')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-plugins')
+    options.add_argument('--disable-images')  # 이미지 로딩 비활성화로 속도 향상
+    
+    # Philippines 지역 설정
+    user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    options.add_argument(f'--user-agent={user_agent}')
+    options.add_argument('--lang=en-PH,en-US,en')
+    options.add_argument('--accept-lang=en-PH,en-US,en')
+    
+    # 지리적 위치 설정 (Philippines)
+    prefs = {
+        "profile.default_content_setting_values.geolocation": 1,
+        "profile.managed_default_content_settings.images": 2  # 이미지 차단
+    }
+    options.add_experimental_option("prefs", prefs)
+    
+    driver = uc.Chrome(options=options, version_main=None)
+    
+    # WebDriver 탐지 방지
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
+    driver.set_page_load_timeout(60)
+    
+    # 폰트/미디어/트래커까지 차단 (이미지는 prefs 로도 차단됨)
+    get_resource_filter("tiktok_shop").apply(driver)
+    return driver
+
+
 class TikTokShopScraper:
     """TikTok Shop Philippines 스크래퍼"""
     
+    # 실제 TikTok Shop 페이지에서 발견된 패턴 기반 상품 요소 선택자
+    PRODUCT_SELECTORS = [
+        # 분석에서 발견된 product 클래스들 (435개)
+        '[class*="product"]',
+        'div[class*="product"]',
+        
+        # item 클래스들 (126개)  
+        '[class*="item"]',
+        'div[class*="item"]',
+        
+        # 일반적인 상품 컨테이너
+        '[class*="card"]',
+        '[class*="Card"]',
+        
+        # TikTok 특화 data 속성
+        '[data-e2e*="product"]',
+        '[data-e2e*="item"]',
+        '[data-testid*="product"]',
+        '[data-testid*="item"]',
+        
+        # 링크 기반 상품 (a 태그 안의 상품들)
+        'a[href*="/product/"]',
+        'a[class*="product"]',
+        
+        # 이미지와 가격이 함께 있는 요소들
+        'div:has(img):has([class*="price"])',
+        'div:has(img):has(span:contains("₱"))',
+        
+        # 마지막 수단: 구조적 접근
+        'div > div > div:has(img)',  # 3단계 depth의 이미지 포함 div
+        'div[class]:has(img):has(span)'  # 클래스가 있고 이미지와 span을 포함
+    ]
+    
+    # 상품 요소 내부 필드 선택자 (우선순위 순)
+    NAME_SELECTORS = [
+        '[data-testid="product-title"]',
+        '.product-title',
+        '.product-name', 
+        'h3', 'h4', 'h5',
+        '[class*="title"]',
+        '[class*="name"]'
+    ]
+    PRICE_SELECTORS = [
+        '[data-testid="product-price"]',
+        '.price',
+        '.current-price',
+        '[class*="price"]',
+        '.cost'
+    ]
+    RATING_SELECTORS = [
+        '[data-testid="rating"]',
+        '.rating',
+        '.star-rating',
+        '[class*="rating"]',
+        '[class*="star"]'
+    ]
+    REVIEW_SELECTORS = [
+        '[data-testid="review-count"]',
+        '.review-count',
+        '.reviews',
+        '[class*="review"]'
+    ]
+    SALES_SELECTORS = [
+        '[data-testid="sales-count"]',
+        '.sales-count',
+        '.sold',
+        '[class*="sold"]',
+        '[class*="sales"]'
+    ]
+    
     def __init__(
         self,
         base_url: str = "https://www.tiktok.com/shop/ph",
         use_undetected: bool = True,
-        headless: bool = True
+        headless: bool = True,
+        parse_mode: str = "live",
+        save_pages_dir: Optional[str] = None,
+        driver_pool: Optional[WebDriverPool] = None,
+        wait_strategy: str = "signals"
     ):
+        """
+        Args:
+            parse_mode: "live" (WebDriver 요소 조회) 또는 "offline" (page_source + lxml 파싱), 호출별로 덮어쓰기 가능
+            save_pages_dir: 지정 시 수집한 page_source 를 저장 (벤치마크용)
+            driver_pool: 지정하면 브라우저를 새로 띄우지 않고 풀에서 대여 후 close() 에서 반납
+            wait_strategy: "signals" (카드 수/DOM/네트워크 신호 대기) 또는 "fixed" (기존 고정 sleep)
+        """
         self.base_url = base_url
         self.use_undetected = use_undetected
         self.headless = headless
+        self.parse_mode = parse_mode
+        self.save_pages_dir = save_pages_dir
+        self._page_parser = None
+        self._parse_executor = None
+        self.driver_pool = driver_pool
+        self.wait_strategy = wait_strategy
+        self.readiness = PageReadinessEngine(self.PRODUCT_SELECTORS)
+        self.resource_filter = get_resource_filter("tiktok_shop")
+        self._driver_lease = None
+        self._pages_loaded = 0
+        self._bot_detected = False
         self.driver = None
         self.user_agent = UserAgent()
         self.collection_date = datetime.now()
@@ -68,46 +212,29 @@ class TikTokShopScraper:
         
         logger.info("🎬 TikTok Shop Scraper initialized")
     
+    @classmethod
+    def shared_driver_pool(cls, headless: bool = True, max_size: int = 2, warm_size: int = 1, **kwargs) -> WebDriverPool:
+        """프로세스 전역 TikTok Shop 드라이버 풀 (headless 여부별로 분리)"""
+        profile = "tiktok_shop:headless" if headless else "tiktok_shop"
+        return get_driver_pool(
+            profile, functools.partial(create_tiktok_shop_driver, headless),
+            max_size=max_size, warm_size=warm_size, **kwargs
+        )
+    
     def _setup_driver(self):
-        """TikTok Shop 최적화된 브라우저 설정"""
+        """TikTok Shop 최적화된 브라우저 설정 (풀이 있으면 대여)"""
         try:
+            if self.driver_pool:
+                self._driver_lease = self.driver_pool.checkout()
+                self.driver = self._driver_lease.driver
+                logger.info(f"✅ TikTok Shop WebDriver checked out from pool ({self._driver_lease.checkouts} uses)")
+                return
+            
             if self.use_undetected:
-                options = uc.ChromeOptions()
-                
-                if self.headless:
-                    options.add_argument('--headless=new')
-                
-                # 기본 스텔스 옵션
-                options.add_argument('--no-sandbox')
-                options.add_argument('--disable-dev-shm-usage')
-                options.add_argument('--disable-blink-features=AutomationControlled')
-                options.add_argument('--window-size=1366,768')
-                
-                # TikTok 특화 설정
-                options.add_argument('--disable-features=VizDisplayCompositor')
-                options.add_argument('--disable-extensions')
-                options.add_argument('--disable-plugins')
-                options.add_argument('--disable-images')  # 이미지 로딩 비활성화로 속도 향상
-                
-                # Philippines 지역 설정
-                user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                options.add_argument(f'--user-agent={user_agent}')
-                options.add_argument('--lang=en-PH,en-US,en')
-                options.add_argument('--accept-lang=en-PH,en-US,en')
-                
-                # 지리적 위치 설정 (Philippines)
-                prefs = {
-                    "profile.default_content_setting_values.geolocation": 1,
-                    "profile.managed_default_content_settings.images": 2  # 이미지 차단
-                }
-                options.add_experimental_option("prefs", prefs)
-                
-                self.driver = uc.Chrome(options=options, version_main=None)
+                self.driver = create_tiktok_shop_driver(self.headless)
             
-            # WebDriver 탐지 방지
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
-            self.driver.set_page_load_timeout(60)
+            if not self.driver:
+                raise RuntimeError("No WebDriver configured (use_undetected=False and no driver_pool)")
             
             logger.info("✅ TikTok Shop WebDriver setup completed")
             
@@ -117,6 +244,20 @@ class TikTokShopScraper:
     
     def _wait_and_scroll(self, wait_time: int = 10, scroll_count: int = 3):
         """TikTok Shop 페이지 로드 대기 및 스크롤링"""
+        if self.wait_strategy == "fixed":
+            return self._wait_and_scroll_fixed(wait_time, scroll_count)
+        
+        try:
+            # 기존 방식: wait_time + 스크롤마다 평균 3초 + 로딩 2초 + 복귀 후 2초
+            self.readiness.wait_for_page(
+                self.driver, scroll_count=scroll_count, legacy_seconds=wait_time + scroll_count * 5 + 2
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Readiness wait failed, falling back to fixed sleeps: {e}")
+            self._wait_and_scroll_fixed(wait_time, scroll_count)
+    
+    def _wait_and_scroll_fixed(self, wait_time: int = 10, scroll_count: int = 3):
+        """고정 sleep 기반 TikTok Shop 페이지 로드 대기 및 스크롤링 (wait_strategy="fixed")"""
         try:
             time.sleep(wait_time)
             
@@ -226,33 +367,139 @@ class TikTokShopScraper:
         except:
             return None
     
-    def get_top_products(self, limit: int = 20) -> List[Dict[str, Any]]:
+    def _resolve_parse_mode(self, parse_mode: Optional[str]) -> str:
+        """호출별 파싱 모드 결정 (lxml 미설치 시 live 로 대체)"""
+        mode = parse_mode or self.parse_mode
+        if mode not in ("live", "offline"):
+            raise ValueError(f"Unknown parse mode: {mode}")
+        if mode == "offline" and not LXML_AVAILABLE:
+            logger.warning("⚠️ lxml/cssselect not available - falling back to live parsing")
+            return "live"
+        return mode
+    
+    def _section_request(self, section: str, limit: int, category: Optional[str] = None) -> Dict[str, Any]:
+        """섹션별 URL, 대기 시간, source_type 구성"""
+        if section == "top_products":
+            return {
+                "url": f"{self.base_url}{self.shop_sections['top_products']}",
+                "source_type": "top_products", "label": "Top Products",
+                "limit": limit, "wait_time": 15, "scroll_count": 4
+            }
+        if section == "flash_sale":
+            return {
+                "url": f"{self.base_url}{self.shop_sections['flash_sale']}",
+                "source_type": "flash_sale", "label": "Flash Sale",
+                "limit": limit, "wait_time": 15, "scroll_count": 3
+            }
+        if section == "category":
+            return {
+                "url": f"{self.base_url}/search?q={quote(category)}",
+                "source_type": f"category_{category}", "label": f"category '{category}'",
+                "limit": limit, "wait_time": 15, "scroll_count": 3
+            }
+        raise ValueError(f"Unknown TikTok Shop section: {section}")
+    
+    def _start_section(self, request: Dict[str, Any], parse_mode: str) -> Future:
+        """
+        섹션 페이지 로드 후 추출 시작
+        
+        offline 모드에서는 page_source 스냅샷 파싱을 백그라운드 스레드에 맡기고 즉시 반환하므로
+        브라우저는 다음 페이지 로드를 바로 진행할 수 있습니다.
+        """
+        if not self.driver:
+            self._setup_driver()
+        
+        self.driver.get(request["url"])
+        self._pages_loaded += 1
+        self._wait_and_scroll(request["wait_time"], request["scroll_count"])
+        
+        try:
+            self.resource_filter.record_page(self.driver)
+        except Exception as e:
+            logger.debug(f"Resource filter stats unavailable: {e}")
+        
+        # 스냅샷 한 번으로 봇 감지 + 오프라인 파싱 공용
+        page_source = self.driver.page_source
+        current_url = self.driver.current_url
+        
+        future = Future()
+        
+        if self._check_bot_detection(page_source, current_url):
+            logger.warning(f"❌ Bot detection triggered on {request['label']} page")
+            self._bot_detected = True
+            future.set_result([])
+            return future
+        
+        if self.save_pages_dir:
+            self._save_page_snapshot(page_source, current_url, request["source_type"])
+        
+        if parse_mode == "offline":
+            return self._get_parse_executor().submit(
+                self._parse_page_source, page_source, current_url, request["source_type"], request["limit"]
+            )
+        
+        # 상품 요소 찾기
+        product_elements = self._find_product_elements()
+        
+        if not product_elements:
+            logger.warning(f"❌ No product elements found on {request['label']} page")
+            future.set_result([])
+            return future
+        
+        future.set_result(self._extract_products_data(product_elements, request["source_type"], request["limit"]))
+        return future
+    
+    def collect_sections(
+        self,
+        sections: List[Dict[str, Any]],
+        parse_mode: Optional[str] = None,
+        delay_between: float = 0.0
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        여러 섹션을 순서대로 수집 (offline 모드에서는 파싱과 다음 페이지 로드가 겹침)
+        
+        Args:
+            sections: [{"section": "top_products", "limit": 10}, {"section": "category", "category": "beauty", "limit": 7}]
+            parse_mode: "live" 또는 "offline" (None 이면 인스턴스 기본값)
+            delay_between: 페이지 로드 사이 대기 시간 (초)
+        
+        Returns:
+            source_type 별 상품 리스트
+        """
+        mode = self._resolve_parse_mode(parse_mode)
+        pending = []
+        
+        for index, section in enumerate(sections):
+            if index and delay_between:
+                time.sleep(delay_between)
+            request = self._section_request(section["section"], section.get("limit", 15), section.get("category"))
+            try:
+                logger.info(f"🎯 Navigating to {request['label']}: {request['url']} ({mode} parsing)")
+                pending.append((request, self._start_section(request, mode)))
+            except Exception as e:
+                logger.error(f"❌ Error loading {request['label']}: {e}")
+                failed = Future()
+                failed.set_result([])
+                pending.append((request, failed))
+        
+        results = {}
+        for request, future in pending:
+            try:
+                results[request["source_type"]] = future.result()
+                logger.info(f"✅ Extracted {len(results[request['source_type']])} products from {request['label']}")
+            except Exception as e:
+                logger.error(f"❌ Error parsing {request['label']}: {e}")
+                results[request["source_type"]] = []
+        
+        return results
+    
+    def get_top_products(self, limit: int = 20, parse_mode: Optional[str] = None) -> List[Dict[str, Any]]:
         """TikTok Shop Top Products 수집"""
         try:
-            if not self.driver:
-                self._setup_driver()
-            
-            # Top Products 페이지로 이동
-            top_products_url = f"{self.base_url}{self.shop_sections['top_products']}"
-            logger.info(f"🎯 Navigating to Top Products: {top_products_url}")
-            
-            self.driver.get(top_products_url)
-            self._wait_and_scroll(15, 4)
+            request = self._section_request("top_products", limit)
+            logger.info(f"🎯 Navigating to Top Products: {request['url']}")
             
-            # 봇 감지 확인
-            if self._check_bot_detection():
-                logger.warning("❌ Bot detection triggered on Top Products page")
-                return []
-            
-            # 상품 요소 찾기
-            product_elements = self._find_product_elements()
-            
-            if not product_elements:
-                logger.warning("❌ No product elements found on Top Products page")
-                return []
-            
-            # 상품 데이터 추출
-            products = self._extract_products_data(product_elements, "top_products", limit)
+            products = self._start_section(request, self._resolve_parse_mode(parse_mode)).result()
             
             logger.info(f"✅ Extracted {len(products)} top products from TikTok Shop")
             return products
@@ -261,33 +508,13 @@ class TikTokShopScraper:
             logger.error(f"❌ Error getting top products: {e}")
             return []
     
-    def get_flash_sale_products(self, limit: int = 15) -> List[Dict[str, Any]]:
+    def get_flash_sale_products(self, limit: int = 15, parse_mode: Optional[str] = None) -> List[Dict[str, Any]]:
         """TikTok Shop Flash Sale 제품 수집"""
         try:
-            if not self.driver:
-                self._setup_driver()
-            
-            # Flash Sale 페이지로 이동
-            flash_sale_url = f"{self.base_url}{self.shop_sections['flash_sale']}"
-            logger.info(f"⚡ Navigating to Flash Sale: {flash_sale_url}")
-            
-            self.driver.get(flash_sale_url)
-            self._wait_and_scroll(15, 3)
-            
-            # 봇 감지 확인
-            if self._check_bot_detection():
-                logger.warning("❌ Bot detection triggered on Flash Sale page")
-                return []
-            
-            # 상품 요소 찾기
-            product_elements = self._find_product_elements()
-            
-            if not product_elements:
-                logger.warning("❌ No product elements found on Flash Sale page")
-                return []
+            request = self._section_request("flash_sale", limit)
+            logger.info(f"⚡ Navigating to Flash Sale: {request['url']}")
             
-            # Flash Sale 특화 데이터 추출
-            products = self._extract_products_data(product_elements, "flash_sale", limit)
+            products = self._start_section(request, self._resolve_parse_mode(parse_mode)).result()
             
             logger.info(f"✅ Extracted {len(products)} flash sale products from TikTok Shop")
             return products
@@ -296,33 +523,13 @@ class TikTokShopScraper:
             logger.error(f"❌ Error getting flash sale products: {e}")
             return []
     
-    def get_category_products(self, category: str, limit: int = 15) -> List[Dict[str, Any]]:
+    def get_category_products(self, category: str, limit: int = 15, parse_mode: Optional[str] = None) -> List[Dict[str, Any]]:
         """TikTok Shop 카테고리별 제품 수집"""
         try:
-            if not self.driver:
-                self._setup_driver()
-            
-            # 카테고리 검색 URL 구성
-            category_url = f"{self.base_url}/search?q={quote(category)}"
-            logger.info(f"📂 Navigating to Category '{category}': {category_url}")
-            
-            self.driver.get(category_url)
-            self._wait_and_scroll(15, 3)
-            
-            # 봇 감지 확인
-            if self._check_bot_detection():
-                logger.warning("❌ Bot detection triggered on Category page")
-                return []
-            
-            # 상품 요소 찾기
-            product_elements = self._find_product_elements()
+            request = self._section_request("category", limit, category)
+            logger.info(f"📂 Navigating to Category '{category}': {request['url']}")
             
-            if not product_elements:
-                logger.warning(f"❌ No product elements found for category '{category}'")
-                return []
-            
-            # 카테고리 특화 데이터 추출
-            products = self._extract_products_data(product_elements, f"category_{category}", limit)
+            products = self._start_section(request, self._resolve_parse_mode(parse_mode)).result()
             
             logger.info(f"✅ Extracted {len(products)} products from category '{category}'")
             return products
@@ -331,11 +538,11 @@ class TikTokShopScraper:
             logger.error(f"❌ Error getting category products: {e}")
             return []
     
-    def _check_bot_detection(self) -> bool:
+    def _check_bot_detection(self, page_source: Optional[str] = None, current_url: Optional[str] = None) -> bool:
         """봇 감지 여부 확인"""
         try:
-            current_url = self.driver.current_url
-            page_source = self.driver.page_source.lower()
+            current_url = current_url if current_url is not None else self.driver.current_url
+            page_source = (page_source if page_source is not None else self.driver.page_source).lower()
             
             # 일반적인 봇 감지 패턴
             bot_indicators = [
@@ -363,43 +570,9 @@ class TikTokShopScraper:
     
     def _find_product_elements(self) -> List:
         """TikTok Shop 상품 요소 찾기 (실제 페이지 구조 기반)"""
-        
-        # 실제 TikTok Shop 페이지에서 발견된 패턴 기반 선택자
-        product_selectors = [
-            # 분석에서 발견된 product 클래스들 (435개)
-            '[class*="product"]',
-            'div[class*="product"]',
-            
-            # item 클래스들 (126개)  
-            '[class*="item"]',
-            'div[class*="item"]',
-            
-            # 일반적인 상품 컨테이너
-            '[class*="card"]',
-            '[class*="Card"]',
-            
-            # TikTok 특화 data 속성
-            '[data-e2e*="product"]',
-            '[data-e2e*="item"]',
-            '[data-testid*="product"]',
-            '[data-testid*="item"]',
-            
-            # 링크 기반 상품 (a 태그 안의 상품들)
-            'a[href*="/product/"]',
-            'a[class*="product"]',
-            
-            # 이미지와 가격이 함께 있는 요소들
-            'div:has(img):has([class*="price"])',
-            'div:has(img):has(span:contains("₱"))',
-            
-            # 마지막 수단: 구조적 접근
-            'div > div > div:has(img)',  # 3단계 depth의 이미지 포함 div
-            'div[class]:has(img):has(span)'  # 클래스가 있고 이미지와 span을 포함
-        ]
-        
         found_elements = []
         
-        for selector in product_selectors:
+        for selector in self.PRODUCT_SELECTORS:
             try:
                 elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                 if len(elements) >= 3:  # 최소 3개 이상 발견되면 유효
@@ -412,160 +585,152 @@ class TikTokShopScraper:
         
         return found_elements
     
+    def _build_product_data(self, candidates: Dict[str, Any], source_type: str) -> Dict[str, Any]:
+        """필드 후보 값으로 상품 데이터 구성 (live/offline 공용)"""
+        product_data = {
+            'collection_date': self.collection_date.isoformat(),
+            'source_type': source_type,
+            'platform': 'tiktok_shop',
+            'product_name': 'Unknown Product',
+            'product_url': '',
+            'price': '',
+            'price_numeric': None,
+            'original_price': '',
+            'original_price_numeric': None,
+            'discount_percentage': None,
+            'rating': None,
+            'rating_numeric': None,
+            'review_count': None,
+            'review_count_numeric': None,
+            'sales_count': None,
+            'sales_count_numeric': None,
+            'image_url': '',
+            'category': '',
+            'brand': '',
+            'seller_info': '',
+            'creator_info': None  # 제휴 크리에이터 정보 (나중에 확장)
+        }
+        
+        # 제품명 추출
+        for name in candidates['names']:
+            if name and name.strip():
+                product_data['product_name'] = name.strip()
+                break
+        
+        # 가격 추출
+        for price_text in candidates['prices']:
+            if price_text and ('₱' in price_text or 'PHP' in price_text or price_text.isdigit()):
+                product_data['price'] = price_text.strip()
+                product_data['price_numeric'] = self._extract_price_value(price_text)
+                break
+        
+        # URL 추출
+        href = candidates['href']
+        if href:
+            if href.startswith('/'):
+                href = self.base_url + href
+            product_data['product_url'] = href
+        
+        # 이미지 URL 추출
+        if candidates['image']:
+            product_data['image_url'] = candidates['image']
+        
+        # 평점 추출
+        for rating_text in candidates['ratings']:
+            if rating_text:
+                product_data['rating'] = rating_text
+                product_data['rating_numeric'] = self._extract_rating_value(rating_text)
+                break
+        
+        # 리뷰 수 추출
+        for review_text in candidates['reviews']:
+            if review_text:
+                product_data['review_count'] = review_text
+                product_data['review_count_numeric'] = self._extract_number_value(review_text)
+                break
+        
+        # 판매량 추출
+        for sales_text in candidates['sales']:
+            if sales_text and 'sold' in sales_text.lower():
+                product_data['sales_count'] = sales_text
+                product_data['sales_count_numeric'] = self._extract_number_value(sales_text)
+                break
+        
+        return product_data
+    
+    def _is_valid_product(self, product_data: Dict[str, Any]) -> bool:
+        """유효한 제품인지 확인"""
+        return (product_data['product_name'] != 'Unknown Product' and 
+                bool(product_data['product_url']) and 
+                'tiktok' in product_data['product_url'])
+    
+    def _collect_candidates_webdriver(self, element) -> Dict[str, Any]:
+        """라이브 WebElement 에서 필드 후보 수집 (첫 유효 값에서 멈추도록 지연 평가)"""
+        return {
+            'names': from_selectors(element, self.NAME_SELECTORS, lambda e: e.text or e.get_attribute('title')),
+            'prices': from_selectors(element, self.PRICE_SELECTORS, lambda e: e.text),
+            'href': first_tag(element, 'a', lambda e: e.get_attribute('href')),
+            'image': first_tag(element, 'img', lambda e: pick_image_url((e.get_attribute(a) for a in IMAGE_ATTRIBUTES), self.base_url)),
+            'ratings': from_selectors(element, self.RATING_SELECTORS, lambda e: e.text or e.get_attribute('title')),
+            'reviews': from_selectors(element, self.REVIEW_SELECTORS, lambda e: e.text),
+            'sales': from_selectors(element, self.SALES_SELECTORS, lambda e: e.text)
+        }
+    
     def _extract_products_data(self, elements: List, source_type: str, limit: int) -> List[Dict[str, Any]]:
         """상품 요소에서 데이터 추출"""
         products = []
         
         for i, element in enumerate(elements[:limit]):
             try:
-                product_data = {
-                    'collection_date': self.collection_date.isoformat(),
-                    'source_type': source_type,
-                    'platform': 'tiktok_shop',
-                    'product_name': 'Unknown Product',
-                    'product_url': '',
-                    'price': '',
-                    'price_numeric': None,
-                    'original_price': '',
-                    'original_price_numeric': None,
-                    'discount_percentage': None,
-                    'rating': None,
-                    'rating_numeric': None,
-                    'review_count': None,
-                    'review_count_numeric': None,
-                    'sales_count': None,
-                    'sales_count_numeric': None,
-                    'image_url': '',
-                    'category': '',
-                    'brand': '',
-                    'seller_info': '',
-                    'creator_info': None  # 제휴 크리에이터 정보 (나중에 확장)
-                }
-                
-                # 제품명 추출
-                name_selectors = [
-                    '[data-testid="product-title"]',
-                    '.product-title',
-                    '.product-name', 
-                    'h3', 'h4', 'h5',
-                    '[class*="title"]',
-                    '[class*="name"]'
-                ]
-                
-                for selector in name_selectors:
-                    try:
-                        name_element = element.find_element(By.CSS_SELECTOR, selector)
-                        name = name_element.text or name_element.get_attribute('title')
-                        if name and name.strip():
-                            product_data['product_name'] = name.strip()
-                            break
-                    except:
-                        continue
-                
-                # 가격 추출
-                price_selectors = [
-                    '[data-testid="product-price"]',
-                    '.price',
-                    '.current-price',
-                    '[class*="price"]',
-                    '.cost'
-                ]
-                
-                for selector in price_selectors:
-                    try:
-                        price_element = element.find_element(By.CSS_SELECTOR, selector)
-                        price_text = price_element.text
-                        if price_text and ('₱' in price_text or 'PHP' in price_text or price_text.isdigit()):
-                            product_data['price'] = price_text.strip()
-                            product_data['price_numeric'] = self._extract_price_value(price_text)
-                            break
-                    except:
-                        continue
-                
-                # URL 추출
-                try:
-                    link_element = element.find_element(By.TAG_NAME, 'a')
-                    href = link_element.get_attribute('href')
-                    if href:
-                        if href.startswith('/'):
-                            href = self.base_url + href
-                        product_data['product_url'] = href
-                except:
-                    pass
-                
-                # 이미지 URL 추출
-                try:
-                    img_element = element.find_element(By.TAG_NAME, 'img')
-                    img_src = img_element.get_attribute('src') or img_element.get_attribute('data-src')
-                    if img_src:
-                        product_data['image_url'] = img_src
-                except:
-                    pass
-                
-                # 평점 추출
-                rating_selectors = [
-                    '[data-testid="rating"]',
-                    '.rating',
-                    '.star-rating',
-                    '[class*="rating"]',
-                    '[class*="star"]'
-                ]
-                
-                for selector in rating_selectors:
-                    try:
-                        rating_element = element.find_element(By.CSS_SELECTOR, selector)
-                        rating_text = rating_element.text or rating_element.get_attribute('title')
-                        if rating_text:
-                            product_data['rating'] = rating_text
-                            product_data['rating_numeric'] = self._extract_rating_value(rating_text)
-                            break
-                    except:
-                        continue
+                product_data = self._build_product_data(self._collect_candidates_webdriver(element), source_type)
                 
-                # 리뷰 수 추출
-                review_selectors = [
-                    '[data-testid="review-count"]',
-                    '.review-count',
-                    '.reviews',
-                    '[class*="review"]'
-                ]
-                
-                for selector in review_selectors:
-                    try:
-                        review_element = element.find_element(By.CSS_SELECTOR, selector)
-                        review_text = review_element.text
-                        if review_text:
-                            product_data['review_count'] = review_text
-                            product_data['review_count_numeric'] = self._extract_number_value(review_text)
-                            break
-                    except:
-                        continue
-                
-                # 판매량 추출
-                sales_selectors = [
-                    '[data-testid="sales-count"]',
-                    '.sales-count',
-                    '.sold',
-                    '[class*="sold"]',
-                    '[class*="sales"]'
-                ]
+                if self._is_valid_product(product_data):
+                    products.append(product_data)
+                    logger.debug(f"✅ Extracted product: {product_data['product_name'][:50]}...")
                 
-                for selector in sales_selectors:
-                    try:
-                        sales_element = element.find_element(By.CSS_SELECTOR, selector)
-                        sales_text = sales_element.text
-                        if sales_text and 'sold' in sales_text.lower():
-                            product_data['sales_count'] = sales_text
-                            product_data['sales_count_numeric'] = self._extract_number_value(sales_text)
-                            break
-                    except:
-                        continue
+            except Exception as e:
+                logger.debug(f"⚠️ Error extracting product {i}: {e}")
+                continue
+        
+        return products
+    
+    def _get_page_parser(self) -> TikTokPageParser:
+        if self._page_parser is None:
+            self._page_parser = TikTokPageParser(
+                self.PRODUCT_SELECTORS,
+                {
+                    'name': self.NAME_SELECTORS,
+                    'price': self.PRICE_SELECTORS,
+                    'rating': self.RATING_SELECTORS,
+                    'review': self.REVIEW_SELECTORS,
+                    'sales': self.SALES_SELECTORS
+                }
+            )
+        return self._page_parser
+    
+    def _get_parse_executor(self) -> ThreadPoolExecutor:
+        if self._parse_executor is None:
+            self._parse_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tiktok-parse")
+        return self._parse_executor
+    
+    def _parse_page_source(self, page_source: str, page_url: str, source_type: str, limit: int) -> List[Dict[str, Any]]:
+        """page_source 스냅샷에서 상품 데이터 추출 (WebDriver 호출 없음)"""
+        start_time = time.time()
+        parser = self._get_page_parser()
+        
+        elements, selector = parser.parse(page_source, page_url)
+        if not elements:
+            logger.warning(f"❌ No product elements found in {source_type} page snapshot")
+            return []
+        
+        logger.info(f"✅ Found {len(elements)} product elements using: {selector} (offline)")
+        
+        products = []
+        for i, element in enumerate(elements[:limit]):
+            try:
+                product_data = self._build_product_data(parser.collect_candidates(element, page_url), source_type)
                 
-                # 유효한 제품인지 확인
-                if (product_data['product_name'] != 'Unknown Product' and 
-                    product_data['product_url'] and 
-                    'tiktok' in product_data['product_url']):
-                    
+                if self._is_valid_product(product_data):
                     products.append(product_data)
                     logger.debug(f"✅ Extracted product: {product_data['product_name'][:50]}...")
                 
@@ -573,11 +738,52 @@ class TikTokShopScraper:
                 logger.debug(f"⚠️ Error extracting product {i}: {e}")
                 continue
         
+        logger.debug(f"⏱️ Offline parsing of {source_type} took {time.time() - start_time:.3f}s")
         return products
     
+    def _save_page_snapshot(self, page_source: str, page_url: str, source_type: str):
+        """벤치마크/디버깅용 page_source 저장 (<source_type>_<timestamp>.html + .url)"""
+        try:
+            save_dir = Path(self.save_pages_dir)
+            save_dir.mkdir(parents=True, exist_ok=True)
+            
+            safe_name = re.sub(r'[^A-Za-z0-9_-]+', '_', source_type)
+            stem = save_dir / f"{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            stem.with_suffix('.html').write_text(page_source, encoding='utf-8')
+            stem.with_suffix('.url').write_text(page_url, encoding='utf-8')
+            
+            logger.debug(f"💾 Saved page snapshot: {stem}.html")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to save page snapshot: {e}")
+    
     def close(self):
         """브라우저 종료"""
-        if self.driver:
+        readiness_stats = self.readiness.get_stats()
+        if readiness_stats["pages"]:
+            logger.info(
+                f"⚡ Page readiness: {readiness_stats['pages']} pages, avg {readiness_stats['avg_wait_seconds']}s wait, "
+                f"{readiness_stats['saved_seconds']:.0f}s saved vs fixed sleeps"
+            )
+        
+        filter_stats = self.resource_filter.get_stats()
+        if filter_stats["pages"]:
+            logger.info(
+                f"🚫 Resource filter: {filter_stats['blocked_requests']} requests blocked "
+                f"(~{filter_stats['estimated_mb_saved']} MB saved) over {filter_stats['pages']} pages"
+            )
+        
+        if self._parse_executor:
+            self._parse_executor.shutdown(wait=True)
+            self._parse_executor = None
+        
+        if self._driver_lease:
+            self.driver_pool.checkin(self._driver_lease, pages=self._pages_loaded, bot_detected=self._bot_detected)
+            self._driver_lease = None
+            self._pages_loaded = 0
+            self._bot_detected = False
+            self.driver = None
+            logger.info("✅ TikTok Shop scraper browser returned to pool")
+        elif self.driver:
             self.driver.quit()
             self.driver = None
             logger.info("✅ TikTok Shop scraper browser closed")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+페르소나 일괄 점수 계산 벤치마크
+Compares per-product LazadaPersonaScraper scoring against PersonaBatchScorer for every persona
+
+사용 예:
+    python scripts/benchmark_batch_scoring.py --products 200000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from config.persona_config import TARGET_PERSONAS
+from scrapers.lazada_persona_scraper import LazadaPersonaScraper
+from utils.persona_batch_scorer import PersonaBatchScorer, ProductBatch
+
+
+def generate_products(count: int, seed: int):
+    rng = random.Random(seed)
+    vocabulary = ["premium", "set", "original", "mini", "new", "bundle"]
+    for persona in TARGET_PERSONAS.values():
+        vocabulary.extend(persona.keywords[:20] + persona.preferred_brands)
+
+    return [{
+        'product_name': " ".join(rng.sample(vocabulary, rng.randint(2, 6))),
+        'category': None,
+        'price_numeric': rng.choice([None, rng.uniform(50, 15000)]),
+        'rating_numeric': rng.choice([None, round(rng.uniform(2.5, 5), 1)]),
+        'review_count_numeric': rng.choice([None, rng.randint(1, 20000)])
+    } for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch persona scoring")
+    parser.add_argument("--products", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    products = generate_products(args.products, args.seed)
+    personas = list(TARGET_PERSONAS)
+    print(f"📊 Persona scoring benchmark ({len(products):,} products x {len(personas)} personas)")
+    print("=" * 80)
+
+    start = time.perf_counter()
+    per_product = {}
+    for persona_name in personas:
+        scraper = LazadaPersonaScraper(persona_name=persona_name)
+        scores = []
+        for product in products:
+            product_data = dict(product)
+            relevant = scraper._is_persona_relevant(product_data)
+            scores.append(scraper._calculate_persona_score(product_data) if relevant else None)
+        per_product[persona_name] = scores
+    per_product_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = PersonaBatchScorer(personas).score(ProductBatch.from_records(products))
+    batch_time = time.perf_counter() - start
+
+    print(f"   per-product: {per_product_time:8.2f}s")
+    print(f"   batch:       {batch_time:8.2f}s | speedup x{per_product_time / batch_time:.1f}")
+
+    mismatches = 0
+    for persona_name in personas:
+        batch = results.for_persona(persona_name)
+        for index, expected in enumerate(per_product[persona_name]):
+            if (expected is None) == bool(batch["relevant"][index]):
+                mismatches += 1
+            elif expected is not None and not np.isclose(expected, batch["scores"][index], rtol=0, atol=1e-9):
+                mismatches += 1
+
+    if mismatches:
+        print(f"   ❌ {mismatches:,} results differ")
+        return 1
+    print("   ✅ All relevance flags and scores identical")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+이벤트 필드 추출 벤치마크
+Compares LocalEventScraper's per-pattern extraction against the compiled event_extraction.extract_batch
+
+사용 예:
+    python scripts/benchmark_event_extraction.py --events 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scrapers.event_extraction import CATEGORY_KEYWORDS, TAG_KEYWORDS, extract_batch
+from scrapers.local_event_scraper import LocalEventScraper
+
+PLACES = ["BGC", "Makati", "Quezon City", "Greenbelt 3", "SM Megamall", "Ayala Triangle", "The Podium Mall",
+          "Rockwell Center", "Eastwood Plaza", "Poblacion", "Maginhawa", "Intramuros"]
+DATES = ["July 11-13, 2025", "11-13 July 2025", "every Saturday", "August 2, 2025", "07/19/2025", "this weekend",
+         "Saturdays until September 30, 2025", "every first Sunday"]
+FILLER = ["join", "the", "community", "for", "an", "afternoon", "of", "with", "friends", "tickets", "available",
+          "online", "free", "entrance", "returns", "this", "year", "featuring", "over", "50", "vendors"]
+
+
+def generate_events(count: int, seed: int):
+    """(제목, 본문) 합성 이벤트 설명"""
+    rng = random.Random(seed)
+    keywords = [kw for kws in list(CATEGORY_KEYWORDS.values()) + list(TAG_KEYWORDS.values()) for kw in kws]
+    events = []
+    for _ in range(count):
+        words = rng.choices(FILLER, k=rng.randint(20, 45)) + rng.sample(keywords, rng.randint(0, 4))
+        rng.shuffle(words)
+        title = f"{rng.choice(PLACES)} {rng.choice(['Weekend Market', 'Food Festival', 'Art Bazaar', 'Pop-up Event'])}"
+        text = f"{title}. {' '.join(words).capitalize()} at {rng.choice(PLACES)} on {rng.choice(DATES)}."
+        events.append((title, text))
+    return events
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark event field extraction")
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    events = generate_events(args.events, args.seed)
+    scraper = LocalEventScraper(http_cache=False)
+    print(f"📊 Event field extraction benchmark ({len(events):,} synthetic descriptions)")
+    print("=" * 80)
+
+    start = time.perf_counter()
+    per_event = []
+    for title, text in events:
+        date_info = scraper._extract_date_info(text)
+        per_event.append((
+            date_info['raw_date'], date_info['is_recurring'], scraper._extract_location_info(text),
+            scraper._categorize_event(title, text), scraper._extract_tags(title, text)
+        ))
+    per_event_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fields = extract_batch(events)
+    batch_time = time.perf_counter() - start
+
+    batch = [(f.raw_date, f.is_recurring, f.location, f.event_type, f.tags) for f in fields]
+    mismatches = sum(1 for old, new in zip(per_event, batch) if old != new)
+
+    print(f"   per-event: {per_event_time:8.2f}s | {len(events) / per_event_time:10,.0f} events/s")
+    print(f"   compiled:  {batch_time:8.2f}s | {len(events) / batch_time:10,.0f} events/s "
+          f"| speedup x{per_event_time / batch_time:.1f}")
+    print(f"   output: {'✅ identical' if not mismatches else f'⚠️ {mismatches} mismatches'}")
+    return 0 if not mismatches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
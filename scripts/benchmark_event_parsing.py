@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+이벤트 페이지 파서 백엔드 벤치마크
+Compares html.parser / lxml / selectolax (and SoupStrainer selective mode) on saved event pages
+
+페이지 저장:
+    EVENT_SAVE_PAGES_DIR=data/event_pages python scrapers/local_event_scraper.py
+    → <source>_<timestamp>_<url hash>.html (+ .url) 이 저장됩니다.
+
+사용 예:
+    python scripts/benchmark_event_parsing.py --pages-dir data/event_pages
+    python scripts/benchmark_event_parsing.py --pages-dir data/event_pages --backends lxml html.parser
+
+메모리는 tracemalloc 기준 Python 힙 최대치이므로 selectolax(C 라이브러리) 내부 할당은 포함되지 않습니다.
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scrapers.event_page_parser import EventPageParser, available_backends
+
+
+def load_pages(pages_dir: Path):
+    """저장된 페이지를 소스별로 묶어서 로드"""
+    pages = defaultdict(list)
+    for html_path in sorted(pages_dir.glob("*.html")):
+        source = html_path.stem.rsplit("_", 3)[0]
+        pages[source].append((html_path, html_path.read_bytes()))
+    return pages
+
+
+def bench(parser, bodies, repeat):
+    """(중앙값 파싱 시간, Python 힙 최대치, 후보 텍스트)"""
+    timings = []
+    candidates = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        candidates = [parser.candidate_texts(body) for body in bodies]
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    for body in bodies:
+        parser.candidate_texts(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak, candidates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark event page parser backends")
+    parser.add_argument("--pages-dir", default="data/event_pages", help="Directory with saved *.html pages")
+    parser.add_argument("--backends", nargs="+", default=list(reversed(available_backends())),
+                        help="Backends to compare (first one is the baseline)")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per source")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    pages = load_pages(Path(args.pages_dir))
+    if not pages:
+        print(f"❌ No saved pages found in {args.pages_dir}")
+        return 1
+
+    variants = []
+    for backend in args.backends:
+        if backend not in available_backends():
+            print(f"⚠️ Skipping unavailable backend: {backend}")
+            continue
+        variants.append((backend, False))
+        if backend != "selectolax":
+            variants.append((backend, True))
+
+    print(f"📊 Event page parsing benchmark ({sum(len(v) for v in pages.values())} pages, repeat={args.repeat})")
+    print("=" * 80)
+
+    for source, entries in sorted(pages.items()):
+        bodies = [body for _, body in entries]
+        print(f"\n📄 {source}: {len(entries)} pages ({sum(len(b) for b in bodies) / 1024:.0f} KB)")
+
+        baseline = None
+        for backend, selective in variants:
+            label = f"{backend}{' +strainer' if selective else ''}"
+            seconds, peak, candidates = bench(EventPageParser(backend, selective=selective), bodies, args.repeat)
+            if baseline is None:
+                baseline = (seconds, candidates)
+            match = "✅ identical" if candidates == baseline[1] else "⚠️ differs"
+            speedup = baseline[0] / max(seconds, 1e-9)
+            print(f"   {label:<22} {seconds * 1000:8.1f} ms | peak {peak / 1024 / 1024:7.2f} MB "
+                  f"| x{speedup:4.1f} | {match}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+페르소나 점수 매칭 벤치마크
+Compares the legacy nested-loop interest matching against the precompiled Aho-Corasick matcher
+
+사용 예:
+    python scripts/benchmark_persona_matcher.py                 # 100k 상품명, 모든 페르소나
+    python scripts/benchmark_persona_matcher.py --products 20000 --seed 7
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from persona_recommendation_engine import PersonaRecommendationEngine
+
+# 벤치마크 동안 DB 상태와 무관하게 같은 트렌드 사용
+BENCHMARK_TRENDS = {
+    "fashion": 86, "makeup": 62, "skincare": 25, "k-pop": 22, "food delivery": 10,
+    "korean skincare": 14, "sunscreen": 9, "tote bag": 7, "blazer": 5
+}
+
+CATEGORIES = ["스킨케어", "메이크업", "패션", "액세서리", "beauty", "fashion", "accessories", "electronics", "home", ""]
+
+FILLER_WORDS = [
+    "premium", "original", "new", "2025", "set", "pack", "for women", "unisex", "mini", "large",
+    "authentic", "sale", "bundle", "ph", "free shipping", "best seller", "limited", "edition"
+]
+
+
+def build_vocabulary(engine: PersonaRecommendationEngine):
+    """페르소나 관심사 키워드 + 특별 매칭 변형 + 무관한 단어"""
+    vocabulary = []
+    for persona in engine.personas.values():
+        for interest in persona.interests:
+            vocabulary.append(interest["keyword"])
+            vocabulary.extend(interest["related"])
+    vocabulary.extend(["세럼", "틴트", "토트백", "블레이저", "한국", "레티놀", "가방"])
+    return vocabulary
+
+
+def generate_products(count: int, vocabulary, seed: int):
+    rng = random.Random(seed)
+    products = []
+    for _ in range(count):
+        words = rng.sample(FILLER_WORDS, rng.randint(1, 4))
+        # 약 절반은 관심사 키워드 포함
+        if rng.random() < 0.5:
+            words.insert(rng.randint(0, len(words)), rng.choice(vocabulary))
+        name = " ".join(words)
+        if rng.random() < 0.3:
+            name = name.title()
+        products.append((name, rng.choice(CATEGORIES)))
+    return products
+
+
+def score_all(engine, products, personas):
+    start = time.perf_counter()
+    results = [
+        engine._calculate_product_score(name, category, persona)
+        for persona in personas
+        for name, category in products
+    ]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark persona interest matching")
+    parser.add_argument("--products", type=int, default=100_000, help="Number of synthetic product names")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    legacy = PersonaRecommendationEngine(use_compiled_matcher=False)
+    compiled = PersonaRecommendationEngine(use_compiled_matcher=True)
+    for engine in (legacy, compiled):
+        engine.trend_data = dict(BENCHMARK_TRENDS)
+
+    products = generate_products(args.products, build_vocabulary(compiled), args.seed)
+    personas = list(compiled.personas.values())
+
+    print(f"📊 Persona matcher benchmark ({len(products):,} products x {len(personas)} personas)")
+    print("=" * 80)
+
+    legacy_time, legacy_results = score_all(legacy, products, personas)
+    compiled_time, compiled_results = score_all(compiled, products, personas)
+
+    total = len(products) * len(personas)
+    print(f"   legacy:   {legacy_time:8.2f}s | {total / legacy_time:12,.0f} scores/s")
+    print(f"   compiled: {compiled_time:8.2f}s | {total / compiled_time:12,.0f} scores/s | speedup x{legacy_time / compiled_time:.1f}")
+
+    mismatches = sum(1 for a, b in zip(legacy_results, compiled_results) if a != b)
+    if mismatches:
+        print(f"   ❌ {mismatches:,} score results differ")
+        return 1
+
+    print("   ✅ All score results identical")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+TikTok Shop 파싱 경로 벤치마크
+Compares the live WebDriver extraction path against the offline page_source + lxml path on saved pages
+
+페이지 저장:
+    TikTokShopScraper(save_pages_dir="data/tiktok_pages") 로 수집하면 <source_type>_<timestamp>.html 이 저장됩니다.
+
+사용 예:
+    python scripts/benchmark_tiktok_parsing.py --pages-dir data/tiktok_pages
+    python scripts/benchmark_tiktok_parsing.py --pages-dir data/tiktok_pages --live   # 브라우저로 라이브 경로도 측정
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scrapers.tiktok_shop_scraper import TikTokShopScraper
+
+
+def load_pages(pages_dir: Path):
+    """저장된 page_source 와 원본 URL 로드"""
+    pages = []
+    for html_path in sorted(pages_dir.glob("*.html")):
+        url_path = html_path.with_suffix(".url")
+        page_url = url_path.read_text(encoding="utf-8").strip() if url_path.exists() else html_path.resolve().as_uri()
+        source_type = html_path.stem.rsplit("_", 2)[0]
+        pages.append((html_path, html_path.read_text(encoding="utf-8"), page_url, source_type))
+    return pages
+
+
+def bench_offline(scraper, html, page_url, source_type, limit, repeat):
+    timings = []
+    products = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        products = scraper._parse_page_source(html, page_url, source_type, limit)
+        timings.append(time.perf_counter() - start)
+    return timings, products
+
+
+def bench_live(scraper, html_path, source_type, limit, repeat):
+    """file:// 로 저장된 페이지를 열고 기존 라이브 경로로 추출"""
+    if not scraper.driver:
+        scraper._setup_driver()
+    scraper.driver.get(html_path.resolve().as_uri())
+
+    timings = []
+    products = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        elements = scraper._find_product_elements()
+        products = scraper._extract_products_data(elements, source_type, limit) if elements else []
+        timings.append(time.perf_counter() - start)
+    return timings, products
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TikTok Shop live vs offline parsing")
+    parser.add_argument("--pages-dir", default="data/tiktok_pages", help="Directory with saved *.html snapshots")
+    parser.add_argument("--limit", type=int, default=20, help="Products extracted per page")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per page")
+    parser.add_argument("--live", action="store_true", help="Also measure the live WebDriver path (needs Chrome)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    pages = load_pages(Path(args.pages_dir))
+    if not pages:
+        print(f"❌ No saved pages found in {args.pages_dir}")
+        return 1
+
+    scraper = TikTokShopScraper(headless=True, parse_mode="offline")
+
+    print(f"📊 TikTok Shop parsing benchmark ({len(pages)} pages, limit={args.limit}, repeat={args.repeat})")
+    print("=" * 80)
+
+    try:
+        for html_path, html, page_url, source_type in pages:
+            print(f"\n📄 {html_path.name} ({len(html) / 1024:.0f} KB)")
+
+            offline_times, offline_products = bench_offline(scraper, html, page_url, source_type, args.limit, args.repeat)
+            print(f"   offline: median {statistics.median(offline_times) * 1000:8.1f} ms | {len(offline_products)} products")
+
+            if args.live:
+                # 라이브 경로는 file:// URL 기준으로 링크를 해석하므로 같은 기준으로 비교
+                file_url = html_path.resolve().as_uri()
+                _, offline_products = bench_offline(scraper, html, file_url, source_type, args.limit, 1)
+                live_times, live_products = bench_live(scraper, html_path, source_type, args.limit, args.repeat)
+                speedup = statistics.median(live_times) / max(statistics.median(offline_times), 1e-9)
+                print(f"   live:    median {statistics.median(live_times) * 1000:8.1f} ms | {len(live_products)} products "
+                      f"| offline speedup x{speedup:.1f}")
+
+                live_names = [p["product_name"] for p in live_products]
+                offline_names = [p["product_name"] for p in offline_products]
+                match = "✅ identical" if live_names == offline_names else "⚠️ differs"
+                print(f"   product names: {match}")
+    finally:
+        scraper.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
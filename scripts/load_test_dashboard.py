@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+대시보드 API 동시 요청 부하 테스트
+Fires concurrent GET requests at a running dashboard API and reports throughput / latency per endpoint
+
+서버 실행:
+    python api/dashboard_api.py
+
+사용 예:
+    python scripts/load_test_dashboard.py                                   # 기본 엔드포인트, 동시 20
+    python scripts/load_test_dashboard.py --concurrency 50 --requests 1000
+    python scripts/load_test_dashboard.py --path /persona/young_filipina/products --path /system/stats
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections import Counter
+
+import aiohttp
+
+DEFAULT_PATHS = [
+    "/persona/young_filipina/products?limit=20",
+    "/user/maria_santos/dashboard",
+    "/system/stats",
+]
+
+
+async def hit(session, base_url, path, results):
+    start = time.perf_counter()
+    try:
+        async with session.get(base_url + path) as response:
+            await response.read()
+            status = response.status
+    except Exception as e:
+        status = type(e).__name__
+    results.append((path, status, time.perf_counter() - start))
+
+
+async def run_load(base_url, paths, total_requests, concurrency, timeout):
+    results = []
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        async def bounded(path):
+            async with semaphore:
+                await hit(session, base_url, path, results)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(bounded(paths[index % len(paths)]) for index in range(total_requests)))
+        elapsed = time.perf_counter() - start
+
+    return results, elapsed
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the dashboard API")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--path", action="append", dest="paths", help="Endpoint path (repeatable)")
+    parser.add_argument("--requests", type=int, default=300, help="Total number of requests")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-request timeout in seconds")
+    args = parser.parse_args()
+
+    paths = args.paths or DEFAULT_PATHS
+    base_url = args.base_url.rstrip("/")
+
+    print(f"📊 Dashboard load test ({args.requests} requests, concurrency {args.concurrency}) → {base_url}")
+    print("=" * 80)
+
+    results, elapsed = asyncio.run(run_load(base_url, paths, args.requests, args.concurrency, args.timeout))
+
+    for path in paths:
+        latencies = [latency for result_path, _, latency in results if result_path == path]
+        statuses = Counter(str(status) for result_path, status, _ in results if result_path == path)
+        if not latencies:
+            continue
+        print(f"   {path}")
+        print(
+            f"      p50 {statistics.median(latencies) * 1000:8.1f}ms | p95 {percentile(latencies, 0.95) * 1000:8.1f}ms | "
+            f"max {max(latencies) * 1000:8.1f}ms | status {dict(statuses)}"
+        )
+
+    ok = sum(1 for _, status, _ in results if status == 200)
+    print("-" * 80)
+    print(f"   total: {len(results)} requests in {elapsed:.2f}s | {len(results) / elapsed:,.1f} req/s | {ok} OK")
+
+    if ok < len(results):
+        print(f"   ⚠️ {len(results) - ok} requests did not return 200")
+        return 1
+    print("   ✅ All requests succeeded")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+-- Natural-key unique indexes for SupabaseClient.bulk_write upserts
+-- on_conflict columns must match these indexes exactly (see SupabaseClient.NATURAL_KEYS)
+
+-- Remove existing duplicates first (keep the most recently created row)
+DELETE FROM google_trends a USING google_trends b
+WHERE a.keyword = b.keyword
+  AND a.trend_type = b.trend_type
+  AND a.collection_date = b.collection_date
+  AND (a.created_at, a.id) < (b.created_at, b.id);
+
+DELETE FROM shopee_products a USING shopee_products b
+WHERE a.product_url = b.product_url
+  AND a.collection_date = b.collection_date
+  AND (a.created_at, a.id) < (b.created_at, b.id);
+
+DELETE FROM tiktok_shop_products a USING tiktok_shop_products b
+WHERE a.product_url = b.product_url
+  AND a.collection_date = b.collection_date
+  AND (a.created_at, a.id) < (b.created_at, b.id);
+
+DELETE FROM tiktok_videos a USING tiktok_videos b
+WHERE a.video_id = b.video_id
+  AND a.collection_date = b.collection_date
+  AND (a.created_at, a.id) < (b.created_at, b.id);
+
+-- Unique indexes (rows with NULL key columns never conflict and are inserted as-is)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_google_trends_natural_key
+    ON google_trends(keyword, trend_type, collection_date);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_shopee_products_natural_key
+    ON shopee_products(product_url, collection_date);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_tiktok_shop_products_natural_key
+    ON tiktok_shop_products(product_url, collection_date);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_tiktok_videos_natural_key
+    ON tiktok_videos(video_id, collection_date);
+
+-- local_events already has UNIQUE(source_url, event_name)
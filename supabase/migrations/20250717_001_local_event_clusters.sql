@@ -0,0 +1,7 @@
+-- Near-duplicate clustering for local_events
+-- EventDeduplicator assigns the same event_cluster_id to listings of one event
+-- across sources and across daily runs; group by it to count distinct events
+
+ALTER TABLE local_events ADD COLUMN IF NOT EXISTS event_cluster_id VARCHAR(40);
+
+CREATE INDEX IF NOT EXISTS idx_local_events_cluster ON local_events(event_cluster_id);
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+비동기 수집기 테스트 (호스트별 간격 / 호스트 간 병렬 / 재시도)
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from utils.async_fetcher import AsyncFetcher, FetchResult
+from utils.http_cache import HttpCache
+from scrapers.local_event_scraper import EVENT_SOURCES, LocalEventScraper
+
+
+async def _serve(handler, coroutine):
+    app = web.Application()
+    app.router.add_get("/{name}", handler)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    try:
+        return await coroutine(server.port)
+    finally:
+        await server.close()
+
+
+def test_delay_is_per_host_and_hosts_run_in_parallel():
+    """같은 호스트는 per_host_delay 간격, 다른 호스트(localhost)는 기다리지 않음"""
+    arrivals = []
+
+    async def handler(request):
+        arrivals.append((request.host.split(":")[0], time.monotonic()))
+        return web.Response(text=request.match_info["name"])
+
+    async def scenario(port):
+        fetcher = AsyncFetcher(per_host_delay=0.3, max_concurrency=4, retries=0)
+        urls = [f"http://127.0.0.1:{port}/a", f"http://127.0.0.1:{port}/b", f"http://localhost:{port}/c"]
+        started = time.monotonic()
+        results = await fetcher.fetch_all(urls)
+        return fetcher, results, started
+
+    fetcher, results, started = asyncio.run(_serve(handler, scenario))
+
+    assert [result.body for result in results] == [b"a", b"b", b"c"]
+    assert all(result.ok for result in results)
+    same_host = sorted(at for host, at in arrivals if host == "127.0.0.1")
+    other_host = [at for host, at in arrivals if host == "localhost"]
+    assert same_host[1] - same_host[0] >= 0.29
+    assert other_host[0] - started < 0.25
+    assert fetcher.get_stats()["succeeded"] == 3
+
+
+def test_retries_transient_errors_only():
+    """503 은 재시도, 404 는 바로 실패"""
+    calls = {"flaky": 0, "missing": 0}
+
+    async def handler(request):
+        name = request.match_info["name"]
+        calls[name] += 1
+        if name == "flaky" and calls[name] < 3:
+            return web.Response(status=503)
+        if name == "missing":
+            return web.Response(status=404)
+        return web.Response(text="ok")
+
+    async def scenario(port):
+        fetcher = AsyncFetcher(per_host_delay=0, retries=2, backoff=0.01)
+        return fetcher, await fetcher.fetch_all([f"http://127.0.0.1:{port}/flaky", f"http://localhost:{port}/missing"])
+
+    fetcher, (flaky, missing) = asyncio.run(_serve(handler, scenario))
+
+    assert flaky.ok and flaky.attempts == 3 and flaky.body == b"ok"
+    assert not missing.ok and missing.status == 404 and missing.attempts == 1
+    assert calls == {"flaky": 3, "missing": 1}
+    assert fetcher.get_stats()["retries"] == 2
+
+
+class RecordingFetcher:
+    """run() 호출을 기록하고 고정 HTML 을 돌려주는 수집기"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def run(self, urls, headers=None):
+        urls = list(urls)
+        self.calls.append(urls)
+        return [
+            FetchResult(url=url, status=200, body=self.pages[url].encode()) if url in self.pages
+            else FetchResult(url=url, error="ClientConnectorError")
+            for url in urls
+        ]
+
+
+def test_get_all_events_fetches_every_source_in_one_batch(tmp_path):
+    """모든 소스 URL 을 한 번에 요청하고, 실패한 소스는 샘플 이벤트로 대체"""
+    spot_url = EVENT_SOURCES['spot_ph'][0]
+    html = (
+        "<html><body><section><p>Makati Weekend Bazaar returns July 19, 2025 at Greenbelt with 80 local makers. "
+        "Bring your tote bags.</p><div>Weekend bazaar</div></section></body></html>"
+    )
+    fetcher = RecordingFetcher({spot_url: html})
+    events = LocalEventScraper(fetcher=fetcher, http_cache=HttpCache(str(tmp_path))).get_all_events()
+
+    assert len(fetcher.calls) == 1
+    assert sorted(fetcher.calls[0]) == sorted(url for urls in EVENT_SOURCES.values() for url in urls)
+
+    spot_events = [event for event in events if event['source_website'] == 'spot_ph']
+    assert spot_events and all(event['source_url'] == spot_url for event in spot_events)
+    assert {event['source_website'] for event in events} == {'nylon_manila', 'spot_ph', 'when_in_manila'}
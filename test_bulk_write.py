@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+SupabaseClient.bulk_write 테스트 (청크 크기 / 이분할 격리 / 연결 오류 / 자연 키 중복 제거)
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from database.supabase_client import SupabaseClient
+
+
+class FakePostgrest:
+    """
+    supabase client 대역
+
+    - 일괄 upsert 는 postgrest 처럼 모든 행의 키 합집합(columns)으로 보내므로 빠진 컬럼은 NULL
+    - 같은 요청 안에서 충돌 키가 같은 행이 두 번 나오면 Postgres 처럼 오류
+    - bad 행이 있으면 요청 전체 실패, down 이면 연결 오류
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.rows = {}
+        self.down = False
+        self._table = None
+
+    def table(self, name):
+        self._table = name
+        return self
+
+    def insert(self, chunk):
+        return self._request(chunk, None)
+
+    def upsert(self, chunk, on_conflict=None):
+        return self._request(chunk, on_conflict.split(","))
+
+    def _request(self, chunk, key_columns):
+        columns = sorted({column for row in chunk for column in row})
+        rows = [{column: row.get(column) for column in columns} for row in chunk]
+        self.requests.append(len(rows))
+        fake = self
+
+        class Query:
+            def execute(self):
+                if fake.down:
+                    raise ConnectionError("Supabase unreachable")
+                if any(row.get("bad") for row in rows):
+                    raise Exception('new row violates check constraint "local_events_check"')
+                if key_columns:
+                    keys = [tuple(row[column] for column in key_columns) for row in rows]
+                    keys = [key for key in keys if None not in key]
+                    if len(keys) != len(set(keys)):
+                        raise Exception("ON CONFLICT DO UPDATE command cannot affect row a second time")
+                for row in rows:
+                    key = tuple(row[column] for column in key_columns) if key_columns else None
+                    fake.rows[key if key and None not in key else len(fake.rows)] = row
+                return type("Response", (), {"data": rows})()
+
+        return Query()
+
+
+def _client(fake):
+    client = object.__new__(SupabaseClient)
+    client.client = fake
+    client._initialized = True
+    return client
+
+
+def _events(count, start=0):
+    return [{"source_url": f"https://example.com/{i}", "event_name": f"Event {i}"} for i in range(start, start + count)]
+
+
+KEYS = SupabaseClient.NATURAL_KEYS["local_events"]
+
+
+def test_records_are_sent_in_chunks():
+    """chunk_size 단위로 요청, 결과 행은 모두 data 에"""
+    fake = FakePostgrest()
+    stats = _client(fake).bulk_write("local_events", _events(23), on_conflict=KEYS, chunk_size=10)
+
+    assert fake.requests == [10, 10, 3]
+    assert (stats["written"], stats["failed"], stats["requests"]) == (23, 0, 3)
+    assert len(stats["data"]) == 23
+
+
+def test_failing_chunk_is_bisected_down_to_the_bad_row():
+    """데이터 오류가 난 청크는 절반씩 나눠 재시도해 문제 행 하나만 실패"""
+    fake = FakePostgrest()
+    records = _events(8)
+    records[5]["bad"] = True
+    stats = _client(fake).bulk_write("local_events", records, on_conflict=KEYS, chunk_size=8)
+
+    assert (stats["written"], stats["failed"]) == (7, 1)
+    assert fake.requests == [8, 4, 4, 2, 1, 1, 2]  # 실패한 절반만 다시 분할
+    assert "Event 5" not in {row["event_name"] for row in fake.rows.values()}
+
+
+def test_connection_error_is_not_bisected():
+    """연결 오류는 분할 재시도 없이 남은 청크까지 실패 처리"""
+    fake = FakePostgrest()
+    fake.down = True
+    stats = _client(fake).bulk_write("local_events", _events(25), on_conflict=KEYS, chunk_size=10)
+
+    assert fake.requests == [10]
+    assert stats["connection_error"] and (stats["written"], stats["failed"]) == (0, 25)
+
+
+def test_natural_key_duplicates_are_collapsed_before_upsert():
+    """같은 자연 키는 마지막 값만 전송, 키 컬럼이 NULL 이거나 빠진 행은 충돌하지 않으므로 모두 유지"""
+    fake = FakePostgrest()
+    records = _events(3) + [
+        {"source_url": "https://example.com/1", "event_name": "Event 1", "event_location": "BGC"},
+        {"source_url": "https://example.com/x", "event_name": None},
+        {"source_url": "https://example.com/x", "event_name": None},
+        # event_name 이 없는 행 - postgrest columns 로 다른 행과 묶이면 NULL 로 전송됨
+        {"source_url": "https://example.com/y"},
+        {"source_url": "https://example.com/y", "event_location": "Makati"},
+    ]
+    stats = _client(fake).bulk_write("local_events", records, on_conflict=KEYS)
+
+    assert stats["failed"] == 0 and fake.requests == [7]
+    assert stats["written"] == 7
+    assert fake.rows[("https://example.com/1", "Event 1")]["event_location"] == "BGC"
+
+    # 중복 제거 없이 보냈다면 한 요청 안의 같은 키 때문에 이분할까지 가야 함
+    fake = FakePostgrest()
+    _client(fake)._write_chunk("local_events", records[:4], KEYS, {"requests": 0, "written": 0, "failed": 0, "data": []})
+    assert len(fake.requests) > 1
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+대시보드 수동 수집 백그라운드 작업 테스트
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from api.collection_jobs import CollectionJobManager
+
+
+def _wait_for(job, timeout=2.0):
+    deadline = time.time() + timeout
+    while job.active and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_job_runs_in_background_and_dedupes():
+    """요청은 바로 반환되고, 같은 페르소나 작업은 하나만 실행"""
+    release = threading.Event()
+    calls = []
+
+    def collect(persona_name, limit):
+        calls.append((persona_name, limit))
+        release.wait(2)
+        return [{}] * limit
+
+    manager = CollectionJobManager(collect)
+    job = manager.submit("young_filipina", 3, requested_by="maria_santos")
+    duplicate = manager.submit("young_filipina", 5)
+
+    assert duplicate.job_id == job.job_id
+    assert job.status in ("queued", "running")
+
+    release.set()
+    _wait_for(job)
+    assert job.status == "completed"
+    assert job.products_collected == 3
+    assert calls == [("young_filipina", 3)]
+    assert manager.get(job.job_id) is job
+    manager.shutdown()
+
+
+def test_failed_job_records_error():
+    """수집 예외는 작업 상태에 기록"""
+    def collect(persona_name, limit):
+        raise RuntimeError("browser crashed")
+
+    manager = CollectionJobManager(collect)
+    job = manager.submit("urban_professional", 5)
+    _wait_for(job)
+
+    assert job.status == "failed"
+    assert "browser crashed" in job.error
+    assert manager.get_stats()["failed"] == 1
+    manager.shutdown()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+WebDriver 풀 테스트 (실제 브라우저 없이 가짜 드라이버 사용)
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from utils.driver_pool import WebDriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("session deleted")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_checkin_reuses_warm_driver():
+    """반납된 드라이버는 다음 대여에서 재사용"""
+    pool = WebDriverPool(FakeDriver, profile="test", max_size=2, warm_size=1)
+    pool.warm_up()
+    assert pool.get_stats()["created"] == 1
+
+    first = pool.checkout()
+    pool.checkin(first, pages=3)
+    second = pool.checkout()
+
+    assert second is first
+    assert pool.get_stats()["created"] == 1
+    assert pool.get_stats()["reused"] == 2
+
+
+def test_recycles_after_page_limit_and_bot_detection():
+    """페이지 한도 초과 또는 봇 감지 시 드라이버 폐기"""
+    pool = WebDriverPool(FakeDriver, profile="test", max_size=1, max_pages_per_driver=5)
+
+    pooled = pool.checkout()
+    pool.checkin(pooled, pages=5)
+    assert pooled.driver.quit_called
+
+    pooled = pool.checkout()
+    pool.checkin(pooled, pages=1, bot_detected=True)
+    assert pooled.driver.quit_called
+
+    stats = pool.get_stats()
+    assert stats["recycled"] == 2
+    assert stats["bot_detections"] == 1
+    assert stats["idle"] == 0
+
+
+def test_unhealthy_driver_replaced_on_checkout():
+    """상태 확인에 실패한 유휴 드라이버는 새 드라이버로 교체"""
+    pool = WebDriverPool(FakeDriver, profile="test", max_size=1)
+    pooled = pool.checkout()
+    pool.checkin(pooled)
+    pooled.driver.alive = False
+
+    replacement = pool.checkout()
+
+    assert replacement is not pooled
+    assert pooled.driver.quit_called
+    assert pool.get_stats()["health_check_failures"] == 1
+
+
+def test_checkout_waits_for_max_size():
+    """최대 크기에 도달하면 반납될 때까지 대기, 시간 초과 시 TimeoutError"""
+    pool = WebDriverPool(FakeDriver, profile="test", max_size=1)
+    pooled = pool.checkout()
+
+    with pytest.raises(TimeoutError):
+        pool.checkout(timeout=0.1)
+
+    threading.Timer(0.1, pool.checkin, args=(pooled,)).start()
+    assert pool.checkout(timeout=2) is pooled
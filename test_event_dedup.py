@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+이벤트 유사 중복 탐지 테스트 (소스 간 / 날짜 간 클러스터링, 영구 인덱스)
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from scrapers.event_dedup import EventDeduplicator, date_key, location_key
+
+
+def _event(name, source, dates="July 11-13, 2025", location="BGC", description=""):
+    return {
+        "event_name": name,
+        "event_dates": dates,
+        "event_location": location,
+        "event_description": description or name,
+        "source_url": f"https://{source}.example.com/events",
+        "source_website": source,
+    }
+
+
+BAZAAR = "Weekend Market Manila Holiday Bazaar featuring local food stalls and handmade crafts"
+
+
+def _filler(count, seed=7):
+    rng = random.Random(seed)
+    words = ["art", "yoga", "jazz", "vinyl", "coffee", "night", "run", "film", "book", "plant", "wine", "comedy",
+             "sneaker", "anime", "pottery", "surf", "ramen", "dance", "tech", "vintage"]
+    return [
+        _event(" ".join(rng.sample(words, 5)) + f" {index}", "filler", dates=f"Aug {index % 28 + 1}, 2025",
+               location=rng.choice(["Makati", "Pasig", "Taguig", "Quezon City"]))
+        for index in range(count)
+    ]
+
+
+def test_same_event_across_sources_collapses(tmp_path):
+    """다른 소스의 같은 이벤트 (표기 차이 포함) → 한 건, 같은 클러스터 ID"""
+    dedup = EventDeduplicator(str(tmp_path / "index.db"))
+    events = [
+        _event(BAZAAR, "spot_ph"),
+        _event("Weekend Market Manila Holiday Bazaar featuring local food stalls and handmade crafts!", "when_in_manila",
+               location="Bonifacio Global City"),
+        _event("Vinyl Night at Poblacion", "nylon_manila", location="Makati"),
+    ]
+
+    kept = dedup.deduplicate(events)
+    assert [event["source_website"] for event in kept] == ["spot_ph", "nylon_manila"]
+    assert kept[0]["event_cluster_id"] != kept[1]["event_cluster_id"]
+    assert dedup.get_stats()["duplicates"] == 1
+
+
+def test_blocking_keeps_different_dates_and_locations_apart(tmp_path):
+    """이름이 같아도 날짜나 장소가 다르면 별도 이벤트"""
+    dedup = EventDeduplicator(str(tmp_path / "index.db"))
+    events = [
+        _event(BAZAAR, "spot_ph"),
+        _event(BAZAAR, "when_in_manila", dates="December 5-7, 2025"),
+        _event(BAZAAR, "nylon_manila", location="Quezon City"),
+    ]
+    assert len(dedup.deduplicate(events)) == 3
+    assert date_key("July 11-13, 2025") == date_key("July 11, 2025") == "07-11"
+    assert location_key("Bonifacio Global City") == location_key("bgc")
+
+
+def test_clusters_persist_across_runs(tmp_path):
+    """다음 날 다른 소스에 올라온 같은 이벤트는 전날 클러스터에 합류"""
+    path = str(tmp_path / "index.db")
+    first = EventDeduplicator(path).deduplicate([_event(BAZAAR, "spot_ph")])
+
+    reopened = EventDeduplicator(path)
+    second = reopened.deduplicate([_event(BAZAAR + " this weekend", "when_in_manila", dates=None)])
+    assert second[0]["event_cluster_id"] == first[0]["event_cluster_id"]
+
+    # 같은 이벤트를 다시 보면 인덱스 크기는 그대로
+    reopened.deduplicate([_event(BAZAAR, "spot_ph")])
+    assert reopened.get_stats()["indexed"] == 2
+
+
+def test_lookup_compares_only_bucket_candidates(tmp_path):
+    """인덱스가 커져도 조회당 비교 후보는 일부분"""
+    dedup = EventDeduplicator(str(tmp_path / "index.db"))
+    filler = _filler(400)
+    assert len(dedup.deduplicate(filler)) == 400
+
+    kept = dedup.deduplicate([_event(BAZAAR, "spot_ph"), _event(BAZAAR, "when_in_manila")])
+    stats = dedup.get_stats()
+    assert len(kept) == 1
+    assert stats["indexed"] == 402
+    assert stats["avg_candidates"] < 40
+    assert dedup.prune(max_age_days=0) == 402
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+컴파일된 이벤트 필드 추출 테스트 (이벤트별 메서드와 동일 결과)
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from scrapers.event_extraction import KeywordAutomaton, _keyword_labels, extract_batch, extract_fields
+from scrapers.local_event_scraper import LocalEventScraper
+
+TOKENS = [
+    "July", "11-13,", "2025", "every", "Saturday", "EVERY", "11", "13", "07/19/2025", "12/1/2024", "1-2", "2,",
+    "BGC", "bgc", "Bonifacio Global City", "Makati", "manila", "Quezon City", "SM", "Megamall", "Ayala", "Triangle",
+    "The", "Podium", "Mall", "Gateway", "Rockwell", "Center", "plaza", "Greenbelt", "festival", "fest", "popup",
+    "pop-up", "pop up", "artist", "party", "fashionart", "styleat", "market", "exhibit", "cuisine", "café", "Σ",
+    "x_1", "2024", "-", ",", ".", "—", "\n", "\t", "  ", " ", "…", "İ", "ſm",
+]
+
+
+def _reference(scraper, title, text):
+    date_info = scraper._extract_date_info(text)
+    return (
+        date_info['raw_date'], date_info['is_recurring'], scraper._extract_location_info(text),
+        scraper._categorize_event(title, text), scraper._extract_tags(title, text)
+    )
+
+
+def test_matches_per_event_methods_on_random_text():
+    """공백/문장부호/비 ASCII 가 섞인 무작위 텍스트에서도 기존 메서드와 같은 결과"""
+    rng = random.Random(20250716)
+    scraper = LocalEventScraper(http_cache=False)
+    events = []
+    for _ in range(3000):
+        tokens = rng.choices(TOKENS, k=rng.randint(0, 25))
+        text = "".join(token + rng.choice(["", " ", "  ", "\n"]) for token in tokens)
+        events.append((" ".join(rng.choices(TOKENS, k=3)), text))
+
+    for (title, text), fields in zip(events, extract_batch(events)):
+        expected = _reference(scraper, title, text)
+        assert (fields.raw_date, fields.is_recurring, fields.location, fields.event_type, fields.tags) == expected, text
+
+
+def test_priority_and_substring_semantics():
+    """앞 패턴이 뒤에서 매치되어도 우선, 키워드는 부분 문자열 기준"""
+    fields = extract_fields("Night Market", "every Saturday until July 11, 2025 at the Rockwell Center, Makati")
+    assert fields.raw_date == "July 11, 2025" and not fields.is_recurring
+    assert fields.location == "Makati"
+    assert fields.event_type == "bazaar"
+
+    fields = extract_fields("Party", "Dance party with a live band")
+    assert fields.event_type == "art_event" and fields.tags == ["art", "music"]
+
+
+def test_keyword_fallback_without_automaton():
+    """pyahocorasick 없이도 같은 라벨"""
+    automaton = KeywordAutomaton(_keyword_labels())
+    fallback = KeywordAutomaton(_keyword_labels())
+    fallback._automaton = None
+    for text in ["weekend festival with live music", "styleat fashionart", "", "pop up gallery wellness yoga"]:
+        assert automaton.labels(text) == fallback.labels(text)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+이벤트 페이지 파서 백엔드 테스트 (백엔드 간 동일 결과 / selective 모드)
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from scrapers.event_page_parser import EventPageParser, available_backends
+
+PAGE = b"""<!DOCTYPE html>
+<html><head><title>Events this week</title><script>var market = "ignored";</script>
+<style>.festival { color: red; }</style></head>
+<body>
+<nav><a href="/events">Events</a></nav>
+<main>
+  <article><h2>Salcedo Saturday Market</h2><p>Every Saturday at Jaime Velasquez Park, Makati &amp; more.</p>
+    <div>Weekend market</div><script>track("market")</script></article>
+  <section><h3>Manila Food Festival</h3><p>July 20-22, 2025 at SM Mall of Asia</p>
+    <div> Food festival </div></section>
+  <ul><li><b>Art in the Park</b> returns to BGC on March 15, 2025.<div>Art market</div></li></ul>
+  <div><div><span>Ignored: nested tag, not a single string</span> market</div></div>
+  <div><!-- promo --></div>
+</main>
+</body></html>"""
+
+
+def test_backends_return_identical_candidates():
+    """html.parser 결과를 기준으로 lxml / selectolax 도 같은 후보 텍스트"""
+    baseline = EventPageParser('html.parser', selective=False).candidate_texts(PAGE)
+
+    assert len(baseline) == 3
+    assert baseline[0].startswith("Salcedo Saturday MarketEvery Saturday") and "Makati & more" in baseline[0]
+    assert "ignored" not in baseline[0] and "track(" not in baseline[0]
+    assert baseline[2] == "Art in the Parkreturns to BGC on March 15, 2025.Art market"
+
+    for backend in available_backends():
+        assert EventPageParser(backend, selective=False).candidate_texts(PAGE) == baseline, backend
+
+
+def test_selective_mode_keeps_container_subtrees():
+    """SoupStrainer 모드는 컨테이너 서브트리만 만들어도 같은 후보를 찾음"""
+    for backend in [name for name in available_backends() if name != 'selectolax']:
+        full = EventPageParser(backend, selective=False).candidate_texts(PAGE)
+        assert EventPageParser(backend, selective=True).candidate_texts(PAGE) == full, backend
+
+    limited = EventPageParser('html.parser', max_candidates=1).candidate_texts(PAGE)
+    assert len(limited) == 1
+
+    try:
+        EventPageParser('not-a-parser')
+        assert False, "unknown backend should raise"
+    except ValueError:
+        pass
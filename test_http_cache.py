@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+이벤트 소스 HTTP 캐시 테스트 (조건부 재검증 / 304 시 파싱 생략)
+"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import scrapers.local_event_scraper as local_event_scraper
+from scrapers.local_event_scraper import LocalEventScraper
+from utils.async_fetcher import AsyncFetcher
+from utils.http_cache import HttpCache
+
+PAGE = (
+    "<html><body><section><p>Quezon City Night Market opens every Friday at Maginhawa with 50 food stalls. "
+    "Free entrance.</p><div>Night market</div></section></body></html>"
+).encode()
+
+
+class EventSite:
+    """ETag 를 지원하는 로컬 이벤트 페이지 서버 (별도 스레드의 이벤트 루프)"""
+
+    def __init__(self):
+        self.etag = '"v1"'
+        self.full_responses = 0
+        self.conditional_requests = 0
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        self.server = asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get("/{name}", self.handler)
+        server = TestServer(app, host="127.0.0.1")
+        await server.start_server()
+        return server
+
+    async def handler(self, request):
+        if request.headers.get("If-None-Match"):
+            self.conditional_requests += 1
+            if request.headers["If-None-Match"] == self.etag:
+                return web.Response(status=304, headers={"ETag": self.etag})
+        self.full_responses += 1
+        return web.Response(body=PAGE, content_type="text/html", headers={"ETag": self.etag})
+
+    def url(self, name):
+        return f"http://127.0.0.1:{self.server.port}/{name}"
+
+    def close(self):
+        asyncio.run_coroutine_threadsafe(self.server.close(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+def test_not_modified_pages_reuse_events_without_parsing(tmp_path, monkeypatch):
+    """두 번째 실행은 304 → 본문/파싱 없이 같은 이벤트, 절약량 집계"""
+    site = EventSite()
+    try:
+        sources = {
+            'nylon_manila': [site.url("nylon")],
+            'spot_ph': [site.url("spot")],
+            'when_in_manila': [site.url("wim")],
+        }
+        monkeypatch.setattr(local_event_scraper, "EVENT_SOURCES", sources)
+        scraper = LocalEventScraper(
+            fetcher=AsyncFetcher(per_host_delay=0, retries=0),
+            http_cache=HttpCache(str(tmp_path)),
+            deduplicator=False  # 세 소스가 같은 페이지를 돌려주므로 유사 중복 병합 없이 비교
+        )
+
+        first = scraper.get_all_events()
+        first_stats = scraper.get_cache_stats()
+        assert first_stats["not_modified"] == 0 and first_stats["bytes_downloaded"] == 3 * len(PAGE)
+        assert {event['source_url'] for event in first} == set(url for urls in sources.values() for url in urls)
+
+        parsed = []
+        original_parse = scraper._parse_events
+        monkeypatch.setattr(scraper, "_parse_events", lambda *args: parsed.append(args) or original_parse(*args))
+
+        second = scraper.get_all_events()
+        stats = scraper.get_cache_stats()
+        assert parsed == []
+        assert (site.full_responses, site.conditional_requests) == (3, 3)
+        assert stats["not_modified"] == 3 and stats["bytes_downloaded"] == 0
+        assert stats["bytes_saved"] == 3 * len(PAGE)
+        assert stats["parse_seconds_saved"] > 0 and stats["parse_seconds"] == 0
+
+        def strip(events):
+            return [{k: v for k, v in event.items() if k != 'collection_date'} for event in events]
+
+        assert strip(second) == strip(first)
+
+        site.etag = '"v2"'
+        scraper.get_all_events()
+        assert len(parsed) == 3 and site.full_responses == 6
+    finally:
+        site.close()
+
+
+def test_cache_entry_round_trip(tmp_path):
+    """항목이 없으면 조건부 헤더/304 기록 없음, 저장 후 검증자와 추출 결과 왕복"""
+    cache = HttpCache(str(tmp_path))
+    assert cache.conditional_headers("https://example.com/events") == {}
+    assert not cache.mark_not_modified("https://example.com/events")
+
+    cache.store("https://example.com/events", b"<html></html>", {"ETag": '"abc"', "Last-Modified": "Wed, 16 Jul 2025 08:00:00 GMT"})
+    assert cache.conditional_headers("https://example.com/events") == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 16 Jul 2025 08:00:00 GMT"
+    }
+    assert cache.load_extracted("https://example.com/events") is None
+    cache.store_extracted("https://example.com/events", [], 0.01)
+    assert cache.load_extracted("https://example.com/events") == []
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+컴파일된 키워드 매처 테스트 (기존 순차 탐색과 점수 동일성)
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from utils.keyword_matcher import AhoCorasick
+from persona_recommendation_engine import PersonaRecommendationEngine
+
+TRENDS = {"fashion": 86, "makeup": 62, "skincare": 25, "k-pop": 22, "Korean Skincare": 14, "bag": 3}
+
+
+def _engine(compiled: bool) -> PersonaRecommendationEngine:
+    engine = PersonaRecommendationEngine(use_compiled_matcher=compiled)
+    engine.trend_data = dict(TRENDS)
+    return engine
+
+
+def test_aho_corasick_finds_all_substrings():
+    """모든 패턴의 포함 여부가 'in' 연산과 일치"""
+    rng = random.Random(0)
+    for _ in range(500):
+        patterns = ["".join(rng.choice("ab가") for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 8))]
+        text = "".join(rng.choice("ab가 ") for _ in range(rng.randint(0, 20)))
+        assert AhoCorasick(patterns).find_all(text) == {p for p in patterns if p in text}
+
+
+def test_compiled_scores_match_legacy():
+    """상품/카테고리/페르소나 조합별 점수와 breakdown 이 기존 방식과 동일"""
+    legacy, compiled = _engine(False), _engine(True)
+    products = [
+        ("세트레티놀 나이트 세럼", "스킨케어"),
+        ("콜로어팝 틴티드 립밤", "메이크업"),
+        ("망고 서스테이너블 블레이저", "패션"),
+        ("COS 미니멀 토트백", "액세서리"),
+        ("Korean Idol Photocard Set", "k-pop"),
+        ("Eco-Friendly Organic Cotton Tote", "fashion"),
+        ("Wireless Charger", "electronics"),
+        ("Budget Sunscreen SPF50", ""),
+    ]
+
+    for persona in compiled.personas.values():
+        for name, category in products:
+            assert compiled._calculate_product_score(name, category, persona) == \
+                legacy._calculate_product_score(name, category, persona)
+
+
+def test_matcher_recompiles_after_config_change():
+    """페르소나 관심사가 바뀌면 매처를 다시 컴파일"""
+    engine = _engine(True)
+    persona = engine.personas["young_filipina_beauty"]
+    before = engine._calculate_product_score("Fountain Pen Ink", "stationery", persona)["interest_alignment"]
+
+    persona.interests.append({"keyword": "stationery", "related": ["fountain pen"]})
+    after = engine._calculate_product_score("Fountain Pen Ink", "stationery", persona)["interest_alignment"]
+
+    assert before == 0
+    assert after == 8
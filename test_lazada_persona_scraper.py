@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Lazada 페르소나 스크래퍼 테스트 (카드 추출 엔진 간 동일 결과 / 카테고리 병렬 수집)
+"""
+
+import logging
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from bs4 import BeautifulSoup
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from scrapers.lazada_persona_scraper import LazadaPersonaScraper
+
+BASE_URL = "https://www.lazada.com.ph/"
+
+# 검색 결과 카드 3개 - 지연 로딩 이미지 / srcset / 숨겨진 후보 요소 / title 속성 평점 / 가격 없는 카드
+CARDS_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><base href="https://www.lazada.com.ph/"></head>
+<body>
+<div class="card" data-qa-locator="product-item">
+  <div class="title">Glass Skin Serum 30ml</div>
+  <a href="/products/glass-skin-serum-i101.html">Glass Skin Serum</a>
+  <img src="data:image/gif;base64,R0lGODlhAQABAAAAACw=" data-src="//img.lazcdn.com/g/p/serum.jpg">
+  <span class="currency">\u20b1&nbsp;299.00</span>
+  <div class="rating-star" title="4.8"></div>
+  <span class="review-count">(1,234)</span>
+</div>
+<div class="card product-card">
+  <div class="title-wrapper" style="display:none"><a href="https://www.lazada.com.ph/products/notebook-i202.html">Hidden promo</a></div>
+  <div class="title">A5 Dotted Notebook</div>
+  <img srcset="https://img.lazcdn.com/g/p/notebook-2x.jpg 2x, https://img.lazcdn.com/g/p/notebook.jpg 1x">
+  <span class="price-current">PHP 149</span>
+  <span class="score-average">4.5</span>
+</div>
+<div class="card item-box">
+  <a title="Desk Lamp with USB Port" href="products/desk-lamp-i303.html"></a>
+  <span class="price">Sold out</span>
+  <span class="reviews">56 reviews</span>
+</div>
+</body></html>"""
+
+
+class SoupElement:
+    """
+    BeautifulSoup 태그를 감싼 WebElement 대역
+
+    Selenium 처럼 숨겨진 요소의 text 는 빈 문자열, href/src 는 문서 기준 절대 URL
+    """
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    def find_element(self, by, selector):
+        found = self.tag.find(selector) if by == By.TAG_NAME else self.tag.select_one(selector)
+        if found is None:
+            raise NoSuchElementException(selector)
+        return SoupElement(found)
+
+    @property
+    def text(self):
+        for tag in [self.tag, *self.tag.parents]:
+            if "display:none" in (tag.get("style") or "").replace(" ", ""):
+                return ""
+        return self.tag.get_text().replace("\u00a0", " ").strip()
+
+    def get_attribute(self, name):
+        value = self.tag.get(name)
+        if value is not None and name in ("href", "src"):
+            return urljoin(BASE_URL, value)
+        return value
+
+
+class BrokenScriptDriver:
+    """execute_script 가 실패하는 드라이버 대역 (JS 엔진 폴백 확인용)"""
+
+    def __init__(self):
+        self.script_calls = 0
+
+    def execute_script(self, script, *args):
+        self.script_calls += 1
+        raise WebDriverException("javascript error: Cannot read properties of null")
+
+
+def _soup_cards():
+    soup = BeautifulSoup(CARDS_PAGE, "html.parser")
+    return [SoupElement(card) for card in soup.select(".card")]
+
+
+def _built(scraper, candidates):
+    return [scraper._build_product_data(card) for card in candidates]
+
+
+EXPECTED_FIELDS = [
+    ("Glass Skin Serum 30ml", "https://www.lazada.com.ph/products/glass-skin-serum-i101.html", "\u20b1 299.00",
+     "https://img.lazcdn.com/g/p/serum.jpg", "4.8", "(1,234)"),
+    ("A5 Dotted Notebook", "https://www.lazada.com.ph/products/notebook-i202.html", "PHP 149",
+     "https://img.lazcdn.com/g/p/notebook-2x.jpg", "4.5", None),
+    ("Desk Lamp with USB Port", "https://www.lazada.com.ph/products/desk-lamp-i303.html", "",
+     "", None, "56 reviews"),
+]
+
+
+def _fields(products):
+    return [
+        (p["product_name"], p["product_url"], p["price"], p["image_url"], p["rating"], p["review_count"])
+        for p in products
+    ]
+
+
+def _headless_chrome():
+    if not any(shutil.which(name) for name in ("google-chrome", "chromium", "chromium-browser", "chrome")):
+        pytest.skip("Chrome not installed")
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    try:
+        return webdriver.Chrome(options=options)
+    except WebDriverException as e:
+        pytest.skip(f"Chrome not available: {e}")
+
+
+def test_js_and_webdriver_engines_extract_identical_cards(tmp_path):
+    """저장된 카드 페이지에서 PRODUCT_FIELDS_SCRIPT 와 요소별 find_element 결과가 같음 (실제 Chrome 필요)"""
+    driver = _headless_chrome()
+    try:
+        page = tmp_path / "lazada_cards.html"
+        page.write_text(CARDS_PAGE, encoding="utf-8")
+        driver.get(page.as_uri())
+        cards = driver.find_elements(By.CSS_SELECTOR, ".card")
+
+        scraper = LazadaPersonaScraper(use_undetected=False)
+        scraper.driver = driver
+        from_js = _built(scraper, scraper._collect_candidates_js(cards))
+        from_webdriver = _built(scraper, [scraper._collect_candidates_webdriver(card) for card in cards])
+
+        assert from_js == from_webdriver
+        assert _fields(from_js) == EXPECTED_FIELDS
+    finally:
+        driver.quit()
+
+
+def test_webdriver_engine_reads_saved_cards():
+    """요소별 엔진이 저장된 카드에서 이름 / 절대 URL / 지연 로딩 이미지 / 평점 / 리뷰를 추출"""
+    scraper = LazadaPersonaScraper(use_undetected=False)
+    candidates = [scraper._collect_candidates_webdriver(card) for card in _soup_cards()]
+
+    assert _fields(_built(scraper, candidates)) == EXPECTED_FIELDS
+
+
+def test_partially_consumed_candidates_close_cleanly():
+    """첫 유효 값에서 소비를 멈춘 후보 generator 를 닫아도 GeneratorExit 를 삼키지 않음"""
+    scraper = LazadaPersonaScraper(use_undetected=False)
+    candidates = scraper._collect_candidates_webdriver(_soup_cards()[1])
+
+    assert next(candidates['names']) is None  # 첫 셀렉터는 카드에 없음
+    candidates['names'].close()
+    prices = candidates['prices']
+    assert next(prices) == "PHP 149"
+    prices.close()
+
+
+def test_js_engine_failure_falls_back_to_webdriver():
+    """execute_script 가 실패하면 같은 카드를 요소별 엔진으로 다시 추출해 같은 결과"""
+    fallback = LazadaPersonaScraper(use_undetected=False, extraction_engine="js")
+    fallback.driver = BrokenScriptDriver()
+    legacy = LazadaPersonaScraper(use_undetected=False, extraction_engine="webdriver")
+    legacy.collection_date = fallback.collection_date
+    for scraper in (fallback, legacy):
+        scraper._is_persona_relevant = lambda product: True
+
+    products = fallback._extract_product_data(_soup_cards())
+
+    assert fallback.driver.script_calls == 1
+    assert products == legacy._extract_product_data(_soup_cards())
+    assert sorted(_fields(products)) == sorted(EXPECTED_FIELDS)
+
+
+class StubPool:
+    """WebDriverPool 대역 - 크기만 제공"""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+
+
+class StubWorker:
+    """카테고리마다 다른 시간 뒤에 결과를 돌려주는 워커 스크래퍼 대역"""
+
+    def __init__(self, delays, active, peak, lock):
+        self.delays = delays
+        self.active = active
+        self.peak = peak
+        self.lock = lock
+        self.closed = False
+
+    def search_persona_products(self, category, limit=5):
+        with self.lock:
+            self.active[0] += 1
+            self.peak[0] = max(self.peak[0], self.active[0])
+        try:
+            time.sleep(self.delays.get(category, 0))
+            if category == "broken":
+                raise RuntimeError("search failed")
+            return [{"product_url": f"https://www.lazada.com.ph/{category}/{i}", "product_name": f"{category} {i}"} for i in range(limit)]
+        finally:
+            with self.lock:
+                self.active[0] -= 1
+
+    def close(self):
+        self.closed = True
+
+
+def _scraper_with_stub_workers(delays, pool_size):
+    scraper = LazadaPersonaScraper(use_undetected=False, driver_pool=StubPool(pool_size))
+    active, peak, lock = [0], [0], threading.Lock()
+    workers = []
+
+    def worker_scraper(driver_pool, rate_limiter):
+        worker = StubWorker(delays, active, peak, lock)
+        workers.append(worker)
+        return worker
+
+    scraper._worker_scraper = worker_scraper
+    return scraper, workers, peak
+
+
+def test_parallel_results_are_merged_in_category_order():
+    """먼저 끝난 카테고리와 무관하게 카테고리 순서로 병합, 카테고리 정보 추가, 실패한 카테고리는 건너뜀"""
+    categories = ["skincare", "broken", "fashion", "gadgets"]
+    delays = {"skincare": 0.15, "broken": 0.0, "fashion": 0.05, "gadgets": 0.0}
+    scraper, workers, _ = _scraper_with_stub_workers(delays, pool_size=4)
+
+    products = scraper._collect_categories_parallel(categories, products_per_category=2, workers=4)
+
+    assert [product["product_name"] for product in products] == [
+        "skincare 0", "skincare 1", "fashion 0", "fashion 1", "gadgets 0", "gadgets 1"
+    ]
+    assert [product["persona_category"] for product in products] == ["skincare"] * 2 + ["fashion"] * 2 + ["gadgets"] * 2
+    assert {product["product_type"] for product in products} == {f"persona_trending_{scraper.persona_name}"}
+    assert len(workers) == 4 and all(worker.closed for worker in workers)
+
+
+def test_workers_are_clamped_to_pool_size(caplog):
+    """이미 만들어진 풀이 요청한 워커 수보다 작으면 경고 후 풀 크기만큼만 실행"""
+    categories = ["skincare", "fashion", "gadgets", "books"]
+    scraper, workers, peak = _scraper_with_stub_workers({category: 0.05 for category in categories}, pool_size=2)
+
+    with caplog.at_level(logging.WARNING, logger="scrapers.lazada_persona_scraper"):
+        products = scraper._collect_categories_parallel(categories, products_per_category=1, workers=4)
+
+    assert [product["persona_category"] for product in products] == categories
+    assert len(workers) == 2 and peak[0] <= 2
+    assert "using 2 category workers instead of 4" in caplog.text
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+스크래퍼 오케스트레이터 테스트
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from automation.orchestrator import ScraperOrchestrator, ScraperJob
+from utils.rate_limiter import DomainRateLimiter
+
+
+def _job(name, duration=0.2, order=None):
+    def run():
+        if order is not None:
+            order.append(f"{name}:start")
+        time.sleep(duration)
+        if order is not None:
+            order.append(f"{name}:end")
+        return {"name": name, "success": True, "data_count": 1, "error": None, "duration": duration}
+    return run
+
+
+def test_independent_jobs_run_concurrently():
+    """서로 다른 도메인 작업은 병렬 실행"""
+    orchestrator = ScraperOrchestrator(max_workers=4, rate_limiter=DomainRateLimiter(min_interval=0))
+    jobs = [ScraperJob(name=f"job{i}", func=_job(f"job{i}"), domains=[f"site{i}.com"]) for i in range(4)]
+
+    start = time.time()
+    results = orchestrator.run(jobs)
+    elapsed = time.time() - start
+
+    assert [r["name"] for r in results] == ["job0", "job1", "job2", "job3"]
+    assert elapsed < 0.6, f"expected concurrent execution, took {elapsed:.2f}s"
+
+
+def test_same_domain_is_serialized_with_interval():
+    """같은 도메인 작업은 직렬화 + 최소 간격 유지"""
+    orchestrator = ScraperOrchestrator(max_workers=4, rate_limiter=DomainRateLimiter(min_interval=0.3))
+    jobs = [
+        ScraperJob(name="a", func=_job("a", 0.05), domains=["https://www.lazada.com.ph/catalog"]),
+        ScraperJob(name="b", func=_job("b", 0.05), domains=["lazada.com.ph"]),
+    ]
+
+    start = time.time()
+    orchestrator.run(jobs)
+    assert time.time() - start >= 0.3
+
+
+def test_dependencies_and_failures():
+    """의존 작업은 선행 작업 이후 실행, 예외는 실패 결과로 변환"""
+    order = []
+
+    def broken():
+        raise RuntimeError("boom")
+
+    orchestrator = ScraperOrchestrator(max_workers=4, rate_limiter=DomainRateLimiter(min_interval=0))
+    jobs = [
+        ScraperJob(name="trends", func=_job("trends", 0.1, order)),
+        ScraperJob(name="broken", func=broken),
+        ScraperJob(name="persona", func=_job("persona", 0.0, order), depends_on=["trends"]),
+    ]
+    results = orchestrator.run(jobs)
+
+    assert order.index("trends:end") < order.index("persona:start")
+    assert results[1]["success"] is False and "boom" in results[1]["error"]
+
+
+def test_invalid_dependencies_rejected():
+    """순환/누락 의존성 검증"""
+    orchestrator = ScraperOrchestrator()
+    for jobs in (
+        [ScraperJob(name="a", func=_job("a"), depends_on=["missing"])],
+        [ScraperJob(name="a", func=_job("a"), depends_on=["b"]),
+         ScraperJob(name="b", func=_job("b"), depends_on=["a"])],
+    ):
+        try:
+            orchestrator.run(jobs)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    test_independent_jobs_run_concurrently()
+    test_same_domain_is_serialized_with_interval()
+    test_dependencies_and_failures()
+    test_invalid_dependencies_rejected()
+    print("✅ Orchestrator tests passed")
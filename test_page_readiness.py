@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+페이지 준비 상태 감지 테스트 (가짜 드라이버로 신호 재현)
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from utils.page_readiness import HumanJitterPolicy, PageReadinessEngine
+
+
+class FakeDriver:
+    """load_seconds 동안 카드가 늘어나고 DOM/네트워크가 바쁜 페이지"""
+
+    def __init__(self, final_cards=20, load_seconds=0.3):
+        self.final_cards = final_cards
+        self.load_seconds = load_seconds
+        self.started = time.monotonic()
+        self.scrolls = []
+
+    def execute_script(self, script, *args):
+        if script.startswith("window.scrollTo"):
+            self.scrolls.append(script)
+            return None
+        elapsed = time.monotonic() - self.started
+        loading = elapsed < self.load_seconds
+        cards = int(self.final_cards * min(1.0, elapsed / self.load_seconds))
+        idle = 0.0 if loading else elapsed - self.load_seconds
+        return {
+            "readyState": "loading" if loading else "complete",
+            "counts": [cards, 0],
+            "sinceMutation": idle,
+            "sinceNetwork": idle,
+            "resources": 10
+        }
+
+
+def _engine(**kwargs):
+    options = dict(
+        timeout=3, scroll_timeout=1, poll_interval=0.02, stable_window=0.1,
+        quiet_window=0.1, network_idle_window=0.05, empty_grace=0.3,
+        jitter=HumanJitterPolicy(enabled=False)
+    )
+    options.update(kwargs)
+    return PageReadinessEngine(['.card', '.item'], **options)
+
+
+def test_ready_once_signals_settle():
+    """카드 수/DOM/네트워크가 안정되면 타임아웃 전에 종료"""
+    engine = _engine()
+    driver = FakeDriver()
+
+    result = engine.wait_for_page(driver, scroll_count=2, legacy_seconds=20)
+
+    assert not result.timed_out
+    assert result.card_count == 20
+    assert result.waited < 2
+    assert result.saved > 18
+    assert len(driver.scrolls) == 3  # 스크롤 2회 + 맨 위로 복귀
+    assert engine.get_stats()["pages"] == 1
+
+
+def test_empty_page_skips_scrolling():
+    """카드가 없는 페이지는 empty_grace 후 종료하고 스크롤하지 않음"""
+    engine = _engine()
+    driver = FakeDriver(final_cards=0, load_seconds=0.1)
+
+    result = engine.wait_for_page(driver, scroll_count=3, legacy_seconds=20)
+
+    assert not result.timed_out
+    assert result.card_count == 0
+    assert len(driver.scrolls) == 1
+
+
+def test_timeout_is_upper_bound():
+    """신호가 안정되지 않으면 timeout 에서 종료"""
+    engine = _engine(timeout=0.3)
+    driver = FakeDriver(load_seconds=60)
+
+    start = time.monotonic()
+    result = engine.wait_for_page(driver, scroll_count=0)
+
+    assert result.timed_out
+    assert time.monotonic() - start < 1
+    assert engine.get_stats()["timeouts"] == 1
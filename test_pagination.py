@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+keyset 커서 페이지네이션 테스트
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from database.pagination import decode_cursor, encode_cursor, keyset_filter, split_page
+
+
+def _rows(count):
+    return [
+        {"id": f"00000000-0000-0000-0000-{index:012d}", "created_at": f"2025-07-{20 - index // 3:02d}T10:00:00+00:00"}
+        for index in range(count)
+    ]
+
+
+def test_cursor_round_trip_and_filter():
+    """커서는 (created_at, id) 를 보존하고 PostgREST 조건으로 변환됨"""
+    row = {"id": "b5a1c2d3-0000-4000-8000-000000000001", "created_at": "2025-07-16T08:30:00.123+00:00"}
+    cursor = encode_cursor(row)
+
+    assert "=" not in cursor and "/" not in cursor
+    assert decode_cursor(cursor) == (row["created_at"], row["id"])
+    assert keyset_filter(cursor) == (
+        'created_at.lt."2025-07-16T08:30:00.123+00:00",'
+        'and(created_at.eq."2025-07-16T08:30:00.123+00:00",id.lt."b5a1c2d3-0000-4000-8000-000000000001")'
+    )
+
+    for invalid in ("not-a-cursor", encode_cursor({"created_at": 1, "id": "x"})):
+        try:
+            decode_cursor(invalid)
+            assert False, "invalid cursor should raise"
+        except ValueError:
+            pass
+
+
+def test_split_page_walks_all_rows():
+    """limit + 1 조회 → 다음 커서, 마지막 페이지는 None"""
+    rows = _rows(7)
+    seen, cursor = [], None
+    while True:
+        remaining = rows if cursor is None else [
+            row for row in rows if (row["created_at"], row["id"]) < decode_cursor(cursor)
+        ]
+        remaining.sort(key=lambda row: (row["created_at"], row["id"]), reverse=True)
+        page, cursor = split_page(remaining[:3 + 1], 3)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert len(seen) == 7
+    assert sorted(row["id"] for row in seen) == sorted(row["id"] for row in rows)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+페르소나 일괄 점수 계산 테스트 (스크래퍼의 상품별 계산과 비교)
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from config.persona_config import TARGET_PERSONAS
+from scrapers.lazada_persona_scraper import LazadaPersonaScraper
+from utils.persona_batch_scorer import PersonaBatchScorer, ProductBatch
+
+
+def _random_products(count: int, seed: int = 1):
+    rng = random.Random(seed)
+    vocabulary = ["serum", "Korean", "tint", "office", "bag", "gaming", "mouse", "cotton", "eco", "lipstick", "set"]
+    for persona in TARGET_PERSONAS.values():
+        vocabulary.extend(persona.keywords[:20] + persona.preferred_brands)
+
+    products = []
+    for _ in range(count):
+        products.append({
+            'product_name': " ".join(rng.sample(vocabulary, rng.randint(1, 5))),
+            'category': rng.choice(["beauty", "fashion", None]),
+            'price_numeric': rng.choice([None, 0, rng.uniform(10, 20000), rng.choice([50, 500, 1000, 2500, 5000])]),
+            'rating_numeric': rng.choice([None, 0, round(rng.uniform(1, 5), 1)]),
+            'review_count_numeric': rng.choice([None, 0, rng.randint(1, 50000)])
+        })
+    return products
+
+
+def test_batch_matches_per_product_scoring():
+    """모든 페르소나에서 적합도/점수가 스크래퍼 계산과 동일"""
+    products = _random_products(2000)
+    results = PersonaBatchScorer().score(ProductBatch.from_records(products))
+
+    for persona_name in TARGET_PERSONAS:
+        scraper = LazadaPersonaScraper(persona_name=persona_name)
+        batch = results.for_persona(persona_name)
+
+        for index, product in enumerate(products):
+            product_data = dict(product)
+            relevant = scraper._is_persona_relevant(product_data)
+            assert batch["relevant"][index] == relevant, (persona_name, product)
+            if relevant:
+                assert batch["brand_bonus"][index] == product_data['brand_bonus']
+                assert np.isclose(batch["scores"][index], scraper._calculate_persona_score(product_data), rtol=0, atol=1e-9)
+
+
+def test_score_records_fills_fields():
+    """score_records 는 적합한 상품만 반환하고 점수를 채움"""
+    persona_name = next(iter(TARGET_PERSONAS))
+    records = [
+        {'product_name': 'Plain item', 'price_numeric': 300, 'rating_numeric': 4.8, 'review_count_numeric': 1200},
+        {'product_name': 'Too expensive', 'price_numeric': 999999, 'rating_numeric': 4.8, 'review_count_numeric': 1200},
+        {'product_name': None, 'price_numeric': 300}
+    ]
+
+    scored = PersonaBatchScorer([persona_name]).score_records(records, persona_name)
+
+    assert [record['product_name'] for record in scored] == ['Plain item']
+    assert 0 < scored[0]['persona_score'] <= 100
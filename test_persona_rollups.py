@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+페르소나 일별 롤업 테스트 (원본 행 분석 결과와 비교)
+"""
+
+import math
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from ai.report_generator import PersonaReportGenerator
+from config.persona_config import TARGET_PERSONAS
+from database.persona_rollups import PersonaRollupStore
+
+PERSONA = "young_filipina"
+STAT_FIELDS = ("total_products", "avg_price", "avg_rating", "avg_persona_score", "top_categories", "brand_distribution", "price_range")
+
+
+def _rows(count, days_ago=0, seed=3):
+    rng = random.Random(seed)
+    brands = TARGET_PERSONAS[PERSONA].preferred_brands
+    created_at = (datetime.now(timezone.utc) - timedelta(days=days_ago)).isoformat()
+    return [{
+        "id": f"{days_ago}-{index}",
+        "created_at": created_at,
+        "product_name": f"{rng.choice(brands + ['Generic'])} serum {index}",
+        "price": rng.choice([None, 0, round(rng.uniform(50, 3000), 2)]),
+        "rating": rng.choice([None, round(rng.uniform(3, 5), 1)]),
+        "category": rng.choice(["beauty", "skincare", None]),
+        "discount_info": {"persona_name": PERSONA, "persona_score": rng.choice([0, round(rng.uniform(10, 100), 1)])}
+    } for index in range(count)]
+
+
+def _assert_same(summary, expected):
+    for field in STAT_FIELDS:
+        if isinstance(expected[field], float):
+            assert math.isclose(summary[field], expected[field], rel_tol=1e-9), field
+        else:
+            assert summary[field] == expected[field], field
+
+
+def test_rollup_matches_raw_analysis(tmp_path):
+    """롤업 합계가 원본 행 분석과 같음 (오늘 / 최근 7일)"""
+    store = PersonaRollupStore(str(tmp_path / "rollups.db"))
+    generator = PersonaReportGenerator()
+    today, older = _rows(300), _rows(200, days_ago=3, seed=4)
+    store.apply_rows(today + older)
+
+    # 백필 전에는 생성 당일도 (생성 전 저장된 행이 빠져 있으므로) 포함하지 않음
+    assert not store.covers(1) and not store.covers(7)
+
+    _assert_same(store.summary(PERSONA, days_back=1), generator.analyze_products(today, PERSONA))
+    _assert_same(store.summary(PERSONA, days_back=7), generator.analyze_products(today + older, PERSONA))
+
+
+def test_rewritten_rows_replace_previous_contribution(tmp_path):
+    """같은 id 를 다시 저장하면 (upsert / 재계산) 이전 값 대신 새 값으로 집계"""
+    store = PersonaRollupStore(str(tmp_path / "rollups.db"))
+    generator = PersonaReportGenerator()
+    rows = _rows(100)
+    store.apply_rows(rows)
+
+    rescored = [dict(row, price=(row["price"] or 0) + 999, discount_info={**row["discount_info"], "persona_score": 42.0}) for row in rows[:60]]
+    store.apply_rows(rescored)
+
+    _assert_same(store.summary(PERSONA, days_back=1), generator.analyze_products(rescored + rows[60:], PERSONA))
+    assert store.get_stats()["rows_replaced"] == 60
+
+
+class FakeShopeeQuery:
+    """backfill 이 쓰는 supabase 쿼리 체인 대역 (id 순 keyset 페이지)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.after_id = None
+        self.page_size = None
+        self.persona = None
+        self.counting = False
+        self.not_ = self
+
+    def table(self, name):
+        self.after_id = None
+        self.persona = None
+        self.counting = False
+        return self
+
+    def select(self, *args, **kwargs):
+        self.counting = kwargs.get("count") == "exact"
+        return self
+
+    def eq(self, column, value):
+        self.persona = value
+        return self
+
+    def gte(self, *args):
+        return self
+
+    def is_(self, *args):
+        return self
+
+    def gt(self, column, value):
+        self.after_id = value
+        return self
+
+    def order(self, column):
+        return self
+
+    def limit(self, size):
+        self.page_size = size
+        return self
+
+    def execute(self):
+        if self.counting:
+            count = sum(1 for row in self.rows if self.persona in (None, row["discount_info"]["persona_name"]))
+            return type("Response", (), {"data": [], "count": count})()
+        rows = sorted((row for row in self.rows if self.after_id is None or row["id"] > self.after_id), key=lambda row: row["id"])
+        return type("Response", (), {"data": rows[:self.page_size]})()
+
+
+def test_coverage_starts_after_creation_day_until_backfill(tmp_path):
+    """생성 당일 이전에 저장된 행이 있을 수 있으므로 backfill 전에는 오늘도 원본 조회로 대체"""
+    store = PersonaRollupStore(str(tmp_path / "rollups.db"))
+    generator = PersonaReportGenerator()
+    saved_before, saved_after = _rows(50, seed=5), [dict(row, id=f"late-{row['id']}") for row in _rows(30, seed=6)]
+    store.apply_rows(saved_after)
+    assert not store.covers(1)
+
+    client = type("Client", (), {"_ensure_client": lambda self: None})()
+    client.client = FakeShopeeQuery(saved_before + saved_after)
+    assert store.backfill(client, days_back=7, page_size=20) == 80
+
+    assert store.covers(1) and store.covers(7) and not store.covers(8)
+    _assert_same(store.summary(PERSONA, days_back=1), generator.analyze_products(saved_before + saved_after, PERSONA))
+
+
+def test_covers_is_false_when_another_store_received_writes(tmp_path):
+    """다른 롤업 파일을 쓰는 writer 가 저장한 행이 있으면 원본 행 수와 달라 원본 조회로 대체"""
+    rows = _rows(40, seed=7)
+    client = type("Client", (), {"_ensure_client": lambda self: None})()
+    client.client = FakeShopeeQuery(rows)
+
+    shared, other = PersonaRollupStore(str(tmp_path / "shared.db")), PersonaRollupStore(str(tmp_path / "other.db"))
+    shared.backfill(client, days_back=7)
+    assert shared.covers(7, PERSONA, client)
+
+    # 스케줄러가 다른 파일에 기록 → 공유 저장소에는 없는 행
+    late = [dict(row, id=f"scheduler-{row['id']}") for row in _rows(10, seed=8)]
+    other.apply_rows(late)
+    client.client.rows = rows + late
+    assert shared.covers(7) and not shared.covers(7, PERSONA, client)
+
+    shared.apply_rows(late)
+    assert shared.covers(7, PERSONA, client)
+
+
+def test_default_path_does_not_depend_on_working_directory(tmp_path, monkeypatch):
+    """모든 writer 가 같은 파일을 쓰도록 기본 경로는 프로젝트 루트 기준 절대 경로"""
+    import database.persona_rollups as persona_rollups
+
+    monkeypatch.chdir(tmp_path)
+    assert Path(persona_rollups.DEFAULT_ROLLUP_PATH).is_absolute()
+    assert Path(persona_rollups.DEFAULT_ROLLUP_PATH).parent.parent.parent == project_root.resolve()
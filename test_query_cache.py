@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+조회 캐시 테스트 (TTL, LRU, 테이블 무효화)
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from database.query_cache import QueryCache
+
+
+def test_ttl_hits_and_expiry():
+    """TTL 안에서는 loader 를 다시 호출하지 않음"""
+    cache = QueryCache(ttls={"google_trends": 0.05}, enabled=True)
+    calls = []
+    loader = lambda: calls.append(1) or [{"keyword": "serum"}]
+
+    assert cache.get_or_load("google_trends", ("latest", 20), loader) == [{"keyword": "serum"}]
+    assert cache.get_or_load("google_trends", ("latest", 20), loader) == [{"keyword": "serum"}]
+    assert len(calls) == 1
+
+    time.sleep(0.06)
+    cache.get_or_load("google_trends", ("latest", 20), loader)
+    assert len(calls) == 2
+
+    stats = cache.get_stats()["tables"]["google_trends"]
+    assert (stats["hits"], stats["misses"], stats["expired"]) == (1, 2, 1)
+
+
+def test_lru_bound_and_errors_not_cached():
+    """최대 항목 수를 넘으면 오래 쓰지 않은 항목부터 제거, 예외는 캐시하지 않음"""
+    cache = QueryCache(max_entries=2, ttls={}, default_ttl=60, enabled=True)
+    cache.get_or_load("t", 1, lambda: "a")
+    cache.get_or_load("t", 2, lambda: "b")
+    cache.get_or_load("t", 1, lambda: "x")   # 1 을 최근 사용으로
+    cache.get_or_load("t", 3, lambda: "c")   # 2 제거
+
+    assert cache.get_or_load("t", 1, lambda: "x") == "a"
+    assert cache.get_or_load("t", 2, lambda: "b2") == "b2"
+    assert cache.get_stats()["tables"]["t"]["evictions"] == 2
+
+    def failing():
+        raise ConnectionError("down")
+
+    for _ in range(2):
+        try:
+            cache.get_or_load("t", 4, failing)
+            assert False, "loader error should propagate"
+        except ConnectionError:
+            pass
+
+
+def test_invalidation_drops_table_and_notifies():
+    """저장 시 해당 테이블만 무효화, 조회 도중 무효화된 결과는 보관하지 않음"""
+    cache = QueryCache(enabled=True)
+    invalidated = []
+    cache.add_invalidation_listener(invalidated.append)
+
+    cache.get_or_load("shopee_products", "persona", lambda: ["old"])
+    cache.get_or_load("google_trends", "latest", lambda: ["trend"])
+    cache.invalidate("shopee_products")
+
+    assert invalidated == ["shopee_products"]
+    assert cache.get_or_load("google_trends", "latest", lambda: ["new"]) == ["trend"]
+
+    def racing_loader():
+        cache.invalidate("shopee_products")
+        return ["stale"]
+
+    assert cache.get_or_load("shopee_products", "persona", racing_loader) == ["stale"]
+    assert cache.get_or_load("shopee_products", "persona", lambda: ["fresh"]) == ["fresh"]
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+페르소나 점수 재계산 테스트 (메모리 테이블로 페이지 조회/upsert/체크포인트 확인)
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from automation.rescoring import PersonaRescorer
+from config.persona_config import get_persona_fingerprint
+from utils.persona_batch_scorer import PersonaBatchScorer
+
+PERSONA = "young_filipina"
+
+
+class MemoryQuery:
+    """rescoring 이 사용하는 PostgREST 조회 체인만 지원"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.persona = None
+        self.after_id = None
+        self.page_size = None
+
+    def select(self, columns):
+        return self
+
+    def eq(self, column, value):
+        self.persona = value
+        return self
+
+    def or_(self, filters):
+        self.fingerprint = filters.rsplit(".", 1)[-1]
+        return self
+
+    def gt(self, column, value):
+        self.after_id = value
+        return self
+
+    def order(self, column):
+        return self
+
+    def limit(self, count):
+        self.page_size = count
+        return self
+
+    def execute(self):
+        rows = sorted(
+            (row for row in self.rows.values()
+             if row["discount_info"].get("persona_name") == self.persona
+             and row["discount_info"].get("persona_fingerprint") != self.fingerprint
+             and (self.after_id is None or row["id"] > self.after_id)),
+            key=lambda row: row["id"]
+        )
+        return SimpleNamespace(data=[dict(row) for row in rows[:self.page_size]])
+
+
+class MemoryDatabase:
+    def __init__(self, rows, fail_after_writes=None):
+        self.rows = {row["id"]: row for row in rows}
+        self.client = SimpleNamespace(table=lambda name: MemoryQuery(self.rows))
+        self.writes = 0
+        self.fail_after_writes = fail_after_writes
+
+    def bulk_write(self, table, records, on_conflict=None, chunk_size=None):
+        if self.fail_after_writes is not None and self.writes >= self.fail_after_writes:
+            return {"written": 0, "failed": len(records), "requests": 1}
+        self.writes += 1
+        for record in records:
+            self.rows[record["id"]] = record
+        return {"written": len(records), "failed": 0, "requests": 1}
+
+
+def _rows(count):
+    return [{
+        "id": f"{index:05d}",
+        "product_name": f"Korean skincare serum {index}",
+        "price": 200 + index,
+        "rating": 4.5,
+        "review_count": 100 + index,
+        "category": "beauty",
+        "discount_info": {"persona_name": PERSONA, "persona_score": 0, "platform": "lazada"}
+    } for index in range(count)]
+
+
+def test_rescores_stale_rows_and_resumes(tmp_path):
+    """실패한 페이지에서 멈춘 뒤 재실행하면 이어서 끝까지 처리"""
+    checkpoint = tmp_path / "checkpoint.json"
+    database = MemoryDatabase(_rows(25), fail_after_writes=2)
+
+    first = PersonaRescorer(database, page_size=10, checkpoint_path=str(checkpoint)).rescore_persona(PERSONA)
+    assert first["rows"] == 20 and not first["completed"]
+
+    database.fail_after_writes = None
+    rescorer = PersonaRescorer(database, page_size=10, checkpoint_path=str(checkpoint))
+    assert rescorer.checkpoint[PERSONA]["last_id"] == "00019"
+    second = rescorer.rescore_persona(PERSONA)
+    assert second["rows"] == 5 and second["completed"]
+    assert second["rows_per_second"] > 0
+
+    fingerprint = get_persona_fingerprint(PERSONA)
+    scorer = PersonaBatchScorer([PERSONA])
+    for row in database.rows.values():
+        info = row["discount_info"]
+        assert info["persona_fingerprint"] == fingerprint
+        assert info["platform"] == "lazada"
+        expected = scorer.score_records([{
+            "product_name": row["product_name"], "price_numeric": row["price"],
+            "rating_numeric": row["rating"], "review_count_numeric": row["review_count"]
+        }], PERSONA)
+        assert info["persona_score"] == expected[0]["persona_score"]
+
+    # 최신 지문의 행은 다시 읽지 않음
+    assert PersonaRescorer(database, checkpoint_path=str(checkpoint)).rescore_persona(PERSONA)["rows"] == 0
+
+
+class LazyMemoryDatabase(MemoryDatabase):
+    """SupabaseClient 처럼 _ensure_client() 전에는 client 가 None"""
+
+    def __init__(self, rows):
+        super().__init__(rows)
+        self._client, self.client = self.client, None
+
+    def _ensure_client(self):
+        self.client = self._client
+
+
+def test_injected_client_is_initialized_before_reading(tmp_path):
+    """scheduler 가 넘긴 초기화 전 클라이언트도 첫 조회 전에 초기화"""
+    database = LazyMemoryDatabase(_rows(3))
+    result = PersonaRescorer(database, checkpoint_path=str(tmp_path / "checkpoint.json")).rescore_persona(PERSONA)
+    assert result["rows"] == 3 and result["completed"]
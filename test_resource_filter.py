@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+리소스 차단 필터 테스트
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from utils.resource_filter import ESTIMATED_BYTES, ResourceFilter, pick_image_url
+
+
+class FakeDriver:
+    def __init__(self, probe=None, support_url_patterns=True):
+        self.probe = probe or {}
+        self.support_url_patterns = support_url_patterns
+        self.cdp_calls = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == "Network.setBlockedURLs" and "urlPatterns" in params and not self.support_url_patterns:
+            raise RuntimeError("Invalid parameters")
+        self.cdp_calls.append((cmd, params))
+        return {}
+
+    def execute_script(self, script, *args):
+        return self.probe
+
+
+def test_allow_rules_take_priority():
+    """allow 패턴(캡차 등)은 차단 카테고리보다 우선"""
+    resource_filter = ResourceFilter("lazada")
+
+    assert resource_filter.classify("https://img.lazcdn.com/g/p/abc.jpg_200x200q80.jpg") == "image"
+    assert resource_filter.classify("https://fonts.gstatic.com/s/roboto.woff2") == "font"
+    assert resource_filter.classify("https://www.googletagmanager.com/gtm.js?id=1") == "tracker"
+    assert resource_filter.classify("https://www.lazada.com.ph/_____tmd_____/punish/bg.png") is None
+    assert resource_filter.classify("https://www.lazada.com.ph/catalog/?q=serum") is None
+
+
+def test_apply_falls_back_to_plain_url_list():
+    """urlPatterns 를 지원하지 않는 Chrome 에서는 urls 목록으로 차단"""
+    driver = FakeDriver(support_url_patterns=False)
+
+    assert ResourceFilter("tiktok_shop").apply(driver)
+    cmd, params = driver.cdp_calls[-1]
+    assert cmd == "Network.setBlockedURLs"
+    assert "*.png*" in params["urls"]
+
+
+def test_record_page_counts_blocked_requests():
+    """페이지별 차단 요청 수와 절약 바이트 추정"""
+    driver = FakeDriver(probe={
+        "urls": [
+            "https://img.lazcdn.com/a.jpg", "https://img.lazcdn.com/a.jpg",
+            "https://img.lazcdn.com/b.webp", "https://www.lazada.com.ph/app.js"
+        ],
+        "fontErrors": 2,
+        "loadedBytes": 1000,
+        "loadedRequests": 5
+    })
+    resource_filter = ResourceFilter("lazada")
+
+    page = resource_filter.record_page(driver)
+
+    assert page["by_category"] == {"image": 2, "font": 2}
+    assert page["estimated_bytes_saved"] == 2 * ESTIMATED_BYTES["image"] + 2 * ESTIMATED_BYTES["font"]
+    assert resource_filter.get_stats()["blocked_requests"] == 4
+
+
+def test_pick_image_url_skips_placeholders():
+    """data: placeholder 대신 lazy-load 속성 / srcset 의 URL 사용"""
+    assert pick_image_url(["data:image/gif;base64,R0l", "//img.lazcdn.com/p.jpg"], "https://www.lazada.com.ph") \
+        == "https://img.lazcdn.com/p.jpg"
+    assert pick_image_url([None, "", None, "https://cdn.example.com/a.webp 1x, https://cdn.example.com/b.webp 2x"]) \
+        == "https://cdn.example.com/a.webp"
+    assert pick_image_url([None, None]) is None
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+대시보드 응답 캐시 테스트 (ETag / 304 / 테이블 무효화 / 계산 중 무효화)
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.response_cache import ResponseCache
+
+
+def _app():
+    cache = ResponseCache(ttl=60)
+    cache.cache_route(r"/persona/[^/]+/report/[^/]+", tables=("shopee_products",))
+    cache.cache_route(r"/personas", tables=())
+
+    app = FastAPI()
+    app.middleware("http")(cache.middleware)
+    calls = {"report": 0, "personas": 0, "stats": 0}
+
+    @app.get("/persona/{persona_name}/report/{scenario}")
+    async def report(persona_name: str, scenario: str):
+        calls["report"] += 1
+        return {"persona": persona_name, "scenario": scenario, "build": calls["report"]}
+
+    @app.get("/personas")
+    async def personas():
+        calls["personas"] += 1
+        return {"personas": ["young_filipina"]}
+
+    @app.get("/system/stats")
+    async def stats():
+        calls["stats"] += 1
+        return {"calls": calls["stats"]}
+
+    return TestClient(app), cache, calls
+
+
+def test_cached_route_serves_hits_and_304():
+    """같은 경로/파라미터는 다시 계산하지 않고, ETag 가 같으면 304"""
+    client, cache, calls = _app()
+
+    first = client.get("/persona/young_filipina/report/summer_skincare")
+    assert first.status_code == 200 and first.headers["x-cache"] == "MISS"
+    etag = first.headers["etag"]
+
+    second = client.get("/persona/young_filipina/report/summer_skincare")
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+
+    revalidated = client.get("/persona/young_filipina/report/summer_skincare", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304 and revalidated.content == b""
+
+    since = client.get("/persona/young_filipina/report/summer_skincare", headers={"If-Modified-Since": first.headers["last-modified"]})
+    assert since.status_code == 304
+
+    client.get("/persona/urban_professional/report/beauty_trends")
+    assert calls["report"] == 2
+    assert cache.get_stats()["not_modified"] == 2
+
+
+def test_invalidation_by_table_and_uncached_routes():
+    """의존 테이블 저장 시에만 다시 계산, 등록되지 않은 경로는 원래 응답 그대로 (캐시/ETag 없음)"""
+    client, cache, calls = _app()
+    client.get("/persona/young_filipina/report/summer_skincare")
+    client.get("/personas")
+
+    cache.invalidate("tiktok_videos")
+    client.get("/persona/young_filipina/report/summer_skincare")
+    assert calls["report"] == 1
+
+    cache.invalidate("shopee_products")
+    rebuilt = client.get("/persona/young_filipina/report/summer_skincare")
+    assert rebuilt.json()["build"] == 2
+    client.get("/personas")
+    assert calls["personas"] == 1
+
+    stats = client.get("/system/stats")
+    assert stats.headers["x-cache"] == "BYPASS" and "etag" not in stats.headers
+    assert stats.headers["content-type"] == "application/json"
+    again = client.get("/system/stats", headers={"If-None-Match": "*"})
+    assert again.status_code == 200 and calls["stats"] == 2
+    assert cache.get_stats()["entries"] == 2
+
+
+def test_response_computed_during_invalidation_is_not_stored():
+    """응답 계산 중에 의존 테이블이 무효화되면 그 응답은 보관하지 않고, 관계없는 테이블 무효화는 무시"""
+    cache = ResponseCache(ttl=60)
+    cache.cache_route(r"/persona/[^/]+/report/[^/]+", tables=("shopee_products",))
+    app = FastAPI()
+    app.middleware("http")(cache.middleware)
+    saves_during_build = ["shopee_products", "tiktok_videos"]
+    builds = []
+
+    @app.get("/persona/{persona_name}/report/{scenario}")
+    async def report(persona_name: str, scenario: str):
+        builds.append(scenario)
+        if saves_during_build:
+            cache.invalidate(saves_during_build.pop(0))  # 계산 도중 다른 스레드의 저장
+        return {"build": len(builds)}
+
+    client = TestClient(app)
+    first = client.get("/persona/young_filipina/report/summer_skincare")
+    assert first.headers["x-cache"] == "MISS" and cache.get_stats()["entries"] == 0
+
+    second = client.get("/persona/young_filipina/report/summer_skincare")
+    assert second.headers["x-cache"] == "MISS" and second.json()["build"] == 2
+    assert cache.get_stats()["entries"] == 1
+
+    third = client.get("/persona/young_filipina/report/summer_skincare")
+    assert third.headers["x-cache"] == "HIT" and len(builds) == 2
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+근사 행 수 서비스 테스트
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from database.table_stats import TableStatsService
+
+
+class CountingClient:
+    """count='estimated' 조회만 지원하는 클라이언트"""
+
+    def __init__(self, counts):
+        self.counts = counts
+        self.queries = []
+
+    def table(self, name):
+        client = self
+
+        class Query:
+            def select(self, column, count=None):
+                client.queries.append((name, count))
+                return self
+
+            def limit(self, size):
+                return self
+
+            def execute(self):
+                return SimpleNamespace(count=client.counts[name], data=[])
+
+        return Query()
+
+
+def _service(counts):
+    client = CountingClient(counts)
+    wrapper = SimpleNamespace(client=client, _ensure_client=lambda: None)
+    return TableStatsService(wrapper, tables=list(counts), refresh_interval=60), client
+
+
+def test_estimates_plus_incremental_writes():
+    """추정값 조회 후 저장 행 수를 더하고, 갱신 주기 안에서는 다시 조회하지 않음"""
+    service, client = _service({"shopee_products": 120000, "google_trends": 800})
+
+    assert service.snapshot()["tables"]["shopee_products"]["rows"] is None
+    assert service.refresh_if_stale()
+    assert client.queries == [("shopee_products", "estimated"), ("google_trends", "estimated")]
+
+    service.record_write("shopee_products", 25)
+    service.record_write("unknown_table", 5)
+    snapshot = service.snapshot()
+    assert snapshot["tables"]["shopee_products"]["rows"] == 120025
+    assert snapshot["tables"]["shopee_products"]["written_since_refresh"] == 25
+    assert snapshot["tables"]["shopee_products"]["refreshed_at"] is not None
+    assert snapshot["age_seconds"] is not None
+
+    assert service.refresh_if_stale()
+    assert len(client.queries) == 2
+
+    client.counts["shopee_products"] = 130000
+    service.refresh()
+    refreshed = service.snapshot()["tables"]["shopee_products"]
+    assert (refreshed["rows"], refreshed["written_since_refresh"]) == (130000, 0)
+
+
+def test_failed_refresh_keeps_the_service_stale():
+    """조회가 모두 실패하면 갱신 시각을 남기지 않고 오류를 기록, 다음 refresh_if_stale 에서 다시 조회"""
+    service, client = _service({"shopee_products": 120000, "google_trends": 800})
+    client.counts = {}  # 모든 조회가 KeyError
+
+    assert not service.refresh_if_stale()
+    snapshot = service.snapshot()
+    assert snapshot["age_seconds"] is None
+    assert "shopee_products" in snapshot["last_error"] and snapshot["last_error_at"] is not None
+    assert snapshot["tables"]["google_trends"]["error"] is not None
+
+    client.counts = {"shopee_products": 120000, "google_trends": 800}
+    assert service.refresh_if_stale()
+    assert len(client.queries) == 4
+    snapshot = service.snapshot()
+    assert snapshot["age_seconds"] is not None and snapshot["last_error"] is None
+
+
+def test_unavailable_client_is_recorded_instead_of_raised():
+    """Supabase 클라이언트를 만들 수 없으면 False 와 함께 오류만 기록"""
+
+    def fail():
+        raise RuntimeError("SUPABASE_URL not set")
+
+    service = TableStatsService(SimpleNamespace(client=None, _ensure_client=fail), tables=["shopee_products"])
+
+    assert not service.refresh()
+    snapshot = service.snapshot()
+    assert snapshot["age_seconds"] is None
+    assert snapshot["last_error"] == "client unavailable: SUPABASE_URL not set"
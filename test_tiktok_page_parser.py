@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+TikTok Shop 오프라인 파싱 테스트 (저장된 page_source 파싱 / collect_sections 의 파싱·페이지 로드 겹침 / 라이브 엔진 후보 generator)
+"""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import call, patch
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+import scrapers.tiktok_shop_scraper as tiktok_shop_scraper
+from scrapers.tiktok_page_parser import LXML_AVAILABLE, visible_text
+from scrapers.tiktok_shop_scraper import TikTokShopScraper
+
+pytestmark = pytest.mark.skipif(not LXML_AVAILABLE, reason="lxml/cssselect not installed")
+
+PAGE_URL = "https://www.tiktok.com/shop/ph"
+
+# 상품 카드 4개 - 지연 로딩 이미지 / 숨겨진 제목 / title 속성 평점 / 링크 없는 카드 / srcset
+PAGE = """<!DOCTYPE html>
+<html><head><title>TikTok Shop</title><script>window.__data = {"name": "ignored"}</script></head>
+<body>
+<div class="product-card">
+  <a href="/shop/ph/pdp/glow-serum/1729">
+    <img src="data:image/png;base64,AAAA" data-src="https://p16-oec.tiktokcdn.com/serum.jpg">
+    <h3 data-testid="product-title">Glow&nbsp;Serum   30ml<script>track("title")</script></h3>
+  </a>
+  <span class="price">₱299</span>
+  <span class="rating" title="4.9"></span>
+  <span class="review-count">1.2K reviews</span>
+  <span class="sold">3K sold</span>
+</div>
+<div class="product-card">
+  <a href="https://www.tiktok.com/shop/ph/pdp/lip-tint/1730"><img src="https://p16-oec.tiktokcdn.com/tint.jpg"></a>
+  <h3 data-testid="product-title" style="display: none">Hidden badge</h3>
+  <h4>Matte Lip Tint</h4>
+  <span class="price">PHP 149</span>
+  <span class="sold">850 sold</span>
+</div>
+<div class="product-card">
+  <h3 data-testid="product-title">Card without a link</h3>
+  <span class="price">₱99</span>
+</div>
+<div class="product-card">
+  <a href="/shop/ph/pdp/desk-fan/1731">
+    <img srcset="https://p16-oec.tiktokcdn.com/fan-2x.jpg 2x, https://p16-oec.tiktokcdn.com/fan.jpg 1x">
+  </a>
+  <h5>Mini Desk Fan</h5>
+  <span class="price">₱ 450</span>
+  <span class="rating">4.7</span>
+</div>
+</body></html>"""
+
+
+def _fields(products):
+    return [
+        (p["product_name"], p["product_url"], p["price"], p["image_url"], p["rating"], p["sales_count"])
+        for p in products
+    ]
+
+
+def test_saved_page_is_parsed_into_products():
+    """저장된 page_source 에서 숨김/스크립트 텍스트를 제외하고 절대 URL 로 상품 추출, 링크 없는 카드는 제외"""
+    scraper = TikTokShopScraper(use_undetected=False)
+    products = scraper._parse_page_source(PAGE, PAGE_URL, "top_products", limit=10)
+
+    assert _fields(products) == [
+        ("Glow Serum 30ml", "https://www.tiktok.com/shop/ph/pdp/glow-serum/1729", "₱299",
+         "https://p16-oec.tiktokcdn.com/serum.jpg", "4.9", "3K sold"),
+        ("Matte Lip Tint", "https://www.tiktok.com/shop/ph/pdp/lip-tint/1730", "PHP 149",
+         "https://p16-oec.tiktokcdn.com/tint.jpg", None, "850 sold"),
+        ("Mini Desk Fan", "https://www.tiktok.com/shop/ph/pdp/desk-fan/1731", "₱ 450",
+         "https://p16-oec.tiktokcdn.com/fan-2x.jpg", "4.7", None),
+    ]
+    assert {p["source_type"] for p in products} == {"top_products"}
+    assert products[0]["review_count"] == "1.2K reviews"
+
+    # limit 은 유효성 검사 전 카드 수 기준 (라이브 경로와 동일)
+    assert len(scraper._parse_page_source(PAGE, PAGE_URL, "top_products", limit=2)) == 2
+    assert scraper._parse_page_source("<html><body><p>empty</p></body></html>", PAGE_URL, "top_products", 10) == []
+
+
+def test_visible_text_matches_webelement_text():
+    """WebElement.text 처럼 숨김 요소 / script 제외, 공백 정규화"""
+    import lxml.html
+
+    root = lxml.html.fromstring("<div>  Glow&nbsp;Serum <span hidden>x</span><script>y</script>\n <b>30ml</b> </div>")
+    assert visible_text(root) == "Glow Serum\n30ml"
+
+
+class FakeDriver:
+    """URL 별 저장된 페이지를 돌려주는 드라이버 대역"""
+
+    def __init__(self, pages, loaded_event_url):
+        self.pages = pages
+        self.loaded_event_url = loaded_event_url
+        self.next_page_loaded = threading.Event()
+        self.loaded = []
+        self.current_url = None
+
+    def get(self, url):
+        self.loaded.append(url)
+        self.current_url = url
+        if url == self.loaded_event_url:
+            self.next_page_loaded.set()
+
+    @property
+    def page_source(self):
+        return self.pages[self.current_url]
+
+
+def test_collect_sections_parses_off_thread_while_next_page_loads():
+    """offline 모드에서 이전 섹션 파싱이 끝나기 전에 다음 섹션 페이지를 로드하고, 결과는 source_type 별로 반환"""
+    scraper = TikTokShopScraper(use_undetected=False, parse_mode="offline")
+    flash_url = f"{PAGE_URL}/flash-sale"
+    scraper.driver = FakeDriver({PAGE_URL: PAGE, flash_url: PAGE, f"{PAGE_URL}/search?q=beauty": PAGE}, flash_url)
+    scraper._wait_and_scroll = lambda wait_time, scroll_count: None
+
+    parse = scraper._parse_page_source
+    overlapped = {}
+
+    def gated_parse(page_source, page_url, source_type, limit):
+        if source_type == "top_products":
+            # 다음 페이지가 로드될 때까지 파싱을 붙잡아 둠 (겹치지 않으면 타임아웃)
+            overlapped[source_type] = scraper.driver.next_page_loaded.wait(5)
+        overlapped.setdefault("threads", set()).add(threading.current_thread().name)
+        return parse(page_source, page_url, source_type, limit)
+
+    scraper._parse_page_source = gated_parse
+    try:
+        with patch.object(tiktok_shop_scraper.time, "sleep") as sleep:
+            results = scraper.collect_sections(
+                [
+                    {"section": "top_products", "limit": 10},
+                    {"section": "flash_sale", "limit": 1},
+                    {"section": "category", "category": "beauty", "limit": 10}
+                ],
+                delay_between=5
+            )
+    finally:
+        scraper._parse_executor.shutdown(wait=True)
+
+    assert overlapped["top_products"] is True
+    assert all(name.startswith("tiktok-parse") for name in overlapped["threads"])
+    assert list(results) == ["top_products", "flash_sale", "category_beauty"]
+    assert [len(products) for products in results.values()] == [3, 1, 3]
+    assert results["category_beauty"][0]["source_type"] == "category_beauty"
+    assert sleep.call_args_list == [call(5), call(5)]
+
+
+class FakeCard:
+    """'.price' 만 찾을 수 있는 WebElement 대역"""
+
+    text = "₱299"
+
+    def find_element(self, by, selector):
+        if selector != ".price":
+            raise LookupError(selector)
+        return self
+
+
+def test_live_candidates_close_cleanly_after_first_value():
+    """라이브 엔진 후보 generator 를 첫 유효 값에서 멈추고 닫아도 GeneratorExit 를 삼키지 않음"""
+    scraper = TikTokShopScraper(use_undetected=False)
+    candidates = scraper._collect_candidates_webdriver(FakeCard())
+
+    prices = candidates['prices']
+    assert [next(prices), next(prices)] == [None, "₱299"]
+    prices.close()
+    assert candidates['href'] is None
+    assert scraper._build_product_data(scraper._collect_candidates_webdriver(FakeCard()), "top_products")["price"] == "₱299"
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Google Trends 영구 캐시 테스트 (DataFrame 왕복 / timeframe 별 만료 / 캐시 적중 시 요청·대기 생략 / payload 재사용 시간)
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd
+import pytest
+
+import scrapers.google_trends as google_trends
+from utils.anti_bot_system import AntiBotSystem
+from utils.ethical_scraping import ScrapingPolicy
+from utils.trends_cache import PYARROW_AVAILABLE, TrendsCache, ttl_for_timeframe
+
+
+def _interest(keywords):
+    index = pd.date_range("2025-07-16", periods=3, freq="h", name="date")
+    frame = pd.DataFrame({keyword: [10, 40, 70 + i] for i, keyword in enumerate(keywords)}, index=index)
+    frame["isPartial"] = [False, False, True]
+    return frame
+
+
+class RecordingTrendReq:
+    """pytrends TrendReq 대역 - 호출 기록 (네트워크 없음)"""
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+        self.kw_list = []
+
+    def build_payload(self, kw_list, cat=0, timeframe="today 5-y", geo="", gprop=""):
+        self.calls.append(("build_payload", tuple(kw_list), timeframe))
+        self.kw_list = list(kw_list)
+
+    def interest_over_time(self):
+        self.calls.append(("interest_over_time", tuple(self.kw_list)))
+        return _interest(self.kw_list)
+
+    def related_queries(self):
+        self.calls.append(("related_queries", tuple(self.kw_list)))
+        return {
+            keyword: {
+                "top": pd.DataFrame({"query": [f"{keyword} sale"], "value": [100]}),
+                "rising": None
+            } for keyword in self.kw_list
+        }
+
+
+@pytest.fixture
+def scraper_factory(tmp_path):
+    def make():
+        anti_bot = Mock(spec=AntiBotSystem)
+        anti_bot.simulate_human_behavior = Mock()
+        policy = Mock(spec=ScrapingPolicy)
+        policy.wait_for_rate_limit = Mock()
+        with patch.object(google_trends, "TrendReq", RecordingTrendReq):
+            return google_trends.GoogleTrendsScraper(anti_bot, policy, trends_cache=TrendsCache(str(tmp_path)))
+    return make
+
+
+@pytest.mark.parametrize("use_parquet", [True, False])
+def test_frames_round_trip(tmp_path, use_parquet):
+    """parquet / pickle 모두 같은 DataFrame 복원, None 유지, 키는 (종류, 키워드, 기간, 지역, 분류) 별"""
+    if use_parquet and not PYARROW_AVAILABLE:
+        pytest.skip("pyarrow not installed")
+    cache = TrendsCache(str(tmp_path), use_parquet=use_parquet)
+    frame = _interest(["shopee", "lazada"])
+    cache.put("interest_over_time", ["shopee", "lazada"], "now 1-d", {"interest_over_time": frame, "empty": None})
+
+    restored = cache.get("interest_over_time", ["shopee", "lazada"], "now 1-d")
+    pd.testing.assert_frame_equal(restored["interest_over_time"], frame, check_freq=False)
+    assert restored["empty"] is None
+
+    assert cache.get("interest_over_time", ["lazada", "shopee"], "now 1-d") is None
+    assert cache.get("interest_over_time", ["shopee", "lazada"], "now 7-d") is None
+    assert cache.get("interest_over_time", ["shopee", "lazada"], "now 1-d", geo="SG") is None
+    assert cache.get("related_queries", ["shopee", "lazada"], "now 1-d") is None
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_ttl_depends_on_timeframe(tmp_path):
+    """짧은 기간일수록 빨리 만료, 끝난 고정 구간은 오래 유지"""
+    assert ttl_for_timeframe("now 1-H") < ttl_for_timeframe("now 1-d") < ttl_for_timeframe("today 3-m")
+    assert ttl_for_timeframe("2024-01-01 2024-12-31") > ttl_for_timeframe("today 12-m")
+
+    cache = TrendsCache(str(tmp_path))
+    cache.put("interest_over_time", ["gcash"], "now 1-d", {"interest_over_time": _interest(["gcash"])})
+    with patch("utils.trends_cache.time.time", return_value=time.time() + ttl_for_timeframe("now 1-d") + 1):
+        assert cache.get("interest_over_time", ["gcash"], "now 1-d") is None
+    assert cache.get_stats()["expired"] == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_repeated_runs_skip_requests_and_delays(scraper_factory):
+    """두 번째 실행은 pytrends 호출 / 요청 간 대기 / 속도 제한 대기 없이 같은 결과"""
+    with patch.object(google_trends.time, "sleep") as sleep:
+        first = scraper_factory()
+        first_trends = first.get_trends(["shopee", "jollibee"])
+        first_interest = first.get_interest_over_time(["shopee", "jollibee"])
+        first_related = first.get_related_queries("shopee")
+        assert ("build_payload", ("shopee", "jollibee"), "today 3-m") in first.pytrends.calls
+        assert sum(call[0] == "build_payload" for call in first.pytrends.calls) == 3
+        assert first.scraping_policy.wait_for_rate_limit.call_count == 1
+        assert sleep.call_count == 2
+
+        sleep.reset_mock()
+        second = scraper_factory()
+        assert second.get_trends(["shopee", "jollibee"])["interest_over_time"] == first_trends["interest_over_time"]
+        assert second.get_trends(["shopee", "jollibee"])["related_queries"] == first_trends["related_queries"]
+
+        def strip(records):
+            return [{k: v for k, v in record.items() if k != "collection_date"} for record in records]
+
+        assert strip(second.get_interest_over_time(["shopee", "jollibee"])) == strip(first_interest)
+        assert strip(second.get_related_queries("shopee")) == strip(first_related)
+        assert second.pytrends.calls == []
+        assert second.scraping_policy.wait_for_rate_limit.call_count == 0
+        assert sleep.call_count == 0
+        assert second.get_cache_stats()["hits"] == 6
+
+
+def test_payload_is_reused_only_briefly():
+    """get_trends 안에서는 build_payload 한 번, 재사용 시간이 지나면 같은 키워드라도 다시 요청"""
+    anti_bot = Mock(spec=AntiBotSystem)
+    anti_bot.simulate_human_behavior = Mock()
+    policy = Mock(spec=ScrapingPolicy)
+    policy.wait_for_rate_limit = Mock()
+    with patch.object(google_trends, "TrendReq", RecordingTrendReq):
+        scraper = google_trends.GoogleTrendsScraper(anti_bot, policy, trends_cache=False)
+
+    def builds():
+        return sum(call[0] == "build_payload" for call in scraper.pytrends.calls)
+
+    now = time.monotonic()
+    with patch.object(google_trends.time, "monotonic", return_value=now):
+        assert scraper.get_trends(["gcash"])["interest_over_time"]
+        assert builds() == 1
+        scraper.get_trends(["gcash"])
+        assert builds() == 1
+
+    later = now + google_trends.GoogleTrendsScraper.PAYLOAD_REUSE_SECONDS
+    with patch.object(google_trends.time, "monotonic", return_value=later):
+        scraper.get_trends(["gcash"])
+    assert builds() == 2
+    assert [call[0] for call in scraper.pytrends.calls].count("interest_over_time") == 3
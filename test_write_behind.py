@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Write-behind 저장기 테스트 (배치 / flush / backpressure / close 시 저장 / 스풀 ack·release)
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from database.write_behind import WriteBehindWriter
+from database.write_spool import WriteSpool
+
+
+class FakeClient:
+    """SupabaseClient 대역 - bulk_write 호출 기록, failing_tables 는 모두 실패, gate 가 열릴 때까지 저장 대기"""
+
+    def __init__(self, spool=None, failing_tables=(), gate=None):
+        self.spool = spool
+        self.failing_tables = set(failing_tables)
+        self.gate = gate
+        self.calls = []
+        self.sync_writes = []
+
+    def _get_spool(self):
+        return self.spool
+
+    def _format_local_event(self, event):
+        return dict(event)
+
+    def bulk_write(self, table, records, on_conflict=None):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.calls.append((table, len(records)))
+        failed = len(records) if table in self.failing_tables else 0
+        return {"written": len(records) - failed, "failed": failed, "requests": 1}
+
+    def _write_records(self, table, records):
+        self.sync_writes.append((table, len(records)))
+        return self.bulk_write(table, records)
+
+
+def _events(count, prefix="e"):
+    return [{"source_url": f"https://example.com/{prefix}{i}", "event_name": f"{prefix} {i}"} for i in range(count)]
+
+
+def _written(client, table="local_events"):
+    return sum(count for name, count in client.calls if name == table)
+
+
+def test_full_batches_are_written_before_the_interval():
+    """batch_size 가 차면 바로 저장, 덜 찬 배치는 flush 까지 대기"""
+    client = FakeClient()
+    writer = WriteBehindWriter(client, batch_size=5, flush_interval=60)
+    try:
+        assert writer.insert_local_events(_events(12))
+        deadline = time.monotonic() + 5
+        while _written(client) < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert _written(client) >= 10
+        assert all(count >= 5 for _, count in client.calls)
+        assert writer.flush(timeout=5)
+        assert _written(client) == 12
+        assert writer.get_stats()["batches"] == len(client.calls)
+    finally:
+        writer.close(timeout=5)
+
+
+def test_flush_waits_for_queued_records():
+    """flush() 는 flush_interval 과 무관하게 지금까지 넣은 레코드가 저장될 때까지 대기"""
+    client = FakeClient()
+    writer = WriteBehindWriter(client, batch_size=100, flush_interval=60)
+    try:
+        writer.insert_local_events(_events(3))
+        assert writer.flush(timeout=5)
+        assert client.calls == [("local_events", 3)]
+        stats = writer.get_stats()
+        assert (stats["enqueued"], stats["written"], stats["queued"]) == (3, 3, 0)
+    finally:
+        writer.close(timeout=5)
+
+
+def test_full_queue_applies_backpressure_then_drops(tmp_path):
+    """큐가 가득 차면 put_timeout 동안 대기, 그래도 가득 차 있으면 나머지는 스풀에 남기고 False"""
+    gate = threading.Event()
+    spool = WriteSpool(str(tmp_path))
+    client = FakeClient(spool=spool, gate=gate)
+    writer = WriteBehindWriter(client, max_queue_size=2, batch_size=1, flush_interval=60, put_timeout=0.2)
+    try:
+        started = time.monotonic()
+        assert not writer.insert_local_events(_events(10))
+        assert time.monotonic() - started >= 0.2
+        stats = writer.get_stats()
+        assert stats["backpressure_waits"] >= 1 and stats["dropped"] > 0
+
+        gate.set()
+        assert writer.flush(timeout=5)
+        assert _written(client) == 10 - stats["dropped"]
+        # 일부만 저장된 항목은 ack 되지 않고 재전송 대상으로 남음
+        assert [entry["seq"] for entry in spool.pending_entries()] == [1]
+
+        # 큐에 자리가 나면 대기 후 모두 들어감
+        gate.clear()
+        threading.Timer(0.2, gate.set).start()
+        writer.put_timeout = 5
+        assert writer.insert_local_events(_events(6, prefix="late"))
+        assert writer.flush(timeout=5)
+        assert _written(client) == 10 - stats["dropped"] + 6
+    finally:
+        gate.set()
+        writer.close(timeout=5)
+
+
+def test_close_drains_queue_and_later_writes_are_synchronous():
+    """close() 는 남은 레코드를 모두 저장하고 종료, 이후 저장은 동기 처리"""
+    client = FakeClient()
+    writer = WriteBehindWriter(client, batch_size=100, flush_interval=60)
+    writer.insert_local_events(_events(7))
+    writer.close(timeout=5)
+
+    assert not writer._thread.is_alive()
+    assert _written(client) == 7
+
+    assert writer.insert_local_events(_events(2, prefix="after"))
+    assert client.sync_writes == [("local_events", 2)]
+
+
+def test_spool_entries_are_acked_or_released_per_submit(tmp_path):
+    """항목의 레코드가 여러 배치로 나뉘어도 모두 처리된 뒤에 한 번만 ack, 실패한 항목은 release"""
+    spool = WriteSpool(str(tmp_path))
+    client = FakeClient(spool=spool, failing_tables={"tiktok_hashtags"})
+    writer = WriteBehindWriter(client, batch_size=2, flush_interval=60)
+    try:
+        writer.insert_local_events(_events(5))
+        writer.insert_tiktok_hashtags([{"hashtag": "ootd"}, {"hashtag": "skincare"}])
+        assert writer.flush(timeout=5)
+
+        assert _written(client) == 5
+        assert spool.get_stats()["acked_upto"] == 1
+        assert [entry["seq"] for entry in spool.pending_entries()] == [2]
+        assert writer._entry_remaining == {} and writer._entry_failed == set()
+    finally:
+        writer.close(timeout=5)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+쓰기 스풀 테스트 (ack / 세그먼트 정리 / 재시작 후 재전송 / dead letter / 연결 오류 시 중단 / 프로세스별 디렉터리)
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from database.write_spool import FCNTL_AVAILABLE, SpoolReplayer, WriteSpool
+
+
+class FakeWriter:
+    """bulk_write 대역 - bad 행은 거부, down 이면 연결 오류"""
+
+    NATURAL_KEYS = {"local_events": ("source_url", "event_name")}
+
+    def __init__(self):
+        self.down = False
+        self.written = []
+        self.calls = 0
+
+    def bulk_write(self, table, records, on_conflict=None):
+        self.calls += 1
+        if self.down:
+            return {"written": 0, "failed": len(records), "connection_error": True}
+        bad = [record for record in records if record.get("bad")]
+        good = [record for record in records if not record.get("bad")]
+        self.written.extend(good)
+        return {"written": len(good), "failed": len(bad), "connection_error": False}
+
+
+def _rows(name, count=2, bad=False):
+    return [{"source_url": f"https://example.com/{name}", "event_name": f"{name} {i}", "bad": bad} for i in range(count)]
+
+
+def _pending_seqs(spool):
+    return [entry["seq"] for entry in spool.pending_entries()]
+
+
+def _pending_names(spool):
+    return [entry["records"][0]["event_name"] for entry in spool.pending_entries()]
+
+
+def test_append_ack_and_compaction(tmp_path):
+    """ack 순서와 무관하게 연속 구간만 acked_upto 로, 모두 ack 된 세그먼트는 삭제"""
+    spool = WriteSpool(str(tmp_path), segment_max_entries=2)
+    seqs = [spool.append("local_events", _rows(f"e{i}")) for i in range(5)]
+    assert seqs == [1, 2, 3, 4, 5]
+    assert _pending_seqs(spool) == []  # 모두 저장 중
+
+    spool.release(seqs)
+    assert _pending_seqs(spool) == seqs
+    assert len(list(spool.spool_dir.glob("segment_*.jsonl"))) == 3
+
+    spool.ack([1, 2, 4])
+    assert spool.get_stats()["acked_upto"] == 2
+    assert _pending_seqs(spool) == [3, 5]
+    assert len(list(spool.spool_dir.glob("segment_*.jsonl"))) == 2
+
+    spool.ack(3)
+    stats = spool.get_stats()
+    assert (stats["acked_upto"], stats["unacked"]) == (4, 1)
+    assert len(list(spool.spool_dir.glob("segment_*.jsonl"))) == 1  # 기록 중인 세그먼트는 유지
+
+
+def test_restart_resumes_from_checkpoint(tmp_path):
+    """재시작 후 이전 프로세스 디렉터리에서 ack 되지 않은 항목만 이어받음"""
+    spool = WriteSpool(str(tmp_path))
+    first, second, third = (spool.append("local_events", _rows(f"e{i}")) for i in range(3))
+    spool.ack(first)
+    spool.ack(third)
+    spool.release(second)
+    spool.close()
+
+    reopened = WriteSpool(str(tmp_path))
+    assert _pending_names(reopened) == ["e1 0"]
+    reopened.release(reopened.append("local_events", _rows("later")))
+
+    # 체크포인트 저장 전에 종료되어 마지막 줄이 잘린 경우도 건너뛰고 계속
+    segment = sorted(reopened.spool_dir.glob("segment_*.jsonl"))[-1]
+    with open(segment, "a", encoding="utf-8") as f:
+        f.write('{"seq": 3, "table": "local_ev')
+    reopened.close()
+    assert _pending_names(WriteSpool(str(tmp_path))) == ["e1 0", "later 0"]
+
+
+def test_rejected_entries_are_dead_lettered(tmp_path):
+    """일괄 전송이 실패하면 항목별로 재시도, 계속 거부되는 항목만 dead letter"""
+    spool = WriteSpool(str(tmp_path))
+    seqs = [
+        spool.append("local_events", _rows("good")),
+        spool.append("local_events", _rows("broken", bad=True)),
+        spool.append("local_events", _rows("also good")),
+    ]
+    spool.release(seqs)
+
+    writer = FakeWriter()
+    summary = SpoolReplayer(writer, spool).replay()
+
+    assert summary["dead_lettered"] == 1 and not summary["stopped_on_connection_error"]
+    assert _pending_seqs(spool) == []
+    assert spool.get_stats()["acked_upto"] == 3
+    dead = [json.loads(line) for line in (spool.spool_dir / WriteSpool.DEAD_LETTER_FILE).read_text().splitlines()]
+    assert [entry["seq"] for entry in dead] == [2] and dead[0]["error"] == "2 rows rejected"
+    # 일괄 시도 + 항목별 재시도로 같은 행이 두 번 전송될 수 있음 (upsert 이므로 무해)
+    assert {row["event_name"] for row in writer.written} == {
+        row["event_name"] for row in _rows("good") + _rows("also good")
+    }
+
+
+def test_replay_stops_on_connection_error(tmp_path):
+    """연결 오류면 남은 항목을 건드리지 않고 중단, 다음 replay 에서 이어서 전송"""
+    spool = WriteSpool(str(tmp_path))
+    seqs = [spool.append("local_events", _rows(f"e{i}")) for i in range(3)]
+    spool.release(seqs)
+
+    writer = FakeWriter()
+    writer.down = True
+    replayer = SpoolReplayer(writer, spool, max_entries_per_round=1)
+    summary = replayer.replay()
+    assert summary["stopped_on_connection_error"] and summary["entries"] == 0
+    assert writer.calls == 1
+    assert _pending_seqs(spool) == seqs
+
+    writer.down = False
+    assert replayer.replay()["entries"] == 3
+    assert _pending_seqs(spool) == []
+
+
+def test_replay_after_stopping_background_thread(tmp_path):
+    """종료 시 백그라운드 스레드를 멈춘 뒤의 마지막 replay 도 남은 항목을 전송"""
+    spool = WriteSpool(str(tmp_path))
+    writer = FakeWriter()
+    replayer = SpoolReplayer(writer, spool)
+    replayer.start_background(interval=3600)
+    replayer.stop()
+
+    spool.release(spool.append("local_events", _rows("during run")))
+    assert replayer.replay()["entries"] == 1
+    assert _pending_seqs(spool) == []
+
+
+@pytest.mark.skipif(not FCNTL_AVAILABLE, reason="fcntl not available")
+def test_processes_sharing_a_spool_do_not_touch_each_other(tmp_path):
+    """같은 기본 디렉터리를 쓰는 프로세스(main / scheduler / dashboard)는 seq / 체크포인트 / 저장 중 항목이 분리됨"""
+    main_spool, scheduler_spool = WriteSpool(str(tmp_path)), WriteSpool(str(tmp_path))
+    assert main_spool.spool_dir != scheduler_spool.spool_dir
+
+    in_flight = main_spool.append("tiktok_hashtags", _rows("main"))
+    assert scheduler_spool.append("tiktok_hashtags", _rows("scheduler")) == in_flight == 1
+
+    # 다른 프로세스가 저장 중인 항목은 재전송하지 않고, 살아 있는 프로세스의 디렉터리는 adopt 하지 않음
+    scheduler_spool.release(1)
+    assert _pending_names(scheduler_spool) == ["scheduler 0"]
+    assert scheduler_spool.adopt_orphans() == 0
+
+    # ack / 세그먼트 정리도 자기 디렉터리만
+    scheduler_spool.ack(1)
+    assert len(list(main_spool.spool_dir.glob("segment_*.jsonl"))) == 1
+    main_spool.release(in_flight)
+    assert _pending_names(main_spool) == ["main 0"]
+
+
+@pytest.mark.skipif(not FCNTL_AVAILABLE, reason="fcntl not available")
+def test_exited_process_spool_is_adopted_by_replayer(tmp_path):
+    """저장 중에 종료된 프로세스의 항목은 살아 있는 프로세스의 다음 replay 가 한 번만 전송"""
+    dashboard_spool = WriteSpool(str(tmp_path))
+    script = (
+        "import os, sys; sys.path.insert(0, sys.argv[1]);"
+        "from database.write_spool import WriteSpool;"
+        "spool = WriteSpool(sys.argv[2]);"
+        "spool.append('local_events', [{'source_url': 'https://example.com/job', 'event_name': 'job 0'}]);"
+        "os._exit(1)"
+    )
+    subprocess.run([sys.executable, "-c", script, str(project_root), str(tmp_path)])
+    assert len([path for path in tmp_path.iterdir() if path.is_dir()]) == 2
+
+    writer = FakeWriter()
+    assert SpoolReplayer(writer, dashboard_spool).replay()["entries"] == 1
+    assert [row["event_name"] for row in writer.written] == ["job 0"]
+    assert [path for path in tmp_path.iterdir() if path.is_dir()] == [dashboard_spool.spool_dir]
+    assert dashboard_spool.adopt_orphans() == 0
+
+    dashboard_spool.close()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,198 @@
+"""
+aiohttp 기반 비동기 페이지 수집기
+Async fetch engine - per-host politeness delay, bounded concurrency across hosts, timeouts and retries
+
+- 같은 호스트에 대한 요청은 per_host_delay 간격으로 예약 (전역 sleep 없음)
+- 서로 다른 호스트는 max_concurrency 한도 안에서 병렬 진행
+- 연결 오류 / 타임아웃 / 429·5xx 는 지수 백오프로 재시도 (Retry-After 존중)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+import aiohttp
+
+from utils.rate_limiter import normalize_domain
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class FetchResult:
+    """단일 URL 수집 결과"""
+    url: str
+    status: Optional[int] = None
+    body: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+    attempts: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status is not None and 200 <= self.status < 300
+
+    @property
+    def not_modified(self) -> bool:
+        return self.error is None and self.status == 304
+
+
+class AsyncFetcher:
+    """
+    호스트별 예의 지연 + 전체 동시 실행 제한을 적용하는 비동기 수집기
+
+    세션/세마포어는 이벤트 루프에 묶이므로 fetch_all() 호출마다 새로 만들고,
+    호스트별 다음 허용 시각만 인스턴스에 남겨 연속 실행 간에도 간격을 지킵니다.
+    """
+
+    def __init__(
+        self,
+        per_host_delay: float = 3.0,
+        max_concurrency: int = 6,
+        per_host_concurrency: int = 1,
+        timeout: float = 30.0,
+        retries: int = 2,
+        backoff: float = 1.0,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Args:
+            per_host_delay: 같은 호스트에 대한 요청 사이의 최소 간격 (초)
+            max_concurrency: 전체 동시 요청 수
+            per_host_concurrency: 호스트별 동시 요청 수
+            timeout: 요청당 전체 타임아웃 (초)
+            retries: 실패 시 추가 시도 횟수
+            backoff: 재시도 기본 대기 (초, 시도마다 2배)
+            headers: 기본 요청 헤더
+        """
+        self.per_host_delay = per_host_delay
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.headers = dict(headers or {})
+
+        self._next_allowed: Dict[str, float] = {}
+        self.stats = {"requests": 0, "succeeded": 0, "not_modified": 0, "failed": 0, "retries": 0, "waited_seconds": 0.0}
+
+    async def _wait_turn(self, host: str, host_lock: asyncio.Lock):
+        """호스트별 다음 요청 슬롯 예약 후 대기"""
+        async with host_lock:
+            now = time.monotonic()
+            scheduled = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = scheduled + self.per_host_delay
+        delay = scheduled - now
+        if delay > 0:
+            self.stats["waited_seconds"] += delay
+            logger.debug(f"⏸️ Politeness delay for {host}: {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        delay = self.backoff * (2 ** attempt)
+        if retry_after and retry_after.strip().isdigit():
+            delay = max(delay, min(float(retry_after), 60.0))
+        return delay
+
+    async def _fetch_one(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        global_slots: asyncio.Semaphore,
+        host_slots: asyncio.Semaphore,
+        host_lock: asyncio.Lock,
+        headers: Optional[Dict[str, str]] = None
+    ) -> FetchResult:
+        result = FetchResult(url=url)
+        started = time.monotonic()
+        host = normalize_domain(url)
+
+        for attempt in range(self.retries + 1):
+            retry_after = None
+            async with host_slots:
+                await self._wait_turn(host, host_lock)
+                async with global_slots:
+                    result.attempts += 1
+                    self.stats["requests"] += 1
+                    try:
+                        async with session.get(url, headers=headers) as response:
+                            result.status = response.status
+                            result.headers = {k: v for k, v in response.headers.items()}
+                            result.body = await response.read()
+                            result.error = None
+                            if response.status in RETRY_STATUSES:
+                                result.error = f"HTTP {response.status}"
+                                retry_after = response.headers.get("Retry-After")
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        result.error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+
+            if result.error is None:
+                break
+            if attempt < self.retries:
+                delay = self._retry_delay(attempt, retry_after)
+                self.stats["retries"] += 1
+                logger.warning(f"🔄 Retrying {url} in {delay:.1f}s ({result.error})")
+                await asyncio.sleep(delay)
+
+        result.elapsed = time.monotonic() - started
+        if result.ok:
+            self.stats["succeeded"] += 1
+        elif result.not_modified:
+            self.stats["not_modified"] += 1
+        else:
+            self.stats["failed"] += 1
+            logger.error(f"Failed to fetch {url}: {result.error or f'HTTP {result.status}'}")
+        return result
+
+    async def fetch_all(
+        self,
+        urls: Iterable[str],
+        headers: Optional[Dict[str, Dict[str, str]]] = None
+    ) -> List[FetchResult]:
+        """
+        URL 목록을 동시에 수집 (입력 순서대로 결과 반환)
+
+        Args:
+            urls: 수집할 URL 목록
+            headers: URL별 추가 요청 헤더 (조건부 요청 등)
+        """
+        urls = list(urls)
+        if not urls:
+            return []
+
+        global_slots = asyncio.Semaphore(self.max_concurrency)
+        host_slots: Dict[str, asyncio.Semaphore] = {}
+        host_locks: Dict[str, asyncio.Lock] = {}
+        for url in urls:
+            host = normalize_domain(url)
+            host_slots.setdefault(host, asyncio.Semaphore(self.per_host_concurrency))
+            host_locks.setdefault(host, asyncio.Lock())
+
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.per_host_concurrency)
+        async with aiohttp.ClientSession(headers=self.headers, timeout=timeout, connector=connector) as session:
+            tasks = [
+                self._fetch_one(
+                    session, url, global_slots,
+                    host_slots[normalize_domain(url)], host_locks[normalize_domain(url)],
+                    (headers or {}).get(url)
+                )
+                for url in urls
+            ]
+            return await asyncio.gather(*tasks)
+
+    def run(
+        self,
+        urls: Iterable[str],
+        headers: Optional[Dict[str, Dict[str, str]]] = None
+    ) -> List[FetchResult]:
+        """동기 코드용 진입점 (실행 중인 이벤트 루프가 없는 스레드에서 호출)"""
+        return asyncio.run(self.fetch_all(urls, headers))
+
+    def get_stats(self) -> Dict[str, float]:
+        return dict(self.stats)
@@ -0,0 +1,297 @@
+"""
+재사용 가능한 WebDriver 풀
+Warm, health-checked browser instances shared across scraper runs
+"""
+
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledDriver:
+    """풀에서 대여한 드라이버와 사용 이력"""
+    driver: Any
+    profile: str
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    pages_served: int = 0
+    checkouts: int = 0
+
+
+class WebDriverPool:
+    """
+    드라이버 풀 (checkout / checkin)
+
+    - warm_size 만큼 미리 띄워 두고 max_size 까지 생성
+    - 대여 시 execute_script('return 1') 로 상태 확인, 실패하면 새로 생성
+    - max_pages_per_driver 페이지 이상 사용했거나, 수명이 지났거나,
+      봇 감지가 보고된 드라이버는 반납 시 폐기 (recycle)
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        profile: str = "default",
+        max_size: int = 2,
+        warm_size: int = 1,
+        max_pages_per_driver: int = 30,
+        max_age_seconds: float = 1800,
+        checkout_timeout: float = 300
+    ):
+        """
+        Args:
+            factory: 새 WebDriver 를 만들어 반환하는 함수
+            profile: 풀 이름 (로그/통계용)
+            max_size: 동시에 존재할 수 있는 최대 드라이버 수
+            warm_size: warm_up 시 미리 생성할 드라이버 수
+            max_pages_per_driver: 이 페이지 수 이상 로드한 드라이버는 재생성
+            max_age_seconds: 생성 후 이 시간이 지난 드라이버는 재생성
+            checkout_timeout: 모든 드라이버가 사용 중일 때 최대 대기 시간 (초)
+        """
+        self.factory = factory
+        self.profile = profile
+        self.max_size = max(1, max_size)
+        self.warm_size = min(max(0, warm_size), self.max_size)
+        self.max_pages_per_driver = max_pages_per_driver
+        self.max_age_seconds = max_age_seconds
+        self.checkout_timeout = checkout_timeout
+
+        self._idle: List[PooledDriver] = []
+        self._in_use = 0
+        self._creating = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self.stats = {
+            "created": 0,
+            "reused": 0,
+            "recycled": 0,
+            "health_check_failures": 0,
+            "bot_detections": 0,
+            "creation_seconds": 0.0
+        }
+
+    # ------------------------------------------------------------------
+    # 생성 / 폐기
+    # ------------------------------------------------------------------
+
+    def _create(self) -> PooledDriver:
+        start_time = time.monotonic()
+        driver = self.factory()
+        elapsed = time.monotonic() - start_time
+
+        with self._condition:
+            self.stats["created"] += 1
+            self.stats["creation_seconds"] += elapsed
+
+        logger.info(f"🚗 [{self.profile}] New WebDriver started in {elapsed:.1f}s")
+        return PooledDriver(driver=driver, profile=self.profile)
+
+    def _destroy(self, pooled: PooledDriver, reason: str):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.debug(f"[{self.profile}] Error quitting driver: {e}")
+        logger.info(f"♻️ [{self.profile}] Driver recycled ({reason}, {pooled.pages_served} pages)")
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _is_expired(self, pooled: PooledDriver) -> bool:
+        return (
+            pooled.pages_served >= self.max_pages_per_driver
+            or time.monotonic() - pooled.created_at >= self.max_age_seconds
+        )
+
+    def warm_up(self, background: bool = False):
+        """warm_size 만큼 드라이버를 미리 생성"""
+
+        def fill():
+            while True:
+                with self._condition:
+                    total = len(self._idle) + self._in_use + self._creating
+                    if self._closed or len(self._idle) + self._creating >= self.warm_size or total >= self.max_size:
+                        return
+                    self._creating += 1
+                try:
+                    pooled = self._create()
+                except Exception as e:
+                    logger.error(f"❌ [{self.profile}] Failed to warm up driver: {e}")
+                    with self._condition:
+                        self._creating -= 1
+                        self._condition.notify()
+                    return
+                with self._condition:
+                    self._creating -= 1
+                    self._idle.append(pooled)
+                    self._condition.notify()
+
+        if background:
+            threading.Thread(target=fill, name=f"{self.profile}-warmup", daemon=True).start()
+        else:
+            fill()
+
+    # ------------------------------------------------------------------
+    # 대여 / 반납
+    # ------------------------------------------------------------------
+
+    def checkout(self, timeout: Optional[float] = None) -> PooledDriver:
+        """
+        드라이버 대여 (유휴 드라이버 재사용, 없으면 생성, 최대치면 대기)
+
+        Raises:
+            TimeoutError: timeout 안에 드라이버를 확보하지 못한 경우
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError(f"Driver pool '{self.profile}' is closed")
+                    if self._idle:
+                        pooled = self._idle.pop()
+                        self._in_use += 1
+                        create = False
+                        break
+                    if self._in_use + self._creating + len(self._idle) < self.max_size:
+                        self._creating += 1
+                        create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No driver available in pool '{self.profile}' within {timeout}s")
+                    self._condition.wait(remaining)
+
+            if create:
+                try:
+                    pooled = self._create()
+                except Exception:
+                    with self._condition:
+                        self._creating -= 1
+                        self._condition.notify()
+                    raise
+                with self._condition:
+                    self._creating -= 1
+                    self._in_use += 1
+                break
+
+            # 재사용 전 상태 확인
+            if self._is_healthy(pooled) and not self._is_expired(pooled):
+                with self._condition:
+                    self.stats["reused"] += 1
+                break
+
+            with self._condition:
+                self._in_use -= 1
+                if not self._is_expired(pooled):
+                    self.stats["health_check_failures"] += 1
+                self.stats["recycled"] += 1
+                self._condition.notify()
+            self._destroy(pooled, "unhealthy" if not self._is_expired(pooled) else "expired")
+
+        pooled.checkouts += 1
+        pooled.last_used = time.monotonic()
+        return pooled
+
+    def checkin(self, pooled: PooledDriver, pages: int = 0, bot_detected: bool = False, broken: bool = False):
+        """
+        드라이버 반납
+
+        Args:
+            pages: 이번 대여 중 로드한 페이지 수
+            bot_detected: 봇 감지가 발생했으면 True (드라이버 폐기)
+            broken: 드라이버가 비정상이면 True (드라이버 폐기)
+        """
+        pooled.pages_served += pages
+        pooled.last_used = time.monotonic()
+
+        reason = None
+        if bot_detected:
+            reason = "bot detection"
+        elif broken:
+            reason = "broken"
+        elif self._is_expired(pooled):
+            reason = "expired"
+
+        with self._condition:
+            self._in_use -= 1
+            if bot_detected:
+                self.stats["bot_detections"] += 1
+            if reason or self._closed:
+                self.stats["recycled"] += 1
+            else:
+                self._idle.append(pooled)
+            self._condition.notify()
+
+        if reason or self._closed:
+            self._destroy(pooled, reason or "pool closed")
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[PooledDriver]:
+        """with pool.lease() as pooled: pooled.driver.get(...) (예외 시 드라이버 폐기)"""
+        pooled = self.checkout(timeout)
+        try:
+            yield pooled
+        except Exception:
+            self.checkin(pooled, broken=not self._is_healthy(pooled))
+            raise
+        else:
+            self.checkin(pooled)
+
+    def close(self):
+        """유휴 드라이버 종료 (사용 중인 드라이버는 반납 시 종료)"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+
+        for pooled in idle:
+            self._destroy(pooled, "pool closed")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 상태 및 통계"""
+        with self._condition:
+            stats = dict(self.stats)
+            stats.update({
+                "profile": self.profile,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "max_size": self.max_size
+            })
+        created = stats["created"]
+        stats["avg_creation_seconds"] = round(stats["creation_seconds"] / created, 2) if created else 0.0
+        return stats
+
+
+# 프로필별 공유 풀 (scheduler, dashboard API 가 같은 브라우저를 재사용)
+_pools: Dict[str, WebDriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(profile: str, factory: Callable[[], Any], **kwargs) -> WebDriverPool:
+    """프로필별 싱글톤 풀 반환 (처음 호출 시 생성)"""
+    with _pools_lock:
+        pool = _pools.get(profile)
+        if pool is None or pool._closed:
+            pool = WebDriverPool(factory, profile=profile, **kwargs)
+            _pools[profile] = pool
+        return pool
+
+
+def close_all_pools():
+    """모든 공유 풀 종료"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,31 @@
+"""
+WebElement 필드 후보 수집 헬퍼
+Shared lazy selector lookups for the per-element (WebDriver) extraction engines
+"""
+
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from selenium.webdriver.common.by import By
+
+
+def from_selectors(element, selectors: Iterable[str], read: Callable[[Any], Optional[str]]) -> Iterator[Optional[str]]:
+    """
+    셀렉터 순서대로 첫 번째 하위 요소의 값 (요소가 없거나 읽기 실패 시 None)
+
+    첫 유효 값에서 소비가 멈추도록 지연 평가합니다. yield 는 try 밖에 두어
+    소비자가 중간에 멈춘 뒤 generator 가 닫힐 때 GeneratorExit 를 삼키지 않습니다.
+    """
+    for selector in selectors:
+        try:
+            value = read(element.find_element(By.CSS_SELECTOR, selector))
+        except Exception:
+            value = None
+        yield value
+
+
+def first_tag(element, tag: str, read: Callable[[Any], Optional[str]]) -> Optional[str]:
+    """첫 번째 tag 하위 요소의 값 (없거나 읽기 실패 시 None)"""
+    try:
+        return read(element.find_element(By.TAG_NAME, tag))
+    except Exception:
+        return None
@@ -0,0 +1,134 @@
+"""
+디스크 기반 HTTP 응답 캐시 (조건부 재검증)
+On-disk HTTP cache - stores bodies with ETag/Last-Modified and the data extracted from them
+
+- 저장된 항목이 있으면 If-None-Match / If-Modified-Since 헤더로 재요청
+- 304 응답이면 본문을 다시 받지도, 파싱하지도 않고 마지막 추출 결과를 재사용
+- 실행 단위로 절약한 전송량 / 파싱 시간을 집계
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv("EVENT_HTTP_CACHE_DIR", "data/http_cache")
+
+
+class HttpCache:
+    """
+    URL 단위 캐시 항목: <sha1>.json (메타 + 추출 결과) / <sha1>.body (원본 본문)
+
+    추출 결과(extracted)는 호출 측이 정하는 JSON 직렬화 가능한 값입니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.reset_stats()
+
+    def reset_stats(self):
+        """실행 단위 통계 초기화"""
+        self.stats = {
+            "requests": 0,
+            "not_modified": 0,
+            "bytes_downloaded": 0,
+            "bytes_saved": 0,
+            "parse_seconds": 0.0,
+            "parse_seconds_saved": 0.0
+        }
+
+    def _paths(self, url: str):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _load_meta(self, url: str) -> Optional[Dict[str, Any]]:
+        meta_path, _ = self._paths(url)
+        if not meta_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable cache entry for {url}: {e}")
+            return None
+        return meta if meta.get("url") == url else None
+
+    def _save_meta(self, url: str, meta: Dict[str, Any]):
+        meta_path, _ = self._paths(url)
+        tmp_path = meta_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, meta_path)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """저장된 검증자로 조건부 요청 헤더 생성 (항목이 없으면 빈 dict)"""
+        meta = self._load_meta(url)
+        if not meta:
+            return {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def store(self, url: str, body: bytes, headers: Dict[str, str]):
+        """200 응답 저장 (이전 추출 결과는 본문이 바뀌었으므로 제거)"""
+        _, body_path = self._paths(url)
+        lowered = {k.lower(): v for k, v in (headers or {}).items()}
+        tmp_path = body_path.with_suffix(".tmp-body")
+        tmp_path.write_bytes(body)
+        os.replace(tmp_path, body_path)
+        self._save_meta(url, {
+            "url": url,
+            "etag": lowered.get("etag"),
+            "last_modified": lowered.get("last-modified"),
+            "fetched_at": time.time(),
+            "size": len(body),
+            "extracted": None,
+            "parse_seconds": None
+        })
+        self.stats["requests"] += 1
+        self.stats["bytes_downloaded"] += len(body)
+
+    def mark_not_modified(self, url: str) -> bool:
+        """304 응답 기록 - 절약한 전송량 집계, 저장된 항목이 없으면 False"""
+        meta = self._load_meta(url)
+        if not meta:
+            return False
+        self.stats["requests"] += 1
+        self.stats["not_modified"] += 1
+        self.stats["bytes_saved"] += meta.get("size") or 0
+        return True
+
+    def load_body(self, url: str) -> Optional[bytes]:
+        _, body_path = self._paths(url)
+        try:
+            return body_path.read_bytes()
+        except OSError:
+            return None
+
+    def load_extracted(self, url: str) -> Optional[Any]:
+        """304 응답 시 재사용할 추출 결과 (없으면 None) - 절약한 파싱 시간 집계"""
+        meta = self._load_meta(url)
+        if not meta or meta.get("extracted") is None:
+            return None
+        self.stats["parse_seconds_saved"] += meta.get("parse_seconds") or 0.0
+        return meta["extracted"]
+
+    def store_extracted(self, url: str, extracted: Any, parse_seconds: float):
+        """본문에서 추출한 결과와 파싱 시간 저장"""
+        self.stats["parse_seconds"] += parse_seconds
+        meta = self._load_meta(url)
+        if not meta:
+            return
+        meta["extracted"] = extracted
+        meta["parse_seconds"] = parse_seconds
+        self._save_meta(url, meta)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)
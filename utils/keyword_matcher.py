@@ -0,0 +1,181 @@
+"""
+페르소나 키워드 매처 (Aho-Corasick)
+Precompiled interest / trend matching for PersonaRecommendationEngine scoring
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+# _fuzzy_match 의 특별 매칭 규칙 (키워드 ↔ 한국어/축약 변형)
+FUZZY_SPECIAL_MATCHES = {
+    "skincare": ["스킨케어", "세럼", "retinol", "레티놀"],
+    "makeup": ["메이크업", "립밤", "lip", "틴트", "tint"],
+    "tote bag": ["토트백", "토트 백", "bag"],
+    "blazer": ["블레이저"],
+    "sustainable": ["서스테이너블", "지속가능"],
+    "korean": ["한국", "코리안", "k-"],
+    "accessories": ["액세서리", "가방", "bag"]
+}
+
+# 카테고리 ↔ 트렌드 키워드 동의어 (한국어 카테고리명)
+CATEGORY_TREND_ALIASES = {
+    ("메이크업", "makeup"),
+    ("스킨케어", "skincare"),
+    ("패션", "fashion")
+}
+
+
+def fuzzy_variants(keyword_lower: str) -> List[str]:
+    """키워드에 적용되는 특별 매칭 변형 목록 (_fuzzy_match 와 동일한 규칙)"""
+    variants = []
+    for match_keyword, match_variants in FUZZY_SPECIAL_MATCHES.items():
+        if keyword_lower in match_keyword or match_keyword in keyword_lower:
+            variants.extend(match_variants)
+    return variants
+
+
+def keyword_patterns(keyword: str) -> Set[str]:
+    """
+    텍스트에 하나라도 포함되면 키워드가 매칭되는 패턴 집합
+
+    기존 조건 (keyword in text) or any(part in text) or _fuzzy_match(keyword, text) 과 동치
+    """
+    keyword_lower = keyword.lower()
+    return {keyword_lower, *keyword_lower.split(), *fuzzy_variants(keyword_lower)}
+
+
+class AhoCorasick:
+    """여러 패턴의 부분 문자열 포함 여부를 텍스트 한 번 순회로 찾는 오토마톤"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[str]] = [set()]
+        self.always: Set[str] = set()  # 빈 패턴은 항상 포함
+
+        for pattern in set(patterns):
+            if not pattern:
+                self.always.add(pattern)
+                continue
+            self._add(pattern)
+        self._build_failure_links()
+
+    def _add(self, pattern: str):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            state = next_state
+        self._output[state].add(pattern)
+
+    def _build_failure_links(self):
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self._goto[state].items():
+                pending.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0) if state else 0
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """텍스트에 포함된 모든 패턴"""
+        found = set(self.always)
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+class PersonaKeywordMatcher:
+    """
+    페르소나 관심사 매처 (페르소나 로드 시 한 번 컴파일)
+
+    match_interests 는 기존 관심사 루프와 같은 순서/규칙으로
+    (관심사 키워드, 매칭된 키워드) 목록을 반환합니다.
+    """
+
+    def __init__(self, interests: List[Dict[str, Any]]):
+        # 비교용 스냅샷 (설정이 바뀌면 다시 컴파일)
+        self.interests = self._snapshot(interests)
+
+        self._keyword_patterns: Dict[str, Set[str]] = {}
+        for interest in self.interests:
+            for keyword in [interest["keyword"], *interest["related"]]:
+                if keyword not in self._keyword_patterns:
+                    self._keyword_patterns[keyword] = keyword_patterns(keyword)
+
+        self._automaton = AhoCorasick(p for patterns in self._keyword_patterns.values() for p in patterns)
+
+    @staticmethod
+    def _snapshot(interests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [{"keyword": i["keyword"], "related": list(i["related"])} for i in interests]
+
+    def matches(self, interests: List[Dict[str, Any]]) -> bool:
+        """현재 관심사 설정으로 컴파일되었는지 확인"""
+        return self.interests == self._snapshot(interests)
+
+    def match_interests(self, search_text: str) -> List[Tuple[str, str, bool]]:
+        """
+        Returns:
+            [(관심사 키워드, 매칭된 키워드, 메인 키워드 매칭 여부), ...] (관심사 순서)
+        """
+        found = self._automaton.find_all(search_text)
+        matched = []
+        matched_keywords = set()
+
+        for interest in self.interests:
+            keyword = interest["keyword"]
+            if keyword in matched_keywords:
+                continue
+
+            if self._keyword_patterns[keyword] & found:
+                matched.append((keyword, keyword, True))
+                matched_keywords.add(keyword)
+                continue
+
+            for related in interest["related"]:
+                if self._keyword_patterns[related] & found:
+                    matched.append((keyword, related, False))
+                    matched_keywords.add(keyword)
+                    break
+
+        return matched
+
+
+class TrendCategoryMatcher:
+    """카테고리별 트렌드 매칭 결과 캐시 (트렌드 로드 시 한 번 생성)"""
+
+    def __init__(self, trend_data: Dict[str, int]):
+        self.trend_items = tuple(trend_data.items())
+        self._lowered = [(keyword, keyword.lower(), score) for keyword, score in self.trend_items]
+        self._cache: Dict[str, List[Tuple[str, int]]] = {}
+
+    def matches(self, trend_data: Dict[str, int]) -> bool:
+        """현재 트렌드 데이터로 생성되었는지 확인"""
+        return self.trend_items == tuple(trend_data.items())
+
+    def match_category(self, category_lower: str) -> List[Tuple[str, int]]:
+        """카테고리와 매칭되는 (트렌드 키워드, 점수) 목록 (trend_data 순서)"""
+        cached = self._cache.get(category_lower)
+        if cached is None:
+            cached = [
+                (keyword, score) for keyword, keyword_lower, score in self._lowered
+                if keyword_lower in category_lower
+                or category_lower in keyword_lower
+                or (category_lower, keyword_lower) in CATEGORY_TREND_ALIASES
+            ]
+            self._cache[category_lower] = cached
+        return cached
@@ -0,0 +1,248 @@
+"""
+이벤트 기반 페이지 준비 상태 감지
+Waits on real page signals (card count, DOM quiescence, network idle) instead of fixed sleeps
+"""
+
+import time
+import random
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 페이지 상태를 한 번의 execute_script 로 조회
+# - 최초 호출 시 MutationObserver 설치 (마지막 DOM 변경 시각 기록)
+# - 네트워크 유휴: Resource Timing 의 마지막 responseEnd 이후 경과 시간
+READINESS_PROBE_SCRIPT = """
+const selectors = arguments[0];
+let state = window.__vootcampReadiness;
+if (!state) {
+    state = window.__vootcampReadiness = {lastMutation: performance.now()};
+    try { performance.setResourceTimingBufferSize(5000); } catch (e) {}
+    const root = document.documentElement || document;
+    new MutationObserver(() => { state.lastMutation = performance.now(); })
+        .observe(root, {childList: true, subtree: true});
+}
+const counts = selectors.map((selector) => {
+    try { return document.querySelectorAll(selector).length; } catch (e) { return 0; }
+});
+let lastResponse = 0;
+const resources = performance.getEntriesByType('resource');
+for (const entry of resources) {
+    if (entry.responseEnd > lastResponse) lastResponse = entry.responseEnd;
+}
+const now = performance.now();
+return {
+    readyState: document.readyState,
+    counts: counts,
+    sinceMutation: (now - state.lastMutation) / 1000,
+    sinceNetwork: (now - lastResponse) / 1000,
+    resources: resources.length
+};
+"""
+
+
+class HumanJitterPolicy:
+    """
+    사람처럼 보이기 위한 최소한의 랜덤 지연 (준비 상태 대기와 별개)
+
+    enabled=False 이면 지연 없이 진행 (테스트/벤치마크용)
+    """
+
+    def __init__(self, min_delay: float = 0.3, max_delay: float = 1.2, enabled: bool = True):
+        self.min_delay = min_delay
+        self.max_delay = max(min_delay, max_delay)
+        self.enabled = enabled
+
+    def pause(self) -> float:
+        """랜덤 지연 후 실제 대기한 시간(초) 반환"""
+        if not self.enabled or self.max_delay <= 0:
+            return 0.0
+        delay = random.uniform(self.min_delay, self.max_delay)
+        time.sleep(delay)
+        return delay
+
+
+@dataclass
+class ReadinessResult:
+    """페이지 한 번의 대기 결과"""
+    waited: float
+    legacy_seconds: float
+    timed_out: bool
+    card_count: int
+    polls: int
+    signals: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def saved(self) -> float:
+        return self.legacy_seconds - self.waited
+
+
+class PageReadinessEngine:
+    """
+    페이지 준비 상태 대기
+
+    다음 조건을 모두 만족하면 준비 완료로 판단 (timeout 이 상한):
+    - document.readyState == "complete"
+    - 상품 카드 수가 stable_window 동안 변하지 않음
+    - DOM 변경이 quiet_window 동안 없음
+    - 네트워크 응답이 network_idle_window 동안 없음
+    카드가 하나도 없는 페이지(봇 감지, 검색 결과 없음)는 empty_grace 동안 조용하면 종료합니다.
+    """
+
+    def __init__(
+        self,
+        card_selectors: Sequence[str],
+        timeout: float = 20.0,
+        scroll_timeout: float = 5.0,
+        poll_interval: float = 0.25,
+        stable_window: float = 1.0,
+        quiet_window: float = 0.8,
+        network_idle_window: float = 0.5,
+        empty_grace: float = 3.0,
+        min_cards: int = 3,
+        jitter: Optional[HumanJitterPolicy] = None
+    ):
+        """
+        Args:
+            card_selectors: 상품 카드 CSS 셀렉터 (스크래퍼의 PRODUCT_SELECTORS)
+            timeout: 최초 로드 대기 상한 (초)
+            scroll_timeout: 스크롤 후 추가 로딩 대기 상한 (초)
+            poll_interval: 상태 조회 간격 (초)
+            stable_window: 카드 수가 유지되어야 하는 시간 (초)
+            quiet_window: DOM 변경이 없어야 하는 시간 (초)
+            network_idle_window: 네트워크 응답이 없어야 하는 시간 (초)
+            empty_grace: 카드가 없는 페이지를 종료하기 전 추가 대기 (초)
+            min_cards: 카드가 로드되었다고 판단할 최소 개수
+            jitter: 스크롤 사이 랜덤 지연 정책 (None 이면 기본값)
+        """
+        self.card_selectors = list(card_selectors)
+        self.timeout = timeout
+        self.scroll_timeout = scroll_timeout
+        self.poll_interval = poll_interval
+        self.stable_window = stable_window
+        self.quiet_window = quiet_window
+        self.network_idle_window = network_idle_window
+        self.empty_grace = empty_grace
+        self.min_cards = min_cards
+        self.jitter = jitter or HumanJitterPolicy()
+
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "pages": 0,
+            "timeouts": 0,
+            "waited_seconds": 0.0,
+            "legacy_seconds": 0.0
+        }
+
+    def _probe(self, driver) -> Dict[str, Any]:
+        return driver.execute_script(READINESS_PROBE_SCRIPT, self.card_selectors) or {}
+
+    def _card_count(self, counts: List[int]) -> int:
+        """셀렉터 순서대로 min_cards 이상인 첫 결과 (스크래퍼의 요소 탐색과 동일한 기준)"""
+        for count in counts:
+            if count >= self.min_cards:
+                return count
+        return max(counts) if counts else 0
+
+    def wait_until_settled(self, driver, timeout: float) -> Tuple[bool, int, int, Dict[str, Any]]:
+        """
+        신호가 모두 안정될 때까지 폴링
+
+        Returns:
+            (timed_out, card_count, polls, 마지막 신호)
+        """
+        deadline = time.monotonic() + timeout
+        last_counts = None
+        stable_since = time.monotonic()
+        polls = 0
+        signals: Dict[str, Any] = {}
+
+        while True:
+            now = time.monotonic()
+            try:
+                signals = self._probe(driver)
+            except Exception as e:
+                logger.debug(f"Readiness probe failed: {e}")
+                signals = {}
+            polls += 1
+
+            counts = tuple(signals.get("counts") or ())
+            if counts != last_counts:
+                last_counts = counts
+                stable_since = now
+            card_count = self._card_count(list(counts))
+
+            quiet = (
+                signals.get("readyState") == "complete"
+                and signals.get("sinceMutation", 0) >= self.quiet_window
+                and signals.get("sinceNetwork", 0) >= self.network_idle_window
+            )
+            stable_for = now - stable_since
+
+            if quiet and card_count >= self.min_cards and stable_for >= self.stable_window:
+                return False, card_count, polls, signals
+            if quiet and card_count < self.min_cards and stable_for >= self.empty_grace:
+                return False, card_count, polls, signals
+
+            if now >= deadline:
+                return True, card_count, polls, signals
+            time.sleep(min(self.poll_interval, max(0.0, deadline - now)))
+
+    def wait_for_page(self, driver, scroll_count: int = 3, scroll_step: int = 800, legacy_seconds: float = 0.0) -> ReadinessResult:
+        """
+        페이지 로드 → 스크롤(추가 로딩) → 맨 위로 복귀까지 대기
+
+        Args:
+            scroll_count: 스크롤 횟수 (lazy-load 상품 로딩용)
+            scroll_step: 스크롤 한 번의 픽셀 수
+            legacy_seconds: 기존 고정 sleep 방식의 대기 시간 (절약 시간 계산용)
+        """
+        start_time = time.monotonic()
+        timed_out, card_count, polls, signals = self.wait_until_settled(driver, self.timeout)
+
+        # 스크롤로 lazy-load 유도, 카드가 없으면 스크롤 생략
+        if card_count >= self.min_cards:
+            for i in range(scroll_count):
+                driver.execute_script(f"window.scrollTo(0, {(i + 1) * scroll_step});")
+                self.jitter.pause()
+                scroll_timed_out, card_count, scroll_polls, signals = self.wait_until_settled(driver, self.scroll_timeout)
+                polls += scroll_polls
+                timed_out = timed_out or scroll_timed_out
+
+        driver.execute_script("window.scrollTo(0, 0);")
+        self.jitter.pause()
+
+        result = ReadinessResult(
+            waited=time.monotonic() - start_time,
+            legacy_seconds=legacy_seconds,
+            timed_out=timed_out,
+            card_count=card_count,
+            polls=polls,
+            signals=signals
+        )
+
+        with self._stats_lock:
+            self.stats["pages"] += 1
+            self.stats["timeouts"] += int(timed_out)
+            self.stats["waited_seconds"] += result.waited
+            self.stats["legacy_seconds"] += legacy_seconds
+
+        status = "⏱️ timed out" if timed_out else "⚡ ready"
+        logger.info(
+            f"{status} in {result.waited:.1f}s with {card_count} cards "
+            f"(saved {result.saved:.1f}s vs fixed sleeps)"
+        )
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """누적 대기 시간 / 절약 시간"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        pages = stats["pages"]
+        stats["saved_seconds"] = stats["legacy_seconds"] - stats["waited_seconds"]
+        stats["avg_wait_seconds"] = round(stats["waited_seconds"] / pages, 2) if pages else 0.0
+        stats["avg_saved_seconds"] = round(stats["saved_seconds"] / pages, 2) if pages else 0.0
+        return stats
@@ -0,0 +1,243 @@
+"""
+페르소나 적합도 일괄 점수 계산 (NumPy)
+Columnar batch version of LazadaPersonaScraper._is_persona_relevant / _calculate_persona_score
+for every persona in TARGET_PERSONAS at once
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from config.persona_config import TARGET_PERSONAS, get_persona_filters
+from utils.keyword_matcher import AhoCorasick
+
+logger = logging.getLogger(__name__)
+
+# 상품명 연결 구분자 (패턴이 상품명 경계를 넘어 매칭되지 않도록)
+SEPARATOR = "\n"
+
+
+def _numeric_column(values: Iterable[Any]) -> np.ndarray:
+    """None → NaN 인 float64 배열"""
+    return np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
+
+
+@dataclass
+class ProductBatch:
+    """
+    컬럼 단위 상품 배치
+
+    숫자 컬럼의 결측값은 NaN, 0 은 스크래퍼와 같이 '값 없음' 으로 취급합니다.
+    categories 는 현재 점수 공식에는 쓰이지 않지만 결과를 원본 행과 맞추기 위해 유지합니다.
+    """
+    names: np.ndarray
+    categories: np.ndarray
+    price_numeric: np.ndarray
+    rating_numeric: np.ndarray
+    review_count_numeric: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_columns(
+        cls,
+        names: Sequence[Optional[str]],
+        categories: Optional[Sequence[Optional[str]]] = None,
+        price_numeric: Optional[Sequence[Optional[float]]] = None,
+        rating_numeric: Optional[Sequence[Optional[float]]] = None,
+        review_count_numeric: Optional[Sequence[Optional[float]]] = None
+    ) -> "ProductBatch":
+        size = len(names)
+        empty = [None] * size
+        return cls(
+            names=np.array(list(names), dtype=object),
+            categories=np.array(list(categories if categories is not None else empty), dtype=object),
+            price_numeric=_numeric_column(price_numeric if price_numeric is not None else empty),
+            rating_numeric=_numeric_column(rating_numeric if rating_numeric is not None else empty),
+            review_count_numeric=_numeric_column(review_count_numeric if review_count_numeric is not None else empty)
+        )
+
+    @classmethod
+    def from_records(cls, records: Sequence[Dict[str, Any]]) -> "ProductBatch":
+        """스크래퍼 product_data 형식 (product_name, category, *_numeric) 목록에서 생성"""
+        return cls.from_columns(
+            names=[record.get('product_name', '') for record in records],
+            categories=[record.get('category') for record in records],
+            price_numeric=[record.get('price_numeric') for record in records],
+            rating_numeric=[record.get('rating_numeric') for record in records],
+            review_count_numeric=[record.get('review_count_numeric') for record in records]
+        )
+
+
+@dataclass
+class BatchScores:
+    """페르소나 × 상품 결과 (행 순서 = personas)"""
+    personas: List[str]
+    relevant: np.ndarray     # (페르소나 수, 상품 수) bool
+    scores: np.ndarray       # (페르소나 수, 상품 수) float64, 0-100
+    brand_bonus: np.ndarray  # (페르소나 수, 상품 수) bool
+
+    def for_persona(self, persona_name: str) -> Dict[str, np.ndarray]:
+        index = self.personas.index(persona_name)
+        return {
+            "relevant": self.relevant[index],
+            "scores": self.scores[index],
+            "brand_bonus": self.brand_bonus[index]
+        }
+
+
+class PersonaBatchScorer:
+    """
+    TARGET_PERSONAS 전체에 대한 일괄 적합도/점수 계산기
+
+    키워드·브랜드 부분 문자열 검사는 모든 페르소나의 패턴을 합쳐 배치 전체에서 한 번씩만
+    수행하고, 나머지 계산은 (페르소나 × 상품) 배열 연산으로 처리합니다.
+    결과는 스크래퍼의 상품별 계산과 동일합니다.
+    """
+
+    def __init__(self, persona_names: Optional[Sequence[str]] = None):
+        """
+        Args:
+            persona_names: 계산할 페르소나 (None 이면 TARGET_PERSONAS 전체)
+        """
+        self.persona_names = list(persona_names) if persona_names is not None else list(TARGET_PERSONAS)
+
+        unknown = [name for name in self.persona_names if name not in TARGET_PERSONAS]
+        if unknown:
+            raise ValueError(f"Unknown persona: {', '.join(unknown)}")
+
+        self.filters = {name: get_persona_filters(name) for name in self.persona_names}
+
+        # 패턴 → 열 번호 (페르소나 간 공유)
+        self._pattern_index: Dict[str, int] = {}
+        self._keyword_columns: Dict[str, List[int]] = {}
+        self._brand_columns: Dict[str, List[int]] = {}
+        for name in self.persona_names:
+            persona = TARGET_PERSONAS[name]
+            # 상위 20개 키워드 (중복 키워드는 스크래퍼처럼 중복 집계)
+            self._keyword_columns[name] = [self._column(kw.lower()) for kw in persona.keywords[:20]]
+            self._brand_columns[name] = [self._column(brand.lower()) for brand in self.filters[name].get('preferred_brands', [])]
+
+        self._automaton = AhoCorasick(self._pattern_index)
+
+    def _column(self, pattern: str) -> int:
+        if pattern not in self._pattern_index:
+            self._pattern_index[pattern] = len(self._pattern_index)
+        return self._pattern_index[pattern]
+
+    def _pattern_hits(self, names: np.ndarray) -> np.ndarray:
+        """
+        (상품 수, 패턴 수) 포함 여부 행렬
+
+        상품명을 줄바꿈으로 이어 붙인 하나의 문자열에서 패턴별로 위치를 찾고,
+        찾은 위치를 상품 행으로 변환합니다 (상품명마다 Python 루프를 돌지 않음).
+        """
+        hits = np.zeros((len(names), len(self._pattern_index)), dtype=bool)
+        if not len(names):
+            return hits
+
+        lowered = [name.lower() if isinstance(name, str) else "" for name in names]
+        if any(SEPARATOR in pattern for pattern in self._pattern_index) or any(SEPARATOR in name for name in lowered):
+            # 구분자가 포함된 경우 상품명별 오토마톤 검색
+            for row, name in enumerate(lowered):
+                columns = [self._pattern_index[pattern] for pattern in self._automaton.find_all(name)]
+                if columns:
+                    hits[row, columns] = True
+            return hits
+
+        text = SEPARATOR.join(lowered)
+        lengths = np.fromiter((len(name) + 1 for name in lowered), dtype=np.int64, count=len(lowered))
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+        for pattern, column in self._pattern_index.items():
+            if not pattern:
+                hits[:, column] = True
+                continue
+            positions = [match.start() for match in re.finditer(re.escape(pattern), text)]
+            if positions:
+                rows = np.searchsorted(starts, np.array(positions, dtype=np.int64), side='right') - 1
+                hits[rows, column] = True
+        return hits
+
+    def score(self, batch: ProductBatch) -> BatchScores:
+        """모든 페르소나에 대한 적합도와 점수 계산"""
+        size = len(batch)
+        personas = len(self.persona_names)
+        relevant = np.zeros((personas, size), dtype=bool)
+        scores = np.zeros((personas, size), dtype=np.float64)
+        brand_bonus = np.zeros((personas, size), dtype=bool)
+
+        hits = self._pattern_hits(batch.names)
+        valid_name = np.array([isinstance(name, str) for name in batch.names], dtype=bool)
+
+        # 스크래퍼의 `if price:` 처럼 NaN / 0 은 값 없음
+        price = batch.price_numeric
+        rating = batch.rating_numeric
+        reviews = batch.review_count_numeric
+        has_price = ~np.isnan(price) & (price != 0)
+        has_rating = ~np.isnan(rating) & (rating != 0)
+        has_reviews = ~np.isnan(reviews) & (reviews != 0)
+
+        with np.errstate(invalid='ignore'):
+            rating_score = np.where(has_rating, np.minimum(25, (rating / 5.0) * 25), 0.0)
+            review_score = np.where(has_reviews, np.minimum(20, np.log10(np.maximum(1, reviews)) * 5), 0.0)
+
+            for row, name in enumerate(self.persona_names):
+                filters = self.filters[name]
+                price_ranges = filters.get('price_ranges', [])
+
+                # 적합도 (_is_persona_relevant)
+                in_range = np.zeros(size, dtype=bool)
+                for low, high in price_ranges:
+                    in_range |= (low <= price) & (price <= high)
+                max_price = filters.get('max_price', 10000)
+                price_ok = ~has_price | ((price <= max_price) & (in_range | (price <= max_price * 0.5)))
+                rating_ok = ~has_rating | ~(rating < filters.get('min_rating', 3.5))
+                reviews_ok = ~has_reviews | ~(reviews < filters.get('min_reviews', 10))
+                relevant[row] = valid_name & price_ok & rating_ok & reviews_ok
+
+                brand_columns = self._brand_columns[name]
+                if brand_columns:
+                    brand_bonus[row] = hits[:, brand_columns].any(axis=1)
+
+                # 점수 (_calculate_persona_score) - 첫 번째로 포함되는 가격대 기준
+                price_score = np.zeros(size, dtype=np.float64)
+                assigned = np.zeros(size, dtype=bool)
+                for low, high in price_ranges:
+                    mask = has_price & ~assigned & (low <= price) & (price <= high)
+                    mid_price = (low + high) / 2
+                    distance_ratio = np.abs(price - mid_price) / (high - low)
+                    price_score = np.where(mask, np.maximum(0, 30 * (1 - distance_ratio)), price_score)
+                    assigned |= mask
+
+                keyword_columns = self._keyword_columns[name]
+                keyword_matches = hits[:, keyword_columns].sum(axis=1) if keyword_columns else np.zeros(size)
+
+                # 스크래퍼와 같은 순서로 누적 (부동소수점 결과 일치)
+                score = 0.0 + price_score
+                score = score + rating_score
+                score = score + review_score
+                score = score + np.where(brand_bonus[row], 15, 0)
+                score = score + np.minimum(10, keyword_matches * 2)
+                scores[row] = np.minimum(100, score)
+
+        return BatchScores(self.persona_names, relevant, scores, brand_bonus)
+
+    def score_records(self, records: Sequence[Dict[str, Any]], persona_name: str) -> List[Dict[str, Any]]:
+        """
+        product_data 목록에 한 페르소나의 brand_bonus / persona_score 를 채우고 적합한 상품만 반환
+        (스크래퍼의 상품별 처리와 같은 결과)
+        """
+        result = self.score(ProductBatch.from_records(records)).for_persona(persona_name)
+        relevant_records = []
+        for record, relevant, score, brand in zip(records, result["relevant"], result["scores"], result["brand_bonus"]):
+            if not relevant:
+                continue
+            record['brand_bonus'] = bool(brand)
+            record['persona_score'] = float(score)
+            relevant_records.append(record)
+        return relevant_records
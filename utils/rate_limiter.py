@@ -0,0 +1,120 @@
+"""
+도메인별 요청 간격 제한 (thread-safe)
+Per-domain politeness limiter shared by concurrent scrapers
+"""
+
+import time
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_domain(url_or_domain: str) -> str:
+    """URL 또는 도메인 문자열을 비교 가능한 도메인 키로 변환"""
+    value = (url_or_domain or "").strip().lower()
+    if "://" in value:
+        value = urlparse(value).netloc
+    if value.startswith("www."):
+        value = value[4:]
+    return value.split(":")[0]
+
+
+class DomainRateLimiter:
+    """
+    도메인별 최소 요청 간격과 동시 실행 수를 제한하는 리미터
+
+    서로 다른 도메인은 병렬로 진행되고, 같은 도메인에 대한 요청은
+    min_interval 간격으로 예약되어 전체 요청 속도가 정책 안에 머무릅니다.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 5.0,
+        max_concurrent: int = 1,
+        overrides: Optional[Dict[str, Dict[str, float]]] = None
+    ):
+        """
+        Args:
+            min_interval: 같은 도메인에 대한 요청 사이의 최소 간격 (초)
+            max_concurrent: 같은 도메인에 동시에 진행 가능한 작업 수
+            overrides: 도메인별 설정 덮어쓰기 {"lazada.com.ph": {"min_interval": 8, "max_concurrent": 2}}
+        """
+        self.min_interval = min_interval
+        self.max_concurrent = max_concurrent
+        self.overrides = {normalize_domain(k): v for k, v in (overrides or {}).items()}
+
+        self._lock = threading.Lock()
+        self._next_allowed: Dict[str, float] = {}
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def _setting(self, domain: str, key: str) -> float:
+        return self.overrides.get(domain, {}).get(key, getattr(self, key))
+
+    def _semaphore(self, domain: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if domain not in self._semaphores:
+                limit = max(1, int(self._setting(domain, "max_concurrent")))
+                self._semaphores[domain] = threading.BoundedSemaphore(limit)
+            return self._semaphores[domain]
+
+    def wait(self, url_or_domain: str) -> float:
+        """
+        다음 요청 슬롯을 예약하고 필요한 만큼 대기
+
+        Returns:
+            실제로 대기한 시간 (초)
+        """
+        domain = normalize_domain(url_or_domain)
+        interval = float(self._setting(domain, "min_interval"))
+
+        with self._lock:
+            now = time.monotonic()
+            scheduled = max(now, self._next_allowed.get(domain, now))
+            self._next_allowed[domain] = scheduled + interval
+
+            domain_stats = self.stats.setdefault(domain, {"requests": 0, "waited_seconds": 0.0})
+            domain_stats["requests"] += 1
+            domain_stats["waited_seconds"] += scheduled - now
+
+        delay = scheduled - now
+        if delay > 0:
+            logger.debug(f"⏸️ Politeness delay for {domain}: {delay:.2f}s")
+            time.sleep(delay)
+        return delay
+
+    @contextmanager
+    def slot(self, url_or_domain: str) -> Iterator[str]:
+        """동시 실행 제한 + 요청 간격 대기를 함께 적용하는 컨텍스트"""
+        domain = normalize_domain(url_or_domain)
+        semaphore = self._semaphore(domain)
+        semaphore.acquire()
+        try:
+            self.wait(domain)
+            yield domain
+        finally:
+            semaphore.release()
+
+    @contextmanager
+    def slots(self, domains: Iterable[str]) -> Iterator[None]:
+        """여러 도메인 슬롯을 정렬된 순서로 획득 (교착 상태 방지)"""
+        ordered = sorted({normalize_domain(d) for d in domains if d})
+        acquired = []
+        try:
+            for domain in ordered:
+                context = self.slot(domain)
+                context.__enter__()
+                acquired.append(context)
+            yield
+        finally:
+            for context in reversed(acquired):
+                context.__exit__(None, None, None)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """도메인별 요청/대기 통계"""
+        with self._lock:
+            return {domain: dict(values) for domain, values in self.stats.items()}
@@ -0,0 +1,219 @@
+"""
+CDP 기반 리소스 차단 필터
+Blocks images, fonts, media and tracker scripts via Network.setBlockedURLs with per-site allow/deny rules
+"""
+
+import os
+import logging
+import threading
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_FILTER_ENABLED = os.getenv("RESOURCE_FILTER_ENABLED", "true").lower() == "true"
+
+# 카테고리별 차단 패턴 (CDP 와일드카드 '*')
+RESOURCE_CATEGORIES = {
+    "image": ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*"],
+    "font": ["*.woff*", "*.ttf*", "*.otf*", "*.eot*"],
+    "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*.m4s*", "*.mp3*"],
+    "tracker": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*googlesyndication.com*", "*connect.facebook.net*", "*hotjar.com*", "*criteo.com*",
+        "*analytics.tiktok.com*", "*mmstat.com*", "*g.alicdn.com/alilog*"
+    ]
+}
+
+# 차단 시 절약되는 요청당 평균 크기 추정치 (bytes)
+ESTIMATED_BYTES = {
+    "image": 40 * 1024,
+    "font": 30 * 1024,
+    "media": 300 * 1024,
+    "tracker": 25 * 1024
+}
+
+# 사이트별 규칙: block 카테고리 + 추가 차단 패턴, allow 는 차단보다 우선
+SITE_RULES = {
+    "lazada": {
+        "block": ["image", "font", "media", "tracker"],
+        "extra_block": [],
+        # 슬라이더 캡차(punish) 페이지는 정상적으로 렌더링되어야 봇 감지 확인 가능
+        "allow": ["*captcha*", "*punish*"]
+    },
+    "tiktok_shop": {
+        "block": ["image", "font", "media", "tracker"],
+        "extra_block": [],
+        "allow": ["*captcha*", "*verify*"]
+    }
+}
+
+# 차단된 리소스도 DOM 에는 URL 이 남아 있으므로 이 순서로 이미지 URL 확인
+IMAGE_ATTRIBUTES = ("src", "data-src", "data-ks-lazyload", "srcset")
+
+# 현재 페이지에서 요청되었을(또는 차단된) 리소스 URL 수집
+RESOURCE_PROBE_SCRIPT = """
+const urls = [];
+document.querySelectorAll('img').forEach((img) => {
+    const url = img.currentSrc || img.src;
+    if (url) urls.push(url);
+});
+document.querySelectorAll('video[src], audio[src], source[src], script[src]').forEach((el) => urls.push(el.src));
+document.querySelectorAll('link[href]').forEach((el) => urls.push(el.href));
+let fontErrors = 0;
+if (document.fonts) {
+    document.fonts.forEach((font) => { if (font.status === 'error') fontErrors += 1; });
+}
+const loaded = performance.getEntriesByType('resource').map((entry) => entry.transferSize || 0);
+return {urls: urls, fontErrors: fontErrors, loadedBytes: loaded.reduce((a, b) => a + b, 0), loadedRequests: loaded.length};
+"""
+
+
+def pick_image_url(values: Iterable[Optional[str]], base_url: str = "") -> Optional[str]:
+    """
+    img 속성 값(IMAGE_ATTRIBUTES 순서)에서 실제 이미지 URL 선택
+
+    data: placeholder 는 건너뛰고, srcset 은 첫 번째 후보 URL 사용
+    """
+    for value in values:
+        if not value:
+            continue
+        value = value.strip()
+        if "," in value or " " in value:
+            value = value.split(",")[0].strip().split(" ")[0]
+        if not value or value.startswith("data:"):
+            continue
+        return urljoin(base_url, value) if base_url else value
+    return None
+
+
+class ResourceFilter:
+    """
+    사이트별 리소스 차단 필터
+
+    apply() 는 드라이버 생성 시 한 번 호출하면 이후 모든 페이지에 적용되며,
+    record_page() 는 페이지마다 차단된 요청 수와 절약된 바이트(추정)를 집계합니다.
+    """
+
+    def __init__(self, site: str, rules: Optional[Dict[str, Any]] = None):
+        rules = rules or SITE_RULES.get(site, {"block": list(RESOURCE_CATEGORIES), "extra_block": [], "allow": []})
+        self.site = site
+        self.block_categories = {
+            category: RESOURCE_CATEGORIES[category] for category in rules.get("block", [])
+        }
+        self.extra_block = list(rules.get("extra_block", []))
+        self.allow = list(rules.get("allow", []))
+
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "drivers": 0,
+            "pages": 0,
+            "blocked_requests": 0,
+            "estimated_bytes_saved": 0,
+            "loaded_requests": 0,
+            "loaded_bytes": 0,
+            "by_category": {category: 0 for category in list(self.block_categories) + ["other"]}
+        }
+
+    @property
+    def block_patterns(self) -> List[str]:
+        patterns = [pattern for patterns in self.block_categories.values() for pattern in patterns]
+        return patterns + self.extra_block
+
+    def apply(self, driver) -> bool:
+        """드라이버에 차단 규칙 적용 (실패 시 차단 없이 계속 진행)"""
+        if not RESOURCE_FILTER_ENABLED:
+            return False
+
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            try:
+                # 최신 Chrome: allow 패턴을 먼저 두면 차단보다 우선 적용
+                url_patterns = [{"urlPattern": pattern, "block": False} for pattern in self.allow]
+                url_patterns += [{"urlPattern": pattern, "block": True} for pattern in self.block_patterns]
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urlPatterns": url_patterns})
+            except Exception:
+                # 구버전 Chrome: 차단 목록만 지원 (allow 패턴과 겹치는 규칙은 제외할 수 없음)
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.block_patterns})
+                if self.allow:
+                    logger.debug(f"[{self.site}] Chrome does not support urlPatterns - allow rules ignored")
+        except Exception as e:
+            logger.warning(f"⚠️ [{self.site}] Resource filter not applied: {e}")
+            return False
+
+        with self._stats_lock:
+            self.stats["drivers"] += 1
+        logger.info(f"🚫 [{self.site}] Blocking {', '.join(self.block_categories) or 'custom'} resources")
+        return True
+
+    def classify(self, url: str) -> Optional[str]:
+        """URL 이 차단 대상이면 카테고리 반환, 아니면 None"""
+        if not url or url.startswith("data:"):
+            return None
+        if any(fnmatchcase(url, pattern) for pattern in self.allow):
+            return None
+        for category, patterns in self.block_categories.items():
+            if any(fnmatchcase(url, pattern) for pattern in patterns):
+                return category
+        if any(fnmatchcase(url, pattern) for pattern in self.extra_block):
+            return "other"
+        return None
+
+    def record_page(self, driver) -> Dict[str, Any]:
+        """현재 페이지에서 차단된 요청 수 / 절약 바이트(추정) 집계"""
+        if not RESOURCE_FILTER_ENABLED:
+            return {}
+
+        probe = driver.execute_script(RESOURCE_PROBE_SCRIPT) or {}
+
+        blocked: Dict[str, int] = {}
+        for url in set(probe.get("urls") or []):
+            category = self.classify(url)
+            if category:
+                blocked[category] = blocked.get(category, 0) + 1
+        if "font" in self.block_categories and probe.get("fontErrors"):
+            blocked["font"] = blocked.get("font", 0) + probe["fontErrors"]
+
+        page = {
+            "blocked_requests": sum(blocked.values()),
+            "estimated_bytes_saved": sum(ESTIMATED_BYTES.get(category, 0) * count for category, count in blocked.items()),
+            "loaded_requests": probe.get("loadedRequests", 0),
+            "loaded_bytes": probe.get("loadedBytes", 0),
+            "by_category": blocked
+        }
+
+        with self._stats_lock:
+            self.stats["pages"] += 1
+            for key in ("blocked_requests", "estimated_bytes_saved", "loaded_requests", "loaded_bytes"):
+                self.stats[key] += page[key]
+            for category, count in blocked.items():
+                self.stats["by_category"][category] = self.stats["by_category"].get(category, 0) + count
+
+        logger.debug(
+            f"🚫 [{self.site}] Blocked {page['blocked_requests']} requests "
+            f"(~{page['estimated_bytes_saved'] / 1024:.0f} KB saved, {page['loaded_bytes'] / 1024:.0f} KB loaded)"
+        )
+        return page
+
+    def get_stats(self) -> Dict[str, Any]:
+        """누적 차단 통계"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+            stats["by_category"] = dict(self.stats["by_category"])
+        stats["site"] = self.site
+        stats["estimated_mb_saved"] = round(stats["estimated_bytes_saved"] / (1024 * 1024), 2)
+        return stats
+
+
+# 사이트별 공유 필터 (드라이버 풀의 모든 드라이버가 같은 통계를 사용)
+_filters: Dict[str, ResourceFilter] = {}
+_filters_lock = threading.Lock()
+
+
+def get_resource_filter(site: str) -> ResourceFilter:
+    """사이트별 싱글톤 필터 반환"""
+    with _filters_lock:
+        if site not in _filters:
+            _filters[site] = ResourceFilter(site)
+        return _filters[site]
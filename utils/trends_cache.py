@@ -0,0 +1,207 @@
+"""
+Google Trends 결과 영구 캐시
+Persistent cache for pytrends DataFrames keyed on (keywords batch, timeframe, geo, cat)
+
+- 요청 종류(interest_over_time / related_queries)별로 pytrends 가 돌려준 DataFrame 을 그대로 저장
+- 만료 시간은 timeframe 에 따라 다름 (now 1-d 는 1시간, today 3-m 은 하루, 과거 고정 구간은 30일)
+- pyarrow 가 있으면 DataFrame 별 parquet, 없으면 항목당 pickle 한 개
+- 항목은 <sha1>.json 메타 + 프레임 파일, 모두 임시 파일 → os.replace 로 원자적 기록
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401 - pandas parquet engine
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv("TRENDS_CACHE_DIR", "data/trends_cache")
+
+# timeframe → 캐시 유지 시간 (초)
+TIMEFRAME_TTLS = {
+    "now 1-H": 15 * 60,
+    "now 4-H": 30 * 60,
+    "now 1-d": 60 * 60,
+    "now 7-d": 3 * 60 * 60,
+    "today 1-m": 12 * 60 * 60,
+    "today 3-m": 24 * 60 * 60,
+    "today 12-m": 3 * 24 * 60 * 60,
+    "today 5-y": 7 * 24 * 60 * 60,
+    "all": 7 * 24 * 60 * 60,
+}
+DEFAULT_TTL = 6 * 60 * 60
+CLOSED_RANGE_TTL = 30 * 24 * 60 * 60
+
+_DATE_RANGE = re.compile(r'^\d{4}-\d{2}-\d{2}(?:T\d{2})? (\d{4}-\d{2}-\d{2})(?:T\d{2})?$')
+
+
+def ttl_for_timeframe(timeframe: str) -> int:
+    """timeframe 별 만료 시간 - 이미 끝난 고정 날짜 구간은 더 바뀌지 않으므로 길게"""
+    if timeframe in TIMEFRAME_TTLS:
+        return TIMEFRAME_TTLS[timeframe]
+    date_range = _DATE_RANGE.match(timeframe.strip())
+    if date_range and date_range.group(1) < datetime.now().strftime("%Y-%m-%d"):
+        return CLOSED_RANGE_TTL
+    return DEFAULT_TTL
+
+
+class TrendsCache:
+    """
+    (kind, keywords, timeframe, geo, cat) 단위 DataFrame 캐시
+
+    값은 이름 → DataFrame (또는 None) dict 이며, None 은 "pytrends 가 결과 없음을 돌려줌" 으로 저장됩니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, use_parquet: Optional[bool] = None):
+        """
+        Args:
+            cache_dir: 저장 위치 (기본값: TRENDS_CACHE_DIR 또는 data/trends_cache)
+            use_parquet: parquet 저장 여부 (기본값: pyarrow 설치 여부)
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.use_parquet = PYARROW_AVAILABLE if use_parquet is None else use_parquet
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "stored": 0, "bytes_written": 0, "fetch_seconds_saved": 0.0}
+
+    @staticmethod
+    def make_key(kind: str, keywords: List[str], timeframe: str, geo: str, cat: int) -> str:
+        payload = json.dumps([kind, list(keywords), timeframe, geo, int(cat)], ensure_ascii=False)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _atomic_write(self, path: Path, writer):
+        tmp_path = path.with_name(path.name + ".tmp")
+        writer(tmp_path)
+        os.replace(tmp_path, path)
+        self.stats["bytes_written"] += path.stat().st_size
+
+    def _remove(self, key: str, meta: Optional[Dict[str, Any]] = None):
+        files = [f"{key}.json"] + list((meta or {}).get("files", []))
+        for name in files:
+            try:
+                (self.cache_dir / name).unlink()
+            except OSError:
+                pass
+
+    def _load_meta(self, key: str) -> Optional[Dict[str, Any]]:
+        meta_path = self._meta_path(key)
+        if not meta_path.exists():
+            return None
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable trends cache entry {key}: {e}")
+            return None
+
+    def get(
+        self, kind: str, keywords: List[str], timeframe: str, geo: str = "PH", cat: int = 0
+    ) -> Optional[Dict[str, Optional[pd.DataFrame]]]:
+        """저장된 프레임 (없거나 만료되었으면 None)"""
+        key = self.make_key(kind, keywords, timeframe, geo, cat)
+        meta = self._load_meta(key)
+        if meta is None:
+            self.stats["misses"] += 1
+            return None
+        if time.time() - meta["stored_at"] > meta["ttl"]:
+            self.stats["expired"] += 1
+            self.stats["misses"] += 1
+            self._remove(key, meta)
+            return None
+
+        try:
+            if meta["format"] == "parquet":
+                frames = {
+                    name: pd.read_parquet(self.cache_dir / file_name) if file_name else None
+                    for name, file_name in meta["frames"].items()
+                }
+            else:
+                with open(self.cache_dir / meta["files"][0], "rb") as f:
+                    frames = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Dropping unreadable trends cache entry {key}: {e}")
+            self._remove(key, meta)
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        self.stats["fetch_seconds_saved"] += meta.get("fetch_seconds") or 0.0
+        return frames
+
+    def put(
+        self,
+        kind: str,
+        keywords: List[str],
+        timeframe: str,
+        frames: Dict[str, Optional[pd.DataFrame]],
+        geo: str = "PH",
+        cat: int = 0,
+        fetch_seconds: float = 0.0
+    ):
+        """pytrends 결과 저장 (저장 실패는 경고만 남기고 무시)"""
+        key = self.make_key(kind, keywords, timeframe, geo, cat)
+        meta = {
+            "kind": kind,
+            "keywords": list(keywords),
+            "timeframe": timeframe,
+            "geo": geo,
+            "cat": int(cat),
+            "stored_at": time.time(),
+            "ttl": ttl_for_timeframe(timeframe),
+            "fetch_seconds": fetch_seconds,
+        }
+        try:
+            if self.use_parquet:
+                meta["format"] = "parquet"
+                meta["frames"] = {}
+                for index, (name, frame) in enumerate(frames.items()):
+                    if frame is None:
+                        meta["frames"][name] = None
+                        continue
+                    file_name = f"{key}.{index}.parquet"
+                    self._atomic_write(self.cache_dir / file_name, lambda path, frame=frame: frame.to_parquet(path))
+                    meta["frames"][name] = file_name
+                meta["files"] = [name for name in meta["frames"].values() if name]
+            else:
+                meta["format"] = "pickle"
+                meta["files"] = [f"{key}.pkl"]
+
+                def write_pickle(path):
+                    with open(path, "wb") as f:
+                        pickle.dump(frames, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+                self._atomic_write(self.cache_dir / meta["files"][0], write_pickle)
+
+            self._atomic_write(self._meta_path(key), lambda path: path.write_text(json.dumps(meta), encoding="utf-8"))
+            self.stats["stored"] += 1
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to cache trends result for {keywords} ({timeframe}): {e}")
+
+    def prune(self) -> int:
+        """만료된 항목 삭제"""
+        removed = 0
+        now = time.time()
+        for meta_path in self.cache_dir.glob("*.json"):
+            meta = self._load_meta(meta_path.stem)
+            if meta is None or now - meta.get("stored_at", 0) > meta.get("ttl", 0):
+                self._remove(meta_path.stem, meta)
+                removed += 1
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)